@@ -2,11 +2,16 @@
 Python プロジェクト検出器
 """
 
+from collections.abc import Iterable
 from pathlib import Path
 import tomllib
+from typing import TYPE_CHECKING
 
 from ..models import Module, Service
 
+if TYPE_CHECKING:
+    from ...utils.scan_session import ScanSession
+
 
 class PythonDetector:
     """Python プロジェクトを検出"""
@@ -18,6 +23,7 @@ class PythonDetector:
         self,
         exclude_directories: list[str] | None = None,
         exclude_patterns: set[str] | None = None,
+        scan_session: "ScanSession | None" = None,
     ):
         """
         初期化
@@ -25,7 +31,9 @@ class PythonDetector:
         Args:
             exclude_directories: 除外するディレクトリのリスト
             exclude_patterns: 依存関係から除外するパターンのセット
+            scan_session: 走査セッション（指定された場合はディレクトリ走査に走査結果を再利用）
         """
+        self.scan_session = scan_session
         self.exclude_dirs = self.DEFAULT_EXCLUDE_DIRS.copy()
         if exclude_directories:
             self.exclude_dirs.update(exclude_directories)
@@ -103,18 +111,44 @@ class PythonDetector:
 
         modules = []
         # プロジェクトルート直下のディレクトリを探索（パッケージのみ）
-        for path in project_root.iterdir():
-            if path.is_dir() and (path / "__init__.py").exists():
-                # 除外ディレクトリのチェック
-                if path.name.startswith(".") or path.name in self.exclude_dirs:
-                    continue
+        for path in self._iter_subpackages(project_root):
+            # 除外ディレクトリのチェック
+            if path.name.startswith(".") or path.name in self.exclude_dirs:
+                continue
 
-                module = self._scan_package(path, project_root)
-                if module:
-                    modules.append(module)
+            module = self._scan_package(path, project_root)
+            if module:
+                modules.append(module)
 
         return modules
 
+    def _iter_subpackages(self, path: Path) -> Iterable[Path]:
+        """直下のPythonパッケージ（`__init__.py`を含むディレクトリ）を列挙"""
+        if self.scan_session is not None:
+            rel_dir = self.scan_session.relative_dir(path)
+            if rel_dir is not None:
+                prefix = f"{rel_dir}/" if rel_dir else ""
+                dir_names, _files = self.scan_session.list_dir(rel_dir)
+                return [
+                    path / name
+                    for name in dir_names
+                    if "__init__.py" in self.scan_session.list_dir(prefix + name)[1]
+                ]
+
+        return [
+            item for item in path.iterdir() if item.is_dir() and (item / "__init__.py").exists()
+        ]
+
+    def _iter_python_files(self, package_path: Path) -> Iterable[Path]:
+        """パッケージ配下の全.pyファイルを列挙"""
+        if self.scan_session is not None:
+            rel_dir = self.scan_session.relative_dir(package_path)
+            if rel_dir is not None:
+                view = self.scan_session.view(extensions={".py"}, prefix=rel_dir)
+                return [file_path for file_path, _rel_path in view]
+
+        return package_path.rglob("*.py")
+
     def _scan_package(
         self, path: Path, project_root: Path, depth: int = 0, max_depth: int = 2
     ) -> Module:
@@ -136,12 +170,11 @@ class PythonDetector:
             )
 
         # パッケージ内のサブパッケージのみをスキャン（個別ファイルは無視）
-        for item in path.iterdir():
-            if item.is_dir() and (item / "__init__.py").exists():
-                if item.name == "__pycache__":
-                    continue
-                submodule = self._scan_package(item, project_root, depth + 1, max_depth)
-                submodules.append(submodule)
+        for item in self._iter_subpackages(path):
+            if item.name == "__pycache__":
+                continue
+            submodule = self._scan_package(item, project_root, depth + 1, max_depth)
+            submodules.append(submodule)
 
         # このパッケージ全体の依存関係を収集
         # ただし、トップレベル（depth=0）では収集しない（冗長な矢印を避けるため）
@@ -181,7 +214,7 @@ class PythonDetector:
         }
 
         # パッケージ内の全.pyファイルをスキャン
-        for py_file in package_path.rglob("*.py"):
+        for py_file in self._iter_python_files(package_path):
             if "__pycache__" in str(py_file):
                 continue
 
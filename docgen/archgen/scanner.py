@@ -3,13 +3,16 @@
 """
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .detectors.docker_detector import DockerDetector
 from .detectors.generic_detector import GenericDetector
 from .detectors.python_detector import PythonDetector
 from .models import ArchitectureManifest
 
+if TYPE_CHECKING:
+    from ..utils.scan_session import ScanSession
+
 
 class ProjectScanner:
     """プロジェクトをスキャンしてアーキテクチャを抽出"""
@@ -19,6 +22,7 @@ class ProjectScanner:
         project_root: Path,
         exclude_directories: list[str] | None = None,
         config: dict[str, Any] | None = None,
+        scan_session: "ScanSession | None" = None,
     ):
         """
         初期化
@@ -27,6 +31,7 @@ class ProjectScanner:
             project_root: プロジェクトルートディレクトリ
             exclude_directories: 除外するディレクトリのリスト
             config: 設定辞書（依存関係フィルタリング用）
+            scan_session: 走査セッション（指定された場合はモジュール構造の走査に再利用）
         """
         self.project_root = project_root
         self.config = config or {}
@@ -36,7 +41,9 @@ class ProjectScanner:
 
         self.detectors = [
             PythonDetector(
-                exclude_directories=exclude_directories, exclude_patterns=self.exclude_patterns
+                exclude_directories=exclude_directories,
+                exclude_patterns=self.exclude_patterns,
+                scan_session=scan_session,
             ),
             GenericDetector(
                 exclude_directories=exclude_directories, exclude_patterns=self.exclude_patterns
@@ -5,15 +5,19 @@ CLI Commands package
 from .base import BaseCommand
 from .benchmark import BenchmarkCommand
 from .build_index import BuildIndexCommand
+from .cache import CacheCommand
 from .generate import GenerateCommand
 from .hooks import HooksCommand
 from .init import InitCommand
+from .watch import WatchCommand
 
 __all__ = [
     "BaseCommand",
     "BenchmarkCommand",
     "BuildIndexCommand",
+    "CacheCommand",
     "GenerateCommand",
     "HooksCommand",
     "InitCommand",
+    "WatchCommand",
 ]
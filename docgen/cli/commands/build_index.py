@@ -4,10 +4,14 @@ Build index command - Build RAG index
 
 from argparse import Namespace
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ...utils.logger import get_logger
 from .base import BaseCommand
 
+if TYPE_CHECKING:
+    from ...utils.remote_cache import RemoteCacheClient
+
 logger = get_logger("docgen")
 
 
@@ -32,11 +36,24 @@ class BuildIndexCommand(BaseCommand):
             from ...rag.chunker import CodeChunker
             from ...rag.embedder import Embedder
             from ...rag.indexer import VectorIndexer
+            from ...utils.remote_cache import get_remote_cache
 
             logger.info("Starting RAG index construction...")
 
             # Get RAG config
             rag_config = config.get("rag", {})
+            remote_cache = get_remote_cache(config)
+
+            # Incremental update based on changed files
+            since = getattr(args, "since", None)
+            staged = getattr(args, "staged", False)
+            if since or staged:
+                result = self._update_index(
+                    project_root, rag_config, since, staged, remote_cache=remote_cache
+                )
+                if result is not None:
+                    return result
+                logger.info("Existing index cannot be updated incrementally, rebuilding...")
 
             # 1. Chunk codebase
             logger.info("Step 1/3: Chunking codebase...")
@@ -51,7 +68,7 @@ class BuildIndexCommand(BaseCommand):
 
             # 2. Generate embeddings
             logger.info("Step 2/3: Generating embeddings...")
-            embedder = Embedder(rag_config)
+            embedder = Embedder(rag_config, remote_cache=remote_cache)
 
             # Extract text from chunks
             texts = [chunk["text"] for chunk in chunks]
@@ -98,3 +115,66 @@ class BuildIndexCommand(BaseCommand):
         except Exception as e:
             logger.error(f"Error building index: {e}", exc_info=True)
             return 1
+
+    @staticmethod
+    def _update_index(
+        project_root: Path,
+        rag_config: dict[str, Any],
+        since: str | None,
+        staged: bool,
+        remote_cache: "RemoteCacheClient | None" = None,
+    ) -> int | None:
+        """
+        変更ファイルのチャンクのみ置き換えて既存のインデックスを差分更新
+
+        Args:
+            project_root: Project root directory
+            rag_config: RAG設定
+            since: 比較するリビジョン
+            staged: ステージされた変更を対象にするかどうか
+            remote_cache: 埋め込みのリモートキャッシュ
+
+        Returns:
+            Exit code（既存のインデックスを使用できない場合はNone）
+        """
+        import numpy as np
+
+        from ...rag.chunker import CodeChunker
+        from ...rag.embedder import Embedder
+        from ...rag.indexer import VectorIndexer
+        from ...utils.change_set import ChangeSetError, load_change_set
+
+        try:
+            change_set = load_change_set(project_root, since=since, staged=staged)
+        except ChangeSetError as e:
+            logger.error(f"Failed to get changed files: {e}")
+            return 1
+
+        if change_set.is_empty():
+            logger.info("No changed files, skipping index update")
+            return 0
+
+        indexer = VectorIndexer(index_dir=project_root / "docgen" / "index", config=rag_config)
+        try:
+            indexer.load()
+        except (OSError, ValueError, KeyError, RuntimeError) as e:
+            logger.info(f"Failed to load existing index: {e}")
+            return None
+
+        chunker = CodeChunker(rag_config)
+        chunks = chunker.chunk_codebase(project_root, paths=change_set.existing)
+
+        if chunks:
+            embedder = Embedder(rag_config, remote_cache=remote_cache)
+            if embedder.embedding_dim != indexer.embedding_dim:
+                logger.info("Embedding dimension differs from the existing index")
+                return None
+            embeddings = embedder.embed_batch([chunk["text"] for chunk in chunks], batch_size=32)
+        else:
+            embeddings = np.empty((0, indexer.embedding_dim), dtype=np.float32)
+
+        indexer.update_files(change_set.paths, embeddings, chunks)
+        indexer.save()
+
+        logger.info(f"✓ Updated index: {len(change_set.paths)} changed files, {len(chunks)} chunks")
+        return 0
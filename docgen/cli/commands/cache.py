@@ -0,0 +1,246 @@
+"""
+Cache command - Inspect and maintain the parser cache
+"""
+
+from argparse import Namespace
+from pathlib import Path
+from typing import Any
+
+from ...utils.cache import CacheManager
+from ...utils.logger import get_logger
+from .base import BaseCommand
+
+logger = get_logger("docgen")
+
+
+# 出力先を指定しない場合のキャッシュバンドルのパス（プロジェクトルートからの相対パス）
+DEFAULT_BUNDLE_PATH = Path("docgen") / ".cache" / "cache-bundle.tar.gz"
+# 保存先を指定しない場合のリモートキャッシュのサーバーの保存先（プロジェクトルートからの相対パス）
+DEFAULT_SERVER_DIR = Path("docgen") / ".cache" / "remote"
+
+
+class CacheCommand(BaseCommand):
+    """パーサーキャッシュの管理コマンド（stats, gc, clear, export, import, warm, serve）"""
+
+    def execute(self, args: Namespace, project_root: Path) -> int:
+        """
+        Handle parser cache actions
+
+        Args:
+            args: Command line arguments
+            project_root: Project root directory
+
+        Returns:
+            Exit code (0 for success, 1 for failure)
+        """
+        action = getattr(args, "cache_action", None) or "stats"
+        if action == "serve":
+            # サーバーはプロジェクトのキャッシュを使用しないため、設定によらず起動できる
+            return self._handle_serve(args, project_root)
+
+        from ... import DocGen
+
+        docgen = DocGen(project_root=project_root, config_path=getattr(args, "config", None))
+        config = docgen.config
+        if not config.get("cache", {}).get("enabled", True):
+            print("キャッシュは無効です（cache.enabled = false）")
+            return 0
+
+        cache_manager = CacheManager.from_config(project_root, config)
+        try:
+            if action in ("export", "import"):
+                bundle = getattr(args, "bundle", None) or project_root / DEFAULT_BUNDLE_PATH
+                if action == "export":
+                    return self._handle_export(cache_manager, project_root, bundle)
+                return self._handle_import(
+                    cache_manager, project_root, bundle, getattr(args, "overwrite_index", False)
+                )
+            elif action == "warm":
+                return self._handle_warm(
+                    docgen, cache_manager, project_root, not getattr(args, "no_rag", False)
+                )
+            elif action == "stats":
+                return self._handle_stats(cache_manager)
+            elif action == "gc":
+                return self._handle_gc(cache_manager, project_root, config)
+            elif action == "clear":
+                cache_manager.clear_cache()
+                print(f"キャッシュをクリアしました: {cache_manager.cache_file}")
+                return 0
+            else:
+                logger.error(f"Unknown action: {action}")
+                return 1
+        finally:
+            cache_manager.close()
+
+    def _handle_serve(self, args: Namespace, project_root: Path) -> int:
+        """Handle 'serve' action: リモートキャッシュの参照実装サーバーを起動"""
+        import os
+
+        from ...utils.cache_server import CacheServer
+
+        storage_dir = getattr(args, "dir", None) or project_root / DEFAULT_SERVER_DIR
+        token_env = getattr(args, "token_env", None)
+        try:
+            server = CacheServer(
+                storage_dir,
+                host=args.host,
+                port=args.port,
+                token=os.environ.get(token_env) if token_env else None,
+            )
+        except OSError as e:
+            logger.error(f"リモートキャッシュのサーバーを起動できませんでした: {e}")
+            return 1
+
+        print(f"Serving remote cache at {server.url} (storage: {storage_dir})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+        return 0
+
+    def _handle_stats(self, cache_manager: CacheManager) -> int:
+        """Handle 'stats' action"""
+        stats = cache_manager.get_cache_stats()
+        print("\nParser cache:")
+        print(f"  File: {stats['cache_file_path']} ({_format_bytes(stats['cache_file_size'])})")
+        print(f"  Backend: {stats['backend']}")
+        print(f"  Verify: {stats['verify']} ({stats['hash_algorithm']})")
+        print("-" * 40)
+        print(f"  Path entries: {stats['total_entries']:,}")
+        print(f"  Results: {stats['total_results']:,} ({_format_bytes(stats['result_bytes'])})")
+        print(f"  Failed parses: {stats['error_results']:,}")
+        max_entries = stats["max_entries"]
+        max_size_mb = stats["max_size_mb"]
+        print(
+            f"  Limits: {f'{max_entries:,} results' if max_entries else 'unlimited'}, "
+            f"{f'{max_size_mb} MB' if max_size_mb else 'unlimited'}"
+        )
+        print("-" * 40)
+        return 0
+
+    def _handle_gc(
+        self, cache_manager: CacheManager, project_root: Path, config: dict[str, Any]
+    ) -> int:
+        """Handle 'gc' action"""
+        from ...utils.scan_session import ScanSession
+
+        files = ScanSession(project_root, config).scanner.get_all_files()
+        removed = cache_manager.gc(live_paths={rel_path.as_posix() for _, rel_path in files})
+        print(
+            f"Removed {removed['paths']:,} path entries, {removed['results']:,} unreferenced "
+            f"results and {removed['evicted']:,} results over the limits"
+        )
+        return 0
+
+    def _handle_export(self, cache_manager: CacheManager, project_root: Path, bundle: Path) -> int:
+        """Handle 'export' action"""
+        from ...rag.embedder import EMBEDDING_CACHE_DIR
+        from ...utils.cache_bundle import export_bundle
+
+        counts = export_bundle(
+            bundle,
+            cache_manager,
+            embeddings_dir=EMBEDDING_CACHE_DIR,
+            index_dir=project_root / "docgen" / "index",
+        )
+        print(
+            f"Exported {counts['results']:,} parser results, {counts['embeddings']:,} embeddings "
+            f"and {counts['index_files']:,} index files to {bundle}"
+        )
+        return 0
+
+    def _handle_import(
+        self, cache_manager: CacheManager, project_root: Path, bundle: Path, overwrite_index: bool
+    ) -> int:
+        """Handle 'import' action"""
+        from ...rag.embedder import EMBEDDING_CACHE_DIR
+        from ...utils.cache_bundle import import_bundle
+        from ...utils.exceptions import CacheError
+
+        try:
+            counts = import_bundle(
+                bundle,
+                cache_manager,
+                embeddings_dir=EMBEDDING_CACHE_DIR,
+                index_dir=project_root / "docgen" / "index",
+                overwrite_index=overwrite_index,
+            )
+        except CacheError as e:
+            logger.error(str(e))
+            return 1
+        print(
+            f"Imported {counts['paths']:,} path entries, {counts['results']:,} parser results, "
+            f"{counts['embeddings']:,} embeddings and {counts['index_files']:,} index files"
+        )
+        return 0
+
+    def _handle_warm(
+        self, docgen: Any, cache_manager: CacheManager, project_root: Path, include_rag: bool
+    ) -> int:
+        """Handle 'warm' action: APIの解析とRAGの埋め込み・インデックス構築を並列に実行"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ...document_generator import DocumentGenerator
+        from ...generators.api_generator import APIGenerator
+        from ...models.project import ProjectInfo
+        from ...utils.scan_session import ScanSession
+
+        config = docgen.config
+        scan_session = ScanSession(project_root, config)
+        scan_session.scan()
+        languages = docgen.detect_languages(scan_session=scan_session)
+        if not languages:
+            logger.warning("サポートされている言語が検出されませんでした")
+            return 1
+
+        api_generator = APIGenerator(
+            project_root,
+            [lang.name for lang in languages],
+            config,
+            docgen.detected_package_managers,
+            cache_manager=cache_manager,
+            scan_session=scan_session,
+        )
+        tasks: dict[str, Any] = {"parser": lambda: api_generator._generate_markdown(ProjectInfo())}
+        if include_rag and config.get("rag", {}).get("enabled", False):
+            document_generator = DocumentGenerator(
+                project_root,
+                languages,
+                config,
+                docgen.detected_package_managers,
+                scan_session=scan_session,
+            )
+            tasks["rag"] = document_generator._handle_rag_generation
+
+        # 解析（スレッドプール）と埋め込み（モデルの推論）は独立しているため同時に実行する
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
+
+        failed = []
+        for name, future in futures.items():
+            try:
+                # RAGインデックスの構築は失敗・スキップした場合にFalseを返す
+                if future.result() is False:
+                    failed.append(name)
+            except Exception as e:
+                logger.error(f"Failed to warm {name} cache: {e}", exc_info=True)
+                failed.append(name)
+
+        stats = cache_manager.get_cache_stats()
+        print(
+            f"Warmed parser cache: {stats['total_entries']:,} path entries, "
+            f"{stats['total_results']:,} results"
+        )
+        if "rag" in futures and "rag" not in failed:
+            print("Built RAG index and embedding cache")
+        return 1 if failed else 0
+
+
+def _format_bytes(size: int) -> str:
+    """バイト数を読みやすい形式に変換"""
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
@@ -4,10 +4,15 @@ Generate command - Generate documentation
 
 from argparse import Namespace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from ...utils.change_set import ChangeSetError, load_change_set, select_targets
 from ...utils.logger import get_logger
 from .base import BaseCommand
 
+if TYPE_CHECKING:
+    from ...docgen import DocGen
+
 logger = get_logger("docgen")
 
 
@@ -53,8 +58,46 @@ class GenerateCommand(BaseCommand):
         if config_updates:
             docgen.update_config(config_updates)
 
+        # Incremental run based on changed files
+        since = getattr(args, "since", None)
+        staged = getattr(args, "staged", False)
+        if since or staged:
+            return self._generate_changed(docgen, since, staged)
+
         # Generate documents
         if docgen.generate_documents():
             return 0
         else:
             return 1
+
+    @staticmethod
+    def _generate_changed(docgen: "DocGen", since: str | None, staged: bool) -> int:
+        """
+        変更ファイルのみを処理し、入力が変わったドキュメントのみ再生成
+
+        Args:
+            docgen: DocGenインスタンス
+            since: 比較するリビジョン
+            staged: ステージされた変更を対象にするかどうか
+
+        Returns:
+            Exit code (0 for success, 1 for failure)
+        """
+        try:
+            change_set = load_change_set(docgen.project_root, since=since, staged=staged)
+        except ChangeSetError as e:
+            logger.error(f"変更ファイルを取得できませんでした: {e}")
+            return 1
+
+        if change_set.is_empty():
+            logger.info("変更されたファイルがないため、ドキュメント生成をスキップします")
+            return 0
+
+        targets = select_targets(change_set.to_file_changes())
+        target_label = "すべて" if targets is None else ", ".join(sorted(targets))
+        logger.info(f"{len(change_set.paths)} 件の変更ファイル（再生成: {target_label}）")
+
+        if docgen.generate_documents(targets=targets, change_set=change_set):
+            return 0
+        else:
+            return 1
@@ -0,0 +1,197 @@
+"""
+Watch command - Regenerate documentation on file changes
+"""
+
+from argparse import Namespace
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+from ...utils.change_set import select_targets
+from ...utils.file_scanner import UnifiedFileScanner
+from ...utils.file_watcher import (
+    OVERFLOW,
+    FileChange,
+    FileWatcher,
+    collect_changes,
+    create_watcher,
+)
+from ...utils.logger import get_logger
+from .base import BaseCommand
+
+if TYPE_CHECKING:
+    from ...docgen import DocGen
+    from ...utils.warm_state import WarmState
+
+logger = get_logger("docgen")
+
+# 生成物・内部データのディレクトリ（変更を監視しても再生成のきっかけにしない）
+_INTERNAL_PREFIXES = ("docgen/index/",)
+
+
+class WatchCommand(BaseCommand):
+    """ファイル変更を監視してドキュメントを再生成するコマンド
+
+    設定・走査結果・パーサーキャッシュ・埋め込みモデルをプロセス内に保持し、
+    変更ごとのコールドスタートを避けます。
+    """
+
+    def execute(self, args: Namespace, project_root: Path) -> int:
+        """
+        Watch the project and regenerate documentation
+
+        Args:
+            args: Command line arguments
+            project_root: Project root directory
+
+        Returns:
+            Exit code (0 for success, 1 for failure)
+        """
+        config_path = getattr(args, "config", None)
+        docgen, warm_state = self._load(project_root, config_path)
+
+        logger.info("初回のドキュメント生成を実行しています...")
+        start = time.monotonic()
+        docgen.generate_documents(warm_state=warm_state)
+        logger.info(f"初回のドキュメント生成が完了しました（{_ms(time.monotonic() - start)} ms）")
+
+        watcher = self._create_watcher(args, docgen, warm_state)
+        logger.info(f"変更を監視しています（{watcher.backend}、Ctrl+Cで終了）: {project_root}")
+
+        try:
+            while True:
+                debounce = self._watch_setting(args, docgen.config, "debounce_ms", 300) / 1000
+                changes = collect_changes(watcher, debounce)
+                relevant = [c for c in changes if not self._is_generated(docgen, c.rel_path)]
+                if not relevant:
+                    continue
+
+                if self._requires_reload(docgen, relevant):
+                    logger.info("設定または.gitignoreが変更されたため、状態を再読み込みします")
+                    docgen, warm_state = self._load(project_root, config_path)
+                    watcher.close()
+                    watcher = self._create_watcher(args, docgen, warm_state)
+                    targets = None
+                else:
+                    warm_state.refresh()
+                    targets = select_targets(relevant)
+                    if targets is not None and not targets:
+                        continue
+
+                self._regenerate(docgen, warm_state, relevant, targets)
+        except KeyboardInterrupt:
+            logger.info("監視を終了します")
+        finally:
+            watcher.close()
+        return 0
+
+    def _load(self, project_root: Path, config_path: Path | None) -> tuple["DocGen", "WarmState"]:
+        """設定を読み込み、実行間で共有する状態を作成"""
+        from ... import DocGen
+        from ...utils.warm_state import WarmState
+
+        docgen = DocGen(project_root=project_root, config_path=config_path)
+        # 変更のないディレクトリは再列挙しない
+        if not docgen.config.get("scan", {}).get("snapshot", False):
+            docgen.update_config({"scan.snapshot": True})
+        return docgen, WarmState(docgen.project_root, docgen.config)
+
+    def _create_watcher(
+        self, args: Namespace, docgen: "DocGen", warm_state: "WarmState"
+    ) -> FileWatcher:
+        """走査と同じ除外設定でウォッチャーを作成"""
+        scanner: UnifiedFileScanner = warm_state.scan_session.scanner
+        backend = (
+            "polling"
+            if getattr(args, "polling", False)
+            else docgen.config.get("watch", {}).get("backend", "auto")
+        )
+        poll_interval = docgen.config.get("watch", {}).get("poll_interval_ms", 1000) / 1000
+        return create_watcher(
+            str(docgen.project_root),
+            prune_dir=scanner.is_excluded_dir,
+            skip_file=scanner.is_excluded_file,
+            backend=backend,
+            poll_interval=poll_interval,
+        )
+
+    @staticmethod
+    def _watch_setting(args: Namespace, config: dict[str, Any], key: str, default: Any) -> Any:
+        """コマンドライン引数を優先して監視設定を取得"""
+        value = getattr(args, key, None)
+        if value is not None:
+            return value
+        return config.get("watch", {}).get(key, default)
+
+    @staticmethod
+    def _output_paths(docgen: "DocGen") -> set[str]:
+        """生成されるドキュメントのプロジェクトルートからの相対パス"""
+        output_config = docgen.config.get("output", {})
+        outputs = {
+            output_config.get("api_doc", "docs/api.md"),
+            output_config.get("readme", "README.md"),
+            output_config.get("agents_doc", "AGENTS.md"),
+            output_config.get("contributing", "CONTRIBUTING.md"),
+        }
+        result = set()
+        for output in outputs:
+            path = Path(output)
+            if path.is_absolute():
+                try:
+                    path = path.resolve().relative_to(docgen.project_root)
+                except ValueError:
+                    continue
+            result.add(path.as_posix())
+        return result
+
+    def _is_generated(self, docgen: "DocGen", rel_path: str) -> bool:
+        """生成物・内部データの変更かどうか（自身の書き込みで再生成がループしないようにする）"""
+        if rel_path in self._output_paths(docgen) or rel_path.startswith(_INTERNAL_PREFIXES):
+            return True
+        # アーキテクチャ図はREADME・AGENTS.mdの生成時に出力される
+        arch_dir = docgen.config.get("architecture", {}).get("output_dir", "docs/architecture")
+        return rel_path.startswith(f"{arch_dir.strip('/')}/")
+
+    @staticmethod
+    def _requires_reload(docgen: "DocGen", changes: list[FileChange]) -> bool:
+        """設定ファイル・.gitignoreの変更、またはイベントの取りこぼしがあるかどうか"""
+        try:
+            config_rel = Path(docgen.config_path).resolve().relative_to(docgen.project_root)
+        except ValueError:
+            config_rel = None
+        config_rel_str = config_rel.as_posix() if config_rel is not None else None
+
+        for change in changes:
+            if change.kind == OVERFLOW:
+                return True
+            if change.rel_path == config_rel_str:
+                return True
+            if change.rel_path.rpartition("/")[2] == ".gitignore":
+                return True
+        return False
+
+    @staticmethod
+    def _regenerate(
+        docgen: "DocGen",
+        warm_state: "WarmState",
+        changes: list[FileChange],
+        targets: set[str] | None,
+    ) -> None:
+        """ドキュメントを再生成して、変更検知から更新完了までの時間を記録"""
+        target_label = "すべて" if targets is None else ", ".join(sorted(targets))
+        logger.info(f"{len(changes)} 件の変更を検知しました（再生成: {target_label}）")
+
+        generation_start = time.monotonic()
+        success = docgen.generate_documents(targets=targets, warm_state=warm_state)
+        finished = time.monotonic()
+
+        latency = finished - min(change.timestamp for change in changes)
+        status = "✓ ドキュメントを更新しました" if success else "✗ ドキュメントの更新に失敗しました"
+        logger.info(
+            f"{status}（変更から更新まで {_ms(latency)} ms、"
+            f"うち生成 {_ms(finished - generation_start)} ms）"
+        )
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}"
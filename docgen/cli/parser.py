@@ -33,6 +33,14 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument("--no-api-doc", action="store_true", help="APIドキュメントを生成しない")
     parser.add_argument("--no-readme", action="store_true", help="READMEを更新しない")
 
+    # Incremental run options
+    parser.add_argument(
+        "--since",
+        metavar="REV",
+        help="指定したリビジョンから変更されたファイルのみ処理（例: HEAD~1、origin/main）",
+    )
+    parser.add_argument("--staged", action="store_true", help="ステージされた変更ファイルのみ処理")
+
     # RAG options
     parser.add_argument("--build-index", action="store_true", help="RAGインデックスをビルド")
     parser.add_argument("--use-rag", action="store_true", help="RAGを使用してドキュメント生成")
@@ -103,4 +111,72 @@ def create_parser() -> argparse.ArgumentParser:
         help="2つのベンチマーク結果を比較（JSONファイルのパスを2つ指定）",
     )
 
+    # watch subcommand
+    watch_parser = subparsers.add_parser(
+        "watch", help="ファイル変更を監視してドキュメントを自動再生成"
+    )
+    watch_parser.add_argument(
+        "--debounce-ms",
+        type=int,
+        help="変更が途絶えてから再生成するまでの待ち時間（ミリ秒、デフォルト: 設定値）",
+    )
+    watch_parser.add_argument(
+        "--polling", action="store_true", help="inotifyを使用せずポーリングで監視"
+    )
+
+    # cache subcommand
+    cache_parser = subparsers.add_parser("cache", help="パーサーキャッシュの管理")
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_action", help="アクション")
+    cache_subparsers.add_parser("stats", help="キャッシュの統計情報を表示")
+    cache_subparsers.add_parser(
+        "gc", help="存在しないファイルのエントリと参照されていない解析結果を削除"
+    )
+    cache_subparsers.add_parser("clear", help="キャッシュをすべて削除")
+    export_parser = cache_subparsers.add_parser(
+        "export", help="パーサーキャッシュ・埋め込み・RAGインデックスをバンドルに出力"
+    )
+    export_parser.add_argument(
+        "bundle",
+        nargs="?",
+        type=Path,
+        help="出力するアーカイブのパス（デフォルト: docgen/.cache/cache-bundle.tar.gz）",
+    )
+    import_parser = cache_subparsers.add_parser(
+        "import", help="バンドルからキャッシュを取り込む（既存のエントリは上書きしない）"
+    )
+    import_parser.add_argument(
+        "bundle",
+        nargs="?",
+        type=Path,
+        help="取り込むアーカイブのパス（デフォルト: docgen/.cache/cache-bundle.tar.gz）",
+    )
+    import_parser.add_argument(
+        "--overwrite-index", action="store_true", help="既存のRAGインデックスを置き換える"
+    )
+    warm_parser = cache_subparsers.add_parser(
+        "warm", help="すべてのファイルを解析・埋め込みしてキャッシュを作成"
+    )
+    warm_parser.add_argument(
+        "--no-rag", action="store_true", help="埋め込み・RAGインデックスを作成しない"
+    )
+    serve_parser = cache_subparsers.add_parser(
+        "serve", help="チームで共有するリモートキャッシュのサーバーを起動"
+    )
+    serve_parser.add_argument(
+        "--host", default="127.0.0.1", help="待ち受けるホスト（デフォルト: 127.0.0.1）"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=8765, help="待ち受けるポート（デフォルト: 8765）"
+    )
+    serve_parser.add_argument(
+        "--dir",
+        type=Path,
+        help="値を保存するディレクトリ（デフォルト: docgen/.cache/remote）",
+    )
+    serve_parser.add_argument(
+        "--token-env",
+        default="DOCGEN_CACHE_TOKEN",
+        help="認証トークンを読み込む環境変数（未設定の場合は認証なし）",
+    )
+
     return parser
@@ -10,9 +10,11 @@ from .commands import (
     BaseCommand,
     BenchmarkCommand,
     BuildIndexCommand,
+    CacheCommand,
     GenerateCommand,
     HooksCommand,
     InitCommand,
+    WatchCommand,
 )
 
 logger = get_logger("docgen.cli")
@@ -29,6 +31,8 @@ class CommandRunner:
             "build-index": BuildIndexCommand,
             "hooks": HooksCommand,
             "benchmark": BenchmarkCommand,
+            "watch": WatchCommand,
+            "cache": CacheCommand,
             "commit-msg": self._create_commit_msg_handler(),
             "arch": self._create_arch_handler(),
         }
@@ -4,12 +4,15 @@
 """
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..models.project import ProjectInfo
 from ..utils.logger import get_logger
 from .collector_utils import BuildCommandCollector
 
+if TYPE_CHECKING:
+    from ..utils.scan_session import ScanSession
+
 
 class ProjectInfoCollector:
     """プロジェクト情報収集クラス
@@ -26,6 +29,7 @@ class ProjectInfoCollector:
         package_managers: dict[str, str] | None = None,
         logger: Any | None = None,
         exclude_directories: list[str] | None = None,
+        scan_session: "ScanSession | None" = None,
     ):
         """
         初期化
@@ -35,6 +39,7 @@ class ProjectInfoCollector:
             package_managers: 言語ごとのパッケージマネージャ辞書
             logger: ロガーインスタンス
             exclude_directories: 除外するディレクトリのリスト
+            scan_session: 実行中に共有する走査セッション（構造分析で使用）
         """
         self.project_root: Path = project_root
         self.package_managers = package_managers or {}
@@ -54,7 +59,10 @@ class ProjectInfoCollector:
         )
         self.coding_standards_collector = CodingStandardsCollector(project_root, logger=self.logger)
         self.structure_analyzer = StructureAnalyzer(
-            project_root, logger=self.logger, exclude_directories=exclude_directories
+            project_root,
+            logger=self.logger,
+            exclude_directories=exclude_directories,
+            scan_session=scan_session,
         )
         self.language_info_collector = LanguageInfoCollector(project_root, logger=self.logger)
 
@@ -7,10 +7,13 @@
 
 import ast
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .base_collector import BaseCollector
 
+if TYPE_CHECKING:
+    from ..utils.scan_session import ScanSession
+
 
 class StructureAnalyzer(BaseCollector[dict[str, Any]]):
     """プロジェクト構造分析クラス"""
@@ -53,6 +56,7 @@ class StructureAnalyzer(BaseCollector[dict[str, Any]]):
         project_root: Path,
         logger: Any | None = None,
         exclude_directories: list[str] | None = None,
+        scan_session: "ScanSession | None" = None,
     ):
         """
         初期化
@@ -61,8 +65,10 @@ class StructureAnalyzer(BaseCollector[dict[str, Any]]):
             project_root: プロジェクトのルートディレクトリ
             logger: ロガーインスタンス
             exclude_directories: 除外するディレクトリのリスト（追加分）
+            scan_session: 走査セッション（指定された場合はディレクトリの列挙に走査結果を再利用）
         """
         super().__init__(project_root, logger)
+        self.scan_session = scan_session
         # カスタム除外ディレクトリをデフォルトに追加
         self.ignore_dirs = self.DEFAULT_IGNORE_DIRS.copy()
         if exclude_directories:
@@ -91,6 +97,11 @@ class StructureAnalyzer(BaseCollector[dict[str, Any]]):
             シンボル数（クラス、関数、非同期関数の合計）
         """
         try:
+            # 走査セッションがある場合はAPI解析・チャンク化とパース結果を共有する
+            if self.scan_session is not None:
+                module = self.scan_session.modules.get(file_path)
+                assert module is not None
+                return len(module.definitions)
             content = file_path.read_text(encoding="utf-8")
             tree = ast.parse(content)
             return len(
@@ -103,6 +114,40 @@ class StructureAnalyzer(BaseCollector[dict[str, Any]]):
         except Exception:
             return 0
 
+    def _list_directory(self, directory: Path) -> tuple[list[str], list[str]]:
+        """
+        ディレクトリ直下のサブディレクトリ名とファイル名を名前順で取得
+
+        Args:
+            directory: 対象ディレクトリ
+
+        Returns:
+            (サブディレクトリ名のリスト, ファイル名のリスト)
+        """
+        if self.scan_session is not None:
+            rel_dir = self.scan_session.relative_dir(directory)
+            if rel_dir is not None:
+                dirs, files = self.scan_session.list_dir(rel_dir)
+                return sorted(dirs), sorted(files)
+
+        dirs = []
+        files = []
+        for item in directory.iterdir():
+            if item.is_dir():
+                dirs.append(item.name)
+            elif item.is_file():
+                files.append(item.name)
+
+        return sorted(dirs), sorted(files)
+
+    def _is_structure_file(self, file_path: Path) -> bool:
+        """構造に含めるファイルかどうかを判定"""
+        if file_path.suffix == ".py":
+            # Pythonファイルはシンボル数をチェック（重要なファイルのみ）
+            return self.count_symbols_in_file(file_path) > 5
+        # 設定・ドキュメントファイル
+        return file_path.suffix in self.CONFIG_EXTENSIONS
+
     def collect_directory_structure(
         self, directory: Path, max_depth: int = 3, current_depth: int = 0
     ) -> dict[str, Any] | str:
@@ -131,34 +176,29 @@ class StructureAnalyzer(BaseCollector[dict[str, Any]]):
         result = {}
 
         try:
-            items = sorted(directory.iterdir(), key=lambda x: (not x.is_dir(), x.name))
+            dir_names, file_names = self._list_directory(directory)
 
-            for item in items:
+            for name in dir_names:
                 # exclude設定を最優先でチェック
-                if item.name in self.ignore_dirs or item.name.startswith("."):
+                if name in self.ignore_dirs or name.startswith("."):
                     continue
 
-                if item.is_dir():
-                    # ネストしないディレクトリかチェック（exclude設定の後でチェック）
-                    if item.name in self.NO_NEST_DIRS:
-                        result[f"{item.name}/"] = "directory"
-                    else:
-                        # ディレクトリの場合は再帰的に処理
-                        subdir_structure = self.collect_directory_structure(
-                            item, max_depth, current_depth + 1
-                        )
-                        if subdir_structure:
-                            result[f"{item.name}/"] = subdir_structure  # type: ignore[assignment]
-                elif item.is_file():
-                    # ファイルの場合
-                    if item.suffix == ".py":
-                        # Pythonファイルはシンボル数をチェック
-                        symbol_count = self.count_symbols_in_file(item)
-                        if symbol_count > 5:  # 重要なファイルのみ
-                            result[item.name] = "file"
-                    elif item.suffix in self.CONFIG_EXTENSIONS:
-                        # 設定・ドキュメントファイル
-                        result[item.name] = "file"
+                # ネストしないディレクトリかチェック（exclude設定の後でチェック）
+                if name in self.NO_NEST_DIRS:
+                    result[f"{name}/"] = "directory"
+                else:
+                    # ディレクトリの場合は再帰的に処理
+                    subdir_structure = self.collect_directory_structure(
+                        directory / name, max_depth, current_depth + 1
+                    )
+                    if subdir_structure:
+                        result[f"{name}/"] = subdir_structure  # type: ignore[assignment]
+
+            for name in file_names:
+                if name.startswith("."):
+                    continue
+                if self._is_structure_file(directory / name):
+                    result[name] = "file"
 
         except Exception as e:
             self.logger.debug(f"Failed to collect directory structure for {directory}: {e}")
@@ -178,31 +218,30 @@ class StructureAnalyzer(BaseCollector[dict[str, Any]]):
         structure = {}
 
         try:
-            items = sorted(self.project_root.iterdir(), key=lambda x: (not x.is_dir(), x.name))
+            dir_names, file_names = self._list_directory(self.project_root)
 
-            for item in items:
+            for name in dir_names:
                 # exclude設定を最優先でチェック
-                if item.name in self.ignore_dirs or item.name.startswith("."):
+                if name in self.ignore_dirs or name.startswith("."):
                     continue
 
-                if item.is_dir():
-                    # ネストしないディレクトリかチェック（exclude設定の後でチェック）
-                    if item.name in self.NO_NEST_DIRS:
-                        structure[f"{item.name}/"] = "directory"
-                    else:
-                        # ディレクトリの場合
-                        dir_structure = self.collect_directory_structure(item, max_depth=max_depth)
-                        if dir_structure:
-                            structure[f"{item.name}/"] = dir_structure  # type: ignore[assignment]
-
-                elif item.is_file():
-                    # ルートのファイル
-                    if item.suffix == ".py":
-                        symbol_count = self.count_symbols_in_file(item)
-                        if symbol_count > 5:
-                            structure[item.name] = "file"
-                    elif item.suffix in self.CONFIG_EXTENSIONS:
-                        structure[item.name] = "file"
+                # ネストしないディレクトリかチェック（exclude設定の後でチェック）
+                if name in self.NO_NEST_DIRS:
+                    structure[f"{name}/"] = "directory"
+                else:
+                    # ディレクトリの場合
+                    dir_structure = self.collect_directory_structure(
+                        self.project_root / name, max_depth=max_depth
+                    )
+                    if dir_structure:
+                        structure[f"{name}/"] = dir_structure  # type: ignore[assignment]
+
+            # ルートのファイル
+            for name in file_names:
+                if name.startswith("."):
+                    continue
+                if self._is_structure_file(self.project_root / name):
+                    structure[name] = "file"
 
         except Exception as e:
             self.logger.warning(f"Failed to collect project structure: {e}")
@@ -15,6 +15,9 @@ class ConfigKeys:
     OUTPUT = "output"
     RAG = "rag"
     CACHE = "cache"
+    SCAN = "scan"
+    PARSE = "parse"
+    WATCH = "watch"
     DEBUG = "debug"
     AGENTS = "agents"
     ARCHITECTURE = "architecture"
@@ -125,6 +128,11 @@ class ConfigAccessor:
     def rag_retrieval(self) -> dict[str, Any]:
         return self.rag.get("retrieval", {})
 
+    @property
+    def rag_max_file_bytes(self) -> int:
+        """これより大きいファイルは先頭のみチャンク化する（0は無制限）"""
+        return self.rag.get("max_file_bytes", 1048576)
+
     # ─────────────────────────────────────────────────────────────────
     # Cache Settings
     # ─────────────────────────────────────────────────────────────────
@@ -136,6 +144,117 @@ class ConfigAccessor:
     def cache_enabled(self) -> bool:
         return self.cache.get("enabled", True)
 
+    @property
+    def cache_backend(self) -> str:
+        """パーサーキャッシュの保存形式（"json", "sqlite"）"""
+        return self.cache.get("backend", "json")
+
+    @property
+    def cache_verify(self) -> str:
+        """キャッシュの検証方法（"stat", "hash"）"""
+        return self.cache.get("verify", "stat")
+
+    @property
+    def cache_hash_algorithm(self) -> str:
+        """キャッシュの内容のハッシュのアルゴリズム（"auto", "xxhash", "blake2b", "sha256"）"""
+        return self.cache.get("hash_algorithm", "auto")
+
+    @property
+    def cache_max_entries(self) -> int:
+        """キャッシュする解析結果の件数の上限（0の場合は無制限）"""
+        return self.cache.get("max_entries", 100000)
+
+    @property
+    def cache_max_size_mb(self) -> int:
+        """キャッシュする解析結果の合計サイズの上限（MB、0の場合は無制限）"""
+        return self.cache.get("max_size_mb", 256)
+
+    @property
+    def cache_remote(self) -> dict[str, Any]:
+        """リモートキャッシュの設定（url, timeout, batch_size, token_env, read_only）"""
+        return self.cache.get("remote", {})
+
+    # ─────────────────────────────────────────────────────────────────
+    # Scan Settings
+    # ─────────────────────────────────────────────────────────────────
+    @property
+    def scan(self) -> dict[str, Any]:
+        return self._config.get(ConfigKeys.SCAN, {})
+
+    @property
+    def scan_snapshot(self) -> bool:
+        """ディレクトリスナップショットを使用するかどうか"""
+        return self.scan.get("snapshot", False)
+
+    @property
+    def scan_backend(self) -> str:
+        """ファイル列挙のバックエンド（"walk" または "git_index"）"""
+        return self.scan.get("backend", "walk")
+
+    @property
+    def scan_untracked(self) -> bool:
+        """git_indexバックエンドで未追跡ファイルも含めるかどうか"""
+        return self.scan.get("untracked", True)
+
+    @property
+    def scan_workers(self) -> int:
+        """ディレクトリを並列に列挙するスレッド数"""
+        return self.scan.get("workers", 1)
+
+    # ─────────────────────────────────────────────────────────────────
+    # Parse Settings
+    # ─────────────────────────────────────────────────────────────────
+    @property
+    def parse(self) -> dict[str, Any]:
+        return self._config.get(ConfigKeys.PARSE, {})
+
+    @property
+    def parse_max_file_bytes(self) -> int:
+        """これより大きいファイルは解析しない（0は無制限）"""
+        return self.parse.get("max_file_bytes", 1048576)
+
+    @property
+    def parse_executor(self) -> str:
+        """解析の並列処理の方式（"thread", "process"）"""
+        return self.parse.get("executor", "thread")
+
+    @property
+    def parse_process_min_files(self) -> int:
+        """プロセスプールで解析する解析対象（キャッシュにない）ファイル数の下限"""
+        return self.parse.get("process_min_files", 200)
+
+    @property
+    def parse_backend(self) -> str:
+        """解析のバックエンド（"regex", "tree_sitter"）"""
+        return self.parse.get("backend", "regex")
+
+    @property
+    def parse_file_timeout(self) -> float:
+        """ファイルごとの解析の時間の上限（秒、0は無制限）"""
+        return self.parse.get("file_timeout", 10.0)
+
+    # ─────────────────────────────────────────────────────────────────
+    # Watch Settings
+    # ─────────────────────────────────────────────────────────────────
+    @property
+    def watch(self) -> dict[str, Any]:
+        return self._config.get(ConfigKeys.WATCH, {})
+
+    @property
+    def watch_backend(self) -> str:
+        """ファイル監視のバックエンド（"auto", "inotify", "polling"）"""
+        return self.watch.get("backend", "auto")
+
+    @property
+    def watch_debounce_ms(self) -> int:
+        """変更が途絶えてから再生成するまでの待ち時間（ミリ秒）"""
+        return self.watch.get("debounce_ms", 300)
+
+    @property
+    def watch_poll_interval_ms(self) -> int:
+        """ポーリング時の走査間隔（ミリ秒）"""
+        return self.watch.get("poll_interval_ms", 1000)
+
     # ─────────────────────────────────────────────────────────────────
     # Debug Settings
     # ─────────────────────────────────────────────────────────────────
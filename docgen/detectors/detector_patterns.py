@@ -2,7 +2,10 @@
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..utils.scan_session import ScanSession
 
 
 class DetectorPatterns:
@@ -227,6 +230,56 @@ class DetectorPatterns:
         # キャッシュ機能を使用
         return cls.detect_by_extensions_with_exclusions(project_root, extensions)
 
+    @classmethod
+    def _extension_language_map(cls) -> dict[str, list[str]]:
+        """拡張子 -> 言語のリストの逆引きマップを作成"""
+        ext_to_languages: dict[str, list[str]] = {}
+        for lang, exts in cls.SOURCE_EXTENSIONS.items():
+            for ext in exts:
+                if ext not in ext_to_languages:
+                    ext_to_languages[ext] = []
+                ext_to_languages[ext].append(lang)
+        return ext_to_languages
+
+    @classmethod
+    def prime_from_scan_session(
+        cls,
+        project_root: Path,
+        scan_session: "ScanSession",
+        max_file_size: int = 10 * 1024 * 1024,
+    ) -> dict[str, bool]:
+        """走査セッションの結果から全言語の検出結果を作成してキャッシュに設定
+
+        `_unified_scan_for_all_languages`の代わりに、実行中に共有される走査結果を使用します。
+
+        Args:
+            project_root: 検出器に渡されるプロジェクトルート（キャッシュキー）
+            scan_session: 走査セッション
+            max_file_size: スキップする最大ファイルサイズ（バイト、デフォルト: 10MB）
+
+        Returns:
+            言語名をキー、検出結果を値とする辞書
+        """
+        ext_to_languages = cls._extension_language_map()
+        detected_languages: dict[str, bool] = dict.fromkeys(cls.SOURCE_EXTENSIONS.keys(), False)
+
+        for file_path, _rel_path in scan_session.view(extensions=ext_to_languages):
+            languages = ext_to_languages.get(file_path.suffix.lower(), ())
+            # 検出済みの言語のみのファイルはstatを省略
+            if all(detected_languages[lang] for lang in languages):
+                continue
+            try:
+                if file_path.stat().st_size > max_file_size:
+                    continue
+            except (OSError, PermissionError):
+                continue
+            for lang in languages:
+                detected_languages[lang] = True
+
+        cls._unified_scan_cache[project_root] = detected_languages
+        cls._file_cache.pop(project_root, None)
+        return detected_languages
+
     @classmethod
     def _unified_scan_for_all_languages(cls, project_root: Path) -> dict[str, bool]:
         """一度の走査で全言語を検出（os.walkを使用して高速化）
@@ -242,12 +295,7 @@ class DetectorPatterns:
             return cls._unified_scan_cache[project_root]
 
         # 全言語の拡張子マップを作成（拡張子 -> 言語のリスト）
-        ext_to_languages: dict[str, list[str]] = {}
-        for lang, exts in cls.SOURCE_EXTENSIONS.items():
-            for ext in exts:
-                if ext not in ext_to_languages:
-                    ext_to_languages[ext] = []
-                ext_to_languages[ext].append(lang)
+        ext_to_languages = cls._extension_language_map()
 
         # 検出結果を初期化
         detected_languages: dict[str, bool] = dict.fromkeys(cls.SOURCE_EXTENSIONS.keys(), False)
@@ -322,12 +370,7 @@ class DetectorPatterns:
         unified_results = cls._unified_scan_for_all_languages(project_root)
 
         # 拡張子から言語を逆引き
-        ext_to_languages: dict[str, list[str]] = {}
-        for lang, exts in cls.SOURCE_EXTENSIONS.items():
-            for ext in exts:
-                if ext not in ext_to_languages:
-                    ext_to_languages[ext] = []
-                ext_to_languages[ext].append(lang)
+        ext_to_languages = cls._extension_language_map()
 
         # 指定された拡張子に対応する言語が検出されているかチェック
         result = False
@@ -6,7 +6,7 @@
 
 from pathlib import Path
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # プロジェクトルートのパスを取得
 DOCGEN_DIR = Path(__file__).parent.resolve()
@@ -19,7 +19,13 @@ from .config_manager import ConfigManager
 from .document_generator import DocumentGenerator
 from .language_detector import LanguageDetector
 from .models import DetectedLanguage
+from .utils.file_classifier import summarize_skipped, summarize_slow
 from .utils.logger import get_logger
+from .utils.scan_session import ScanSession
+
+if TYPE_CHECKING:
+    from .utils.change_set import ChangeSet
+    from .utils.warm_state import WarmState
 
 # ロガーの初期化
 logger = get_logger("docgen")
@@ -63,19 +69,24 @@ class DocGen:
         self.detected_languages: list[DetectedLanguage] = []
         self.detected_package_managers: dict[str, Any] = {}
 
-    def detect_languages(self, use_parallel: bool = True) -> list[DetectedLanguage]:
+    def detect_languages(
+        self, use_parallel: bool = True, scan_session: ScanSession | None = None
+    ) -> list[DetectedLanguage]:
         """
         プロジェクトの使用言語を自動検出
 
         Args:
             use_parallel: 並列処理を使用するかどうか（デフォルト: True）
+            scan_session: 走査セッション（Noneの場合は検出器が独自に走査）
 
         Returns:
             検出された言語オブジェクトのリスト
         """
         benchmark_enabled = self.config.get("benchmark", {}).get("enabled", False)
         with BenchmarkContext("言語検出", enabled=benchmark_enabled):
-            self.detected_languages = self.language_detector.detect_languages(use_parallel)
+            self.detected_languages = self.language_detector.detect_languages(
+                use_parallel, scan_session=scan_session
+            )
             self.detected_package_managers = self.language_detector.detected_package_managers
         return self.detected_languages
 
@@ -89,16 +100,35 @@ class DocGen:
         self.config_manager.update_config(updates)
         self.config = self.config_manager.get_config()
 
-    def generate_documents(self) -> bool:
+    def generate_documents(
+        self,
+        targets: set[str] | None = None,
+        warm_state: "WarmState | None" = None,
+        change_set: "ChangeSet | None" = None,
+    ) -> bool:
         """
         ドキュメントを生成
 
+        Args:
+            targets: 生成するドキュメントの種類（"api", "rag", "readme", "agents",
+                "contributing"、Noneの場合は設定で有効なものすべて）
+            warm_state: 実行間で共有する状態（`watch`サブコマンドで使用）
+            change_set: 差分実行の変更ファイル（`--since`・`--staged`で使用）
+
         Returns:
             成功したかどうか
         """
         benchmark_enabled = self.config.get("benchmark", {}).get("enabled", False)
         with BenchmarkContext("ドキュメント生成全体", enabled=benchmark_enabled):
-            self.detect_languages()
+            # プロジェクトツリーは一度だけ走査し、各サブシステムで共有する
+            with BenchmarkContext("プロジェクト走査", enabled=benchmark_enabled):
+                if warm_state is not None:
+                    scan_session = warm_state.scan_session
+                else:
+                    scan_session = ScanSession(self.project_root, self.config)
+                scan_session.scan()
+
+            self.detect_languages(scan_session=scan_session)
             logger.info(f"Detected languages: {[lang.name for lang in self.detected_languages]}")
 
             if not self.detected_languages:
@@ -110,8 +140,21 @@ class DocGen:
                 self.detected_languages,
                 self.config,
                 self.detected_package_managers,
+                scan_session=scan_session,
+                warm_state=warm_state,
+                change_set=change_set,
             )
-            return document_generator.generate_documents()
+            result = document_generator.generate_documents(targets=targets)
+
+            # サイズ・種類によりスキップしたファイルを報告
+            for line in summarize_skipped(scan_session.classifier.get_skipped()):
+                logger.info(line)
+            scan_session.classifier.reset_skipped()
+            # 解析が時間の上限を超えたファイルを報告
+            for line in summarize_slow(scan_session.classifier.get_slow()):
+                logger.warning(line)
+            scan_session.classifier.reset_slow()
+            return result
 
 
 def _check_and_auto_init(project_root: Path) -> int:
@@ -3,13 +3,18 @@
 """
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .benchmark import BenchmarkContext
 from .generator_factory import GeneratorFactory
 from .models import DetectedLanguage
 from .utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from .utils.change_set import ChangeSet
+    from .utils.scan_session import ScanSession
+    from .utils.warm_state import WarmState
+
 logger = get_logger("document_generator")
 
 
@@ -22,6 +27,9 @@ class DocumentGenerator:
         detected_languages: list[DetectedLanguage],
         config: dict[str, Any],
         detected_package_managers: dict[str, str] | None = None,
+        scan_session: "ScanSession | None" = None,
+        warm_state: "WarmState | None" = None,
+        change_set: "ChangeSet | None" = None,
     ):
         """
         初期化
@@ -31,16 +39,25 @@ class DocumentGenerator:
             detected_languages: 検出された言語リスト
             config: 設定辞書
             detected_package_managers: 検出されたパッケージマネージャ辞書
+            scan_session: 実行中に共有する走査セッション（Noneの場合は各処理が独自に走査）
+            warm_state: 実行間で共有する状態（パーサーキャッシュ・埋め込みモデルなどを再利用）
+            change_set: 差分実行の変更ファイル（指定された場合は変更ファイルのみ再解析・再チャンク化）
         """
         self.project_root = project_root
         self.detected_languages = detected_languages
         self.config = config
         self.detected_package_managers = detected_package_managers or {}
+        self.scan_session = scan_session
+        self.warm_state = warm_state
+        self.change_set = change_set
 
-    def generate_documents(self) -> bool:
+    def generate_documents(self, targets: set[str] | None = None) -> bool:
         """
         ドキュメントを生成
 
+        Args:
+            targets: 生成するジェネレーターの種類（Noneの場合は設定で有効なものすべて）
+
         Returns:
             成功したかどうか
         """
@@ -50,6 +67,8 @@ class DocumentGenerator:
 
         benchmark_enabled = self.config.get("benchmark", {}).get("enabled", False)
         generators_to_run = self._determine_generators_to_run()
+        if targets is not None:
+            generators_to_run = [g for g in generators_to_run if g[0] in targets]
         with BenchmarkContext("ドキュメント生成", enabled=benchmark_enabled) as ctx:
             result = self._execute_generators(generators_to_run)
             # 子処理として各ジェネレーターの結果を記録
@@ -98,6 +117,12 @@ class DocumentGenerator:
 
         benchmark_enabled = self.config.get("benchmark", {}).get("enabled", False)
 
+        # 走査セッションが共有されている場合のみジェネレーターに渡す
+        generator_kwargs: dict[str, Any] = {}
+        if self.scan_session is not None:
+            generator_kwargs["scan_session"] = self.scan_session
+        cache_manager = self.warm_state.cache_manager if self.warm_state is not None else None
+
         # 各ジェネレーターを実行
         for gen_type, gen_name in generators_to_run:
             logger.info(f"[{gen_name}生成]")
@@ -113,12 +138,18 @@ class DocumentGenerator:
 
             try:
                 with BenchmarkContext(f"{gen_name}生成", enabled=benchmark_enabled):
+                    kwargs = dict(generator_kwargs)
+                    if gen_type == "api" and cache_manager is not None:
+                        kwargs["cache_manager"] = cache_manager
+                    if gen_type == "api" and self.change_set is not None:
+                        kwargs["change_set"] = self.change_set
                     generator = GeneratorFactory.create_generator(
                         gen_type,
                         self.project_root,
                         [lang.name for lang in self.detected_languages],  # 文字列のリストを渡す
                         self.config,
                         self.detected_package_managers,
+                        **kwargs,
                     )
                     if generator.generate():
                         logger.info(f"✓ {gen_name}を生成しました")
@@ -162,6 +193,7 @@ class DocumentGenerator:
             from .rag.chunker import CodeChunker
             from .rag.embedder import Embedder
             from .rag.indexer import VectorIndexer
+            from .utils.remote_cache import get_remote_cache
         except ImportError as e:
             logger.warning(
                 f"RAGモジュールのインポートに失敗しました: {e}\n"
@@ -172,21 +204,30 @@ class DocumentGenerator:
         # RAG設定を取得
         rag_config = self.config.get("rag", {})
 
+        # 言語ごとのパターンを収集
+        allowed_patterns = []
+        for lang in self.detected_languages:
+            if lang.rag_enabled:
+                allowed_patterns.extend(lang.get_rag_patterns())
+
+        if allowed_patterns:
+            logger.info(f"RAG対象パターン: {allowed_patterns}")
+
+        # 差分実行では既存のインデックスのうち変更ファイルのチャンクのみ置き換える
+        if self.change_set is not None:
+            updated = self._update_vector_index(self.change_set, rag_config, allowed_patterns)
+            if updated is not None:
+                return updated
+            logger.info("既存のインデックスを差分更新できないため、インデックスを再構築します")
+
         # 1. コードベースをチャンク化
         logger.info("Step 1/3: コードベースをチャンク化中...")
         with BenchmarkContext("RAG: チャンク化", enabled=benchmark_enabled):
-            # 言語ごとのパターンを収集
-            allowed_patterns = []
-            for lang in self.detected_languages:
-                if lang.rag_enabled:
-                    allowed_patterns.extend(lang.get_rag_patterns())
-
-            if allowed_patterns:
-                logger.info(f"RAG対象パターン: {allowed_patterns}")
-
             chunker = CodeChunker(rag_config)
             chunks = chunker.chunk_codebase(
-                self.project_root, allowed_patterns=allowed_patterns if allowed_patterns else None
+                self.project_root,
+                allowed_patterns=allowed_patterns if allowed_patterns else None,
+                scan_session=self.scan_session,
             )
 
         if not chunks:
@@ -198,7 +239,12 @@ class DocumentGenerator:
         # 2. 埋め込み生成
         logger.info("Step 2/3: 埋め込みを生成中...")
         with BenchmarkContext("RAG: 埋め込み生成", enabled=benchmark_enabled):
-            embedder = Embedder(rag_config)
+            # ウォームな状態がある場合はモデルを再読み込みしない
+            embedder = (
+                self.warm_state.embedder
+                if self.warm_state
+                else Embedder(rag_config, remote_cache=get_remote_cache(self.config))
+            )
 
             # チャンクのテキストを抽出
             texts = [chunk["text"] for chunk in chunks]
@@ -212,11 +258,14 @@ class DocumentGenerator:
         logger.info("Step 3/3: インデックスを構築中...")
         with BenchmarkContext("RAG: インデックス構築", enabled=benchmark_enabled):
             index_dir = self.project_root / "docgen" / "index"
-            indexer = VectorIndexer(
-                index_dir=index_dir,
-                embedding_dim=embedder.embedding_dim,
-                config=rag_config,
-            )
+            if self.warm_state is not None:
+                indexer = self.warm_state.get_indexer(embedder.embedding_dim)
+            else:
+                indexer = VectorIndexer(
+                    index_dir=index_dir,
+                    embedding_dim=embedder.embedding_dim,
+                    config=rag_config,
+                )
 
             # インデックス構築
             indexer.build(embeddings, chunks)
@@ -231,3 +280,70 @@ class DocumentGenerator:
         logger.info(f"埋め込み次元: {embedder.embedding_dim}")
 
         return True
+
+    def _update_vector_index(
+        self, change_set: "ChangeSet", rag_config: dict[str, Any], allowed_patterns: list[str]
+    ) -> bool | None:
+        """
+        変更ファイルのみ再チャンク化して既存のベクトルインデックスを差分更新
+
+        Args:
+            change_set: 変更ファイル
+            rag_config: RAG設定
+            allowed_patterns: RAG対象のファイルパターン
+
+        Returns:
+            成功したかどうか（既存のインデックスを使用できない場合はNone）
+        """
+        import numpy as np
+
+        from .rag.chunker import CodeChunker
+        from .rag.embedder import Embedder
+        from .rag.indexer import VectorIndexer
+        from .utils.remote_cache import get_remote_cache
+
+        benchmark_enabled = self.config.get("benchmark", {}).get("enabled", False)
+        index_dir = self.project_root / "docgen" / "index"
+
+        indexer = VectorIndexer(index_dir=index_dir, config=rag_config)
+        try:
+            indexer.load()
+        except (OSError, ValueError, KeyError, RuntimeError) as e:
+            logger.info(f"既存のインデックスを読み込めませんでした: {e}")
+            return None
+
+        with BenchmarkContext("RAG: チャンク化（差分）", enabled=benchmark_enabled):
+            chunker = CodeChunker(rag_config)
+            chunks = chunker.chunk_codebase(
+                self.project_root,
+                allowed_patterns=allowed_patterns if allowed_patterns else None,
+                scan_session=self.scan_session,
+                paths=change_set.existing,
+            )
+
+        # 削除のみの場合は埋め込みモデルを読み込まない
+        if chunks:
+            with BenchmarkContext("RAG: 埋め込み生成（差分）", enabled=benchmark_enabled):
+                embedder = (
+                    self.warm_state.embedder
+                    if self.warm_state
+                    else Embedder(rag_config, remote_cache=get_remote_cache(self.config))
+                )
+                if embedder.embedding_dim != indexer.embedding_dim:
+                    logger.info("埋め込みの次元数が既存のインデックスと異なります")
+                    return None
+                embeddings = embedder.embed_batch(
+                    [chunk["text"] for chunk in chunks], batch_size=32
+                )
+        else:
+            embeddings = np.empty((0, indexer.embedding_dim), dtype=np.float32)
+
+        with BenchmarkContext("RAG: インデックス更新", enabled=benchmark_enabled):
+            indexer.update_files(change_set.paths, embeddings, chunks)
+            indexer.save()
+
+        logger.info(
+            f"✓ インデックスを差分更新しました: {len(change_set.paths)} ファイル、"
+            f"{len(chunks)} チャンク"
+        )
+        return True
@@ -1,11 +1,16 @@
 """ジェネレーターファクトリーモジュール"""
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .generators.base_generator import BaseGenerator
 from .utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from .utils.cache import CacheManager
+    from .utils.change_set import ChangeSet
+    from .utils.scan_session import ScanSession
+
 logger = get_logger("generator_factory")
 
 
@@ -28,6 +33,9 @@ class GeneratorFactory:
         detected_languages: list[str],
         config: dict[str, Any],
         detected_package_managers: dict[str, str] | None = None,
+        scan_session: "ScanSession | None" = None,
+        cache_manager: "CacheManager | None" = None,
+        change_set: "ChangeSet | None" = None,
     ) -> BaseGenerator:
         """指定されたタイプのジェネレーターを作成"""
         class_name = cls._generators.get(generator_type)
@@ -47,7 +55,20 @@ class GeneratorFactory:
         else:
             raise ValueError(f"Unknown generator type: {generator_type}")
 
-        return GeneratorClass(project_root, detected_languages, config, detected_package_managers)
+        # 走査セッションは共有される場合のみ渡す（ジェネレーターは未指定時に独自に走査する）
+        kwargs: dict[str, Any] = {}
+        if scan_session is not None:
+            kwargs["scan_session"] = scan_session
+        # パーサーキャッシュはAPIジェネレーターのみが使用する
+        if cache_manager is not None and generator_type == "api":
+            kwargs["cache_manager"] = cache_manager
+        # 差分実行の変更ファイルもAPIジェネレーターのみが使用する
+        if change_set is not None and generator_type == "api":
+            kwargs["change_set"] = change_set
+
+        return GeneratorClass(
+            project_root, detected_languages, config, detected_package_managers, **kwargs
+        )
 
     @classmethod
     def get_available_generators(cls) -> list[str]:
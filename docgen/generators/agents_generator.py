@@ -343,6 +343,7 @@ class AgentsGenerator(BaseGenerator):
                 project_root=self.project_root,
                 languages=self.languages,
                 config=self.config,
+                scan_session=self.scan_session,
             )
         return self._implementation_validator
 
@@ -372,7 +373,9 @@ class AgentsGenerator(BaseGenerator):
             self.logger.debug(f"実装検証モジュールの読み込みに失敗: {e}")
             return ""
         except Exception as e:
-            self.logger.warning(f"実装情報の取得中に予期しないエラーが発生しました: {e}", exc_info=True)
+            self.logger.warning(
+                f"実装情報の取得中に予期しないエラーが発生しました: {e}", exc_info=True
+            )
             return ""
 
     def _generate_content_with_llm(
@@ -498,7 +501,9 @@ class AgentsGenerator(BaseGenerator):
             self.logger.warning(f"ハイブリッド生成（概要改善）中にエラーが発生しました: {e}")
             # エラーが発生してもテンプレート生成されたコンテンツを返す
         except Exception as e:
-            self.logger.warning(f"ハイブリッド生成中に予期しないエラーが発生しました: {e}", exc_info=True)
+            self.logger.warning(
+                f"ハイブリッド生成中に予期しないエラーが発生しました: {e}", exc_info=True
+            )
             # エラーが発生してもテンプレート生成されたコンテンツを返す
 
         return content
@@ -7,18 +7,22 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from ..detectors.detector_patterns import DetectorPatterns
-from ..models.api import APIInfo
+from ..models.api import APIRecord
 from ..models.project import ProjectInfo
 from ..utils.cache import CacheManager
+from ..utils.file_classifier import DEFAULT_MAX_FILE_BYTES
 from ..utils.markdown_utils import (
     GENERATION_TIMESTAMP_LABEL,
     SECTION_SEPARATOR,
     get_current_timestamp,
 )
 from .base_generator import BaseGenerator
+from .parsers.base_parser import DEFAULT_FILE_TIMEOUT, DEFAULT_PROCESS_MIN_FILES
 from .parsers.parser_factory import ParserFactory
 
 if TYPE_CHECKING:
+    from ..utils.change_set import ChangeSet
+    from ..utils.scan_session import ScanSession
     from .parsers.base_parser import BaseParser
 
 
@@ -31,6 +35,9 @@ class APIGenerator(BaseGenerator):
         languages: list[str],
         config: dict[str, Any],
         package_managers: dict[str, str] | None = None,
+        cache_manager: CacheManager | None = None,
+        change_set: "ChangeSet | None" = None,
+        **kwargs: Any,
     ):
         """
         初期化
@@ -40,16 +47,21 @@ class APIGenerator(BaseGenerator):
             languages: 検出された言語のリスト
             config: 設定辞書
             package_managers: 検出されたパッケージマネージャの辞書
+            cache_manager: 共有するキャッシュマネージャー（Noneの場合は新規作成）
+            change_set: 差分実行の変更ファイル（指定された場合は変更ファイルのみ再解析）
+            **kwargs: BaseGeneratorに渡す追加引数（サービス、走査セッションなど）
         """
-        super().__init__(project_root, languages, config, package_managers)
+        super().__init__(project_root, languages, config, package_managers, **kwargs)
 
         # キャッシュマネージャーの初期化
         cache_enabled = self.config.get("cache", {}).get("enabled", True)
-        self.cache_manager = (
-            CacheManager(project_root=self.project_root, enabled=cache_enabled)
-            if cache_enabled
-            else None
-        )
+        if cache_manager is not None:
+            self.cache_manager: CacheManager | None = cache_manager
+        else:
+            self.cache_manager = (
+                CacheManager.from_config(self.project_root, self.config) if cache_enabled else None
+            )
+        self.change_set = change_set
 
     def _get_mode_key(self) -> str:
         return "api_mode"
@@ -119,11 +131,28 @@ class APIGenerator(BaseGenerator):
         for parser in parsers:
             all_extensions.update(parser.get_supported_extensions())
 
+        scanner = self._get_scan_session().scanner
         shared_files_to_parse = self._scan_project_files(
             exclude_dirs=exclude_dirs,
             extensions=all_extensions,
         )
 
+        # 差分実行では変更ファイルのみ再解析し、それ以外はキャッシュから結果を取得する
+        # サイズ・種類の判定は走査結果とともにRAGのチャンク化と共有する
+        parse_config = self.config.get("parse", {})
+        parse_kwargs: dict[str, Any] = {
+            "classifier": scanner.classifier,
+            "max_file_bytes": parse_config.get("max_file_bytes", DEFAULT_MAX_FILE_BYTES),
+            "executor": parse_config.get("executor", "thread"),
+            "process_min_files": parse_config.get("process_min_files", DEFAULT_PROCESS_MIN_FILES),
+            "file_timeout": parse_config.get("file_timeout", DEFAULT_FILE_TIMEOUT),
+        }
+        if self.change_set is not None:
+            parse_kwargs["changed_paths"] = self.change_set.existing
+            if self.cache_manager is not None:
+                for rel_path in self.change_set.deleted:
+                    self.cache_manager.invalidate_file(self.project_root / rel_path)
+
         # 各パーサーで解析（ファイルスキャン結果を共有）
         parser_stats = {}  # パーサーごとの統計情報
 
@@ -145,6 +174,8 @@ class APIGenerator(BaseGenerator):
                     files_to_parse=shared_files_to_parse,
                     skip_cache_save=skip_cache_save,
                     gitignore_matcher=gitignore_matcher,
+                    as_records=True,
+                    **parse_kwargs,
                 )
                 all_apis.extend(apis)
                 parser_stats[parser_language] = {
@@ -174,6 +205,12 @@ class APIGenerator(BaseGenerator):
 
         # すべてのパーサー実行後に一度だけキャッシュを保存
         if use_cache and self.cache_manager:
+            # 全体の実行では、走査で見つからなかった（削除・除外された）ファイルのエントリを削除する
+            if self.change_set is None:
+                self.cache_manager.gc(
+                    live_paths={rel_path.as_posix() for _, rel_path in shared_files_to_parse},
+                    prune_results=False,
+                )
             self.cache_manager.save()
 
         # API情報をソート（ファイル名、行番号順）
@@ -181,12 +218,12 @@ class APIGenerator(BaseGenerator):
 
         return self._render_api_markdown(all_apis)
 
-    def _render_api_markdown(self, apis: list[APIInfo]) -> str:
+    def _render_api_markdown(self, apis: list[APIRecord]) -> str:
         """
         API情報のリストからマークダウンをレンダリング
 
         Args:
-            apis: API情報のリスト
+            apis: API情報のレコードのリスト
 
         Returns:
             マークダウン文字列
@@ -258,7 +295,13 @@ class APIGenerator(BaseGenerator):
         Returns:
             パーサーのリスト
         """
-        return ParserFactory.create_parsers(self.project_root, self.languages)
+        module_store = self.scan_session.modules if self.scan_session is not None else None
+        return ParserFactory.create_parsers(
+            self.project_root,
+            self.languages,
+            module_store=module_store,
+            backend=self.config.get("parse", {}).get("backend", "regex"),
+        )
 
     def _scan_project_files(
         self, exclude_dirs: list[str], extensions: set[str]
@@ -273,53 +316,21 @@ class APIGenerator(BaseGenerator):
         Returns:
             (絶対パス, 相対パス)のタプルのリスト
         """
-        from ..utils.file_scanner import get_unified_scanner
+        # 実行中に共有される走査結果のビュー（スキャナーはシンボリックリンクを除外し、
+        # 正規化済みの(絶対パス, 相対パス)を保持している）
+        return (
+            self._get_scan_session().view(extensions=extensions, exclude_dirs=exclude_dirs).files()
+        )
 
-        project_root_resolved = self.project_root.resolve()
-        extensions_set = {ext.lower() for ext in extensions}
+    def _get_scan_session(self) -> "ScanSession":
+        """
+        走査結果を保持する走査セッションを取得
 
-        # 統一ファイルスキャナーを取得
-        use_gitignore = self.config.get("exclude", {}).get("use_gitignore", True)
-        scanner = get_unified_scanner(
-            project_root=self.project_root,
-            exclude_dirs=set(exclude_dirs),
-            use_gitignore=use_gitignore,
-        )
+        Returns:
+            実行中に共有される走査セッション（渡されていない場合は作成して保持）
+        """
+        if self.scan_session is None:
+            from ..utils.scan_session import ScanSession
 
-        # スキャン結果を取得
-        scan_result = scanner.scan_once()
-        files_to_parse = []
-
-        # 拡張子でフィルタリング
-        try:
-            for ext, files in scan_result["files_by_extension"].items():
-                if ext.lower() in extensions_set:
-                    for file_path in files:
-                        try:
-                            # パスの正規化（シンボリックリンクを解決）
-                            file_path_resolved = file_path.resolve()
-
-                            # プロジェクトルート外へのアクセスを防止
-                            try:
-                                file_path_relative = file_path_resolved.relative_to(
-                                    project_root_resolved
-                                )
-                            except ValueError:
-                                # プロジェクトルート外のファイルはスキップ
-                                continue
-
-                            # シンボリックリンクのチェック
-                            if file_path.is_symlink():
-                                continue
-
-                            files_to_parse.append((file_path, file_path_relative))
-                        except (OSError, PermissionError):
-                            # ファイルアクセスエラーは無視して続行
-                            continue
-        except (OSError, PermissionError) as e:
-            from ..utils.logger import get_logger
-
-            logger = get_logger("api_generator")
-            logger.warning(f"プロジェクトの走査中にエラーが発生しました: {e}")
-
-        return files_to_parse
+            self.scan_session = ScanSession(self.project_root, self.config)
+        return self.scan_session
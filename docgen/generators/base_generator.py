@@ -14,6 +14,7 @@ from ..utils.exceptions import FileOperationError, GenerationError
 from ..utils.logger import get_logger
 
 if TYPE_CHECKING:
+    from ..utils.scan_session import ScanSession
     from .services.formatting_service import FormattingService
     from .services.llm_service import LLMService
     from .services.manual_section_service import ManualSectionService
@@ -40,6 +41,7 @@ class BaseGenerator(ABC):
         rag_service: "RAGService | None" = None,
         formatting_service: "FormattingService | None" = None,
         manual_section_service: "ManualSectionService | None" = None,
+        scan_session: "ScanSession | None" = None,
     ):
         """
         初期化
@@ -54,12 +56,14 @@ class BaseGenerator(ABC):
             rag_service: RAGサービス（DI）
             formatting_service: フォーマットサービス（DI）
             manual_section_service: 手動セクションサービス（DI）
+            scan_session: 実行中に共有する走査セッション（Noneの場合は各処理が独自に走査）
         """
         self.project_root: Path = project_root
         self.config: dict[str, Any] = config
         self.package_managers: dict[str, str] = package_managers or {}
         self.output_path: Path = self._get_output_path(config)
         self.logger = get_logger(self.__class__.__name__.lower())
+        self.scan_session = scan_session
 
         # 言語設定を適用（ignoredとpreferred）
         languages_config = config.get("languages", {})
@@ -101,6 +105,7 @@ class BaseGenerator(ABC):
             package_managers,
             logger=self.logger,
             exclude_directories=exclude_directories,
+            scan_session=scan_session,
         )
 
         # AGENTS設定
@@ -303,6 +308,7 @@ class BaseGenerator(ABC):
                 project_root=self.project_root,
                 languages=self.languages,
                 config=self.config,
+                scan_session=self.scan_session,
             )
 
             validation_result = validator.validate_implementation(document)
@@ -358,7 +364,10 @@ class BaseGenerator(ABC):
             # スキャナーとレンダラーの初期化
             exclude_dirs = self.config.get("exclude", {}).get("directories", [])
             scanner = ProjectScanner(
-                self.project_root, exclude_directories=exclude_dirs, config=self.config
+                self.project_root,
+                exclude_directories=exclude_dirs,
+                config=self.config,
+                scan_session=self.scan_session,
             )
             manifest = scanner.scan()
             self.logger.info(
@@ -404,7 +413,9 @@ class BaseGenerator(ABC):
             self.logger.warning(f"アーキテクチャ図ファイルの読み込みに失敗しました: {e}")
             return ""
         except Exception as e:
-            self.logger.warning(f"アーキテクチャ図の生成/取得中に予期しないエラーが発生しました: {e}", exc_info=True)
+            self.logger.warning(
+                f"アーキテクチャ図の生成/取得中に予期しないエラーが発生しました: {e}", exc_info=True
+            )
             return ""
 
     def _generate_key_features(
@@ -7,5 +7,13 @@ from .generic_parser import GenericParser
 from .js_parser import JSParser
 from .parser_factory import ParserFactory
 from .python_parser import PythonParser
+from .tree_sitter_parser import TreeSitterParser
 
-__all__ = ["BaseParser", "PythonParser", "JSParser", "GenericParser", "ParserFactory"]
+__all__ = [
+    "BaseParser",
+    "PythonParser",
+    "JSParser",
+    "GenericParser",
+    "TreeSitterParser",
+    "ParserFactory",
+]
@@ -6,21 +6,187 @@ Template Methodパターンを使用して、コード解析の共通フロー
 """
 
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 import os
 from pathlib import Path
+import re
+import signal
+import time
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from ...models import APIInfo
-from ...utils.exceptions import ParseError
+from ...models import APIInfo, APIRecord
+from ...utils.api_records import decode_apis, encode_apis
+from ...utils.exceptions import ParseError, ParseTimeoutError
+from ...utils.file_classifier import DEFAULT_MAX_FILE_BYTES, FileClassifier
+from ...utils.fs_walker import file_extension, walk_files
 from ...utils.logger import get_logger
+from ...utils.parse_budget import parse_deadline
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from ...utils.cache import CacheManager
     from ...utils.gitignore_parser import GitIgnoreMatcher
 
 logger = get_logger("parser")
 
+# 並列処理の方式（`parse.executor`）
+EXECUTORS = ("thread", "process")
+# プロセスプールを使用する解析対象ファイル数の下限（`parse.process_min_files`）。
+# ワーカーの起動とパーサーの転送にかかる時間を、解析の並列化で取り戻せる目安
+DEFAULT_PROCESS_MIN_FILES = 200
+# ファイルごとの解析の時間の上限（秒、`parse.file_timeout`）
+DEFAULT_FILE_TIMEOUT = 10.0
+# プロセスプールで、ワーカーが時間の上限を超えても結果を返さない場合に待つ追加の時間（秒）。
+# パーサーの確認位置で止まらない解析（1回の正規表現の照合など）は、超えた時点でワーカーを停止する
+_WORKER_GRACE = 1.0
+# 1つのワーカーに割り当てるチャンクの数（解析時間のばらつきを平準化する）
+_CHUNKS_PER_WORKER = 4
+
+# アウトラインの抽出: 行頭の宣言のキーワードと名前（各行の先頭の一定の文字数のみ照合する）
+_OUTLINE_PATTERN = re.compile(
+    r"\s*(?:(?:export|default|public|private|protected|internal|static|async|abstract|final|pub)\s+)*"
+    r"(?P<keyword>function|class|def|func|fn|struct|interface|trait|enum|type)\s+"
+    r"(?P<name>[A-Za-z_$][\w$]*)"
+)
+_OUTLINE_LINE_LENGTH = 200
+_OUTLINE_CLASS_KEYWORDS = frozenset({"class", "struct", "interface", "trait", "enum", "type"})
+
+
+def should_use_processes(file_count: int, min_files: int = DEFAULT_PROCESS_MIN_FILES) -> bool:
+    """
+    プロセスプールで解析するかどうかを判定
+
+    Args:
+        file_count: 解析が必要な（キャッシュにない）ファイルの数
+        min_files: プロセスプールを使用するファイル数の下限
+
+    Returns:
+        CPUが2つ以上あり、ファイル数が下限以上の場合はTrue
+    """
+    return (os.cpu_count() or 1) >= 2 and file_count >= max(1, min_files)
+
+
+class _WorkerSlots:
+    """
+    ワーカープロセスごとのPIDと、解析中のファイル・開始時刻（共有メモリ）
+
+    ワーカーはファイルの解析を始めるたびに自身のスロットを更新し、親プロセスは
+    時間の上限を超えて解析を続けているワーカーを検出して、そのPIDで停止します。
+    """
+
+    def __init__(self, workers: int):
+        """
+        初期化
+
+        Args:
+            workers: ワーカープロセス数
+        """
+        self.count = multiprocessing.Value("i", 0)
+        self.pids = multiprocessing.RawArray("q", workers)
+        # 解析中のファイルの番号（-1は解析中のファイルなし）と開始時刻（time.time()）
+        self.files = multiprocessing.RawArray("q", [-1] * workers)
+        self.started = multiprocessing.RawArray("d", workers)
+
+    def claim(self) -> int:
+        """ワーカーのスロットを割り当て、PIDを記録（ワーカープロセスで呼び出す）"""
+        with self.count.get_lock():
+            slot = self.count.value
+            self.count.value += 1
+        self.pids[slot] = os.getpid()
+        return slot
+
+    def next_timeout(self, limit: float) -> float:
+        """解析中のファイルのうち、最も早く上限に達するまでの時間（秒）"""
+        now = time.time()
+        remaining = [
+            self.started[slot] + limit - now
+            for slot in range(self.count.value)
+            if self.files[slot] >= 0
+        ]
+        return max(0.0, min(remaining, default=limit))
+
+    def stuck(self, limit: float) -> list[tuple[int, int, float]]:
+        """
+        上限を超えて解析を続けているワーカー
+
+        Returns:
+            (PID, ファイルの番号, 経過時間（秒）)のリスト
+        """
+        now = time.time()
+        stuck = []
+        for slot in range(self.count.value):
+            index = self.files[slot]
+            elapsed = now - self.started[slot]
+            if index >= 0 and elapsed >= limit:
+                stuck.append((self.pids[slot], index, elapsed))
+        return stuck
+
+
+# ワーカープロセスのパーサーとスロット（`_init_worker`でプロセスの起動時に1度だけ受け取る）
+_worker: "tuple[BaseParser, _WorkerSlots, int] | None" = None
+
+
+def _init_worker(parser: "BaseParser", slots: _WorkerSlots) -> None:
+    """ワーカープロセスの初期化（チャンクごとにパーサーをpickleしないよう保持する）"""
+    global _worker
+    _worker = (parser, slots, slots.claim())
+
+
+def _parse_chunk(
+    files: list[tuple[int, str, str]], file_timeout: float = 0.0
+) -> list[tuple[int, tuple[Any, str | None, float, bool]]]:
+    """
+    ワーカープロセスでファイルのチャンクを解析
+
+    解析結果はオブジェクトをpickleせずに済むよう、キャッシュと同じレコード形式
+    （marshalしたタプル）で返します。
+
+    Args:
+        files: (ファイルの番号, 絶対パス, 相対パス)のリスト
+        file_timeout: ファイルごとの解析の時間の上限（秒、0は無制限）
+
+    Returns:
+        (ファイルの番号, (レコード形式の解析結果（変換できない場合はレコードのリスト),
+        エラーメッセージ, 解析時間（秒）, アウトラインのみかどうか))のリスト
+    """
+    assert _worker is not None
+    parser, slots, slot = _worker
+    results: list[tuple[int, tuple[Any, str | None, float, bool]]] = []
+    for index, file_path, file_path_relative in files:
+        slots.started[slot] = time.time()
+        slots.files[slot] = index
+        start = time.perf_counter()
+        try:
+            apis, outline = parser._parse_within(Path(file_path), file_timeout)
+            apis = parser._normalize_apis(apis, file_path_relative)
+        except Exception as e:
+            results.append((index, (None, _error_message(e), time.perf_counter() - start, False)))
+            continue
+        finally:
+            slots.files[slot] = -1
+        elapsed = time.perf_counter() - start
+        try:
+            results.append((index, (encode_apis(apis), None, elapsed, outline)))
+        except (ValueError, AttributeError):
+            results.append((index, (apis, None, elapsed, outline)))
+    return results
+
+
+def _error_message(error: Exception) -> str:
+    """キャッシュに記録するエラーメッセージ（ParseErrorの場合は元の例外の内容を含める）"""
+    cause = error.__cause__ if isinstance(error, ParseError) and error.__cause__ else error
+    return f"{type(cause).__name__}: {cause}"
+
 
 class BaseParser(ABC):
     """コード解析のベースクラス
@@ -33,9 +199,12 @@ class BaseParser(ABC):
 
     Attributes:
         PARSER_TYPE: パーサーの種類を示すクラス変数
+        PARSER_VERSION: パーサーの実装のバージョン（抽出ロジックを変更した場合は
+            インクリメントし、キャッシュ済みの解析結果を無効化する）
     """
 
     PARSER_TYPE: ClassVar[str] = "generic"
+    PARSER_VERSION: ClassVar[str] = "1"
 
     def __init__(self, project_root: Path):
         """
@@ -48,7 +217,7 @@ class BaseParser(ABC):
 
     def parse_file(self, file_path: Path) -> list[APIInfo]:
         """
-        ファイルを解析してAPI情報を抽出 (Template Method)
+        ファイルを解析してAPI情報を抽出
 
         Args:
             file_path: 解析するファイルのパス
@@ -56,6 +225,18 @@ class BaseParser(ABC):
         Returns:
             API情報のリスト
         """
+        return [api.to_model() for api in self._parse_file_records(file_path)]
+
+    def _parse_file_records(self, file_path: Path) -> list[APIRecord]:
+        """
+        ファイルを解析してAPI情報のレコードを抽出 (Template Method)
+
+        Args:
+            file_path: 解析するファイルのパス
+
+        Returns:
+            API情報のレコードのリスト
+        """
         try:
             content = self._read_file(file_path)
             ast = self._parse_to_ast(content, file_path)
@@ -82,11 +263,11 @@ class BaseParser(ABC):
         pass
 
     @abstractmethod
-    def _extract_elements(self, ast: Any, file_path: Path) -> list[APIInfo]:
-        """要素を抽出（サブクラスで実装）"""
+    def _extract_elements(self, ast: Any, file_path: Path) -> list[APIRecord]:
+        """要素を抽出（サブクラスで実装、`file_path`には相対パスを設定する）"""
         pass
 
-    def _post_process(self, elements: list[APIInfo]) -> list[APIInfo]:
+    def _post_process(self, elements: list[APIRecord]) -> list[APIRecord]:
         """後処理（オプション）"""
         return elements
 
@@ -109,6 +290,68 @@ class BaseParser(ABC):
         """
         return self.PARSER_TYPE
 
+    def get_language(self) -> str:
+        """
+        抽出したAPI情報に設定する言語を返す
+
+        Returns:
+            言語名（デフォルトはパーサーの種類）
+        """
+        return self.PARSER_TYPE
+
+    def parse_outline(self, file_path: Path) -> list[APIRecord]:
+        """
+        ファイルのアウトライン（行頭で宣言された関数・クラスの名前と行番号）のみを抽出
+
+        解析が時間の上限を超えたファイルの代わりに使用します。各行の先頭の
+        `_OUTLINE_LINE_LENGTH`文字のみを照合するため、処理時間はファイルサイズに比例します。
+
+        Args:
+            file_path: 解析するファイルのパス
+
+        Returns:
+            API情報のレコードのリスト（シグネチャは名前のみ、docstringは空）
+        """
+        relative_path = str(file_path.relative_to(self.project_root))
+        language = self.get_language()
+        match = _OUTLINE_PATTERN.match
+        apis = []
+        for line_number, line in enumerate(self._read_file(file_path).split("\n"), start=1):
+            outline_match = match(line[:_OUTLINE_LINE_LENGTH])
+            if outline_match is None:
+                continue
+            keyword, name = outline_match.group("keyword", "name")
+            is_class = keyword in _OUTLINE_CLASS_KEYWORDS
+            apis.append(
+                APIRecord(
+                    name=name,
+                    type="class" if is_class else "function",
+                    signature=f"{keyword} {name}" if is_class else f"{name}(...)",
+                    docstring="",
+                    line_number=line_number,
+                    file_path=relative_path,
+                    language=language,
+                )
+            )
+        return apis
+
+    def _parse_within(self, file_path: Path, file_timeout: float) -> tuple[list[APIRecord], bool]:
+        """
+        時間の上限内でファイルを解析（超えた場合はアウトラインのみを抽出）
+
+        Args:
+            file_path: 解析するファイルのパス
+            file_timeout: 解析の時間の上限（秒、0以下の場合は無制限）
+
+        Returns:
+            (API情報のレコードのリスト, アウトラインのみかどうか)
+        """
+        try:
+            with parse_deadline(file_timeout):
+                return self._parse_file_records(file_path), False
+        except ParseTimeoutError:
+            return self.parse_outline(file_path), True
+
     def parse_project(
         self,
         exclude_dirs: list[str] | None = None,
@@ -119,7 +362,14 @@ class BaseParser(ABC):
         files_to_parse: list[tuple[Path, Path]] | None = None,
         skip_cache_save: bool = False,
         gitignore_matcher: "GitIgnoreMatcher | None" = None,
-    ) -> list[APIInfo]:
+        changed_paths: "Collection[str] | None" = None,
+        classifier: FileClassifier | None = None,
+        max_file_bytes: int = DEFAULT_MAX_FILE_BYTES,
+        executor: str = "thread",
+        process_min_files: int = DEFAULT_PROCESS_MIN_FILES,
+        as_records: bool = False,
+        file_timeout: float = DEFAULT_FILE_TIMEOUT,
+    ) -> list[APIInfo] | list[APIRecord]:
         """
         プロジェクト全体を解析
 
@@ -132,6 +382,16 @@ class BaseParser(ABC):
             files_to_parse: 既にスキャン済みのファイルリスト（Noneの場合は新規スキャン）
             skip_cache_save: キャッシュ保存をスキップするか（デフォルト: False）
             gitignore_matcher: .gitignoreマッチャー（Noneの場合は.gitignoreを適用しない）
+            changed_paths: 差分実行で変更されたファイルの相対パス（指定された場合、それ以外の
+                ファイルはキャッシュの検証を省略してキャッシュから結果を取得する）
+            classifier: ファイルのサイズ・種類の判定（Noneの場合は新規作成）
+            max_file_bytes: これより大きいファイルは読み込まずにスキップ（`parse.max_file_bytes`）
+            executor: 並列処理の方式（`parse.executor`、"thread", "process"）
+            process_min_files: "process"の場合に、プロセスプールを使用する解析対象（キャッシュに
+                ない）ファイル数の下限（`parse.process_min_files`、少ない場合はスレッドで解析）
+            as_records: `APIInfo`に変換せず、内部のレコード（`APIRecord`）のまま返すかどうか
+            file_timeout: ファイルごとの解析の時間の上限（`parse.file_timeout`、秒、0は無制限）。
+                超えたファイルはアウトラインのみを抽出し、キャッシュと`classifier`に記録する
 
         Returns:
             全API情報のリスト
@@ -145,98 +405,15 @@ class BaseParser(ABC):
         effective_use_cache = use_cache and cache_manager is not None
         parser_type = self.get_parser_type()
 
-        all_apis = []
+        all_apis: list[APIRecord] = []
         extensions = self.get_supported_extensions()
         # 拡張子をセットに変換して高速な検索を可能にする
         extensions_set = {ext.lower() for ext in extensions}
 
-        # プロジェクトルートを正規化（絶対パスに変換）
-        project_root_resolved = self.project_root.resolve()
-
-        # 解析対象ファイルのリストを収集（os.walkで一度だけ走査）
+        # 解析対象ファイルのリストを収集（scandirベースの走査エンジンで一度だけ走査）
         # files_to_parseが提供されている場合はそれを使用（重複スキャンを避ける）
         if files_to_parse is None:
-            files_to_parse = []
-            try:
-                for root, dirs, files in os.walk(self.project_root, followlinks=False):
-                    root_path = Path(root)
-
-                    # 除外ディレクトリを早期にスキップ（dirsをin-placeで変更）
-                    dirs_to_remove = []
-                    for d in dirs:
-                        dir_path = root_path / d
-                        # 既存の除外チェック
-                        if d in exclude_dirs or d.startswith(".") or d.endswith(".egg-info"):
-                            dirs_to_remove.append(d)
-                            continue
-                        # .gitignoreチェック
-                        if gitignore_matcher and gitignore_matcher.should_exclude_dir(dir_path):
-                            dirs_to_remove.append(d)
-                            continue
-
-                    for d in dirs_to_remove:
-                        dirs.remove(d)
-
-                    # パスベースの除外チェック（セット検索でO(1)）
-                    try:
-                        rel_path = root_path.relative_to(project_root_resolved)
-                        # セットのintersectionを使用して高速チェック
-                        exclude_dirs_set = set(exclude_dirs)
-                        if exclude_dirs_set.intersection(rel_path.parts):
-                            dirs[:] = []  # このディレクトリ以下をスキップ
-                            continue
-                        if any(part.endswith(".egg-info") for part in rel_path.parts):
-                            dirs[:] = []  # egg-infoディレクトリ以下をスキップ
-                            continue
-                        # .gitignoreチェック（ディレクトリ全体）
-                        if gitignore_matcher and gitignore_matcher.should_exclude_dir(root_path):
-                            dirs[:] = []  # このディレクトリ以下をスキップ
-                            continue
-                    except ValueError:
-                        # プロジェクトルート外の場合はスキップ
-                        continue
-
-                    # ファイルをチェック
-                    for file_name in files:
-                        file_path = root_path / file_name
-
-                        # .gitignoreチェック
-                        if gitignore_matcher and gitignore_matcher.is_ignored(file_path):
-                            continue
-
-                        # 拡張子をチェック
-                        ext = file_path.suffix.lower()
-                        if ext not in extensions_set:
-                            continue
-
-                        try:
-                            # パスの正規化（シンボリックリンクを解決）
-                            file_path_resolved = file_path.resolve()
-
-                            # プロジェクトルート外へのアクセスを防止
-                            try:
-                                file_path_relative = file_path_resolved.relative_to(
-                                    project_root_resolved
-                                )
-                            except ValueError:
-                                # プロジェクトルート外のファイルはスキップ
-                                logger.debug(
-                                    f"プロジェクトルート外のファイルをスキップ: {file_path}"
-                                )
-                                continue
-
-                            # シンボリックリンクのチェック（オプション: シンボリックリンクをスキップする場合）
-                            if file_path.is_symlink():
-                                logger.debug(f"シンボリックリンクをスキップ: {file_path}")
-                                continue
-
-                            files_to_parse.append((file_path, file_path_relative))
-                        except (OSError, PermissionError) as e:
-                            # ファイルアクセスエラー（権限エラーなど）は無視して続行
-                            logger.debug(f"{file_path} へのアクセスに失敗しました: {e}")
-                            continue
-            except (OSError, PermissionError) as e:
-                logger.warning(f"プロジェクトの走査中にエラーが発生しました: {e}")
+            files_to_parse = self._collect_files(exclude_dirs, extensions_set, gitignore_matcher)
         else:
             # 提供されたファイルリストから、このパーサーがサポートする拡張子のファイルのみをフィルタリング
             files_to_parse = [
@@ -245,30 +422,85 @@ class BaseParser(ABC):
                 if file_path.suffix.lower() in extensions_set
             ]
 
+        # サイズ上限を超えるファイルは読み込む（キャッシュのハッシュを計算する）前に除外する
+        if classifier is None:
+            classifier = FileClassifier(self.project_root)
+        files_to_parse = [
+            (file_path, file_path_relative)
+            for file_path, file_path_relative in files_to_parse
+            if classifier.check(file_path_relative.as_posix(), "parse", max_file_bytes, sniff=False)
+            is None
+        ]
+
+        # 差分実行では変更されていないファイルのキャッシュを検証せずに使用する
+        def is_unchanged(file_path_relative: Path) -> bool:
+            return changed_paths is not None and file_path_relative.as_posix() not in changed_paths
+
+        # リモートキャッシュがある場合は、ローカルにない解析結果をまとめて取得しておく
+        # （差分実行で変更されていないファイルはローカルのキャッシュを使用する）
+        if effective_use_cache and cache_manager is not None and cache_manager.remote is not None:
+            cache_manager.prefetch_remote(
+                [path for path, rel_path in files_to_parse if not is_unchanged(rel_path)],
+                parser_type,
+                self.PARSER_VERSION,
+            )
+
+        if executor not in EXECUTORS:
+            logger.warning(f"不明な解析の並列処理の方式です: {executor}。スレッドで解析します")
+            executor = "thread"
+        cache_arg = cache_manager if effective_use_cache else None
+        type_arg = parser_type if effective_use_cache else None
+        error_count = 0
+        success_count = 0
+
+        # プロセスプールでは、キャッシュにあるファイルを先に親プロセスで取得し、
+        # 解析が必要なファイルの数でプロセスの起動に見合うかを判定する
+        use_processes = False
+        if use_parallel and executor == "process":
+            remaining = []
+            for file_path, file_path_relative in files_to_parse:
+                cached = self._get_cached_apis(
+                    file_path,
+                    file_path_relative,
+                    cache_arg,
+                    type_arg,
+                    is_unchanged(file_path_relative),
+                )
+                if cached is None:
+                    remaining.append((file_path, file_path_relative))
+                else:
+                    all_apis.extend(cached)
+                    success_count += 1
+            files_to_parse = remaining
+            use_processes = should_use_processes(len(files_to_parse), process_min_files)
+
         # 並列処理または逐次処理で解析
         # 閾値: ファイル数が5を超える場合、またはCPU数が2以上でファイル数が3を超える場合
-        import os as os_module
-
-        cpu_count = os_module.cpu_count() or 1
+        cpu_count = os.cpu_count() or 1
         parallel_threshold = 3 if cpu_count >= 2 else 5
-        if use_parallel and len(files_to_parse) > parallel_threshold:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if use_processes:
+            apis, succeeded, failed = self._parse_in_processes(
+                files_to_parse, cache_arg, type_arg, classifier, max_workers, file_timeout
+            )
+            all_apis.extend(apis)
+            success_count += succeeded
+            error_count += failed
+        elif use_parallel and len(files_to_parse) > parallel_threshold:
+            with ThreadPoolExecutor(max_workers=max_workers) as thread_executor:
                 future_to_file = {
-                    executor.submit(
+                    thread_executor.submit(
                         self._parse_file_safe,
                         file_path,
                         file_path_relative,
-                        cache_manager if effective_use_cache else None,
-                        parser_type if effective_use_cache else None,
+                        cache_arg,
+                        type_arg,
+                        is_unchanged(file_path_relative),
+                        classifier,
+                        file_timeout,
                     ): (file_path, file_path_relative)
                     for file_path, file_path_relative in files_to_parse
                 }
 
-                # エラー統計情報
-                error_count = 0
-                success_count = 0
-                parser_type = self.get_parser_type()
-
                 for future in as_completed(future_to_file):
                     file_path, file_path_relative = future_to_file[future]
                     try:
@@ -288,24 +520,18 @@ class BaseParser(ABC):
                             f"[{parser_type}] {file_path_relative} の解析に失敗しました: {e}",
                             exc_info=logger.isEnabledFor(10),  # DEBUGレベルでスタックトレースを表示
                         )
-
-                # 統計情報をログ出力
-                if error_count > 0 or success_count > 0:
-                    logger.info(
-                        f"[{parser_type}] 解析完了: 成功 {success_count}件, 失敗 {error_count}件"
-                    )
         else:
             # 逐次処理
-            error_count = 0
-            success_count = 0
-
             for file_path, file_path_relative in files_to_parse:
                 try:
                     apis = self._parse_file_safe(
                         file_path,
                         file_path_relative,
-                        cache_manager if effective_use_cache else None,
-                        parser_type if effective_use_cache else None,
+                        cache_arg,
+                        type_arg,
+                        is_unchanged(file_path_relative),
+                        classifier,
+                        file_timeout,
                     )
                     if apis:
                         all_apis.extend(apis)
@@ -324,17 +550,66 @@ class BaseParser(ABC):
                     )
                     continue
 
-            # 統計情報をログ出力
-            if error_count > 0 or success_count > 0:
-                logger.info(
-                    f"[{parser_type}] 解析完了: 成功 {success_count}件, 失敗 {error_count}件"
-                )
+        # 統計情報をログ出力
+        if error_count > 0 or success_count > 0:
+            logger.info(f"[{parser_type}] 解析完了: 成功 {success_count}件, 失敗 {error_count}件")
+
+        if effective_use_cache and cache_manager:
+            # 前回の解析が時間の上限を超えたためアウトラインを再利用したファイルを記録
+            for rel_path, slow_type, elapsed in cache_manager.pop_slow_hits():
+                classifier.record_slow(rel_path, slow_type, elapsed, outline=True, cached=True)
+            # ワーカーの書き込みバッファをまとめてストアに反映
+            cache_manager.flush_buffers()
+            # キャッシュを保存（skip_cache_saveがFalseの場合のみ）
+            if not skip_cache_save:
+                cache_manager.save()
+
+        if as_records:
+            return all_apis
+        return [api.to_model() for api in all_apis]
 
-        # キャッシュを保存（skip_cache_saveがFalseの場合のみ）
-        if effective_use_cache and cache_manager and not skip_cache_save:
-            cache_manager.save()
+    def _collect_files(
+        self,
+        exclude_dirs: list[str],
+        extensions_set: set[str],
+        gitignore_matcher: "GitIgnoreMatcher | None" = None,
+    ) -> list[tuple[Path, Path]]:
+        """
+        解析対象ファイルを走査して収集
 
-        return all_apis
+        シンボリックリンクは辿らないため、ファイルごとのパス解決は不要です。
+
+        Args:
+            exclude_dirs: 除外するディレクトリ名
+            extensions_set: 対象とする拡張子のセット（小文字）
+            gitignore_matcher: .gitignoreマッチャー
+
+        Returns:
+            (絶対パス, 相対パス)のタプルのリスト
+        """
+        exclude_dirs_set = set(exclude_dirs)
+
+        def prune_dir(rel_path: str, name: str) -> bool:
+            if name in exclude_dirs_set or name.startswith(".") or name.endswith(".egg-info"):
+                return True
+            return bool(
+                gitignore_matcher and gitignore_matcher.should_exclude_dir_relative(rel_path)
+            )
+
+        def skip_file(rel_path: str, name: str) -> bool:
+            if file_extension(name) not in extensions_set:
+                return True
+            return bool(gitignore_matcher and gitignore_matcher.is_ignored_relative(rel_path))
+
+        files: list[tuple[Path, Path]] = []
+        try:
+            for walked in walk_files(
+                str(self.project_root.resolve()), prune_dir=prune_dir, skip_file=skip_file
+            ):
+                files.append((Path(walked.abs_path), Path(walked.rel_path)))
+        except (OSError, PermissionError) as e:
+            logger.warning(f"プロジェクトの走査中にエラーが発生しました: {e}")
+        return files
 
     def _parse_file_safe(
         self,
@@ -342,7 +617,10 @@ class BaseParser(ABC):
         file_path_relative: Path,
         cache_manager: "CacheManager | None" = None,
         parser_type: str | None = None,
-    ) -> list[APIInfo]:
+        trust_cache: bool = False,
+        classifier: FileClassifier | None = None,
+        file_timeout: float = 0.0,
+    ) -> list[APIRecord]:
         """
         ファイルを安全に解析（内部メソッド）
 
@@ -351,64 +629,399 @@ class BaseParser(ABC):
             file_path_relative: 相対パス
             cache_manager: キャッシュマネージャー（オプション）
             parser_type: パーサーの種類（オプション）
+            trust_cache: キャッシュの検証（mtime・ハッシュ）を省略するかどうか
+            classifier: ファイルの種類の判定（指定された場合、バイナリ・minify済みのファイルは解析しない）
+            file_timeout: 解析の時間の上限（秒、0は無制限、超えた場合はアウトラインのみを抽出）
 
         Returns:
             API情報のリスト
         """
         # キャッシュから結果を取得
-        if cache_manager is not None and parser_type is not None:
-            cached_result = cache_manager.get_cached_result(file_path, parser_type)
-            if cached_result is not None:
-                # キャッシュされた結果をAPIInfoオブジェクトに変換
-                result: list[APIInfo] = []
-                parser_type_str = parser_type or self.get_parser_type()
-                for api_data in cached_result:
-                    # キャッシュから取得したデータが辞書の場合はAPIInfoに変換
-                    if isinstance(api_data, dict):
-                        # 辞書からAPIInfoを作成
-                        api_dict = dict(api_data)
-                        api_dict["file_path"] = str(file_path_relative)
-                        # languageフィールドが不足している場合は追加
-                        if "language" not in api_dict:
-                            api_dict["language"] = parser_type_str
-                        api_info = APIInfo(**api_dict)
-                    elif isinstance(api_data, APIInfo):
-                        # APIInfoオブジェクトのコピーを作成
-                        api_info = APIInfo.model_validate(api_data.model_dump())
-                        api_info.file_path = str(file_path_relative)
-                    else:
-                        continue
-                    result.append(api_info)
-                return result
+        cached = self._get_cached_apis(
+            file_path, file_path_relative, cache_manager, parser_type, trust_cache
+        )
+        if cached is not None:
+            return cached
 
-        try:
-            apis = self.parse_file(file_path)
-            # APIInfoオブジェクトのリストを処理
-            processed_apis: list[APIInfo] = []
-            for api in apis:
-                if isinstance(api, dict):
-                    # 辞書の場合はAPIInfoに変換（必須フィールドを確認）
-                    api_dict = dict(api)
-                    api_dict["file_path"] = str(file_path_relative)
-                    # languageフィールドが不足している場合は追加
-                    if "language" not in api_dict:
-                        api_dict["language"] = parser_type or self.get_parser_type()
-                    processed_apis.append(APIInfo(**api_dict))
-                else:
-                    # APIInfoオブジェクトの場合は属性を設定
-                    api.file_path = str(file_path_relative)
-                    processed_apis.append(api)
-            apis = processed_apis
+        # キャッシュにない場合のみ先頭を読み込んで種類を判定する
+        if classifier is not None and classifier.check(
+            file_path_relative.as_posix(), "parse", max_bytes=0
+        ):
+            return []
 
-            # 結果をキャッシュに保存
-            if cache_manager is not None and parser_type is not None:
-                cache_manager.set_cached_result(file_path, parser_type, apis)
+        start = time.perf_counter()
+        try:
+            apis, outline = self._parse_within(file_path, file_timeout)
+            apis = self._normalize_apis(apis, str(file_path_relative))
 
+            # 結果をキャッシュに保存（時間の上限を超えたファイルはアウトラインとして記録）
+            self._store_result(
+                file_path,
+                file_path_relative.as_posix(),
+                apis,
+                cache_manager,
+                parser_type,
+                classifier,
+                time.perf_counter() - start,
+                outline,
+                file_timeout,
+            )
             return apis
         except Exception as e:
+            # 失敗も内容に対して記録し、ファイルが変更されるまで再解析しない
+            if cache_manager is not None and parser_type is not None:
+                cache_manager.set_cached_error(
+                    file_path, parser_type, _error_message(e), parser_version=self.PARSER_VERSION
+                )
             parser_type = parser_type or self.get_parser_type()
             logger.warning(
                 f"[{parser_type}] {file_path} の解析に失敗しました: {type(e).__name__}: {e}",
                 exc_info=logger.isEnabledFor(10),  # DEBUGレベルでスタックトレースを表示
             )
             return []
+
+    def _store_result(
+        self,
+        file_path: Path,
+        rel_path: str,
+        apis: list[APIRecord],
+        cache_manager: "CacheManager | None",
+        parser_type: str | None,
+        classifier: FileClassifier | None,
+        elapsed: float,
+        outline: bool,
+        file_timeout: float,
+        records: bytes | None = None,
+    ) -> None:
+        """
+        解析結果をキャッシュに保存し、時間の上限を超えたファイルを記録
+
+        Args:
+            file_path: ファイルパス
+            rel_path: 相対パス（`/`区切り）
+            apis: 解析結果
+            cache_manager: キャッシュマネージャー（オプション）
+            parser_type: パーサーの種類（オプション）
+            classifier: 時間の上限を超えたファイルを記録する判定（オプション）
+            elapsed: 解析時間（秒）
+            outline: 時間の上限を超えてアウトラインのみを抽出したかどうか
+            file_timeout: 解析の時間の上限（秒、0は無制限）
+            records: `encode_apis`で変換済みのレコード（オプション）
+        """
+        if outline:
+            logger.warning(
+                f"[{self.get_parser_type()}] {rel_path} の解析が時間の上限（{file_timeout:g}秒）を"
+                "超えたため、アウトラインのみを抽出しました"
+            )
+        if cache_manager is not None and parser_type is not None:
+            if outline:
+                # ファイルが変更されるまで再解析せず、アウトラインを使用する
+                cache_manager.set_cached_outline(
+                    file_path, parser_type, apis, elapsed, parser_version=self.PARSER_VERSION
+                )
+            else:
+                cache_manager.set_cached_result(
+                    file_path,
+                    parser_type,
+                    apis,
+                    parser_version=self.PARSER_VERSION,
+                    records=records,
+                )
+        if classifier is not None and file_timeout > 0 and (outline or elapsed > file_timeout):
+            classifier.record_slow(rel_path, self.get_parser_type(), elapsed, outline=outline)
+
+    def _get_cached_apis(
+        self,
+        file_path: Path,
+        file_path_relative: Path,
+        cache_manager: "CacheManager | None",
+        parser_type: str | None,
+        trust_cache: bool = False,
+    ) -> list[APIRecord] | None:
+        """
+        キャッシュから解析結果を取得
+
+        キャッシュは取得のたびに新しいレコードを作成し、参照したファイルのパスを設定するため、
+        そのまま返します。
+
+        Args:
+            file_path: ファイルパス
+            file_path_relative: 相対パス
+            cache_manager: キャッシュマネージャー（Noneの場合はNoneを返す）
+            parser_type: パーサーの種類
+            trust_cache: キャッシュの検証（mtime・ハッシュ）を省略するかどうか
+
+        Returns:
+            API情報のレコードのリスト（キャッシュにない場合はNone）
+        """
+        if cache_manager is None or parser_type is None:
+            return None
+        return cache_manager.get_cached_result(
+            file_path, parser_type, verify=not trust_cache, parser_version=self.PARSER_VERSION
+        )
+
+    def _normalize_apis(self, apis: list[Any], file_path_relative: str) -> list[APIRecord]:
+        """
+        パーサーが返したAPI情報をレコードに変換
+
+        このパッケージのパーサーは相対パスを設定したレコードを返すため、そのまま返します。
+        辞書・`APIInfo`を返すパーサーの結果は、相対パスを設定したレコードに変換します。
+
+        Args:
+            apis: `parse_file`の戻り値
+            file_path_relative: 相対パス
+
+        Returns:
+            API情報のレコードのリスト
+        """
+        if all(type(api) is APIRecord for api in apis):
+            return apis
+
+        processed_apis: list[APIRecord] = []
+        for api in apis:
+            if isinstance(api, dict):
+                # 辞書の場合はレコードに変換（languageフィールドが不足している場合は追加）
+                api_dict = {"language": self.get_parser_type(), **api}
+                api_dict["file_path"] = file_path_relative
+                processed_apis.append(APIRecord.from_dict(api_dict))
+            elif isinstance(api, APIInfo):
+                record = APIRecord.from_model(api)
+                record.file_path = file_path_relative
+                processed_apis.append(record)
+            else:
+                api.file_path = file_path_relative
+                processed_apis.append(api)
+        return processed_apis
+
+    def _parse_in_processes(
+        self,
+        files_to_parse: list[tuple[Path, Path]],
+        cache_manager: "CacheManager | None",
+        parser_type: str | None,
+        classifier: FileClassifier | None,
+        max_workers: int | None = None,
+        file_timeout: float = 0.0,
+    ) -> tuple[list[APIRecord], int, int]:
+        """
+        キャッシュにないファイルをプロセスプールで解析
+
+        ファイルのリストをチャンクに分けてワーカーに渡し、レコード形式で返された
+        解析結果を親プロセスで復元・キャッシュに保存します。
+
+        ワーカーが時間の上限（と`_WORKER_GRACE`）を超えても1つのファイルの解析を
+        続けている場合は、そのワーカーを停止し、ファイルは親プロセスでアウトラインを
+        抽出します。結果を返していないチャンクの残りのファイルは新しいプロセスプールで
+        解析し直します。ワーカーが異常終了した場合は、残りのファイルをスレッドで解析します。
+
+        Args:
+            files_to_parse: 解析するファイル（(絶対パス, 相対パス)のリスト）
+            cache_manager: キャッシュマネージャー（オプション）
+            parser_type: パーサーの種類（オプション）
+            classifier: ファイルの種類の判定（指定された場合、バイナリ・minify済みのファイルは解析しない）
+            max_workers: ワーカープロセス数（Noneの場合はCPU数）
+            file_timeout: ファイルごとの解析の時間の上限（秒、0は無制限）
+
+        Returns:
+            (API情報のレコードのリスト, 成功したファイル数, 失敗したファイル数)
+        """
+        targets: list[tuple[str, str]] = []
+        skipped = 0
+        for file_path, file_path_relative in files_to_parse:
+            if classifier is not None and classifier.check(
+                file_path_relative.as_posix(), "parse", max_bytes=0
+            ):
+                skipped += 1
+                continue
+            targets.append((str(file_path), str(file_path_relative)))
+        if not targets:
+            return [], skipped, 0
+
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(targets)))
+        hard_timeout = file_timeout + _WORKER_GRACE if file_timeout > 0 else None
+        type_name = self.get_parser_type()
+
+        all_apis: list[APIRecord] = []
+        success_count = skipped
+        error_count = 0
+
+        def collect(index: int, result: tuple[Any, str | None, float, bool]) -> None:
+            nonlocal success_count, error_count
+            file_path, file_path_relative = targets[index]
+            apis = self._store_worker_result(
+                Path(file_path),
+                file_path_relative,
+                result,
+                cache_manager,
+                parser_type,
+                classifier,
+                file_timeout,
+            )
+            if apis is None:
+                error_count += 1
+            else:
+                all_apis.extend(apis)
+                success_count += 1
+
+        remaining = list(range(len(targets)))
+        while remaining:
+            chunk_size = max(1, -(-len(remaining) // (workers * _CHUNKS_PER_WORKER)))
+            slots = _WorkerSlots(workers)
+            futures: dict[Future, list[int]] = {}
+            stuck: list[tuple[int, int, float]] = []
+            broken = False
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self, slots)
+            ) as process_executor:
+                for start in range(0, len(remaining), chunk_size):
+                    chunk = remaining[start : start + chunk_size]
+                    files = [(index, *targets[index]) for index in chunk]
+                    futures[process_executor.submit(_parse_chunk, files, file_timeout)] = chunk
+                remaining = []
+
+                while futures:
+                    timeout = None if hard_timeout is None else slots.next_timeout(hard_timeout)
+                    done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk = futures.pop(future)
+                        try:
+                            results = future.result()
+                        except BrokenProcessPool:
+                            broken = True
+                            remaining.extend(chunk)
+                            continue
+                        for index, result in results:
+                            collect(index, result)
+                    if broken:
+                        break
+                    if hard_timeout is None:
+                        continue
+                    stuck = slots.stuck(hard_timeout)
+                    if stuck:
+                        # 時間の上限を超えても解析を続けているワーカーを停止する
+                        # （プロセスプールは使用できなくなるため、残りは作り直したプールで解析する）
+                        for pid, _, _ in stuck:
+                            try:
+                                os.kill(pid, signal.SIGTERM)
+                            except OSError:
+                                pass
+                        break
+
+                # 結果を返していないチャンクのファイルのみを解析し直す
+                for future, chunk in futures.items():
+                    try:
+                        results = future.result() if future.done() else None
+                    except BrokenProcessPool:
+                        results = None
+                    if results is None:
+                        remaining.extend(chunk)
+                        continue
+                    for index, result in results:
+                        collect(index, result)
+                process_executor.shutdown(wait=True, cancel_futures=True)
+
+            stuck_indexes = {index for _, index, _ in stuck}
+            for _, index, elapsed in stuck:
+                file_path, file_path_relative = targets[index]
+                logger.warning(
+                    f"[{type_name}] {file_path_relative} の解析が応答しないため、"
+                    "ワーカープロセスを停止しました"
+                )
+                collect(
+                    index, self._outline_in_parent(Path(file_path), file_path_relative, elapsed)
+                )
+            remaining = [index for index in remaining if index not in stuck_indexes]
+
+            if broken and remaining:
+                # ワーカーが異常終了した（メモリ不足・拡張モジュールのクラッシュなど）場合は
+                # 残りのファイルをスレッドで解析する
+                logger.warning(
+                    f"[{type_name}] ワーカープロセスが異常終了したため、"
+                    f"残りの {len(remaining)} 件のファイルをスレッドで解析します"
+                )
+                for index in remaining:
+                    file_path, file_path_relative = targets[index]
+                    apis = self._parse_file_safe(
+                        Path(file_path),
+                        Path(file_path_relative),
+                        cache_manager,
+                        parser_type,
+                        classifier=classifier,
+                        file_timeout=file_timeout,
+                    )
+                    all_apis.extend(apis)
+                    success_count += 1
+                remaining = []
+        return all_apis, success_count, error_count
+
+    def _outline_in_parent(
+        self, file_path: Path, file_path_relative: str, elapsed: float
+    ) -> tuple[Any, str | None, float, bool]:
+        """
+        停止したワーカーの代わりに親プロセスでアウトラインを抽出
+
+        Returns:
+            `_parse_chunk`が返すファイルごとの結果と同じ形式
+        """
+        try:
+            apis = self._normalize_apis(self.parse_outline(file_path), file_path_relative)
+        except Exception as e:
+            return None, _error_message(e), elapsed, False
+        return apis, None, elapsed, True
+
+    def _store_worker_result(
+        self,
+        file_path: Path,
+        file_path_relative: str,
+        result: tuple[Any, str | None, float, bool],
+        cache_manager: "CacheManager | None",
+        parser_type: str | None,
+        classifier: FileClassifier | None,
+        file_timeout: float,
+    ) -> list[APIRecord] | None:
+        """
+        ワーカーの解析結果を復元してキャッシュに保存
+
+        Args:
+            file_path: ファイルパス
+            file_path_relative: 相対パス
+            result: `_parse_chunk`が返すファイルごとの結果
+            cache_manager: キャッシュマネージャー（オプション）
+            parser_type: パーサーの種類（オプション）
+            classifier: 時間の上限を超えたファイルを記録する判定（オプション）
+            file_timeout: 解析の時間の上限（秒、0は無制限）
+
+        Returns:
+            API情報のレコードのリスト（解析に失敗した場合はNone）
+        """
+        payload, error, elapsed, outline = result
+        type_name = self.get_parser_type()
+        if error is not None:
+            # 失敗も内容に対して記録し、ファイルが変更されるまで再解析しない
+            if cache_manager is not None and parser_type is not None:
+                cache_manager.set_cached_error(
+                    file_path, parser_type, error, parser_version=self.PARSER_VERSION
+                )
+            logger.warning(f"[{type_name}] {file_path} の解析に失敗しました: {error}")
+            return None
+
+        if isinstance(payload, bytes):
+            records = payload
+            apis = decode_apis(payload, file_path_relative) or []
+        else:
+            records = None
+            apis = payload
+        self._store_result(
+            file_path,
+            file_path_relative.replace(os.sep, "/"),
+            apis,
+            cache_manager,
+            parser_type,
+            classifier,
+            elapsed,
+            outline,
+            file_timeout,
+            records=records,
+        )
+        if not apis:
+            logger.debug(f"[{type_name}] {file_path_relative}: API要素が見つかりませんでした")
+        return apis
@@ -5,34 +5,79 @@
 
 from pathlib import Path
 import re
+from typing import ClassVar
 
-from ...models import APIInfo
+from ...models import APIRecord
+from ...utils.exceptions import ParseTimeoutError
 from ...utils.logger import get_logger
+from ...utils.parse_budget import check_deadline
+from ...utils.source_index import LineIndex
 from .base_parser import BaseParser
 
 logger = get_logger("generic_parser")
 
+# ブロック形式のドキュメントコメント（/** ... */）
+_BLOCK_COMMENT = r"/\*\*\s*\n(?s:(?P<doc>.*?))\*/"
+
+# 行コメントは行頭（インデントのみ）から始まるものだけをドキュメントコメントとする
+_LINE_PREFIX = r"(?m:^)[ \t]*"
+
+# ドキュメントコメントの終わりから関数定義までの最大文字数
+_DOC_WINDOW = 200
+
+# 時間の上限を確認するマッチの間隔
+_DEADLINE_INTERVAL = 64
+
 
 class GenericParser(BaseParser):
-    """汎用コード解析クラス"""
+    """汎用コード解析クラス
+
+    言語ごとのパターン（ドキュメントコメント・関数定義・クラス定義）を名前付きグループの
+    1つの選択パターンにコンパイルしてクラスで共有し、1ファイルを1回の走査で抽出します。
+    """
 
     PARSER_TYPE: str = "generic"  # type: ignore[misc]
+    PARSER_VERSION: str = "3"  # type: ignore[misc]
 
-    # 言語別のコメントパターン
-    COMMENT_PATTERNS = {
-        "rust": (r"//!?\s*(.*)", r"fn\s+(\w+)", r"struct\s+(\w+)|impl\s+(\w+)"),
+    # 言語別のパターン（ドキュメントコメント, 関数定義, クラス定義）。
+    # それぞれ名前付きグループ doc・function・class_name で名前・本文を取得する。
+    # ブロックコメントは(?s:...)で複数行にマッチさせる
+    COMMENT_PATTERNS: ClassVar[dict[str, tuple[str, str, str]]] = {
+        "rust": (
+            _LINE_PREFIX + r"//[/!]?[ \t]*(?P<doc>.*)",
+            r"fn\s+(?P<function>\w+)",
+            r"(?:struct|impl)\s+(?P<class_name>\w+)",
+        ),
         "java": (
-            r"/\*\*\s*\n(.*?)\*/",
-            r"public\s+(?:static\s+)?(?:.*?\s+)?(\w+)\s*\(",
-            r"public\s+class\s+(\w+)",
+            _BLOCK_COMMENT,
+            r"public\s+(?:static\s+)?(?:.*?\s+)?(?P<function>\w+)\s*\(",
+            r"public\s+class\s+(?P<class_name>\w+)",
+        ),
+        "c": (_BLOCK_COMMENT, r"(?P<function>\w+)\s*\([^)]*\)", r"struct\s+(?P<class_name>\w+)"),
+        "cpp": (_BLOCK_COMMENT, r"(?P<function>\w+)\s*\([^)]*\)", r"class\s+(?P<class_name>\w+)"),
+        "go": (
+            _LINE_PREFIX + r"//[ \t]*(?P<doc>.*)",
+            r"func\s+(?P<function>\w+)",
+            r"type\s+(?P<class_name>\w+)\s+struct",
         ),
-        "c": (r"/\*\*\s*\n(.*?)\*/", r"(\w+)\s*\([^)]*\)", r"struct\s+(\w+)|typedef\s+struct"),
-        "cpp": (r"/\*\*\s*\n(.*?)\*/", r"(\w+)\s*\([^)]*\)", r"class\s+(\w+)"),
-        "go": (r"//\s*(.*)", r"func\s+(\w+)", r"type\s+(\w+)\s+struct"),
-        "ruby": (r"#\s*(.*)", r"def\s+(\w+)", r"class\s+(\w+)"),
-        "php": (r"/\*\*\s*\n(.*?)\*/", r"function\s+(\w+)", r"class\s+(\w+)"),
+        "ruby": (
+            _LINE_PREFIX + r"#[ \t]*(?P<doc>.*)",
+            r"def\s+(?P<function>\w+)",
+            r"class\s+(?P<class_name>\w+)",
+        ),
+        "php": (_BLOCK_COMMENT, r"function\s+(?P<function>\w+)", r"class\s+(?P<class_name>\w+)"),
     }
 
+    # パターンが定義されていない言語のパターン（Cスタイルコメント）
+    DEFAULT_PATTERNS: ClassVar[tuple[str, str, str]] = (
+        _BLOCK_COMMENT,
+        r"(?P<function>\w+)\s*\([^)]*\)",
+        r"(?:class|struct)\s+(?P<class_name>\w+)",
+    )
+
+    # 言語ごとにコンパイルした選択パターン（クラスで共有する）
+    _compiled_patterns: ClassVar[dict[str, re.Pattern[str]]] = {}
+
     def __init__(self, project_root: Path, language: str = "generic"):
         """
         初期化
@@ -46,75 +91,103 @@ class GenericParser(BaseParser):
         # 言語名をPARSER_TYPEとして使用（ログなどで識別しやすくするため）
         self.PARSER_TYPE = language
 
+    @classmethod
+    def get_pattern(cls, language: str) -> re.Pattern[str]:
+        """
+        言語の選択パターンを取得（初回のみコンパイルする）
+
+        ドキュメントコメント・クラス定義・関数定義の順の選択で、どれにマッチしたかは
+        `lastgroup`（_doc, _class, _function）で判定します。
+
+        Args:
+            language: 言語名
+
+        Returns:
+            コンパイル済みのパターン
+
+        Raises:
+            re.error: パターンが不正な場合
+        """
+        pattern = cls._compiled_patterns.get(language)
+        if pattern is None:
+            doc, function, class_ = cls.COMMENT_PATTERNS.get(language, cls.DEFAULT_PATTERNS)
+            pattern = re.compile(f"(?P<_doc>{doc})|(?P<_class>{class_})|(?P<_function>{function})")
+            cls._compiled_patterns[language] = pattern
+        return pattern
+
     def _parse_to_ast(self, content: str, file_path: Path) -> str:
         """ASTにパース（正規表現ベースなのでコンテンツをそのまま返す）"""
         return content
 
-    def _extract_elements(self, content: str, file_path: Path) -> list[APIInfo]:
+    def _extract_elements(self, content: str, file_path: Path) -> list[APIRecord]:
         """要素を抽出"""
         apis = []
 
-        # 言語に応じたパターンを取得
-        patterns = self.COMMENT_PATTERNS.get(self.language)
-        if not patterns:
-            # デフォルトパターン（Cスタイルコメント）
-            patterns = (
-                r"/\*\*\s*\n(.*?)\*/",
-                r"(\w+)\s*\([^)]*\)",
-                r"class\s+(\w+)|struct\s+(\w+)",
-            )
+        if self.language not in self.COMMENT_PATTERNS:
             logger.debug(
                 f"[{self.language}] カスタムパターンが見つかりませんでした。"
                 f"デフォルトパターンを使用します: {file_path.name}"
             )
 
-        comment_pattern, func_pattern, class_pattern = patterns
-
         try:
-            # コメント付き関数を抽出
-            for match in re.finditer(comment_pattern, content, re.DOTALL):
-                docstring = match.group(1).strip()
-                start_pos = match.end()
-
-                # 次の関数定義を探す
-                func_match = re.search(func_pattern, content[start_pos : start_pos + 200])
-                if func_match:
-                    name = func_match.group(1)
-                    line_num = content[: start_pos + func_match.start()].count("\n") + 1
-                    signature = self._extract_signature(
-                        content, start_pos + func_match.start(), name, "function"
-                    )
+            pattern = self.get_pattern(self.language)
+            relative_path = str(file_path.relative_to(self.project_root))
+            # 行番号はファイルごとに一度だけ作成したインデックスから求める
+            line_index = LineIndex(content)
+            # 直前のドキュメントコメント（連続する行コメントはまとめる）と終了位置
+            doc_lines: list[str] = []
+            doc_end = -1
+
+            for count, match in enumerate(pattern.finditer(content)):
+                # 時間の上限は一定のマッチ数ごとに確認する
+                if not count % _DEADLINE_INTERVAL:
+                    check_deadline()
+                kind = match.lastgroup
+                start = match.start()
 
+                if kind == "_doc":
+                    gap = content[doc_end:start] if doc_lines else ""
+                    if not doc_lines or gap.isspace() and gap.count("\n") <= 1:
+                        doc_lines.append(match.group("doc").strip())
+                    else:
+                        doc_lines = [match.group("doc").strip()]
+                    doc_end = match.end()
+
+                elif kind == "_class":
+                    name = match.group("class_name")
+                    signature = f"class {name}" if "class" in match.group(0) else f"struct {name}"
                     apis.append(
-                        APIInfo(
+                        APIRecord(
                             name=name,
-                            type="function",
+                            type="class",
                             signature=signature,
-                            docstring=self._clean_docstring(docstring),
-                            line_number=line_num,
-                            file_path=str(file_path.relative_to(self.project_root)),
+                            docstring="",
+                            line_number=line_index.line_of(start),
+                            file_path=relative_path,
                             language=self.language,
                         )
                     )
 
-            # クラス定義を抽出
-            for match in re.finditer(class_pattern, content):
-                name = match.group(1) or match.group(2) if match.lastindex else None
-                if name:
-                    line_num = content[: match.start()].count("\n") + 1
-                    signature = f"class {name}" if "class" in match.group(0) else f"struct {name}"
-
+                elif doc_lines:
+                    # ドキュメントコメントの直後（_DOC_WINDOW文字以内）の関数のみを抽出する
+                    docstring = "\n".join(doc_lines)
+                    doc_lines = []
+                    if start - doc_end >= _DOC_WINDOW:
+                        continue
+                    name = match.group("function")
                     apis.append(
-                        APIInfo(
+                        APIRecord(
                             name=name,
-                            type="class",
-                            signature=signature,
-                            docstring="",
-                            line_number=line_num,
-                            file_path=str(file_path.relative_to(self.project_root)),
+                            type="function",
+                            signature=self._extract_signature(content, start, name, "function"),
+                            docstring=self._clean_docstring(docstring),
+                            line_number=line_index.line_of(start),
+                            file_path=relative_path,
                             language=self.language,
                         )
                     )
+        except ParseTimeoutError:
+            raise
         except re.error as e:
             logger.warning(
                 f"[{self.language}] {file_path.name} の正規表現パターンでエラーが発生しました: {e}"
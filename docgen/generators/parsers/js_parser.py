@@ -4,178 +4,49 @@ JSDocコメントを抽出してAPI情報を生成
 """
 
 from pathlib import Path
-import re
-from typing import TYPE_CHECKING
 
-from ...models import APIInfo
+from ...models import APIParameterRecord, APIRecord
 from .base_parser import BaseParser
-
-if TYPE_CHECKING:
-    from ...models import APIParameter
+from .js_scanner import JSDeclaration, scan_declarations
 
 
 class JSParser(BaseParser):
-    """JavaScript/TypeScriptコード解析クラス"""
-
-    PARSER_TYPE: str = "javascript"  # type: ignore[misc]
+    """JavaScript/TypeScriptコード解析クラス
 
-    # JSDocコメントのパターン
-    JSDOC_PATTERN = re.compile(
-        r"/\*\*\s*\n(.*?)\*/\s*\n\s*(?:export\s+)?(?:async\s+)?(?:(?:function|class)\s+(\w+)|(?:const|let|var)\s+(\w+)\s*=|(\w+)\s*\([^)]*\)\s*\{)",
-        re.DOTALL | re.MULTILINE,
-    )
+    字句解析ベースのスキャナー（`js_scanner.scan_declarations`）で宣言とJSDocを
+    一度の走査で抽出します。
+    """
 
-    # 関数定義のパターン
-    FUNCTION_PATTERN = re.compile(
-        r"(?:export\s+)?(?:async\s+)?(?:function\s+(\w+)|(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\([^)]*\)\s*=>|(\w+)\s*:\s*(?:async\s+)?\([^)]*\)\s*=>|(\w+)\s*\([^)]*\)\s*\{)",
-        re.MULTILINE,
-    )
-
-    # クラス定義のパターン
-    CLASS_PATTERN = re.compile(r"(?:export\s+)?class\s+(\w+)", re.MULTILINE)
+    PARSER_TYPE: str = "javascript"  # type: ignore[misc]
+    PARSER_VERSION: str = "4"  # type: ignore[misc]
 
-    def _parse_to_ast(self, content: str, file_path: Path) -> str:
-        """ASTにパース（正規表現ベースなのでコンテンツをそのまま返す）"""
-        return content
+    def _parse_to_ast(self, content: str, file_path: Path) -> list[JSDeclaration]:
+        """ASTにパース（宣言のリストを返す）"""
+        return scan_declarations(content)
 
-    def _extract_elements(self, content: str, file_path: Path) -> list[APIInfo]:
+    def _extract_elements(
+        self, declarations: list[JSDeclaration], file_path: Path
+    ) -> list[APIRecord]:
         """要素を抽出"""
+        relative_path = str(file_path.relative_to(self.project_root))
         apis = []
-        class_stack = []
-
-        # クラス定義を先に抽出してclass_stackを作成
-        for match in self.CLASS_PATTERN.finditer(content):
-            name = match.group(1)
-            class_start = match.start()
-            # 対応する}を見つける
-            brace_count = 0
-            class_end = class_start
-            for i, char in enumerate(content[class_start:], class_start):
-                if char == "{":
-                    brace_count += 1
-                elif char == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        class_end = i + 1
-                        break
-            class_stack.append((name, class_start, class_end))
-
-        # JSDoc付きの関数/クラスを抽出
-        for match in self.JSDOC_PATTERN.finditer(content):
-            docstring = match.group(1).strip()
-            name = match.group(2) or match.group(3) or match.group(4)
-
-            # 行番号を取得
-            line_num = content[: match.start()].count("\n") + 1
-
-            # 関数かクラスかを判定
-            api_type = "function"
-            if "class" in match.group(0):
-                api_type = "class"
-            elif match.group(4):  # メソッドの場合
-                api_type = "method"
-
-            # シグネチャを抽出
-            signature = self._extract_signature(content, match.end(), name, api_type)
-
-            # パラメータを抽出
-            parameters = self._extract_parameters(docstring)
-
+        for declaration in declarations:
+            jsdoc = declaration.jsdoc
             apis.append(
-                APIInfo(
-                    name=name,
-                    type=api_type,
-                    signature=signature,
-                    docstring=self._clean_jsdoc(docstring),
-                    parameters=parameters,
-                    line_number=line_num,
-                    file_path=str(file_path.relative_to(self.project_root)),
+                APIRecord(
+                    name=declaration.name,
+                    type=declaration.kind,
+                    signature=declaration.signature,
+                    docstring=self._clean_jsdoc(jsdoc) if jsdoc else "",
+                    parameters=self._extract_parameters(jsdoc) if jsdoc else None,
+                    line_number=declaration.line,
+                    file_path=relative_path,
                     language="javascript",
                 )
             )
-
-        # JSDocなしの関数も抽出（簡易版）
-        for match in self.FUNCTION_PATTERN.finditer(content):
-            name = match.group(1) or match.group(2) or match.group(3) or match.group(4)
-            if name and not any(api.name == name for api in apis):
-                line_num = content[: match.start()].count("\n") + 1
-
-                # クラス内にあるかをチェック
-                api_type = "function"
-                for _class_name, class_start, class_end in class_stack:
-                    if class_start < match.start() < class_end:
-                        api_type = "method"
-                        break
-
-                signature = self._extract_signature(content, match.end(), name, api_type)
-                apis.append(
-                    APIInfo(
-                        name=name,
-                        type=api_type,
-                        signature=signature,
-                        docstring="",
-                        line_number=line_num,
-                        file_path=str(file_path.relative_to(self.project_root)),
-                        language="javascript",
-                    )
-                )
-
-        for match in self.CLASS_PATTERN.finditer(content):
-            name = match.group(1)
-            if name and not any(api.name == name for api in apis):
-                line_num = content[: match.start()].count("\n") + 1
-                signature = f"class {name}"
-                apis.append(
-                    APIInfo(
-                        name=name,
-                        type="class",
-                        signature=signature,
-                        docstring="",
-                        line_number=line_num,
-                        file_path=str(file_path.relative_to(self.project_root)),
-                        language="javascript",
-                    )
-                )
-
         return apis
 
-    def _extract_signature(self, content: str, start_pos: int, name: str, api_type: str) -> str:
-        """
-        シグネチャを抽出
-
-        Args:
-            content: ファイル内容
-            start_pos: 開始位置
-            name: 関数/クラス名
-            api_type: 'function' または 'class'
-
-        Returns:
-            シグネチャ文字列
-        """
-        # 簡易的なシグネチャ抽出
-        if api_type == "class":
-            return f"class {name}"
-
-        # 関数のシグネチャを抽出（簡易版）
-        lines = content[start_pos : start_pos + 10].split("\n")
-        if lines:
-            first_line = lines[0].strip()
-            if "(" in first_line:
-                end_pos = first_line.find(")") + 1
-                if end_pos > 0:
-                    # 関数名を含むシグネチャを構築
-                    sig = first_line[:end_pos]
-                    # 関数名が含まれていない場合は追加
-                    if name not in sig:
-                        # パラメータ部分を抽出
-                        param_start = sig.find("(")
-                        if param_start >= 0:
-                            return f"function {name}{sig[param_start:]}"
-                    return sig
-
-        return f"function {name}(...)"
-
-    def _extract_parameters(self, docstring: str) -> "list[APIParameter] | None":
+    def _extract_parameters(self, docstring: str) -> list[APIParameterRecord] | None:
         """
         JSDocからパラメータを抽出
 
@@ -183,11 +54,9 @@ class JSParser(BaseParser):
             docstring: JSDocコメントの内容
 
         Returns:
-            APIParameterオブジェクトのリスト、またはNone
+            パラメータのレコードのリスト、またはNone
         """
-        from ...models import APIParameter
-
-        params: "list[APIParameter]" = []
+        params: list[APIParameterRecord] = []
         lines = docstring.split("\n")
         for line in lines:
             # * を削除してから処理
@@ -208,7 +77,7 @@ class JSParser(BaseParser):
                         desc_start = line.find("-") + 1
                         description = line[desc_start:].strip()
                     params.append(
-                        APIParameter(
+                        APIParameterRecord(
                             name=param_name,
                             type=param_type,
                             description=description,
@@ -0,0 +1,644 @@
+"""
+JavaScript/TypeScriptの宣言スキャナー
+
+字句解析で文字列・テンプレートリテラル・コメント・正規表現リテラルを読み飛ばしながら
+ソースを一度だけ走査し、括弧の対応を求めたうえで、モジュール直下・クラス本体・
+モジュール直下のオブジェクトリテラルにある宣言（関数・クラス・メソッド）と、
+直前のJSDocを抽出します。文字列やコメント中の括弧に影響されず、処理時間は
+ファイルサイズに比例します。
+
+関数本体の中のローカルな関数は、APIではないため抽出しません。
+"""
+
+from dataclasses import dataclass
+import re
+
+from ...utils.parse_budget import check_deadline
+from ...utils.source_index import LineIndex
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<space>\s+)
+    |(?P<jsdoc>/\*\*(?![*/]).*?(?:\*/|\Z))
+    |(?P<comment>/\*.*?(?:\*/|\Z)|//[^\n]*)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    |(?P<template>`)
+    |(?P<name>(?:[^\W\d]|[$#])[\w$]*)
+    |(?P<number>\.?\d(?:[\w.]|(?<=[eE])[-+])*)
+    |(?P<punct>=>|\.\.\.|[=!]==?|\?\?=?|\?\.(?!\d)|&&=?|\|\|=?|\*\*=?|<<=?|>>>?=?
+        |[-+*/%&|^<>]=|\+\+|--|.)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# テンプレートリテラルの本体（終端の`または式の開始の${まで）
+_TEMPLATE_PATTERN = re.compile(r"(?:[^`\\$]+|\\.|\$(?!\{))*(`|\$\{)?", re.DOTALL)
+
+# 正規表現リテラル（文字クラス内の/を含む）
+_REGEX_PATTERN = re.compile(r"/(?:[^/\\\n\[]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+
+# 直後の/が正規表現リテラルの開始になるキーワード
+_EXPRESSION_KEYWORDS = frozenset(
+    {
+        "return",
+        "typeof",
+        "instanceof",
+        "in",
+        "of",
+        "new",
+        "delete",
+        "void",
+        "throw",
+        "case",
+        "do",
+        "else",
+        "yield",
+        "await",
+    }
+)
+
+# モジュール直下の宣言の前に置ける修飾子
+_MODULE_MODIFIERS = frozenset({"export", "default", "declare", "abstract"})
+
+# クラスのメンバーの修飾子（シグネチャに含めるもの）
+_SIGNATURE_MODIFIERS = ("static", "async", "get", "set")
+
+# クラスのメンバーの修飾子（シグネチャに含めないもの）
+_MEMBER_MODIFIERS = frozenset(
+    {
+        *_SIGNATURE_MODIFIERS,
+        "public",
+        "private",
+        "protected",
+        "readonly",
+        "abstract",
+        "override",
+        "declare",
+        "accessor",
+    }
+)
+
+# 修飾子ではなくメンバー名として使われていることを示す次のトークン
+_MEMBER_NAME_FOLLOWERS = frozenset({"(", "=", ":", ";", "?", "!", "<", ",", "}"})
+
+# 型の中で、直後の{が本体ではなく型の一部になるトークン
+_TYPE_CONTINUATIONS = frozenset({":", "|", "&", "<", ",", "=>", "(", "[", "keyof", "typeof"})
+
+# 値の終わりになり得るトークン（改行の後に続くトークンは次の文・メンバーとみなす）
+_VALUE_END_KINDS = frozenset({"name", "number", "string", "template", "regex"})
+
+
+@dataclass(slots=True)
+class Token:
+    """
+    字句解析のトークン
+
+    Attributes:
+        kind: 種類（name, number, string, template, regex, punct）
+        text: テキスト（テンプレートリテラルは`のみ）
+        start: ソース中の開始位置
+        newline: 直前のトークンとの間に改行があるか
+    """
+
+    kind: str
+    text: str
+    start: int
+    newline: bool
+
+
+@dataclass(slots=True)
+class JSDeclaration:
+    """
+    抽出した宣言
+
+    Attributes:
+        name: 名前
+        kind: 種類（function, class, method）
+        line: 行番号（修飾子・exportを含む宣言の先頭の行）
+        signature: シグネチャ
+        jsdoc: 直前のJSDocの本文（`/**`と`*/`の間、ない場合はNone）
+    """
+
+    name: str
+    kind: str
+    line: int
+    signature: str
+    jsdoc: str | None = None
+
+
+def tokenize(source: str) -> tuple[list[Token], dict[int, str]]:
+    """
+    ソースをトークンに分割
+
+    コメントは読み飛ばし、JSDocは直後のトークンの位置に関連付けます。
+    テンプレートリテラルは式（`${...}`）を含めて1つのトークンにします。
+
+    Args:
+        source: ソース
+
+    Returns:
+        (トークンのリスト, {JSDocの直後のトークンの位置: JSDocの本文})
+    """
+    tokens: list[Token] = []
+    docs: dict[int, str] = {}
+    match = _TOKEN_PATTERN.match
+    # テンプレートリテラルの式（${...}）ごとの、式の中の{のネストの深さ
+    template_stack: list[int] = []
+    newline = True
+    last: Token | None = None
+    pos = 0
+    length = len(source)
+    steps = 0
+
+    def template_body(pos: int) -> int:
+        end_match = _TEMPLATE_PATTERN.match(source, pos)
+        assert end_match is not None
+        if end_match.group(1) == "${":
+            template_stack.append(0)
+        return end_match.end()
+
+    while pos < length:
+        # 解析の時間の上限は一定のトークン数ごとに確認する
+        steps += 1
+        if not steps & 0xFFF:
+            check_deadline()
+        token_match = match(source, pos)
+        assert token_match is not None
+        kind = token_match.lastgroup
+        start = pos
+        pos = token_match.end()
+
+        if kind == "space" or kind == "comment":
+            if "\n" in token_match.group():
+                newline = True
+            continue
+        if kind == "jsdoc":
+            if not template_stack:
+                text = token_match.group()
+                docs[len(tokens)] = text[3:-2] if text.endswith("*/") else text[3:]
+            newline = True
+            continue
+        if kind == "template":
+            if not template_stack:
+                last = Token("template", "`", start, newline)
+                tokens.append(last)
+                newline = False
+            pos = template_body(pos)
+            continue
+
+        text = token_match.group()
+        if template_stack:
+            # テンプレートリテラルの式の中のトークンは読み飛ばす
+            if text == "{":
+                template_stack[-1] += 1
+            elif text == "}":
+                if template_stack[-1] == 0:
+                    template_stack.pop()
+                    pos = template_body(pos)
+                else:
+                    template_stack[-1] -= 1
+            continue
+
+        assert kind is not None
+        if text == "/" and _regex_allowed(last):
+            regex_match = _REGEX_PATTERN.match(source, start)
+            if regex_match is not None:
+                kind, text, pos = "regex", regex_match.group(), regex_match.end()
+
+        last = Token(kind, text, start, newline)
+        tokens.append(last)
+        newline = False
+
+    return tokens, docs
+
+
+def _regex_allowed(last: Token | None) -> bool:
+    """直前のトークンから、/が正規表現リテラルの開始かどうかを判定"""
+    if last is None:
+        return True
+    if last.kind == "name":
+        return last.text in _EXPRESSION_KEYWORDS
+    if last.kind == "punct":
+        # <の直後の/はJSXの閉じタグ（</tag>）とみなす
+        return last.text not in (")", "]", "}", "<")
+    return False
+
+
+def match_brackets(tokens: list[Token]) -> list[int]:
+    """
+    括弧の対応を求める
+
+    Args:
+        tokens: トークンのリスト
+
+    Returns:
+        開き括弧の位置に対応する閉じ括弧の位置を持つリスト（閉じていない場合は
+        トークン数、括弧以外は-1）
+    """
+    closes = [-1] * len(tokens)
+    stack: list[int] = []
+    for i, token in enumerate(tokens):
+        if token.kind != "punct":
+            continue
+        text = token.text
+        if text == "(" or text == "[" or text == "{":
+            stack.append(i)
+        elif (text == ")" or text == "]" or text == "}") and stack:
+            closes[stack.pop()] = i
+    for i in stack:
+        closes[i] = len(tokens)
+    return closes
+
+
+def scan_declarations(source: str) -> list[JSDeclaration]:
+    """
+    ソースから宣言を抽出
+
+    Args:
+        source: JavaScript/TypeScriptのソース
+
+    Returns:
+        宣言のリスト（出現順、クラスはメソッドより前）
+    """
+    tokens, docs = tokenize(source)
+    scanner = _DeclarationScanner(source, tokens, docs)
+    scanner.scan_module(0, len(tokens))
+    return scanner.declarations
+
+
+class _DeclarationScanner:
+    """トークン列から宣言を抽出"""
+
+    def __init__(self, source: str, tokens: list[Token], docs: dict[int, str]):
+        self.source = source
+        self.tokens = tokens
+        self.docs = docs
+        self.closes = match_brackets(tokens)
+        self.line_index = LineIndex(source)
+        self.declarations: list[JSDeclaration] = []
+        # 重複を除くための (所属するクラス・オブジェクト, 名前)
+        self._seen: set[tuple[str, str]] = set()
+
+    # --- ヘルパー ---
+
+    def _text(self, i: int) -> str:
+        """位置iのトークンのテキスト（範囲外の場合は空文字）"""
+        return self.tokens[i].text if i < len(self.tokens) else ""
+
+    def _is_name(self, i: int) -> bool:
+        return i < len(self.tokens) and self.tokens[i].kind == "name"
+
+    def _source_between(self, open_index: int, close_index: int) -> str:
+        """括弧の中のソース（空白を1つにまとめる）"""
+        start = self.tokens[open_index].start + 1
+        end = self.tokens[close_index].start if close_index < len(self.tokens) else len(self.source)
+        return " ".join(self.source[start:end].split())
+
+    def _skip_angles(self, i: int, end: int) -> int:
+        """型引数（<...>）の次の位置"""
+        depth = 0
+        while i < end:
+            text = self.tokens[i].text
+            if text == "<":
+                depth += 1
+            elif text in (">", ">>", ">>>"):
+                depth -= len(text)
+                if depth <= 0:
+                    return i + 1
+            elif text in ("{", "(", "["):
+                i = self.closes[i]
+            elif text == ";":
+                return i
+            i += 1
+        return i
+
+    def _ends_value(self, i: int) -> bool:
+        """位置iのトークンが改行の後にあり、直前で値・型が終わっているか（自動セミコロン挿入）"""
+        token = self.tokens[i]
+        if not token.newline or i == 0:
+            return False
+        previous = self.tokens[i - 1]
+        if previous.kind in _VALUE_END_KINDS:
+            return token.kind == "name" or token.text in ("@", "#", "*", "[", "(", "{")
+        return previous.text in (")", "]", "}") and token.kind == "name"
+
+    def _skip_type(self, i: int, end: int, stops: tuple[str, ...]) -> int:
+        """型注釈を読み飛ばし、stopsのいずれか・本体の{・文の終わりの位置を返す"""
+        while i < end:
+            token = self.tokens[i]
+            text = token.text
+            if text in stops or text == ";" or text == "}":
+                return i
+            if text == "{":
+                previous = self.tokens[i - 1].text
+                if previous not in _TYPE_CONTINUATIONS:
+                    return i
+                i = self.closes[i] + 1
+                continue
+            if text in ("(", "["):
+                i = self.closes[i] + 1
+                continue
+            if text == "<":
+                i = self._skip_angles(i, end)
+                continue
+            if self._ends_value(i):
+                return i
+            i += 1
+        return i
+
+    def _skip_value(self, i: int, end: int) -> int:
+        """式を読み飛ばし、文・メンバーの区切り（; , または改行）の位置を返す"""
+        while i < end:
+            text = self.tokens[i].text
+            if text in (";", ",", "}") or self._ends_value(i):
+                return i
+            if text in ("(", "[", "{"):
+                i = self.closes[i] + 1
+                continue
+            i += 1
+        return i
+
+    def _function_value(self, i: int, end: int) -> tuple[str, int] | None:
+        """
+        関数式・アロー関数を判定
+
+        Returns:
+            (引数のソース, 関数の次の位置)、関数でない場合はNone
+        """
+        if self._text(i) == "async" and self._text(i + 1) != "=>":
+            i += 1
+        if self._text(i) == "function":
+            i += 1
+            if self._text(i) == "*":
+                i += 1
+            if self._is_name(i):
+                i += 1
+            if self._text(i) == "<":
+                i = self._skip_angles(i, end)
+            if self._text(i) != "(":
+                return None
+            close = self.closes[i]
+            return self._source_between(i, close), self._skip_body(close + 1, end)
+        if self._is_name(i) and self._text(i + 1) == "=>":
+            return self.tokens[i].text, self._skip_body(i + 2, end)
+        if self._text(i) == "<":
+            i = self._skip_angles(i, end)
+        if self._text(i) != "(":
+            return None
+        close = self.closes[i]
+        after = close + 1
+        if self._text(after) == ":":
+            after = self._skip_type(after + 1, end, ("=>",))
+        if self._text(after) != "=>":
+            return None
+        return self._source_between(i, close), self._skip_body(after + 1, end)
+
+    def _skip_body(self, i: int, end: int) -> int:
+        """関数の本体（{...}またはアロー関数の式）の次の位置"""
+        if self._text(i) == ":":
+            i = self._skip_type(i + 1, end, ())
+        if self._text(i) == "{":
+            return self.closes[i] + 1
+        return self._skip_value(i, end)
+
+    def _add(self, name: str, kind: str, start: int, signature: str, owner: str = "") -> None:
+        """宣言を追加（同じクラス・オブジェクトの同じ名前は最初の宣言のみ）"""
+        key = (owner, name)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.declarations.append(
+            JSDeclaration(
+                name=name,
+                kind=kind,
+                line=self.line_index.line_of(self.tokens[start].start),
+                signature=signature,
+                jsdoc=self.docs.get(start),
+            )
+        )
+
+    # --- モジュール ---
+
+    def scan_module(self, i: int, end: int) -> None:
+        """モジュール直下（名前空間の中を含む）の宣言を抽出"""
+        tokens = self.tokens
+        while i < end:
+            token = tokens[i]
+            text = token.text
+            if token.kind == "punct":
+                i = self.closes[i] + 1 if text in ("(", "[", "{") else i + 1
+                continue
+            if token.kind != "name":
+                i += 1
+                continue
+
+            start = i
+            while self._text(i) in _MODULE_MODIFIERS and self._is_name(i + 1):
+                i += 1
+            text = self._text(i)
+
+            if text == "async" and self._text(i + 1) == "function":
+                i = self._function_declaration(start, i + 1, end)
+            elif text == "function":
+                i = self._function_declaration(start, i, end)
+            elif text == "class":
+                i = self._class_declaration(start, i, end)
+            elif text in ("const", "let", "var"):
+                i = self._variable_declaration(start, i + 1, end)
+            elif text in ("namespace", "module") and self._text(i + 2) == "{":
+                close = self.closes[i + 2]
+                self.scan_module(i + 3, close)
+                i = close + 1
+            elif text in ("exports", "module") and (start == 0 or tokens[start - 1].text != "."):
+                i = self._exports_assignment(i, end)
+            else:
+                i += 1
+
+    def _function_declaration(self, start: int, i: int, end: int) -> int:
+        """function宣言（iはfunctionの位置）"""
+        i += 1
+        if self._text(i) == "*":
+            i += 1
+        if not self._is_name(i):
+            return i
+        name = self.tokens[i].text
+        i += 1
+        if self._text(i) == "<":
+            i = self._skip_angles(i, end)
+        if self._text(i) != "(":
+            return i
+        close = self.closes[i]
+        self._add(name, "function", start, f"function {name}({self._source_between(i, close)})")
+        return self._skip_body(close + 1, end)
+
+    def _class_declaration(self, start: int, i: int, end: int, name: str | None = None) -> int:
+        """class宣言・式（iはclassの位置、nameは無名クラスを代入した変数名）"""
+        i += 1
+        if self._is_name(i) and self._text(i) not in ("extends", "implements"):
+            name = self.tokens[i].text
+            i += 1
+        # extends・implements・型引数を読み飛ばして本体を探す
+        while i < end and self._text(i) != "{":
+            text = self._text(i)
+            if text == "<":
+                i = self._skip_angles(i, end)
+            elif text in ("(", "["):
+                i = self.closes[i] + 1
+            else:
+                i += 1
+        if i >= end:
+            return i
+        close = self.closes[i]
+        if name:
+            self._add(name, "class", start, f"class {name}")
+            self.scan_class(i + 1, close, name)
+        return close + 1
+
+    def _variable_declaration(self, start: int, i: int, end: int) -> int:
+        """const・let・var宣言（iは変数名の位置）"""
+        if not self._is_name(i):
+            return i
+        name = self.tokens[i].text
+        i += 1
+        if self._text(i) in ("!", "?"):
+            i += 1
+        if self._text(i) == ":":
+            i = self._skip_type(i + 1, end, ("=",))
+        if self._text(i) != "=":
+            return i
+        return self._assigned_value(start, i + 1, end, name, "")
+
+    def _assigned_value(self, start: int, i: int, end: int, name: str, owner: str) -> int:
+        """変数・プロパティに代入した値（関数・クラス・オブジェクトリテラル）"""
+        if self._text(i) == "class":
+            return self._class_declaration(start, i, end, name)
+        if self._text(i) == "{":
+            close = self.closes[i]
+            self.scan_object(i + 1, close, name)
+            return close + 1
+        function = self._function_value(i, end)
+        if function is None:
+            return i
+        params, i = function
+        self._add(name, "function", start, f"function {name}({params})", owner)
+        return i
+
+    def _exports_assignment(self, i: int, end: int) -> int:
+        """exports.name = ...・module.exports.name = ...・module.exports = {...}"""
+        start = i
+        if self._text(i) == "module":
+            if self._text(i + 1) != "." or self._text(i + 2) != "exports":
+                return i + 1
+            i += 2
+        i += 1
+        if self._text(i) == "=":
+            if self._text(i + 1) == "{":
+                close = self.closes[i + 1]
+                self.scan_object(i + 2, close, "module.exports")
+                return close + 1
+            return i + 1
+        if self._text(i) != "." or not self._is_name(i + 1) or self._text(i + 2) != "=":
+            return i
+        return self._assigned_value(start, i + 3, end, self.tokens[i + 1].text, "")
+
+    # --- クラス・オブジェクト ---
+
+    def scan_class(self, i: int, end: int, class_name: str) -> None:
+        """クラス本体のメソッドを抽出"""
+        while i < end:
+            text = self._text(i)
+            if text in (";", ","):
+                i += 1
+                continue
+            start = i
+            # デコレーター
+            while self._text(i) == "@":
+                i += 1
+                while self._is_name(i) or self._text(i) == ".":
+                    i += 1
+                if self._text(i) == "(":
+                    i = self.closes[i] + 1
+            # static {...}（静的初期化ブロック）
+            if self._text(i) == "static" and self._text(i + 1) == "{":
+                i = self.closes[i + 1] + 1
+                continue
+            i = self._member(start, i, end, class_name, "method")
+
+    def scan_object(self, i: int, end: int, owner: str) -> None:
+        """モジュール直下のオブジェクトリテラルの関数を抽出"""
+        while i < end:
+            text = self._text(i)
+            if text == ",":
+                i += 1
+                continue
+            if text == "...":
+                i = self._skip_value(i + 1, end)
+                continue
+            i = self._member(i, i, end, owner, "function")
+
+    def _member(self, start: int, i: int, end: int, owner: str, kind: str) -> int:
+        """クラス・オブジェクトのメンバー（iは修飾子・名前の位置）"""
+        modifiers = []
+        while (
+            self._text(i) in _MEMBER_MODIFIERS and self._text(i + 1) not in _MEMBER_NAME_FOLLOWERS
+        ):
+            if self._text(i) in _SIGNATURE_MODIFIERS:
+                modifiers.append(self._text(i))
+            i += 1
+        if self._text(i) == "*":
+            modifiers.append("*")
+            i += 1
+
+        token = self.tokens[i] if i < end else None
+        if token is None:
+            return end
+        if token.kind == "name" or token.kind == "number":
+            name = token.text
+            i += 1
+        elif token.kind == "string":
+            name = token.text[1:-1]
+            i += 1
+        elif token.text == "[":
+            # 計算されたプロパティ名
+            close = self.closes[i]
+            name = f"[{self._source_between(i, close)}]"
+            i = close + 1
+        else:
+            return i + 1
+
+        if self._text(i) in ("?", "!"):
+            i += 1
+        if self._text(i) in ("<", "("):
+            if self._text(i) == "<":
+                i = self._skip_angles(i, end)
+            if self._text(i) != "(":
+                return i
+            close = self.closes[i]
+            params = self._source_between(i, close)
+            i = close + 1
+            if self._text(i) == ":":
+                i = self._skip_type(i + 1, end, ())
+            if self._text(i) == "{":
+                i = self.closes[i] + 1
+            if not name.startswith("#"):
+                prefix = "".join(f"{m} " if m != "*" else m for m in modifiers)
+                self._add(name, kind, start, f"{prefix}{name}({params})", owner)
+            return i
+
+        if self._text(i) == ":" and kind == "method":
+            # 型注釈付きのフィールド
+            i = self._skip_type(i + 1, end, ("=",))
+        if self._text(i) in ("=", ":"):
+            i += 1
+            function = self._function_value(i, end)
+            if function is not None:
+                params, i = function
+                if not name.startswith("#"):
+                    self._add(name, kind, start, f"{name}({params})", owner)
+                return i
+            if kind == "function" and self._text(i) == "{":
+                # ネストしたオブジェクトリテラル
+                close = self.closes[i]
+                self.scan_object(i + 1, close, f"{owner}.{name}")
+                i = close + 1
+        return self._skip_value(i, end)
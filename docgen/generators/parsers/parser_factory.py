@@ -8,15 +8,22 @@
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ...utils.logger import get_logger
 from .base_parser import BaseParser
 from .generic_parser import GenericParser
 from .js_parser import JSParser
 from .python_parser import PythonParser
+from .tree_sitter_parser import GRAMMARS, TreeSitterParser
 
 if TYPE_CHECKING:
-    pass
+    from ...utils.module_store import ModuleStore
 
-__all__ = ["ParserFactory"]
+__all__ = ["BACKENDS", "ParserFactory"]
+
+logger = get_logger("parser_factory")
+
+# 解析のバックエンド（`parse.backend`）
+BACKENDS = ("regex", "tree_sitter")
 
 
 class ParserFactory:
@@ -32,14 +39,26 @@ class ParserFactory:
         "typescript": JSParser,  # TypeScriptもJSParserを使用
     }
 
+    # tree-sitterを使用できずに正規表現ベースのパーサーにフォールバックした言語（警告は一度のみ）
+    _tree_sitter_fallbacks: set[str] = set()
+
     @classmethod
-    def create_parser(cls, project_root: Path, language: str) -> BaseParser:
+    def create_parser(
+        cls,
+        project_root: Path,
+        language: str,
+        module_store: "ModuleStore | None" = None,
+        backend: str = "regex",
+    ) -> BaseParser:
         """
         指定された言語のパーサーを作成
 
         Args:
             project_root: プロジェクトのルートディレクトリ
             language: 言語名（例: 'python', 'javascript', 'go'）
+            module_store: 解析済みモジュールのストア（PythonParserで共有）
+            backend: 解析のバックエンド（`parse.backend`、"regex", "tree_sitter"）。
+                "tree_sitter"でも文法を読み込めない言語は正規表現ベースのパーサーを使用する
 
         Returns:
             パーサーインスタンス
@@ -47,8 +66,22 @@ class ParserFactory:
         Raises:
             ValueError: サポートされていない言語が指定された場合
         """
+        if backend == "tree_sitter" and language in GRAMMARS:
+            if TreeSitterParser.is_available(language):
+                return TreeSitterParser(project_root, language)
+            if language not in cls._tree_sitter_fallbacks:
+                cls._tree_sitter_fallbacks.add(language)
+                logger.warning(
+                    f"[{language}] tree-sitterの文法を読み込めないため、正規表現ベースのパーサーで解析します"
+                    "（インストール: pip install 'agents-docs-sync[tree-sitter]'）"
+                )
+        elif backend not in BACKENDS:
+            logger.warning(f"不明な解析のバックエンドです: {backend}。regexで解析します")
+
         # 専用パーサーが定義されている場合
         parser_class = cls._PARSER_MAP.get(language)
+        if parser_class is PythonParser:
+            return PythonParser(project_root, module_store=module_store)
         if parser_class:
             return parser_class(project_root)
 
@@ -56,13 +89,21 @@ class ParserFactory:
         return GenericParser(project_root, language=language)
 
     @classmethod
-    def create_parsers(cls, project_root: Path, languages: list[str]) -> list[BaseParser]:
+    def create_parsers(
+        cls,
+        project_root: Path,
+        languages: list[str],
+        module_store: "ModuleStore | None" = None,
+        backend: str = "regex",
+    ) -> list[BaseParser]:
         """
         複数の言語のパーサーを作成
 
         Args:
             project_root: プロジェクトのルートディレクトリ
             languages: 言語名のリスト
+            module_store: 解析済みモジュールのストア（PythonParserで共有）
+            backend: 解析のバックエンド（`parse.backend`）
 
         Returns:
             パーサーインスタンスのリスト
@@ -71,9 +112,12 @@ class ParserFactory:
         seen_parsers = set()  # 重複を避けるため（例: javascriptとtypescriptは同じパーサー）
 
         for lang in languages:
-            # 同じパーサー型を複数作成しないようにチェック
-            parser = cls.create_parser(project_root, lang)
-            parser_type = type(parser).__name__
+            # 同じ種類のパーサーを複数作成しないようにチェック
+            # （GenericParser・TreeSitterParserは言語ごとに種類が異なる）
+            parser = cls.create_parser(
+                project_root, lang, module_store=module_store, backend=backend
+            )
+            parser_type = parser.get_parser_type()
 
             if parser_type not in seen_parsers:
                 parsers.append(parser)
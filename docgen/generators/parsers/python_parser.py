@@ -6,10 +6,14 @@ docstringを抽出してAPI情報を生成
 import ast
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
 
-from ...models import APIInfo
+from ...models import APIParameterRecord, APIRecord
 from .base_parser import BaseParser
 
+if TYPE_CHECKING:
+    from ...utils.module_store import ModuleStore
+
 # Python 3.9+ では ast.unparse が利用可能
 if sys.version_info >= (3, 9):
     _ast_unparse = ast.unparse
@@ -31,15 +35,37 @@ class PythonParser(BaseParser):
     """Pythonコード解析クラス"""
 
     PARSER_TYPE: str = "python"  # type: ignore[misc]
+    PARSER_VERSION: str = "1"  # type: ignore[misc]
+
+    def __init__(self, project_root: Path, module_store: "ModuleStore | None" = None):
+        """
+        初期化
+
+        Args:
+            project_root: プロジェクトのルートディレクトリ
+            module_store: 解析済みモジュールのストア（指定された場合は読み込み・パースを共有）
+        """
+        super().__init__(project_root)
+        self.module_store = module_store
+
+    def _read_file(self, file_path: Path) -> str:
+        """ファイルを読み込む"""
+        if self.module_store is None:
+            return super()._read_file(file_path)
+        module = self.module_store.get(file_path)
+        assert module is not None
+        return module.source
 
     def _parse_to_ast(self, content: str, file_path: Path) -> ast.AST | None:
         """ASTにパース"""
+        if self.module_store is not None:
+            return self.module_store.from_source(content, str(file_path)).tree
         try:
             return ast.parse(content, filename=str(file_path))
         except SyntaxError:
             return None
 
-    def _extract_elements(self, tree: ast.AST | None, file_path: Path) -> list[APIInfo]:
+    def _extract_elements(self, tree: ast.AST | None, file_path: Path) -> list[APIRecord]:
         """要素を抽出"""
         if tree is None:
             return []
@@ -61,7 +87,9 @@ class PythonASTVisitor(ast.NodeVisitor):
     def __init__(self, file_path: Path, project_root: Path):
         self.file_path = file_path
         self.project_root = project_root
-        self.apis: list[APIInfo] = []
+        # 各API情報に設定する相対パス（ファイルごとに1度だけ計算する）
+        self.relative_path = str(file_path.relative_to(project_root))
+        self.apis: list[APIRecord] = []
         self.class_stack: list[str] = []
 
     def visit_ClassDef(self, node: ast.ClassDef):
@@ -73,13 +101,13 @@ class PythonASTVisitor(ast.NodeVisitor):
         docstring = ast.get_docstring(node) or ""
 
         self.apis.append(
-            APIInfo(
+            APIRecord(
                 name=node.name,
                 type="class",
                 signature=signature,
                 docstring=docstring or None,
                 line_number=node.lineno,
-                file_path=str(self.file_path.relative_to(self.project_root)),
+                file_path=self.relative_path,
                 language="python",
             )
         )
@@ -104,14 +132,12 @@ class PythonASTVisitor(ast.NodeVisitor):
         docstring = ast.get_docstring(node) or ""
 
         # パラメータと戻り値の型を取得
-        from ...models import APIParameter
-
-        api_parameters: list[APIParameter] = []
+        api_parameters: list[APIParameterRecord] = []
         for arg in node.args.args:
             param_name = arg.arg
             param_type = _ast_unparse(arg.annotation) if arg.annotation else "Any"
             api_parameters.append(
-                APIParameter(
+                APIParameterRecord(
                     name=param_name,
                     type=param_type,
                     description=None,
@@ -123,7 +149,7 @@ class PythonASTVisitor(ast.NodeVisitor):
             return_type = _ast_unparse(node.returns)
 
         self.apis.append(
-            APIInfo(
+            APIRecord(
                 name=node.name,
                 type=api_type,
                 signature=signature,
@@ -131,7 +157,7 @@ class PythonASTVisitor(ast.NodeVisitor):
                 parameters=api_parameters if api_parameters else None,
                 return_type=return_type or None,
                 line_number=node.lineno,
-                file_path=str(self.file_path.relative_to(self.project_root)),
+                file_path=self.relative_path,
                 language="python",
             )
         )
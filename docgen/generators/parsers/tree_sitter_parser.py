@@ -0,0 +1,465 @@
+"""
+tree-sitterによるコード解析モジュール
+
+tree-sitterの文法（言語ごとの`tree-sitter-<言語>`のwheel）で構文木を作成し、
+正規表現ベースのパーサー（JSParser・GenericParser）と同じ種類のAPI要素を抽出します。
+`parse.backend = "tree_sitter"`の場合に`ParserFactory`が使用します。
+"""
+
+from collections.abc import Iterator
+from functools import cache
+import importlib
+from pathlib import Path
+import threading
+from typing import Any
+
+from ...models import APIParameterRecord, APIRecord
+from ...utils.logger import get_logger
+from .base_parser import BaseParser
+from .js_parser import JSParser
+
+logger = get_logger("tree_sitter_parser")
+
+# 言語ごとの文法（モジュール名, Languageのポインタを返す関数名）
+GRAMMARS: dict[str, tuple[str, str]] = {
+    "javascript": ("tree_sitter_javascript", "language"),
+    "typescript": ("tree_sitter_typescript", "language_typescript"),
+    "go": ("tree_sitter_go", "language"),
+    "rust": ("tree_sitter_rust", "language"),
+    "java": ("tree_sitter_java", "language"),
+}
+
+# 言語の文法とは別の文法で解析する拡張子
+_EXTENSION_GRAMMARS: dict[str, tuple[str, str]] = {
+    ".tsx": ("tree_sitter_typescript", "language_tsx"),
+}
+
+# API情報に設定する言語（JSParserと同じくTypeScriptもjavascriptとする）
+_OUTPUT_LANGUAGES = {"typescript": "javascript"}
+
+# コメントのノードの種類
+_COMMENT_TYPES = frozenset({"comment", "line_comment", "block_comment"})
+# ドキュメントコメントと宣言の間に置ける属性のノードの種類（Rustの#[...]）
+_ATTRIBUTE_TYPES = frozenset({"attribute_item"})
+
+# JavaScript/TypeScript: 関数の値になるノードの種類
+_JS_FUNCTION_VALUES = frozenset(
+    {"arrow_function", "function_expression", "function", "generator_function"}
+)
+
+# JavaScript/TypeScript: メソッドのシグネチャに含める修飾子
+_JS_SIGNATURE_MODIFIERS = ("static", "async", "get", "set", "*")
+
+
+@cache
+def load_language(module_name: str, function_name: str) -> Any:
+    """
+    文法を読み込む（プロセス内で一度だけ）
+
+    Args:
+        module_name: 文法のモジュール名（例: 'tree_sitter_go'）
+        function_name: Languageのポインタを返す関数名
+
+    Returns:
+        `tree_sitter.Language`
+
+    Raises:
+        ImportError: tree-sitterまたは文法がインストールされていない場合
+    """
+    from tree_sitter import Language
+
+    module = importlib.import_module(module_name)
+    return Language(getattr(module, function_name)())
+
+
+def _text(node: Any) -> str:
+    """ノードのソース"""
+    return node.text.decode("utf-8", "replace") if node is not None else ""
+
+
+def _line(node: Any) -> int:
+    """ノードの開始行（1始まり）"""
+    return node.start_point[0] + 1
+
+
+def _squash(text: str) -> str:
+    """空白を1つにまとめる"""
+    return " ".join(text.split())
+
+
+def _inner_params(node: Any) -> str:
+    """パラメータリストのノードの括弧の中（単一の識別子の場合はそのまま）"""
+    text = _text(node)
+    if text.startswith("(") and text.endswith(")"):
+        text = text[1:-1]
+    return _squash(text)
+
+
+def _preceding_comments(node: Any) -> list[str]:
+    """ノードの直前に隣接するコメント（空行を挟まないもの、属性は読み飛ばす）を先頭から順に返す"""
+    comments: list[str] = []
+    row = node.start_point[0]
+    sibling = node.prev_sibling
+    while sibling is not None and sibling.type in _COMMENT_TYPES | _ATTRIBUTE_TYPES:
+        if sibling.end_point[0] < row - 1:
+            break
+        if sibling.type in _COMMENT_TYPES:
+            comments.append(_text(sibling))
+        row = sibling.start_point[0]
+        sibling = sibling.prev_sibling
+    comments.reverse()
+    return comments
+
+
+def _comment_body(comment: str) -> str:
+    """コメント記号を除いた本文"""
+    if comment.startswith("/*"):
+        return comment[2:].removesuffix("*/")
+    if comment.startswith("//"):
+        return comment[2:].lstrip("/!")
+    return comment.lstrip("#")
+
+
+class TreeSitterParser(BaseParser):
+    """tree-sitterによるコード解析クラス
+
+    抽出するAPI要素の種類はA/B比較できるよう正規表現ベースのパーサーに合わせています。
+
+    - JavaScript/TypeScript: JSParserと同じく、モジュール直下の関数・クラス・メソッドと
+      `module.exports`のオブジェクトの関数（JSDocはJSParserと同じ方法で整形する）
+    - Go・Rust・Java: GenericParserと同じく、ドキュメントコメント付きの関数と
+      構造体・クラス
+
+    tree-sitterのParserはスレッド間で共有できないため、スレッドごとに作成します。
+    """
+
+    PARSER_VERSION: str = "1"  # type: ignore[misc]
+
+    def __init__(self, project_root: Path, language: str):
+        """
+        初期化
+
+        Args:
+            project_root: プロジェクトのルートディレクトリ
+            language: 言語名（`GRAMMARS`のキー）
+
+        Raises:
+            ValueError: 文法が定義されていない言語が指定された場合
+        """
+        if language not in GRAMMARS:
+            raise ValueError(f"tree-sitterの文法が定義されていない言語です: {language}")
+        super().__init__(project_root)
+        self.language = language
+        # キャッシュのキーを正規表現ベースのパーサーの解析結果と区別する
+        self.PARSER_TYPE = f"tree_sitter_{language}"
+        self._output_language = _OUTPUT_LANGUAGES.get(language, language)
+        self._jsdoc = JSParser(project_root)  # JSDocの整形・パラメータの抽出を共有
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """プロセスプールに渡す状態（スレッドごとのParserは除く）"""
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """状態を復元"""
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    @staticmethod
+    def is_available(language: str) -> bool:
+        """
+        言語の文法を読み込めるかどうか
+
+        Args:
+            language: 言語名
+
+        Returns:
+            tree-sitterと文法がインストールされている場合True
+        """
+        grammar = GRAMMARS.get(language)
+        if grammar is None:
+            return False
+        try:
+            load_language(*grammar)
+        except Exception as e:
+            logger.debug(f"[{language}] tree-sitterの文法を読み込めません: {e}")
+            return False
+        return True
+
+    def get_language(self) -> str:
+        """抽出したAPI情報に設定する言語を返す（TypeScriptもjavascript）"""
+        return self._output_language
+
+    def _get_ts_parser(self, grammar: tuple[str, str]) -> Any:
+        """現在のスレッドのParserを取得（文法ごとに一度だけ作成）"""
+        parsers = getattr(self._local, "parsers", None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+        parser = parsers.get(grammar)
+        if parser is None:
+            from tree_sitter import Parser
+
+            parser = parsers[grammar] = Parser(load_language(*grammar))
+        return parser
+
+    def _parse_to_ast(self, content: str, file_path: Path) -> Any:
+        """構文木にパース（ルートノードを返す）"""
+        grammar = _EXTENSION_GRAMMARS.get(file_path.suffix, GRAMMARS[self.language])
+        return self._get_ts_parser(grammar).parse(content.encode("utf-8")).root_node
+
+    def _extract_elements(self, root: Any, file_path: Path) -> list[APIRecord]:
+        """要素を抽出"""
+        relative_path = str(file_path.relative_to(self.project_root))
+        if self._output_language == "javascript":
+            apis = self._extract_js(root)
+        else:
+            apis = self._extract_documented(root)
+        for api in apis:
+            api.file_path = relative_path
+        return apis
+
+    def _record(
+        self,
+        node: Any,
+        name: str,
+        kind: str,
+        signature: str,
+        docstring: str = "",
+        parameters: list[APIParameterRecord] | None = None,
+    ) -> APIRecord:
+        """API情報のレコードを作成（file_pathは呼び出し元で設定する）"""
+        return APIRecord(
+            name=name,
+            type=kind,
+            signature=signature,
+            docstring=docstring,
+            parameters=parameters,
+            line_number=_line(node),
+            file_path="",
+            language=self._output_language,
+        )
+
+    # --- JavaScript/TypeScript ---
+
+    def _extract_js(self, root: Any) -> list[APIRecord]:
+        """モジュール直下の宣言を抽出（同じ所属・名前は最初の宣言のみ）"""
+        apis: list[APIRecord] = []
+        seen: set[tuple[str, str]] = set()
+        for owner, node, doc_node, name, kind, signature in self._js_module(root):
+            if (owner, name) in seen:
+                continue
+            seen.add((owner, name))
+            jsdoc = self._jsdoc_of(doc_node)
+            apis.append(
+                self._record(
+                    node,
+                    name,
+                    kind,
+                    signature,
+                    docstring=self._jsdoc._clean_jsdoc(jsdoc) if jsdoc else "",
+                    parameters=self._jsdoc._extract_parameters(jsdoc) if jsdoc else None,
+                )
+            )
+        return apis
+
+    def _jsdoc_of(self, node: Any) -> str | None:
+        """直前のJSDocコメント（/** ... */）の本文"""
+        comments = _preceding_comments(node)
+        if comments and comments[-1].startswith("/**"):
+            return comments[-1][3:].removesuffix("*/")
+        return None
+
+    def _js_module(self, root: Any) -> Iterator[tuple[str, Any, Any, str, str, str]]:
+        """(所属, ノード, JSDocを探すノード, 名前, 種類, シグネチャ)を順に返す"""
+        for node in root.named_children:
+            doc_node = node
+            if node.type == "export_statement":
+                declaration = node.child_by_field_name("declaration") or node.child_by_field_name(
+                    "value"
+                )
+                if declaration is None:
+                    continue
+                node = declaration
+            yield from self._js_declaration(node, doc_node)
+
+    def _js_declaration(
+        self, node: Any, doc_node: Any
+    ) -> Iterator[tuple[str, Any, Any, str, str, str]]:
+        """モジュール直下の1つの文の宣言"""
+        kind = node.type
+        if kind in ("function_declaration", "generator_function_declaration", "function_signature"):
+            name = _text(node.child_by_field_name("name"))
+            params = _inner_params(node.child_by_field_name("parameters"))
+            yield "", doc_node, doc_node, name, "function", f"function {name}({params})"
+        elif kind in ("class_declaration", "abstract_class_declaration", "class"):
+            name_node = node.child_by_field_name("name")
+            if name_node is None:
+                return
+            name = _text(name_node)
+            yield "", doc_node, doc_node, name, "class", f"class {name}"
+            body = node.child_by_field_name("body")
+            if body is not None:
+                yield from self._js_class_body(body, name)
+        elif kind in ("lexical_declaration", "variable_declaration"):
+            for declarator in node.named_children:
+                if declarator.type != "variable_declarator":
+                    continue
+                value = declarator.child_by_field_name("value")
+                if value is None or value.type not in _JS_FUNCTION_VALUES:
+                    continue
+                name = _text(declarator.child_by_field_name("name"))
+                params = self._js_function_params(value)
+                yield "", doc_node, doc_node, name, "function", f"function {name}({params})"
+        elif kind == "expression_statement":
+            expression = node.named_children[0] if node.named_child_count else None
+            if expression is None or expression.type != "assignment_expression":
+                return
+            right = expression.child_by_field_name("right")
+            if _text(expression.child_by_field_name("left")) == "module.exports" and (
+                right is not None and right.type == "object"
+            ):
+                yield from self._js_object(right, "module.exports")
+
+    def _js_function_params(self, value: Any) -> str:
+        """関数の値のパラメータ（アロー関数の単一の識別子を含む）"""
+        params = value.child_by_field_name("parameters") or value.child_by_field_name("parameter")
+        return _inner_params(params)
+
+    def _js_class_body(
+        self, body: Any, class_name: str
+    ) -> Iterator[tuple[str, Any, Any, str, str, str]]:
+        """クラス本体のメソッド（#から始まる非公開のメンバーを除く）"""
+        decorator = None  # メンバーの前のデコレーター（TypeScriptではメンバーの兄弟ノード）
+        for member in body.named_children:
+            kind = member.type
+            if kind == "decorator":
+                decorator = decorator or member
+                continue
+            if kind in _COMMENT_TYPES:
+                continue
+            # 行番号・JSDocはデコレーターを含むメンバーの先頭から求める
+            anchor = decorator or member
+            decorator = None
+            if kind in ("method_definition", "abstract_method_signature", "method_signature"):
+                name_node = member.child_by_field_name("name")
+                name = _text(name_node)
+                if not name or name.startswith("#"):
+                    continue
+                modifiers = []
+                for child in member.children:
+                    if child == name_node:
+                        break
+                    if child.type in _JS_SIGNATURE_MODIFIERS:
+                        modifiers.append(child.type)
+                prefix = "".join(f"{m} " if m != "*" else m for m in modifiers)
+                params = _inner_params(member.child_by_field_name("parameters"))
+                yield class_name, anchor, anchor, name, "method", f"{prefix}{name}({params})"
+            elif kind in ("field_definition", "public_field_definition"):
+                name = _text(
+                    member.child_by_field_name("name") or member.child_by_field_name("property")
+                )
+                value = member.child_by_field_name("value")
+                if name.startswith("#") or value is None or value.type not in _JS_FUNCTION_VALUES:
+                    continue
+                params = self._js_function_params(value)
+                yield class_name, anchor, anchor, name, "method", f"{name}({params})"
+
+    def _js_object(self, node: Any, owner: str) -> Iterator[tuple[str, Any, Any, str, str, str]]:
+        """オブジェクトリテラルの関数（ネストしたオブジェクトを含む）"""
+        for member in node.named_children:
+            if member.type == "method_definition":
+                name = _text(member.child_by_field_name("name"))
+                params = _inner_params(member.child_by_field_name("parameters"))
+                yield owner, member, member, name, "function", f"{name}({params})"
+            elif member.type == "pair":
+                name = _text(member.child_by_field_name("key")).strip("'\"")
+                value = member.child_by_field_name("value")
+                if value is None:
+                    continue
+                if value.type in _JS_FUNCTION_VALUES:
+                    params = self._js_function_params(value)
+                    yield owner, member, member, name, "function", f"{name}({params})"
+                elif value.type == "object":
+                    yield from self._js_object(value, f"{owner}.{name}")
+
+    # --- Go・Rust・Java ---
+
+    def _extract_documented(self, root: Any) -> list[APIRecord]:
+        """ドキュメントコメント付きの関数と構造体・クラスを出現順に抽出"""
+        apis: list[APIRecord] = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            found = self._documented_element(node)
+            if found is not None:
+                name_node, kind, signature = found
+                if kind == "class":
+                    apis.append(self._record(node, _text(name_node), kind, signature))
+                else:
+                    docstring = self._doc_comment(node)
+                    if docstring is not None:
+                        apis.append(
+                            self._record(node, _text(name_node), kind, signature, docstring)
+                        )
+            stack.extend(reversed(node.named_children))
+        return apis
+
+    def _documented_element(self, node: Any) -> tuple[Any, str, str] | None:
+        """抽出対象のノードであれば(名前のノード, 種類, シグネチャ)"""
+        kind = node.type
+        language = self.language
+        if language == "go":
+            if kind == "function_declaration":
+                return self._function(node)
+            if kind == "type_spec":
+                type_node = node.child_by_field_name("type")
+                if type_node is not None and type_node.type == "struct_type":
+                    return self._class(node.child_by_field_name("name"), "struct")
+        elif language == "rust":
+            if kind == "function_item":
+                return self._function(node)
+            if kind in ("struct_item", "impl_item"):
+                name_node = node.child_by_field_name("name" if kind == "struct_item" else "type")
+                if name_node is not None:
+                    return self._class(name_node, "struct")
+        elif language == "java" and kind in ("method_declaration", "class_declaration"):
+            # GenericParserと同じくpublicの宣言のみ
+            if not any(
+                child.type == "modifiers" and "public" in _text(child).split()
+                for child in node.children
+            ):
+                return None
+            if kind == "method_declaration":
+                return self._function(node)
+            return self._class(node.child_by_field_name("name"), "class")
+        return None
+
+    def _class(self, name_node: Any, keyword: str) -> tuple[Any, str, str]:
+        """構造体・クラスの(名前のノード, 種類, シグネチャ)"""
+        return name_node, "class", f"{keyword} {_text(name_node)}"
+
+    def _function(self, node: Any) -> tuple[Any, str, str]:
+        """関数の(名前のノード, 種類, シグネチャ)"""
+        name_node = node.child_by_field_name("name")
+        params = _inner_params(node.child_by_field_name("parameters"))
+        return name_node, "function", f"{_text(name_node)}({params})"
+
+    def _doc_comment(self, node: Any) -> str | None:
+        """直前のドキュメントコメント（連続する行コメントはまとめる）、なければNone"""
+        comments = _preceding_comments(node)
+        if self.language == "java":
+            # Javaは直前のJavadoc（/** ... */）のみ
+            comments = comments[-1:] if comments and comments[-1].startswith("/**") else []
+        if not comments:
+            return None
+        # Rustの行コメントのノードは末尾の改行を含む
+        lines = "\n".join(_comment_body(comment.rstrip()) for comment in comments).split("\n")
+        return "\n".join(line.strip().lstrip("*").lstrip("#").strip() for line in lines).strip()
+
+    def get_supported_extensions(self) -> list[str]:
+        """サポートする拡張子を返す"""
+        from ...detectors.detector_patterns import DetectorPatterns
+
+        return DetectorPatterns.get_source_extensions(self.language)
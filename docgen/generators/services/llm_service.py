@@ -9,7 +9,9 @@ from logging import Logger
 from typing import Any
 
 from docgen.utils.llm import LLMClientFactory
+from docgen.utils.llm.remote_cached_client import RemoteCachedLLMClient
 from docgen.utils.logger import get_logger
+from docgen.utils.remote_cache import get_remote_cache
 
 
 class LLMService:
@@ -52,6 +54,11 @@ class LLMService:
         self._client = LLMClientFactory.create_client_with_fallback(
             self.agents_config, preferred_mode=preferred_mode
         )
+
+        # リモートキャッシュが設定されている場合は、LLMの応答を共有する
+        remote = get_remote_cache(self._config)
+        if self._client is not None and remote is not None:
+            self._client = RemoteCachedLLMClient(self._client, remote)
         return self._client
 
     def generate(self, prompt: str) -> str:
@@ -11,7 +11,8 @@ class DocGeneratorTask(HookTask):
         print("Generating documentation...")
 
         python_cmd = get_python_command()
-        cmd = python_cmd.split() + ["-m", "docgen.docgen"]
+        # ステージされた変更ファイルのみ処理し、入力が変わったドキュメントのみ再生成する
+        cmd = python_cmd.split() + ["-m", "docgen.docgen", "--staged"]
 
         # 設定ファイルパス
         # config_path = os.path.join(context.project_root, "docgen", "config.toml")
@@ -20,7 +20,8 @@ class RagGeneratorTask(HookTask):
         # または、直接モジュールを実行する
 
         # docgen.py の --build-index オプションを使用
-        cmd = python_cmd.split() + ["-m", "docgen.docgen", "--build-index"]
+        # ステージされた変更ファイルのチャンクのみ置き換えて差分更新する
+        cmd = python_cmd.split() + ["-m", "docgen.docgen", "--build-index", "--staged"]
 
         try:
             code, stdout, stderr = run_command(cmd, cwd=context.project_root, capture_output=True)
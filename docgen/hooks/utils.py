@@ -1,3 +1,4 @@
+from pathlib import Path
 import subprocess
 
 
@@ -33,17 +34,61 @@ def run_command(
         return 1, "", str(e)
 
 
-def get_changed_files(staged: bool = False) -> list[str]:
-    """変更されたファイルを取得する"""
-    cmd = ["git", "diff", "--name-only"]
+class GitCommandError(Exception):
+    """gitコマンドの実行に失敗した場合の例外"""
+
+
+def run_git(args: list[str], cwd: str | Path | None = None) -> str:
+    """gitコマンドを実行して標準出力を返す（失敗した場合はGitCommandError）"""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=False
+        )
+    except FileNotFoundError as e:
+        raise GitCommandError("gitコマンドが見つかりません") from e
+    if result.returncode != 0:
+        raise GitCommandError(f"git {args[0]} に失敗しました: {result.stderr.strip()}")
+    return result.stdout
+
+
+def get_changed_file_statuses(
+    staged: bool = False, since: str | None = None, cwd: str | Path | None = None
+) -> list[tuple[str, str]]:
+    """
+    変更されたファイルとステータス（A・M・Dなど）を取得する
+
+    リネームは削除と作成として扱い、パスは`cwd`からの相対パスで返す
+    （`cwd`の外の変更は含まない）。`since`を指定した場合はそのリビジョンと比較する。
+    失敗した場合はGitCommandError。
+    """
+    args = ["diff", "--name-status", "-z", "--no-renames", "--relative"]
     if staged:
-        cmd.append("--cached")
+        args.append("--cached")
+    if since:
+        args.extend([since, "--"])
+    output = run_git(args, cwd)
 
-    code, stdout, _ = run_command(cmd)
-    if code != 0:
-        return []
+    # -z形式: ステータス\0パス\0ステータス\0パス\0...
+    fields = output.split("\0")
+    return [
+        (status, path) for status, path in zip(fields[0::2], fields[1::2], strict=False) if path
+    ]
+
+
+def get_untracked_files(cwd: str | Path | None = None) -> list[str]:
+    """未追跡のファイル（.gitignoreで除外されたものを除く）を取得する"""
+    output = run_git(["ls-files", "--others", "--exclude-standard", "-z"], cwd)
+    return [path for path in output.split("\0") if path]
 
-    return [f for f in stdout.splitlines() if f.strip()]
+
+def get_changed_files(
+    staged: bool = False, since: str | None = None, cwd: str | Path | None = None
+) -> list[str]:
+    """変更されたファイルを取得する（取得できない場合は空のリスト）"""
+    try:
+        return [path for _, path in get_changed_file_statuses(staged, since, cwd)]
+    except GitCommandError:
+        return []
 
 
 def is_git_repo(path: str) -> bool:
@@ -5,13 +5,16 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .detectors.detector_patterns import DetectorPatterns
 from .detectors.plugin_registry import PluginRegistry
 from .models import DetectedLanguage
 from .utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from .utils.scan_session import ScanSession
+
 logger = get_logger("language_detector")
 
 
@@ -71,18 +74,24 @@ class LanguageDetector:
             f"{len(self.plugin_registry.get_all_languages())} plugins"
         )
 
-    def detect_languages(self, use_parallel: bool = True) -> list[DetectedLanguage]:
+    def detect_languages(
+        self, use_parallel: bool = True, scan_session: "ScanSession | None" = None
+    ) -> list[DetectedLanguage]:
         """
         プロジェクトの使用言語を自動検出
 
         Args:
             use_parallel: 並列処理を使用するかどうか（デフォルト: True）
+            scan_session: 走査セッション（指定された場合はソースファイルの検出に走査結果を再利用）
 
         Returns:
             検出された言語オブジェクトのリスト
         """
         from .detectors.unified_detector import UnifiedDetectorFactory
 
+        if scan_session is not None:
+            DetectorPatterns.prime_from_scan_session(self.project_root, scan_session)
+
         # 統一 detector を使用
         detectors = UnifiedDetectorFactory.create_all_detectors(self.project_root)
 
@@ -13,7 +13,7 @@ from .agents import (
     ProjectOverview,
     SetupInstructions,
 )
-from .api import APIInfo, APIParameter
+from .api import APIInfo, APIParameter, APIParameterRecord, APIRecord
 from .base import DocgenBaseModel
 from .cache import CacheEntry, CacheMetadata
 from .config import (
@@ -24,6 +24,9 @@ from .config import (
     GenerationConfig,
     LanguagesConfig,
     OutputConfig,
+    ParseConfig,
+    ScanConfig,
+    WatchConfig,
 )
 from .detected_language import DetectedLanguage
 from .detector import LanguageConfig, PackageManagerRule
@@ -56,12 +59,17 @@ __all__ = [
     "OutputConfig",
     "GenerationConfig",
     "ExcludeConfig",
+    "ParseConfig",
+    "ScanConfig",
+    "WatchConfig",
     "CacheConfig",
     "DebugConfig",
     "DocgenConfig",
     # API
     "APIParameter",
     "APIInfo",
+    "APIParameterRecord",
+    "APIRecord",
     # LLM
     "LLMClientConfig",
     # Cache
@@ -1,5 +1,6 @@
 """API related Pydantic models."""
 
+from dataclasses import dataclass
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -29,3 +30,106 @@ class APIInfo(BaseModel):
     decorators: list[str] | None = Field(default=None, description="デコレータ")
     visibility: str | None = Field(default=None, description="可視性 (public, private, protected)")
     language: str = Field(description="プログラミング言語")
+
+
+# モデルのフィールド（`APIInfo.model_dump()`と同じ順序）
+_API_FIELDS = tuple(APIInfo.model_fields)
+_API_FIELDS_SET = frozenset(_API_FIELDS)
+_PARAMETER_FIELDS = tuple(APIParameter.model_fields)
+_PARAMETER_FIELDS_SET = frozenset(_PARAMETER_FIELDS)
+
+
+@dataclass(slots=True)
+class APIParameterRecord:
+    """
+    パーサー内部のAPIパラメータのレコード（`APIParameter`と同じフィールド）
+
+    `APIRecord`とともに、解析・キャッシュ・ドキュメントの生成で使用します。
+    """
+
+    name: str
+    type: str
+    description: str | None = None
+    default: Any = None
+    required: bool = True
+
+    def to_model(self) -> APIParameter:
+        """`APIParameter`に変換"""
+        values = {field: getattr(self, field) for field in _PARAMETER_FIELDS}
+        return _construct(APIParameter, values, _PARAMETER_FIELDS_SET)
+
+
+@dataclass(slots=True)
+class APIRecord:
+    """
+    パーサー内部のAPI情報のレコード（`APIInfo`と同じフィールド）
+
+    シンボルごとにpydanticのモデルを作成・検証しないよう、解析・キャッシュ・
+    ドキュメントの生成では`__slots__`のレコードを使用し、公開APIの境界
+    （`BaseParser.parse_project`の戻り値など）でのみ`to_model`で`APIInfo`に変換します。
+    """
+
+    name: str
+    type: str
+    file_path: str
+    language: str
+    line_number: int | None = None
+    signature: str | None = None
+    docstring: str | None = None
+    parameters: list[APIParameterRecord] | None = None
+    return_type: str | None = None
+    decorators: list[str] | None = None
+    visibility: str | None = None
+
+    def to_model(self) -> APIInfo:
+        """
+        `APIInfo`に変換
+
+        レコードはパーサーが作成した値のため、検証を行わずにモデルを作成します。
+        """
+        values = {field: getattr(self, field) for field in _API_FIELDS}
+        parameters = self.parameters
+        if parameters is not None:
+            values["parameters"] = [parameter.to_model() for parameter in parameters]
+        if self.decorators is not None:
+            values["decorators"] = list(self.decorators)
+        return _construct(APIInfo, values, _API_FIELDS_SET)
+
+    @classmethod
+    def from_model(cls, api: APIInfo) -> "APIRecord":
+        """`APIInfo`からレコードを作成"""
+        return cls.from_dict(api.model_dump())
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "APIRecord":
+        """
+        辞書（`APIInfo.model_dump()`の形式）からレコードを作成
+
+        Raises:
+            TypeError: 必須のフィールドがない・不明なフィールドを含む場合
+        """
+        values = dict(data)
+        parameters = values.get("parameters")
+        if parameters is not None:
+            values["parameters"] = [
+                parameter
+                if isinstance(parameter, APIParameterRecord)
+                else APIParameterRecord(**parameter)
+                for parameter in parameters
+            ]
+        return cls(**values)
+
+
+def _construct(model: type[Any], values: dict[str, Any], fields_set: frozenset[str]) -> Any:
+    """
+    検証を行わずにモデルのインスタンスを作成
+
+    `model_construct`と同じ状態のインスタンスを作成しますが、既定値の補完や
+    エイリアスの解決を行わない（すべてのフィールドがそろっている前提の）ため高速です。
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(fields_set))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
@@ -112,10 +112,55 @@ class ExcludeConfig(DocgenBaseModel):
     use_gitignore: bool = True  # .gitignoreファイルを適用するかどうか
 
 
+class ScanConfig(DocgenBaseModel):
+    """File scan configuration model."""
+
+    snapshot: bool = False  # ディレクトリmtimeのスナップショットを永続化して再走査を省略
+    backend: str = "walk"  # "walk"（ディレクトリ走査）, "git_index"（.git/indexを直接読む）
+    untracked: bool = True  # git_index使用時に未追跡ファイルも含めるかどうか
+    workers: int = 1  # ディレクトリを並列に列挙するスレッド数（1は逐次走査）
+
+
+class ParseConfig(DocgenBaseModel):
+    """Parser configuration model."""
+
+    max_file_bytes: int = 1048576  # これより大きいファイルは解析しない（0は無制限）
+    executor: str = "thread"  # 並列処理の方式: "thread", "process"（GILを保持するパーサー向け）
+    process_min_files: int = 200  # "process"でプロセスプールを使用する解析対象ファイル数の下限
+    backend: str = "regex"  # 解析のバックエンド: "regex", "tree_sitter"（要: tree-sitter extra）
+    # ファイルごとの解析の時間の上限（秒、超えた場合はアウトラインのみ、0は無制限）
+    # "thread"では解析中の確認位置でのみ打ち切る（確実に打ち切るには"process"を使用）
+    file_timeout: float = 10.0
+
+
+class WatchConfig(DocgenBaseModel):
+    """Watch mode configuration model."""
+
+    backend: str = "auto"  # "auto"（Linuxではinotify）, "inotify", "polling"
+    debounce_ms: int = 300  # 変更が途絶えてから再生成するまでの待ち時間
+    poll_interval_ms: int = 1000  # ポーリング時の走査間隔
+
+
+class RemoteCacheConfig(DocgenBaseModel):
+    """Remote cache configuration model."""
+
+    url: str = ""  # リモートキャッシュのサーバーのURL（空の場合は使用しない）
+    timeout: float = 2.0  # 1回のリクエストのタイムアウト（秒）
+    batch_size: int = 256  # 1回のリクエストで送受信するキーの最大数
+    token_env: str = "DOCGEN_CACHE_TOKEN"  # 認証トークンを読み込む環境変数
+    read_only: bool = False  # 読み込みのみ行い、書き込まない（CIなど）
+
+
 class CacheConfig(DocgenBaseModel):
     """Cache configuration model."""
 
     enabled: bool = True
+    backend: str = "json"  # "json"（parser_cache.json）, "sqlite"（parser_cache.db）
+    verify: str = "stat"  # "stat"（mtime・サイズ・inodeで検証）, "hash"（常に内容で検証）
+    hash_algorithm: str = "auto"  # "auto"（xxhash、なければblake2b）, "xxhash", "blake2b", "sha256"
+    max_entries: int = 100000  # 解析結果の件数の上限（超えた分は使用日時の古い順に削除、0で無制限）
+    max_size_mb: int = 256  # 解析結果の合計サイズの上限（MB、0で無制限）
+    remote: RemoteCacheConfig = Field(default_factory=RemoteCacheConfig)
 
 
 class BenchmarkConfig(DocgenBaseModel):
@@ -177,6 +222,7 @@ class RagConfig(DocgenBaseModel):
 
     enabled: bool = True
     auto_build_index: bool = False
+    max_file_bytes: int = 1048576  # これより大きいファイルは先頭のみチャンク化（0は無制限）
     embedding: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
     index: IndexConfig = Field(default_factory=IndexConfig)
     retrieval: RetrievalConfig = Field(default_factory=RetrievalConfig)
@@ -220,6 +266,9 @@ class DocgenConfig(DocgenBaseModel):
     generation: GenerationConfig = Field(default_factory=GenerationConfig)
     agents: AgentsConfigSection = Field(default_factory=lambda: AgentsConfigSection())
     exclude: ExcludeConfig = Field(default_factory=ExcludeConfig)
+    scan: ScanConfig = Field(default_factory=ScanConfig)
+    parse: ParseConfig = Field(default_factory=ParseConfig)
+    watch: WatchConfig = Field(default_factory=WatchConfig)
     cache: CacheConfig = Field(default_factory=CacheConfig)
     benchmark: BenchmarkConfig = Field(default_factory=BenchmarkConfig)
     debug: DebugConfig = Field(default_factory=DebugConfig)
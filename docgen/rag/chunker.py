@@ -4,12 +4,18 @@
 RAGインデックス用のチャンクを生成します。
 """
 
+from collections.abc import Collection, Iterator
 from pathlib import Path
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from ..utils.file_classifier import DEFAULT_MAX_FILE_BYTES, FileClassifier, read_text_limited
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from ..utils.module_store import ModuleStore
+    from ..utils.scan_session import ScanSession
+
 logger = get_logger(__name__)
 
 
@@ -55,6 +61,8 @@ class CodeChunker:
         self.config = config or {}
         self.max_chunk_size = self.config.get("chunking", {}).get("max_chunk_size", 512)
         self.overlap = self.config.get("chunking", {}).get("overlap", 50)
+        # これより大きいファイルは先頭のみチャンク化する（0は無制限）
+        self.max_file_bytes = self.config.get("max_file_bytes", DEFAULT_MAX_FILE_BYTES)
 
         # カスタム除外パターン + デフォルトパターン
         custom_patterns = self.config.get("exclude_patterns", [])
@@ -145,13 +153,19 @@ class CodeChunker:
 
         return True
 
-    def chunk_file(self, file_path: Path, project_root: Path) -> list[dict[str, Any]]:
+    def chunk_file(
+        self,
+        file_path: Path,
+        project_root: Path,
+        module_store: "ModuleStore | None" = None,
+    ) -> list[dict[str, Any]]:
         """
         ファイルをチャンク化
 
         Args:
             file_path: ファイルパス
             project_root: プロジェクトルート
+            module_store: 解析済みモジュールのストア（Pythonファイルの読み込み・パースを共有）
 
         Returns:
             チャンクのリスト
@@ -160,17 +174,26 @@ class CodeChunker:
             return []
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, FileNotFoundError) as e:
+            # サイズ上限以内のPythonファイルはAPI解析などと読み込み・パースを共有する
+            module = None
+            if module_store is not None and file_path.suffix.lower() == ".py":
+                module = module_store.get(file_path, max_bytes=self.max_file_bytes)
+            if module is not None:
+                content, truncated = module.source, False
+            else:
+                content, truncated = read_text_limited(file_path, self.max_file_bytes)
+        except (UnicodeDecodeError, OSError) as e:
             logger.warning(f"Failed to read file {file_path}: {e}")
             return []
+        if truncated:
+            logger.debug(f"Truncated {file_path} to {self.max_file_bytes} bytes")
 
         # Initialize strategies
         from docgen.detectors.detector_patterns import DetectorPatterns
 
         from .strategies import CodeChunkStrategy, MarkdownChunkStrategy, TextChunkStrategy
 
-        code_strategy = CodeChunkStrategy(project_root)
+        code_strategy = CodeChunkStrategy(project_root, module_store=module_store)
         markdown_strategy = MarkdownChunkStrategy(project_root)
         text_strategy = TextChunkStrategy(project_root)
 
@@ -192,7 +215,11 @@ class CodeChunker:
             return text_strategy.chunk(content, file_path)
 
     def chunk_codebase(
-        self, project_root: Path, allowed_patterns: list[str] | None = None
+        self,
+        project_root: Path,
+        allowed_patterns: list[str] | None = None,
+        scan_session: "ScanSession | None" = None,
+        paths: Collection[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         プロジェクト全体をチャンク化
@@ -200,12 +227,87 @@ class CodeChunker:
         Args:
             project_root: プロジェクトルート
             allowed_patterns: 許可するファイルパターンのリスト（Noneの場合はすべて許可/設定依存）
+            scan_session: 走査セッション（指定された場合は走査結果を再利用）
+            paths: チャンク化するファイルの相対パス（差分実行用、Noneの場合はすべて）
 
         Returns:
             すべてのチャンクのリスト
         """
         all_chunks = []
+        # サイズ・種類の判定とPythonのパース結果は走査セッションがある場合はAPI解析と共有する
+        classifier = (
+            scan_session.classifier if scan_session is not None else FileClassifier(project_root)
+        )
+        module_store = scan_session.modules if scan_session is not None else None
+
+        if scan_session is not None:
+            candidates = self._iter_session_files(project_root, scan_session, paths)
+        elif paths is not None:
+            candidates = self._iter_paths(project_root, paths)
+        else:
+            candidates = self._walk_codebase(project_root)
+
+        for file_path in candidates:
+            if self.should_process_file(file_path):
+                # パターンフィルタリング（指定されている場合）
+                if allowed_patterns:
+                    try:
+                        # pathlib.matchはglobパターンを使用
+                        # 再帰的なパターンやディレクトリを含まない場合はファイル名に対してマッチ
+                        if not any(file_path.match(p) for p in allowed_patterns):
+                            continue
+                    except Exception:
+                        continue
+
+                # バイナリ・minify済みのファイルは読み込まない（大きいファイルは先頭のみ読み込む）
+                rel_path = file_path.relative_to(project_root).as_posix()
+                if classifier.check(rel_path, "rag", self.max_file_bytes, truncate=True):
+                    continue
+
+                chunks = self.chunk_file(file_path, project_root, module_store=module_store)
+                all_chunks.extend(chunks)
+
+        logger.info(f"Created {len(all_chunks)} chunks from codebase")
+        return all_chunks
 
+    def _iter_session_files(
+        self,
+        project_root: Path,
+        scan_session: "ScanSession",
+        paths: Collection[str] | None = None,
+    ) -> Iterator[Path]:
+        """走査セッションの結果から無視すべきディレクトリ配下を除いたファイルを列挙"""
+        for _file_path, rel_path in scan_session.view(exclude_dirs=self._exact_dir_names):
+            if paths is not None and rel_path.as_posix() not in paths:
+                continue
+            if self._is_in_path_pattern(rel_path):
+                continue
+            yield project_root / rel_path
+
+    def _iter_paths(self, project_root: Path, paths: Collection[str]) -> Iterator[Path]:
+        """指定された相対パスのうち、無視すべきディレクトリ配下を除いた既存のファイルを列挙"""
+        for path in sorted(paths):
+            rel_path = Path(path)
+            if any(part in self._exact_dir_names for part in rel_path.parts[:-1]):
+                continue
+            if self._is_in_path_pattern(rel_path):
+                continue
+            file_path = project_root / rel_path
+            if file_path.is_file():
+                yield file_path
+
+    def _is_in_path_pattern(self, rel_path: Path) -> bool:
+        """docgen/indexのようなネストされた除外パス配下かどうか"""
+        if not self._path_patterns:
+            return False
+        rel_dir = rel_path.parent.as_posix()
+        return any(
+            rel_dir == pattern or rel_dir.startswith(f"{pattern}/")
+            for pattern in self._path_patterns
+        )
+
+    def _walk_codebase(self, project_root: Path) -> Iterator[Path]:
+        """プロジェクトを走査して無視すべきディレクトリ配下を除いたファイルを列挙"""
         # os.walkを使用してディレクトリを走査し、無視すべきディレクトリをスキップ
         import os
 
@@ -246,20 +348,4 @@ class CodeChunker:
             dirs[:] = valid_dirs
 
             for file_name in files:
-                file_path = Path(root) / file_name
-                if self.should_process_file(file_path):
-                    # パターンフィルタリング（指定されている場合）
-                    if allowed_patterns:
-                        try:
-                            # pathlib.matchはglobパターンを使用
-                            # 再帰的なパターンやディレクトリを含まない場合はファイル名に対してマッチ
-                            if not any(file_path.match(p) for p in allowed_patterns):
-                                continue
-                        except Exception:
-                            continue
-
-                    chunks = self.chunk_file(file_path, project_root)
-                    all_chunks.extend(chunks)
-
-        logger.info(f"Created {len(all_chunks)} chunks from codebase")
-        return all_chunks
+                yield Path(root) / file_name
@@ -4,25 +4,40 @@ sentence-transformersを使用してテキストの埋め込みベクトルを
 """
 
 import hashlib
+import io
 from logging import Logger
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from ..utils.remote_cache import RemoteCacheClient
+
+# 埋め込みのキャッシュディレクトリ（プロジェクトローカルではなくユーザーホーム）
+EMBEDDING_CACHE_DIR = Path.home() / ".cache" / "agents-docs-sync" / "embeddings"
+# リモートキャッシュの埋め込みのnamespace
+_REMOTE_NAMESPACE = "embeddings"
+
 
 class Embedder:
     """テキスト埋め込み生成クラス"""
 
-    def __init__(self, config: dict[str, Any] | None = None, logger: Logger | None = None):
+    def __init__(
+        self,
+        config: dict[str, Any] | None = None,
+        logger: Logger | None = None,
+        remote_cache: "RemoteCacheClient | None" = None,
+    ):
         """
         初期化
 
         Args:
             config: RAG設定（config.toml の rag セクション）
             logger: ロガーインスタンス（Noneの場合は新規作成）
+            remote_cache: リモートキャッシュ（ローカルにない埋め込みを取得し、新しい埋め込みを書き込む）
         """
         self.config = config or {}
         embedding_config = self.config.get("embedding", {})
@@ -33,8 +48,8 @@ class Embedder:
 
         self._model = None  # Lazy loading
 
-        # キャッシュディレクトリ（プロジェクトローカルではなくユーザーホーム）
-        self.cache_dir = Path.home() / ".cache" / "agents-docs-sync" / "embeddings"
+        self.cache_dir = EMBEDDING_CACHE_DIR
+        self.remote_cache = remote_cache
 
     @property
     def model(self):
@@ -74,6 +89,8 @@ class Embedder:
 
         # キャッシュから取得を試みる
         cached = self._get_from_cache(cache_key)
+        if cached is None:
+            cached = self._get_from_remote([cache_key]).get(cache_key)
         if cached is not None:
             return cached
 
@@ -82,6 +99,7 @@ class Embedder:
 
         # キャッシュに保存
         self._save_to_cache(cache_key, embedding)
+        self._save_to_remote({cache_key: embedding})
 
         return embedding
 
@@ -112,6 +130,23 @@ class Embedder:
                 texts_to_embed.append(text)
                 indices_to_embed.append(i)
 
+        # ローカルにない埋め込みはリモートキャッシュからまとめて取得
+        if texts_to_embed and self.remote_cache is not None:
+            keys = [self._get_cache_key(text) for text in texts_to_embed]
+            fetched = self._get_from_remote(keys)
+            if fetched:
+                remaining = [
+                    (i, text)
+                    for i, text, key in zip(indices_to_embed, texts_to_embed, keys, strict=True)
+                    if key not in fetched
+                ]
+                for i, key in zip(indices_to_embed, keys, strict=True):
+                    if key in fetched:
+                        embeddings_dict[i] = fetched[key]
+                        self._save_to_cache(key, fetched[key])
+                indices_to_embed = [i for i, _ in remaining]
+                texts_to_embed = [text for _, text in remaining]
+
         # 未キャッシュのテキストのみバッチ処理
         if texts_to_embed:
             self.logger.debug(
@@ -126,9 +161,12 @@ class Embedder:
             )
 
             # キャッシュに保存
+            new_entries = {}
             for text, embedding in zip(texts_to_embed, new_embeddings, strict=True):
                 cache_key = self._get_cache_key(text)
                 self._save_to_cache(cache_key, embedding)
+                new_entries[cache_key] = embedding
+            self._save_to_remote(new_entries)
 
             # インデックスと埋め込みをマッピング
             for idx, emb in zip(indices_to_embed, new_embeddings, strict=True):
@@ -165,3 +203,27 @@ class Embedder:
             np.save(cache_path, embedding)
         except Exception as e:
             self.logger.debug(f"Cache write failed: {e}")
+
+    def _get_from_remote(self, cache_keys: list[str]) -> dict[str, np.ndarray]:
+        """リモートキャッシュから埋め込みをまとめて取得"""
+        if self.remote_cache is None:
+            return {}
+        embeddings = {}
+        for cache_key, data in self.remote_cache.get_many(_REMOTE_NAMESPACE, cache_keys).items():
+            try:
+                embeddings[cache_key] = np.load(io.BytesIO(data), allow_pickle=False)
+            except ValueError as e:
+                self.logger.debug(f"Remote cache entry is invalid: {e}")
+        if embeddings:
+            self.logger.debug(f"Remote cache hit: {len(embeddings)}/{len(cache_keys)}")
+        return embeddings
+
+    def _save_to_remote(self, embeddings: dict[str, np.ndarray]) -> None:
+        """埋め込みをリモートキャッシュに書き込む"""
+        if self.remote_cache is None or not embeddings:
+            return
+        for cache_key, embedding in embeddings.items():
+            buffer = io.BytesIO()
+            np.save(buffer, embedding, allow_pickle=False)
+            self.remote_cache.put(_REMOTE_NAMESPACE, cache_key, buffer.getvalue())
+        self.remote_cache.flush(_REMOTE_NAMESPACE)
@@ -3,6 +3,7 @@
 hnswlibを使用してベクトルインデックスの構築、保存、読み込みを管理します。
 """
 
+from collections.abc import Collection
 import json
 from logging import Logger
 from pathlib import Path
@@ -46,6 +47,8 @@ class VectorIndexer:
 
         self._index: Any | None = None
         self._metadata: list[dict[str, Any]] = []
+        # 差分更新で削除済みとしてマークしたチャンクのID（メタデータのインデックス）
+        self._deleted: set[int] = set()
 
     def build(self, embeddings: np.ndarray, metadata: list[dict[str, Any]]):
         """
@@ -71,6 +74,7 @@ class VectorIndexer:
             raise ValueError(f"Unsupported index type: {self.index_type}")
 
         self._metadata = metadata
+        self._deleted = set()
         self.logger.info("Index built successfully")
 
     def _build_hnswlib(self, embeddings: np.ndarray):
@@ -118,6 +122,7 @@ class VectorIndexer:
                     "chunk_count": len(self._metadata),
                     "embedding_dim": self.embedding_dim,
                     "index_type": self.index_type,
+                    "deleted_ids": sorted(self._deleted),
                     "chunks": self._metadata,
                 },
                 f,
@@ -142,6 +147,7 @@ class VectorIndexer:
         self._metadata = meta["chunks"]
         self.embedding_dim = meta["embedding_dim"]
         self.index_type = meta.get("index_type", "hnswlib")
+        self._deleted = set(meta.get("deleted_ids", []))
 
         # インデックスを読み込み
         index_path = self.index_dir / f"{self.index_type}.idx"
@@ -184,13 +190,18 @@ class VectorIndexer:
         if len(query_embedding.shape) == 1:
             query_embedding = query_embedding.reshape(1, -1)
 
+        # 削除済みのチャンクは検索対象外のため、件数を有効なチャンク数までに制限
+        k = min(k, len(self._metadata) - len(self._deleted))
+        if k <= 0:
+            return []
+
         # 検索実行
         labels, distances = self._index.knn_query(query_embedding, k=k)
 
         # 結果を整形
         results = []
         for idx, dist in zip(labels[0], distances[0], strict=True):
-            if idx < len(self._metadata):
+            if idx < len(self._metadata) and idx not in self._deleted:
                 # cosine距離をsimilarityスコアに変換 (1 - distance)
                 similarity = 1.0 - dist
                 results.append((self._metadata[idx], float(similarity)))
@@ -228,3 +239,53 @@ class VectorIndexer:
         self._metadata.extend(new_metadata)
 
         self.logger.info(f"Index now contains {len(self._metadata)} chunks")
+
+    def update_files(
+        self,
+        file_paths: Collection[str],
+        new_embeddings: np.ndarray,
+        new_metadata: list[dict[str, Any]],
+    ):
+        """
+        指定ファイルのチャンクを置き換える（差分更新）
+
+        既存のチャンクは削除済みとしてマークし、新しいチャンクを追加します。
+        削除済みのチャンクが半数を超えた場合は、インデックスに保存されたベクトルから
+        インデックスを詰め直します（埋め込みの再生成は不要）。
+
+        Args:
+            file_paths: 置き換えるファイルの相対パス（削除されたファイルを含む）
+            new_embeddings: 新しいチャンクの埋め込みベクトル
+            new_metadata: 新しいチャンクのメタデータ
+        """
+        if self._index is None:
+            raise ValueError("Index has not been loaded")
+
+        if len(new_embeddings) != len(new_metadata):
+            raise ValueError("new_embeddings and new_metadata must have the same length")
+
+        targets = set(file_paths)
+        stale_ids = [
+            i
+            for i, chunk in enumerate(self._metadata)
+            if i not in self._deleted and str(chunk.get("file", "")).replace("\\", "/") in targets
+        ]
+        for label in stale_ids:
+            self._index.mark_deleted(label)
+        self._deleted.update(stale_ids)
+        self.logger.info(f"Removed {len(stale_ids)} stale chunks from {len(targets)} files")
+
+        if len(new_embeddings) > 0:
+            self.incremental_update(new_embeddings, new_metadata)
+
+        live_count = len(self._metadata) - len(self._deleted)
+        if live_count > 0 and len(self._deleted) > live_count:
+            self._compact()
+
+    def _compact(self):
+        """削除済みのチャンクを除いてインデックスを詰め直す"""
+        live_ids = [i for i in range(len(self._metadata)) if i not in self._deleted]
+        self.logger.info(f"Compacting index: {len(self._deleted)} deleted chunks")
+
+        embeddings = np.asarray(self._index.get_items(live_ids), dtype=np.float32)
+        self.build(embeddings, [self._metadata[i] for i in live_ids])
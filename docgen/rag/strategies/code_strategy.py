@@ -8,6 +8,8 @@ import re
 from typing import Any
 
 from ...utils.logger import get_logger
+from ...utils.module_store import ModuleStore
+from ...utils.source_index import BraceIndex, LineIndex
 from .base_strategy import BaseChunkStrategy
 
 logger = get_logger(__name__)
@@ -16,6 +18,15 @@ logger = get_logger(__name__)
 class CodeChunkStrategy(BaseChunkStrategy):
     """Strategy for chunking code files (Python, JavaScript/TypeScript, YAML, TOML)."""
 
+    def __init__(self, project_root: Path, module_store: ModuleStore | None = None):
+        """
+        Args:
+            project_root: Project root directory
+            module_store: Parsed module store shared within a run (None parses locally)
+        """
+        super().__init__(project_root)
+        self.module_store = module_store
+
     def chunk(self, content: str, file_path: Path) -> list[dict[str, Any]]:
         """
         Chunk code content based on file extension.
@@ -48,10 +59,11 @@ class CodeChunkStrategy(BaseChunkStrategy):
         """Chunk Python files by function and class."""
         chunks = []
 
-        try:
-            tree = ast.parse(content)
-        except SyntaxError as e:
-            logger.warning(f"Syntax error in {file_path}: {e}")
+        # Reuse the AST parsed by the API parser when a shared store is available
+        store = self.module_store if self.module_store is not None else ModuleStore()
+        module = store.from_source(content, str(file_path))
+        if module.tree is None:
+            logger.warning(f"Syntax error in {file_path}: {module.error}")
             # Fallback to treating as a single chunk (handled by caller or return single chunk here?)
             # Returning single chunk here seems appropriate as fallback
             return [
@@ -66,44 +78,43 @@ class CodeChunkStrategy(BaseChunkStrategy):
                 }
             ]
 
-        lines = content.splitlines()
+        lines = module.lines
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                start_line = node.lineno - 1  # 0-indexed
-                end_line = node.end_lineno if node.end_lineno else start_line + 1
+        for node in module.definitions:
+            start_line = node.lineno - 1  # 0-indexed
+            end_line = node.end_lineno if node.end_lineno else start_line + 1
 
-                # Extract node content
-                chunk_text = "\n".join(lines[start_line:end_line])
+            # Extract node content
+            chunk_text = "\n".join(lines[start_line:end_line])
 
-                # Extract docstring and add to chunk text for better semantic search
-                docstring = ast.get_docstring(node)
-                enhanced_text = chunk_text
+            # Extract docstring and add to chunk text for better semantic search
+            docstring = ast.get_docstring(node)
+            enhanced_text = chunk_text
 
-                if docstring:
-                    # docstringをテキストの前に追加して、意味的検索を改善
-                    enhanced_text = f"# {node.name}: {docstring}\n{chunk_text}"
+            if docstring:
+                # docstringをテキストの前に追加して、意味的検索を改善
+                enhanced_text = f"# {node.name}: {docstring}\n{chunk_text}"
 
-                # 直前のコメントも含める（最大3行）
-                comment_lines = []
-                for i in range(max(0, start_line - 3), start_line):
-                    line = lines[i].strip()
-                    if line.startswith("#"):
-                        comment_lines.append(lines[i])
-                if comment_lines:
-                    enhanced_text = "\n".join(comment_lines) + "\n" + enhanced_text
+            # 直前のコメントも含める（最大3行）
+            comment_lines = []
+            for i in range(max(0, start_line - 3), start_line):
+                line = lines[i].strip()
+                if line.startswith("#"):
+                    comment_lines.append(lines[i])
+            if comment_lines:
+                enhanced_text = "\n".join(comment_lines) + "\n" + enhanced_text
 
-                chunks.append(
-                    {
-                        "file": str(file_path.relative_to(self.project_root)),
-                        "type": node.__class__.__name__,
-                        "name": node.name,
-                        "text": enhanced_text,
-                        "start_line": start_line + 1,  # 1-indexed for display
-                        "end_line": end_line,
-                        "hash": self._hash_text(enhanced_text),
-                    }
-                )
+            chunks.append(
+                {
+                    "file": str(file_path.relative_to(self.project_root)),
+                    "type": node.__class__.__name__,
+                    "name": node.name,
+                    "text": enhanced_text,
+                    "start_line": start_line + 1,  # 1-indexed for display
+                    "end_line": end_line,
+                    "hash": self._hash_text(enhanced_text),
+                }
+            )
 
         return chunks
 
@@ -128,85 +139,63 @@ class CodeChunkStrategy(BaseChunkStrategy):
 
         # 関数とクラスを抽出
         found_elements: list[dict[str, Any]] = []
+        # Line numbers and brace positions are indexed once per file and shared by all matches
+        line_index = LineIndex(content)
+        brace_index = BraceIndex(content)
+        found_names: set[tuple[str, int]] = set()
 
         # クラス定義を抽出
         for match in re.finditer(class_pattern, content, re.MULTILINE):
             name = match.group(1)
-            start_line = content[: match.start()].count("\n") + 1
+            start_line = line_index.line_of(match.start())
             # 対応する}を見つける
-            brace_count = 0
-            end_pos = match.end()
-            for i, char in enumerate(content[end_pos:], end_pos):
-                if char == "{":
-                    brace_count += 1
-                elif char == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_line = content[: i + 1].count("\n") + 1
-                        found_elements.append(
-                            {
-                                "type": "ClassDef",
-                                "name": name,
-                                "start_line": start_line,
-                                "end_line": end_line,
-                            }
-                        )
-                        break
+            brace_end = brace_index.find_block_end(match.end())
+            if brace_end != -1:
+                found_names.add((name, start_line))
+                found_elements.append(
+                    {
+                        "type": "ClassDef",
+                        "name": name,
+                        "start_line": start_line,
+                        "end_line": line_index.line_of(brace_end),
+                    }
+                )
 
         # 関数定義を抽出
         for pattern in function_patterns:
             for match in re.finditer(pattern, content, re.MULTILINE):
                 name = match.group(1)
                 if name:
-                    start_line = content[: match.start()].count("\n") + 1
+                    start_line = line_index.line_of(match.start())
                     # 対応する}を見つける
-                    brace_count = 0
-                    end_pos = match.end()
-                    for i, char in enumerate(content[end_pos:], end_pos):
-                        if char == "{":
-                            brace_count += 1
-                        elif char == "}":
-                            brace_count -= 1
-                            if brace_count == 0:
-                                end_line = content[: i + 1].count("\n") + 1
-                                # 既に追加されていないかチェック
-                                if not any(
-                                    e["name"] == name and e["start_line"] == start_line
-                                    for e in found_elements
-                                ):
-                                    found_elements.append(
-                                        {
-                                            "type": "FunctionDef",
-                                            "name": name,
-                                            "start_line": start_line,
-                                            "end_line": end_line,
-                                        }
-                                    )
-                                break
-
-        # インターフェース/型定義を抽出（TypeScript）
-        for match in re.finditer(interface_pattern, content, re.MULTILINE):
-            name = match.group(1)
-            start_line = content[: match.start()].count("\n") + 1
-            # 対応する}を見つける
-            brace_count = 0
-            end_pos = match.end()
-            for i, char in enumerate(content[end_pos:], end_pos):
-                if char == "{":
-                    brace_count += 1
-                elif char == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_line = content[: i + 1].count("\n") + 1
+                    brace_end = brace_index.find_block_end(match.end())
+                    # 既に追加されていないかチェック
+                    if brace_end != -1 and (name, start_line) not in found_names:
+                        found_names.add((name, start_line))
                         found_elements.append(
                             {
-                                "type": "InterfaceDef",
+                                "type": "FunctionDef",
                                 "name": name,
                                 "start_line": start_line,
-                                "end_line": end_line,
+                                "end_line": line_index.line_of(brace_end),
                             }
                         )
-                        break
+
+        # インターフェース/型定義を抽出（TypeScript）
+        for match in re.finditer(interface_pattern, content, re.MULTILINE):
+            name = match.group(1)
+            start_line = line_index.line_of(match.start())
+            # 対応する}を見つける
+            brace_end = brace_index.find_block_end(match.end())
+            if brace_end != -1:
+                found_elements.append(
+                    {
+                        "type": "InterfaceDef",
+                        "name": name,
+                        "start_line": start_line,
+                        "end_line": line_index.line_of(brace_end),
+                    }
+                )
 
         # チャンクを作成
         for elem in found_elements:
@@ -0,0 +1,119 @@
+"""
+キャッシュ用のAPI情報のレコード形式モジュール
+
+パーサーキャッシュに保存するAPI情報のリストを、JSONの辞書ではなくmarshalした
+タプルのレコード（フィールドは固定の順序）として保存します。
+同じファイル内で繰り返し現れる文字列（型名・言語・デコレータなど）は同じオブジェクトに
+まとめてからmarshalするため、参照として1度だけ保存されます。
+
+キャッシュのデータは自身が解析した結果のため、復元時にはpydanticのモデルではなく
+`APIRecord`（`__slots__`のレコード）を検証を行わずに作成します。
+"""
+
+import marshal
+from typing import Any
+
+from ..models.api import APIInfo, APIParameterRecord, APIRecord
+
+# レコードの形式（フィールドの追加・順序の変更時はインクリメントし、以前の形式は読み込まない。
+# 保存済みの解析結果は上書きされないため、`cache_store._SCHEMA_VERSION`もインクリメントする）
+RECORD_FORMAT = 1
+
+# レコードのフィールドの順序: name, type, line_number, signature, docstring, parameters,
+# return_type, decorators, visibility, language（file_pathはキャッシュを参照したファイルの
+# パスを設定するため保存しない）。parametersは_PARAMETER_FIELDSの順序のタプル
+# （`APIParameterRecord`のフィールドの順序と同じ）
+_PARAMETER_FIELDS = ("name", "type", "description", "default", "required")
+
+
+def encode_apis(apis: "list[APIRecord] | list[APIInfo]") -> bytes:
+    """
+    API情報のリストをレコード形式に変換
+
+    Args:
+        apis: API情報（レコードまたは`APIInfo`）のリスト
+
+    Returns:
+        marshalしたレコード
+
+    Raises:
+        ValueError: marshalできない値（パラメータのデフォルト値など）を含む場合
+    """
+    strings: dict[str, str] = {}
+
+    def intern(value: Any) -> Any:
+        return strings.setdefault(value, value) if isinstance(value, str) else value
+
+    records = []
+    for api in apis:
+        parameters = api.parameters
+        decorators = api.decorators
+        records.append(
+            (
+                intern(api.name),
+                intern(api.type),
+                api.line_number,
+                intern(api.signature),
+                intern(api.docstring),
+                None
+                if parameters is None
+                else tuple(
+                    tuple(intern(getattr(parameter, field)) for field in _PARAMETER_FIELDS)
+                    for parameter in parameters
+                ),
+                intern(api.return_type),
+                None if decorators is None else tuple(intern(d) for d in decorators),
+                intern(api.visibility),
+                intern(api.language),
+            )
+        )
+    return marshal.dumps((RECORD_FORMAT, tuple(records)))
+
+
+def decode_apis(data: bytes, file_path: str) -> list[APIRecord] | None:
+    """
+    レコード形式からAPI情報のリストを復元
+
+    Args:
+        data: `encode_apis`で作成したレコード
+        file_path: 各API情報に設定するファイルパス
+
+    Returns:
+        API情報のレコードのリスト（形式が異なる・壊れている場合はNone）
+    """
+    # 壊れたデータ・以前の形式のデータは、レコードの展開時の例外も含めて復元しない
+    try:
+        record_format, records = marshal.loads(data)
+        if record_format != RECORD_FORMAT:
+            return None
+        return [
+            APIRecord(
+                name,
+                api_type,
+                file_path,
+                language,
+                line_number,
+                signature,
+                docstring,
+                None
+                if parameters is None
+                else [APIParameterRecord(*parameter) for parameter in parameters],
+                return_type,
+                None if decorators is None else list(decorators),
+                visibility,
+            )
+            for (
+                name,
+                api_type,
+                line_number,
+                signature,
+                docstring,
+                parameters,
+                return_type,
+                decorators,
+                visibility,
+                language,
+            ) in records
+        ]
+    except (EOFError, ValueError, TypeError):
+        return None
@@ -3,24 +3,175 @@
 ファイル解析結果をキャッシュして、パフォーマンスを向上させます
 """
 
+from collections.abc import Collection
 from datetime import datetime
-import hashlib
 import json
+import os
 from pathlib import Path
+import sqlite3
+import threading
+import time
 from typing import Any
 
-from ..models.api import APIInfo
+from ..models.api import APIInfo, APIRecord
 from ..models.cache import CacheEntry, CacheMetadata
+from .api_records import decode_apis, encode_apis
+from .cache_store import (
+    JSON_CACHE_FILE,
+    SQLITE_CACHE_FILE,
+    CacheStore,
+    dump_portable,
+    is_error_result,
+    is_outline_result,
+    key_path,
+    load_portable,
+    open_cache_store,
+    result_key,
+)
 from .exceptions import ErrorMessages
+from .file_hash import hash_file, resolve_hash_algorithm
 from .logger import get_logger
+from .remote_cache import RemoteCacheClient, get_remote_cache
 
 logger = get_logger("cache")
 
+# リモートキャッシュの解析結果のnamespace
+_REMOTE_NAMESPACE = "parse"
+# リモートキャッシュの解析結果の形式（先頭の1バイト、JSON）
+_REMOTE_FORMAT = b"J"
 
-class CacheManager:
-    """キャッシュ管理クラス"""
+# 検証方法（`cache.verify`）
+VERIFY_MODES = ("stat", "hash")
+# キャッシュ保存時刻からこの時間内に更新されたファイルは、同じ時刻の単位（秒単位の
+# mtimeを持つファイルシステムなど）で再度書き換えられても検出できないため、内容で検証する
+_RACY_WINDOW_NS = 1_000_000_000
+
+# 解析結果の件数・合計サイズの上限の既定値（`cache.max_entries`, `cache.max_size_mb`）
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_MAX_SIZE_MB = 256
+
+# (st_mtime_ns, st_size, st_ino)
+StatStamp = tuple[int, int, int]
+
+
+def _stat_stamp(st: os.stat_result) -> StatStamp:
+    """stat結果からキャッシュの検証に使用する値を取得"""
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _to_portable(value: Any) -> Any | None:
+    """
+    解析結果をJSONに変換できる値に変換（リモートキャッシュ・キャッシュバンドルで使用）
+
+    marshalしたレコード形式はPythonのバージョンに依存し、他の環境で作成された値の
+    復元にも安全に使用できないため、`APIInfo`の辞書のリストとして出力します。
+
+    Returns:
+        JSONに変換できる値（レコードを復元できない場合はNone）
+    """
+    if isinstance(value, bytes):
+        records = decode_apis(value, "")
+        if records is None:
+            return None
+        return [record.to_model().model_dump(exclude={"file_path"}) for record in records]
+    return value
+
+
+def _validate_apis(items: Any) -> list[APIInfo]:
+    """
+    他の環境で作成されたAPI情報の辞書のリストを検証
+
+    Raises:
+        TypeError, ValueError: リストでない・フィールドが不正な場合
+    """
+    if not isinstance(items, list):
+        raise TypeError("API情報のリストではありません")
+    return [APIInfo.model_validate({**item, "file_path": ""}) for item in items]
+
+
+def _from_portable(value: Any) -> Any | None:
+    """
+    `_to_portable`で変換した値を検証して解析結果に変換
+
+    他の開発者・CIが作成した値のため、すべてのフィールドを`APIInfo`で検証してから
+    ローカルの保存形式（レコード形式・エラー・アウトライン）に変換します。
+
+    Returns:
+        解析結果（形式が不正な場合はNone）
+    """
+    try:
+        if isinstance(value, list):
+            return encode_apis(_validate_apis(value))
+        if isinstance(value, dict) and value.keys() == {"error"}:
+            if isinstance(value["error"], str):
+                return value
+        elif isinstance(value, dict) and value.keys() == {"slow", "apis"}:
+            if isinstance(value["slow"], int | float):
+                apis = _validate_apis(value["apis"])
+                return {"slow": float(value["slow"]), "apis": [api.model_dump() for api in apis]}
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def _to_remote(value: Any) -> bytes | None:
+    """
+    解析結果をリモートキャッシュの値（JSON）に変換
+
+    Returns:
+        先頭の1バイトに`_REMOTE_FORMAT`を付けたJSON（レコードを復元できない場合はNone）
+    """
+    portable = _to_portable(value)
+    if portable is None:
+        return None
+    return _REMOTE_FORMAT + json.dumps(portable, ensure_ascii=False).encode("utf-8")
+
+
+def _from_remote(data: bytes) -> Any | None:
+    """
+    リモートキャッシュの値を検証して解析結果に変換
 
-    def __init__(self, project_root: Path, cache_dir: Path | None = None, enabled: bool = True):
+    Returns:
+        解析結果（形式が不正な場合はNone、キャッシュミスとして扱う）
+    """
+    if data[:1] != _REMOTE_FORMAT:
+        return None
+    try:
+        value = json.loads(data[1:])
+    except ValueError:
+        return None
+    return _from_portable(value)
+
+
+class _WriteBuffer:
+    """1つのスレッドが書き込んだパスのエントリと解析結果（`flush_buffers`でストアに反映）"""
+
+    __slots__ = ("paths", "results")
+
+    def __init__(self) -> None:
+        self.paths: dict[str, dict[str, Any]] = {}
+        self.results: dict[str, Any] = {}
+
+
+class CacheManager:
+    """キャッシュ管理クラス
+
+    並列解析の各スレッドからの書き込みはスレッドごとのバッファに保持し、
+    `flush_buffers`（`BaseParser.parse_project`の終了時・保存時）でまとめてストアに反映します。
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        cache_dir: Path | None = None,
+        enabled: bool = True,
+        backend: str = "json",
+        verify: str = "stat",
+        hash_algorithm: str = "auto",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_size_mb: int = DEFAULT_MAX_SIZE_MB,
+        remote: RemoteCacheClient | None = None,
+    ):
         """
         初期化
 
@@ -28,52 +179,156 @@ class CacheManager:
             project_root: プロジェクトのルートディレクトリ
             cache_dir: キャッシュディレクトリ（Noneの場合は`docgen/.cache/`）
             enabled: キャッシュを有効にするかどうか
+            backend: キャッシュの保存形式（`cache.backend`）: "json", "sqlite"
+            verify: キャッシュの検証方法（`cache.verify`）: "stat"（mtime・サイズ・inodeが
+                一致すれば内容を読まない）, "hash"（常に内容のハッシュで検証）
+            hash_algorithm: 内容のハッシュのアルゴリズム（`cache.hash_algorithm`）:
+                "auto", "xxhash", "blake2b", "sha256"
+            max_entries: 解析結果の件数の上限（`cache.max_entries`、0の場合は無制限）
+            max_size_mb: 解析結果の合計サイズの上限（MB、`cache.max_size_mb`、0の場合は無制限）
+            remote: リモートキャッシュ（`cache.remote`、ローカルにない解析結果を取得し、
+                新しい解析結果を書き込む）
         """
         self.project_root: Path = project_root.resolve()
+        # キャッシュキーの生成で相対パスに変換するためのプレフィックス
+        self._root_prefix: str = os.path.join(str(self.project_root), "")
         self.enabled: bool = enabled
         self.cache_dir: Path = cache_dir or (project_root / "docgen" / ".cache")
-        self.cache_file: Path = self.cache_dir / "parser_cache.json"
-        self._cache_data: dict[str, dict[str, Any]] | None = None
+        self.backend: str = backend
+        if verify not in VERIFY_MODES:
+            logger.warning(f"不明なキャッシュの検証方法です: {verify}。statで検証します")
+            verify = "stat"
+        self.verify: str = verify
+        self.hash_algorithm: str = resolve_hash_algorithm(hash_algorithm)
+        self.max_entries: int = max_entries
+        self.max_size_mb: int = max_size_mb
+        self.remote: RemoteCacheClient | None = remote
+        # リモートキャッシュに問い合わせ済みの解析結果のキー（ないものを繰り返し問い合わせない）
+        self._remote_checked: set[str] = set()
+        self._store: CacheStore | None = None
+        # 取得時に計算したハッシュ（キャッシュキー → (stat, ハッシュ, ハッシュ計算前の時刻)）。
+        # 解析後の保存で再利用する
+        self._pending_hashes: dict[str, tuple[StatStamp, str, int]] = {}
         self._metadata: CacheMetadata | None = None
+        # スレッドごとの書き込みバッファ（スレッドID → バッファ）
+        self._buffers: dict[int, _WriteBuffer] = {}
+        self._buffers_lock = threading.Lock()
+        # アウトラインを再利用した（前回の解析が時間の上限を超えた）ファイル
+        # （相対パス → (パーサーの種類, 前回の解析時間)）
+        self._slow_hits: dict[str, tuple[str, float]] = {}
 
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
             self._load_cache()
 
+    @classmethod
+    def from_config(cls, project_root: Path, config: dict[str, Any]) -> "CacheManager":
+        """
+        設定からキャッシュマネージャーを作成
+
+        Args:
+            project_root: プロジェクトのルートディレクトリ
+            config: 設定辞書（`cache`セクションを使用）
+
+        Returns:
+            キャッシュマネージャー
+        """
+        cache_config = config.get("cache", {})
+        return cls(
+            project_root=project_root,
+            enabled=cache_config.get("enabled", True),
+            backend=cache_config.get("backend", "json"),
+            verify=cache_config.get("verify", "stat"),
+            hash_algorithm=cache_config.get("hash_algorithm", "auto"),
+            max_entries=cache_config.get("max_entries", DEFAULT_MAX_ENTRIES),
+            max_size_mb=cache_config.get("max_size_mb", DEFAULT_MAX_SIZE_MB),
+            remote=get_remote_cache(config),
+        )
+
+    @property
+    def cache_file(self) -> Path:
+        """キャッシュファイルのパス（バックエンドにより`parser_cache.json`または`parser_cache.db`）"""
+        if self._store is not None:
+            return self._store.path
+        return self.cache_dir / (SQLITE_CACHE_FILE if self.backend == "sqlite" else JSON_CACHE_FILE)
+
     def _load_cache(self) -> None:
-        """キャッシュファイルを読み込む"""
+        """キャッシュストアを開く（JSONの場合は全件読み込み、SQLiteの場合は接続のみ）"""
         if not self.enabled:
             return
 
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, encoding="utf-8") as f:
-                    loaded_data = json.load(f)
-                    if isinstance(loaded_data, dict):
-                        self._cache_data = loaded_data
-                        logger.debug(
-                            f"キャッシュを読み込みました: {len(self._cache_data)} エントリ"
-                        )
-                    else:
-                        self._cache_data = {}
-                        logger.warning("キャッシュファイルの形式が不正です")
-            except (OSError, json.JSONDecodeError) as e:
-                logger.warning(ErrorMessages.CACHE_LOAD_FAILED.format(error=e))
-                self._cache_data = {}
-        else:
-            self._cache_data = {}
+        try:
+            self._store = open_cache_store(self.cache_dir, self.backend)
+        except ValueError as e:
+            logger.warning(f"{e}。JSONで保存します")
+            self.backend = "json"
+            self._store = open_cache_store(self.cache_dir, self.backend)
+        except sqlite3.Error as e:
+            # キャッシュを開けなくても生成は続行する
+            logger.warning(ErrorMessages.CACHE_LOAD_FAILED.format(error=e))
+            self._store = None
 
     def _save_cache(self) -> None:
-        """キャッシュファイルを保存"""
-        if not self.enabled or self._cache_data is None:
+        """書き込みバッファを反映し、上限を超えた解析結果を削除してキャッシュを保存"""
+        if not self.enabled or self._store is None:
             return
+        self.flush_buffers()
+        if self.remote is not None:
+            self.remote.flush(_REMOTE_NAMESPACE)
+        evicted = self._store.evict_results(self.max_entries, self.max_size_mb * 1024 * 1024)
+        if evicted:
+            logger.debug(f"使用日時の古い解析結果を削除しました: {evicted} 件")
+        self._store.flush()
+
+    def _buffer(self) -> _WriteBuffer:
+        """現在のスレッドの書き込みバッファを取得（初回は作成）"""
+        ident = threading.get_ident()
+        buffer = self._buffers.get(ident)
+        if buffer is None:
+            buffer = _WriteBuffer()
+            with self._buffers_lock:
+                self._buffers[ident] = buffer
+        return buffer
+
+    def flush_buffers(self) -> None:
+        """
+        すべてのスレッドの書き込みバッファをストアにまとめて反映
 
-        try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self._cache_data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"キャッシュを保存しました: {len(self._cache_data)} エントリ")
-        except OSError as e:
-            logger.warning(f"キャッシュファイルの保存に失敗しました: {e}")
+        並列解析のワーカーがすべて終了した後（`BaseParser.parse_project`の終了時）に呼び出します。
+        ファイルへの保存は`save`・`close`で行います。
+        """
+        with self._buffers_lock:
+            buffers, self._buffers = self._buffers, {}
+        if self._store is None:
+            return
+        paths: dict[str, dict[str, Any]] = {}
+        results: dict[str, Any] = {}
+        for buffer in buffers.values():
+            paths.update(buffer.paths)
+            results.update(buffer.results)
+        if paths or results:
+            self._store.put_many(paths, results)
+            logger.debug(
+                f"キャッシュの書き込みを反映しました: パス {len(paths)} 件, 解析結果 {len(results)} 件"
+            )
+
+    def _get_entry(self, cache_key: str) -> dict[str, Any] | None:
+        """パスのエントリを取得（反映前の書き込みを優先）"""
+        assert self._store is not None
+        for buffer in list(self._buffers.values()):
+            entry = buffer.paths.get(cache_key)
+            if entry is not None:
+                return entry
+        return self._store.get(cache_key)
+
+    def _get_result(self, key: str) -> Any | None:
+        """解析結果を取得（反映前の書き込みを優先）"""
+        assert self._store is not None
+        for buffer in list(self._buffers.values()):
+            result = buffer.results.get(key)
+            if result is not None:
+                return result
+        return self._store.get_result(key)
 
     def get_file_hash(self, file_path: Path) -> str:
         """
@@ -83,15 +338,10 @@ class CacheManager:
             file_path: ファイルパス
 
         Returns:
-            ファイルのSHA256ハッシュ（16進数文字列）
+            `アルゴリズム名:16進数`形式のハッシュ（読み込めない場合は空文字列）
         """
         try:
-            with open(file_path, "rb") as f:
-                file_hash = hashlib.sha256()
-                # 大きなファイルでも効率的に処理するため、チャンク単位で読み込む
-                while chunk := f.read(8192):
-                    file_hash.update(chunk)
-                return file_hash.hexdigest()
+            return hash_file(file_path, self.hash_algorithm)
         except OSError as e:
             logger.warning(f"ファイルのハッシュ計算に失敗しました ({file_path}): {e}")
             return ""
@@ -107,6 +357,13 @@ class CacheManager:
         Returns:
             キャッシュキー
         """
+        # プロジェクトルート配下の絶対パスは文字列の操作で相対パスに変換する
+        # （解析結果をキャッシュから取得するたびに呼ばれるため、Path.relative_toを避ける）
+        path_str = str(file_path)
+        if path_str.startswith(self._root_prefix):
+            normalized_path = path_str[len(self._root_prefix) :].replace("\\", "/")
+            return f"{parser_type}:{normalized_path}"
+
         try:
             # 相対パスに変換
             if file_path.is_absolute():
@@ -121,101 +378,353 @@ class CacheManager:
             # プロジェクトルート外のファイルの場合、絶対パスを使用
             return f"{parser_type}:{file_path}"
 
-    def get_cached_result(self, file_path: Path, parser_type: str) -> list[APIInfo] | None:
+    def get_cached_result(
+        self, file_path: Path, parser_type: str, verify: bool = True, parser_version: str = ""
+    ) -> list[APIRecord] | None:
         """
         キャッシュから結果を取得
 
+        解析結果はファイルの内容のハッシュで検索するため、パスのエントリがない場合や
+        mtimeが変わった場合でも、同じ内容のファイル（リネーム・コピー・ブランチの切り替え・
+        変更の取り消し）が解析済みであればその結果を返します。
+
         Args:
             file_path: ファイルパス
             parser_type: パーサーの種類
+            verify: mtime・ハッシュでファイルが変更されていないか検証するかどうか
+                （差分実行で未変更と分かっているファイルはFalseにして検証を省略）
+            parser_version: パーサーの実装のバージョン（異なるバージョンの解析結果は使用しない）
 
         Returns:
-            キャッシュされた結果（存在する場合）、またはNone
+            キャッシュされた解析結果のレコード（存在する場合）、またはNone。同じ内容の
+            ファイルの解析に失敗している場合は空のリスト
         """
-        if not self.enabled or self._cache_data is None:
-            return None
-
-        if not file_path.exists():
+        if not self.enabled or self._store is None:
             return None
 
         cache_key = self.get_cache_key(file_path, parser_type)
-        cache_entry = self._cache_data.get(cache_key)
+        cache_entry = self._get_entry(cache_key)
 
-        if cache_entry is None:
-            return None
+        if not verify:
+            if cache_entry is None or not cache_entry.get("hash"):
+                return None
+            return self._lookup_result(cache_key, parser_type, parser_version, cache_entry["hash"])
 
-        # まずmtimeをチェック（軽い処理）
-        # mtimeが一致しない場合は、ハッシュ計算をスキップして早期リターン
         try:
-            current_mtime = file_path.stat().st_mtime
+            stamp = _stat_stamp(file_path.stat())
         except OSError:
             # ファイルアクセスエラーの場合、キャッシュを無効化
-            del self._cache_data[cache_key]
+            if cache_entry is not None:
+                for buffer in list(self._buffers.values()):
+                    buffer.paths.pop(cache_key, None)
+                self._store.delete(cache_key)
             return None
 
-        cached_mtime = cache_entry.get("mtime")
-        if current_mtime != cached_mtime:
-            # mtimeが一致しない場合、キャッシュは無効
-            logger.debug(f"キャッシュが無効（mtime不一致）: {file_path}")
-            del self._cache_data[cache_key]
+        # mtime・サイズ・inodeが一致すれば内容を読まずに有効とみなす
+        if self.verify == "stat" and cache_entry is not None and self._is_fresh(cache_entry, stamp):
+            result = self._lookup_result(
+                cache_key, parser_type, parser_version, cache_entry["hash"]
+            )
+            if result is not None:
+                logger.debug(f"キャッシュから結果を取得: {file_path}")
+                return result
+
+        # 先読み（`prefetch_remote`）で計算したハッシュは、その後ファイルが変更されていなければ再利用する
+        pending = self._pending_hashes.get(cache_key)
+        if pending is not None and pending[0] == stamp:
+            _, current_hash, checked_ns = pending
+        else:
+            checked_ns = time.time_ns()
+            current_hash = self.get_file_hash(file_path)
+        if not current_hash:
             return None
+        result = self._lookup_result(cache_key, parser_type, parser_version, current_hash)
 
-        # mtimeが一致する場合のみ、ハッシュを計算して検証（重い処理）
-        # ハッシュが一致すれば、キャッシュは有効
-        current_hash = self.get_file_hash(file_path)
-        cached_hash = cache_entry.get("hash")
+        if result is None:
+            # 解析後の保存でハッシュを再計算しないよう保持しておく
+            logger.debug(f"キャッシュに同じ内容の解析結果がありません: {file_path}")
+            self._pending_hashes[cache_key] = (stamp, current_hash, checked_ns)
+            return None
 
-        if current_hash and current_hash == cached_hash:
-            logger.debug(f"キャッシュから結果を取得: {file_path}")
-            result = cache_entry.get("result")
-            if result is None:
+        self._pending_hashes.pop(cache_key, None)
+        # 同じ内容の解析結果があれば再利用し、パスのエントリを現在の内容とstatに更新する
+        # （リネーム・コピー・変更の取り消し、または保存直後に更新されたファイル）
+        if (
+            cache_entry is None
+            or cache_entry.get("hash") != current_hash
+            or cache_entry.get("version") != parser_version
+            or not self._is_fresh(cache_entry, stamp)
+        ):
+            logger.debug(f"キャッシュから同じ内容の解析結果を取得: {file_path}")
+            self._buffer().paths[cache_key] = self._path_entry(
+                current_hash, parser_version, stamp, checked_ns
+            )
+        return result
+
+    @staticmethod
+    def _is_fresh(cache_entry: dict[str, Any], stamp: StatStamp) -> bool:
+        """
+        statのみでパスのエントリが有効と判定できるかどうか
+
+        mtime・サイズ・inodeが一致し、かつハッシュ計算の時点でmtimeが十分に古い
+        （同じ時刻の単位で再度書き換えられた可能性がない）場合のみTrueを返します。
+        """
+        cached_stamp = (
+            cache_entry.get("mtime_ns"),
+            cache_entry.get("size"),
+            cache_entry.get("ino"),
+        )
+        checked_ns = cache_entry.get("checked_ns") or 0
+        return cached_stamp == stamp and stamp[0] < checked_ns - _RACY_WINDOW_NS
+
+    @staticmethod
+    def _path_entry(
+        file_hash: str, parser_version: str, stamp: StatStamp, checked_ns: int
+    ) -> dict[str, Any]:
+        """パスのエントリを作成"""
+        mtime_ns, size, ino = stamp
+        return {
+            "hash": file_hash,
+            "version": parser_version,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "ino": ino,
+            "checked_ns": checked_ns,
+            "cached_at": datetime.now().isoformat(),
+        }
+
+    def _lookup_result(
+        self, cache_key: str, parser_type: str, parser_version: str, file_hash: str
+    ) -> list[APIRecord] | None:
+        """内容のハッシュから解析結果を取得（解析に失敗した内容の場合は空のリスト）"""
+        assert self._store is not None
+        key = result_key(parser_type, key_path(cache_key), file_hash, parser_version)
+        result = self._get_result(key)
+        if result is None:
+            result = self._fetch_remote([key]).get(key)
+        if result is None:
+            return None
+        if is_error_result(result):
+            # 同じ内容のファイルは再度解析しても失敗するため、変更されるまで解析しない
+            logger.info(
+                f"前回の解析に失敗したファイルのため解析をスキップします: "
+                f"{key_path(cache_key)} ({result['error']})"
+            )
+            return []
+        if is_outline_result(result):
+            # 同じ内容のファイルは再度解析しても時間の上限を超えるため、変更されるまでアウトラインを使用する
+            rel_path = key_path(cache_key)
+            self._slow_hits[rel_path] = (parser_type, float(result["slow"]))
+            try:
+                return [
+                    APIRecord.from_dict({**item, "file_path": rel_path}) for item in result["apis"]
+                ]
+            except (TypeError, AttributeError):
                 return None
-            # 辞書のリストをAPIInfoのリストに変換
-            if isinstance(result, list) and len(result) > 0 and isinstance(result[0], dict):
-                return [APIInfo(**item) if isinstance(item, dict) else item for item in result]
-            return result
-
-        # ハッシュが一致しない場合、キャッシュは無効
-        logger.debug(f"キャッシュが無効（ハッシュ不一致）: {file_path}")
-        del self._cache_data[cache_key]
-        return None
+        if isinstance(result, bytes):
+            # レコード形式の解析結果は検証を行わずに復元する（形式が異なる場合は再解析）
+            return decode_apis(result, key_path(cache_key))
+        # 辞書のリストをレコードのリストに変換（フィールドが異なる場合は再解析）
+        try:
+            return [
+                APIRecord.from_dict({**item, "file_path": key_path(cache_key)}) for item in result
+            ]
+        except (TypeError, AttributeError):
+            return None
+
+    def _fetch_remote(self, keys: list[str]) -> dict[str, Any]:
+        """
+        ローカルにない解析結果をリモートキャッシュから取得し、ローカルの書き込みバッファに追加
 
-    def set_cached_result(self, file_path: Path, parser_type: str, result: list[APIInfo]) -> None:
+        Args:
+            keys: 解析結果のキー
+
+        Returns:
+            取得した解析結果（キー → 解析結果）
+        """
+        if self.remote is None or not self.remote.available:
+            return {}
+        keys = [key for key in keys if key not in self._remote_checked]
+        if not keys:
+            return {}
+        self._remote_checked.update(keys)
+        fetched = {}
+        for key, data in self.remote.get_many(_REMOTE_NAMESPACE, keys).items():
+            value = _from_remote(data)
+            if value is not None:
+                fetched[key] = value
+        if fetched:
+            self._buffer().results.update(fetched)
+            logger.debug(f"リモートキャッシュから解析結果を取得しました: {len(fetched)} 件")
+        return fetched
+
+    def prefetch_remote(self, files: list[Path], parser_type: str, parser_version: str = "") -> int:
+        """
+        ローカルにない解析結果をリモートキャッシュからまとめて取得
+
+        解析の前に呼び出し、ファイルごとに問い合わせる代わりに`batch_size`件ずつ取得します。
+        計算したハッシュは`get_cached_result`・保存で再利用します。
+
+        Args:
+            files: 解析するファイル
+            parser_type: パーサーの種類
+            parser_version: パーサーの実装のバージョン
+
+        Returns:
+            取得した解析結果の件数
+        """
+        if not self.enabled or self._store is None or self.remote is None:
+            return 0
+        if not self.remote.available:
+            return 0
+
+        missing = []
+        for file_path in files:
+            cache_key = self.get_cache_key(file_path, parser_type)
+            try:
+                stamp = _stat_stamp(file_path.stat())
+            except OSError:
+                continue
+            cache_entry = self._get_entry(cache_key)
+            if (
+                self.verify == "stat"
+                and cache_entry is not None
+                and cache_entry.get("version") == parser_version
+                and self._is_fresh(cache_entry, stamp)
+            ):
+                file_hash = cache_entry["hash"]
+            else:
+                checked_ns = time.time_ns()
+                file_hash = self.get_file_hash(file_path)
+                if not file_hash:
+                    continue
+                self._pending_hashes[cache_key] = (stamp, file_hash, checked_ns)
+            key = result_key(parser_type, key_path(cache_key), file_hash, parser_version)
+            if self._get_result(key) is None:
+                missing.append(key)
+        return len(self._fetch_remote(missing))
+
+    def set_cached_result(
+        self,
+        file_path: Path,
+        parser_type: str,
+        result: list[APIRecord],
+        parser_version: str = "",
+        records: bytes | None = None,
+    ) -> None:
         """
         結果をキャッシュに保存
 
+        解析結果は内容のハッシュをキーとして保存し、パスのエントリはそのハッシュを参照します。
+
         Args:
             file_path: ファイルパス
             parser_type: パーサーの種類
             result: 解析結果
+            parser_version: パーサーの実装のバージョン
+            records: `encode_apis`で変換済みのレコード（ワーカープロセスの解析結果など、
+                指定された場合は変換を省略する）
         """
-        if not self.enabled or self._cache_data is None:
+        if records is not None:
+            self._put(file_path, parser_type, parser_version, records)
             return
+        try:
+            # 復元時に検証を省略できるよう、レコード形式で保存する
+            value: Any = encode_apis(result)
+        except (ValueError, AttributeError):
+            # marshalできない値を含む場合は辞書に変換して保存
+            value = [
+                (api if isinstance(api, APIInfo) else api.to_model()).model_dump() for api in result
+            ]
+        self._put(file_path, parser_type, parser_version, value)
+
+    def set_cached_error(
+        self, file_path: Path, parser_type: str, error: str, parser_version: str = ""
+    ) -> None:
+        """
+        解析に失敗したことをキャッシュに保存（ネガティブキャッシュ）
+
+        構文エラーのファイルなどを、内容が変更されるまで毎回解析しないようにします。
+
+        Args:
+            file_path: ファイルパス
+            parser_type: パーサーの種類
+            error: エラーメッセージ
+            parser_version: パーサーの実装のバージョン
+        """
+        self._put(file_path, parser_type, parser_version, {"error": error})
+
+    def set_cached_outline(
+        self,
+        file_path: Path,
+        parser_type: str,
+        result: list[APIRecord],
+        elapsed: float,
+        parser_version: str = "",
+    ) -> None:
+        """
+        解析が時間の上限を超えたファイルのアウトラインをキャッシュに保存
+
+        内容が変更されるまで再解析せず、保存したアウトラインを使用します。
+
+        Args:
+            file_path: ファイルパス
+            parser_type: パーサーの種類
+            result: アウトラインの解析結果
+            elapsed: 時間の上限を超えるまでの解析時間（秒）
+            parser_version: パーサーの実装のバージョン
+        """
+        apis = [api.to_model().model_dump() for api in result]
+        self._put(file_path, parser_type, parser_version, {"slow": round(elapsed, 3), "apis": apis})
 
-        if not file_path.exists():
+    def pop_slow_hits(self) -> list[tuple[str, str, float]]:
+        """
+        キャッシュのアウトラインを再利用したファイルを取得してクリア
+
+        Returns:
+            (相対パス, パーサーの種類, 前回の解析時間（秒）)のリスト
+        """
+        hits, self._slow_hits = self._slow_hits, {}
+        return [
+            (rel_path, parser_type, elapsed) for rel_path, (parser_type, elapsed) in hits.items()
+        ]
+
+    def _put(self, file_path: Path, parser_type: str, parser_version: str, value: Any) -> None:
+        """解析結果（またはエラー）とパスのエントリを現在のスレッドの書き込みバッファに追加"""
+        if not self.enabled or self._store is None:
             return
 
         cache_key = self.get_cache_key(file_path, parser_type)
-        file_hash = self.get_file_hash(file_path)
-
         try:
-            file_mtime = file_path.stat().st_mtime
+            stamp = _stat_stamp(file_path.stat())
         except OSError:
             return
 
-        # APIInfoオブジェクトを辞書に変換して保存
-        result_dicts = [api.model_dump() if isinstance(api, APIInfo) else api for api in result]
-        self._cache_data[cache_key] = {
-            "hash": file_hash,
-            "mtime": file_mtime,
-            "result": result_dicts,
-            "cached_at": datetime.now().isoformat(),
-        }
+        # 取得時に計算したハッシュは、その後ファイルが変更されていなければ再利用する
+        pending = self._pending_hashes.pop(cache_key, None)
+        if pending is not None and pending[0] == stamp:
+            _, file_hash, checked_ns = pending
+        else:
+            checked_ns = time.time_ns()
+            file_hash = self.get_file_hash(file_path)
+        if not file_hash:
+            return
+
+        key = result_key(parser_type, key_path(cache_key), file_hash, parser_version)
+        buffer = self._buffer()
+        buffer.results[key] = value
+        buffer.paths[cache_key] = self._path_entry(file_hash, parser_version, stamp, checked_ns)
+        if self.remote is not None:
+            data = _to_remote(value)
+            if data is not None:
+                self.remote.put(_REMOTE_NAMESPACE, key, data)
 
     def clear_cache(self) -> None:
         """キャッシュをクリア"""
-        if self._cache_data is not None:
-            self._cache_data.clear()
+        if self._store is not None:
+            with self._buffers_lock:
+                self._buffers = {}
+            self._store.clear()
             self._save_cache()
             logger.info("キャッシュをクリアしました")
 
@@ -227,13 +736,13 @@ class CacheManager:
             file_path: ファイルパス
             parser_type: パーサーの種類（Noneの場合はすべてのパーサータイプ）
         """
-        if not self.enabled or self._cache_data is None:
+        if not self.enabled or self._store is None:
             return
+        self.flush_buffers()
 
         if parser_type:
             cache_key = self.get_cache_key(file_path, parser_type)
-            if cache_key in self._cache_data:
-                del self._cache_data[cache_key]
+            if self._store.delete(cache_key):
                 logger.debug(f"キャッシュを無効化: {file_path} ({parser_type})")
         else:
             # すべてのパーサータイプのキャッシュを無効化
@@ -248,17 +757,94 @@ class CacheManager:
                 # プロジェクトルート外のファイルの場合、絶対パスを使用
                 normalized_path = str(file_path).replace("\\", "/")
 
-            keys_to_remove = [
-                key for key in self._cache_data.keys() if key.endswith(f":{normalized_path}")
-            ]
-            for key in keys_to_remove:
-                del self._cache_data[key]
+            if self._store.delete_path(normalized_path):
                 logger.debug(f"キャッシュを無効化: {file_path}")
 
+    def gc(
+        self, live_paths: Collection[str] | None = None, prune_results: bool = True
+    ) -> dict[str, int]:
+        """
+        不要なエントリを削除（保存は`save`・`close`で行う）
+
+        Args:
+            live_paths: 現在の走査で見つかったファイルの相対パス（指定された場合、
+                それ以外のパスのエントリを削除）
+            prune_results: どのパスのエントリからも参照されていない解析結果（削除された
+                ファイルや、以前のバージョンのパーサーの解析結果）を削除するかどうか。
+                Falseの場合、参照されていない解析結果はブランチの切り替えなどで再利用できるよう
+                件数・サイズの上限までは残す
+
+        Returns:
+            削除した件数（`paths`: パスのエントリ、`results`: 参照されていない解析結果、
+            `evicted`: 上限を超えた解析結果）
+        """
+        removed = {"paths": 0, "results": 0, "evicted": 0}
+        if not self.enabled or self._store is None:
+            return removed
+        self.flush_buffers()
+
+        if live_paths is not None:
+            removed["paths"] = self._store.delete_paths_except(live_paths)
+        if prune_results:
+            referenced = {
+                result_key(
+                    key.partition(":")[0], key_path(key), entry["hash"], entry.get("version") or ""
+                )
+                for key, entry in self._store.items()
+                if entry.get("hash")
+            }
+            removed["results"] = self._store.delete_results_except(referenced)
+        removed["evicted"] = self._store.evict_results(
+            self.max_entries, self.max_size_mb * 1024 * 1024
+        )
+        if any(removed.values()):
+            logger.info(
+                f"キャッシュを整理しました: パス {removed['paths']} 件, "
+                f"解析結果 {removed['results'] + removed['evicted']} 件"
+            )
+        return removed
+
+    def export_entries(self) -> dict[str, Any]:
+        """
+        パスに依存しない形式でキャッシュのエントリを出力（`cache export`で使用）
+
+        Returns:
+            JSONに変換できる辞書（キャッシュが無効な場合は空の辞書）
+        """
+        if not self.enabled or self._store is None:
+            return {}
+        self.flush_buffers()
+        return dump_portable(self._store, _to_portable)
+
+    def import_entries(self, data: dict[str, Any]) -> dict[str, int]:
+        """
+        `export_entries`で出力したエントリを取り込む（保存は`save`・`close`で行う）
+
+        Args:
+            data: `export_entries`で出力した辞書
+
+        Returns:
+            取り込んだ件数（`paths`: パスのエントリ、`results`: 解析結果）
+
+        Raises:
+            ValueError: キャッシュの形式が異なる場合
+        """
+        if not self.enabled or self._store is None:
+            return {"paths": 0, "results": 0}
+        self.flush_buffers()
+        return load_portable(self._store, data, _from_portable)
+
     def save(self) -> None:
         """キャッシュを保存（明示的に保存する場合）"""
         self._save_cache()
 
+    def close(self) -> None:
+        """キャッシュを保存してストアを閉じる"""
+        if self._store is not None:
+            self._save_cache()
+            self._store.close()
+            self._store = None
+
     def get_cache_stats(self) -> dict[str, Any]:
         """
         キャッシュの統計情報を取得
@@ -266,14 +852,24 @@ class CacheManager:
         Returns:
             統計情報の辞書
         """
-        if not self.enabled or self._cache_data is None:
+        if not self.enabled or self._store is None:
             return {"enabled": False, "total_entries": 0, "cache_file_size": 0}
 
+        self.flush_buffers()
         cache_file_size = self.cache_file.stat().st_size if self.cache_file.exists() else 0
+        result_stats = self._store.result_stats()
 
         return {
             "enabled": True,
-            "total_entries": len(self._cache_data),
+            "backend": self.backend,
+            "verify": self.verify,
+            "hash_algorithm": self.hash_algorithm,
+            "total_entries": self._store.count(),
+            "total_results": result_stats["results"],
+            "error_results": result_stats["error_results"],
+            "result_bytes": result_stats["result_bytes"],
+            "max_entries": self.max_entries,
+            "max_size_mb": self.max_size_mb,
             "cache_file_size": cache_file_size,
             "cache_file_path": str(self.cache_file),
         }
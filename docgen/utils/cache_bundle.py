@@ -0,0 +1,234 @@
+"""
+キャッシュバンドルモジュール
+
+パーサーキャッシュ・埋め込みのキャッシュ・RAGインデックスを1つのアーカイブ（tar.gz）に
+まとめて出力し、別の環境（CIのランナーなど）で取り込みます。空のキャッシュから開始する
+環境でもバンドルを復元すれば、変更されたファイルのみを解析・埋め込みできます。
+
+アーカイブの構成:
+
+- `manifest.json`: バンドルの形式のバージョン（`BUNDLE_FORMAT`）と各キャッシュの件数
+- `parser_cache.json`: パーサーキャッシュ（パスはプロジェクトルートからの相対パス、
+  解析結果は内容のハッシュがキーのため、チェックアウト先のパスに依存しない）。
+  解析結果はPythonのバージョンに依存しないJSON（`APIInfo`の辞書）で保存し、
+  取り込み時に検証する
+- `embeddings/`: 埋め込みのキャッシュ（テキストのハッシュがキー）
+- `index/`: RAGインデックス（チャンクのファイルパスは相対パス）
+"""
+
+from datetime import datetime
+import io
+import json
+import os
+from pathlib import Path, PurePosixPath
+import tarfile
+from typing import TYPE_CHECKING
+
+from .exceptions import CacheError
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    from .cache import CacheManager
+
+logger = get_logger("cache")
+
+# バンドルの形式（アーカイブの構成を変更した場合はインクリメントし、以前の形式は取り込まない）
+# 2: 解析結果をmarshalしたレコードではなくJSONで保存
+BUNDLE_FORMAT = 2
+
+_MANIFEST = "manifest.json"
+_PARSER_CACHE = "parser_cache.json"
+_EMBEDDINGS = "embeddings"
+_INDEX = "index"
+
+
+def export_bundle(
+    output: Path,
+    cache_manager: "CacheManager | None",
+    embeddings_dir: Path | None = None,
+    index_dir: Path | None = None,
+) -> dict[str, int]:
+    """
+    キャッシュをバンドルに出力
+
+    アーカイブは一時ファイルに書き込んでからリネームするため、途中で失敗しても
+    既存のバンドルは壊れません。
+
+    Args:
+        output: 出力するアーカイブのパス
+        cache_manager: パーサーキャッシュ（Noneの場合は含めない）
+        embeddings_dir: 埋め込みのキャッシュディレクトリ（Noneの場合は含めない）
+        index_dir: RAGインデックスのディレクトリ（Noneの場合は含めない）
+
+    Returns:
+        出力した件数（`paths`, `results`, `embeddings`, `index_files`）
+    """
+    parser_cache = cache_manager.export_entries() if cache_manager is not None else {}
+    embedding_files = _list_files(embeddings_dir, "*.npy")
+    index_files = _list_files(index_dir, "*")
+    counts = {
+        "paths": len(parser_cache.get("paths", {})),
+        "results": len(parser_cache.get("results", {})),
+        "embeddings": len(embedding_files),
+        "index_files": len(index_files),
+    }
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "created_at": datetime.now().isoformat(),
+        "counts": counts,
+    }
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(output.name + ".tmp")
+    try:
+        with tarfile.open(tmp_path, "w:gz") as tar:
+            _add_bytes(tar, _MANIFEST, json.dumps(manifest, indent=2).encode("utf-8"))
+            if parser_cache:
+                _add_bytes(
+                    tar,
+                    _PARSER_CACHE,
+                    json.dumps(parser_cache, ensure_ascii=False, separators=(",", ":")).encode(
+                        "utf-8"
+                    ),
+                )
+            for prefix, base_dir, files in (
+                (_EMBEDDINGS, embeddings_dir, embedding_files),
+                (_INDEX, index_dir, index_files),
+            ):
+                for path in files:
+                    assert base_dir is not None
+                    tar.add(path, arcname=f"{prefix}/{path.relative_to(base_dir).as_posix()}")
+        os.replace(tmp_path, output)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.info(
+        f"キャッシュをバンドルに出力しました: {output} "
+        f"(解析結果 {counts['results']} 件, 埋め込み {counts['embeddings']} 件)"
+    )
+    return counts
+
+
+def import_bundle(
+    archive: Path,
+    cache_manager: "CacheManager | None",
+    embeddings_dir: Path | None = None,
+    index_dir: Path | None = None,
+    overwrite_index: bool = False,
+) -> dict[str, int]:
+    """
+    バンドルからキャッシュを取り込む
+
+    既存のパーサーキャッシュ・埋め込みは上書きせず、バンドルにのみあるエントリを追加します。
+    RAGインデックスは既存のインデックスがない場合（または`overwrite_index`の場合）のみ取り込みます。
+
+    Args:
+        archive: `export_bundle`で出力したアーカイブのパス
+        cache_manager: パーサーキャッシュ（Noneの場合は取り込まない）
+        embeddings_dir: 埋め込みのキャッシュディレクトリ（Noneの場合は取り込まない）
+        index_dir: RAGインデックスのディレクトリ（Noneの場合は取り込まない）
+        overwrite_index: 既存のRAGインデックスを置き換えるかどうか
+
+    Returns:
+        取り込んだ件数（`paths`, `results`, `embeddings`, `index_files`）
+
+    Raises:
+        CacheError: アーカイブを読み込めない・形式が異なる場合
+    """
+    counts = {"paths": 0, "results": 0, "embeddings": 0, "index_files": 0}
+    try:
+        with tarfile.open(archive, "r:*") as tar:
+            manifest = json.loads(_read_member(tar, _MANIFEST) or b"{}")
+            if manifest.get("format") != BUNDLE_FORMAT:
+                raise CacheError(
+                    f"キャッシュバンドルの形式が異なります: {archive} "
+                    f"({manifest.get('format')}, 現在: {BUNDLE_FORMAT})"
+                )
+
+            parser_cache = _read_member(tar, _PARSER_CACHE)
+            if cache_manager is not None and parser_cache is not None:
+                try:
+                    counts.update(cache_manager.import_entries(json.loads(parser_cache)))
+                except ValueError as e:
+                    # パーサーキャッシュの形式が異なる場合は、埋め込み・インデックスのみ取り込む
+                    logger.warning(f"パーサーキャッシュを取り込めませんでした: {e}")
+
+            replace_index = index_dir is not None and (
+                overwrite_index or not (index_dir / "meta.json").exists()
+            )
+            for member in tar.getmembers():
+                if not member.isfile():
+                    continue
+                prefix, rel_path = _split_member(member.name)
+                if prefix == _EMBEDDINGS and embeddings_dir is not None:
+                    dest = embeddings_dir / rel_path
+                    if dest.exists():
+                        continue
+                    counts["embeddings"] += 1
+                elif prefix == _INDEX and replace_index:
+                    assert index_dir is not None
+                    dest = index_dir / rel_path
+                    counts["index_files"] += 1
+                else:
+                    continue
+                _extract_to(tar, member, dest)
+    except (OSError, tarfile.TarError, json.JSONDecodeError) as e:
+        raise CacheError(f"キャッシュバンドルを読み込めませんでした: {archive}: {e}") from e
+
+    logger.info(
+        f"キャッシュをバンドルから取り込みました: {archive} "
+        f"(解析結果 {counts['results']} 件, 埋め込み {counts['embeddings']} 件)"
+    )
+    return counts
+
+
+def _list_files(base_dir: Path | None, pattern: str) -> list[Path]:
+    """ディレクトリ以下のファイルを列挙（存在しない場合は空のリスト）"""
+    if base_dir is None or not base_dir.is_dir():
+        return []
+    return sorted(path for path in base_dir.rglob(pattern) if path.is_file())
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    """バイト列をアーカイブのファイルとして追加"""
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(datetime.now().timestamp())
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _read_member(tar: tarfile.TarFile, name: str) -> bytes | None:
+    """アーカイブのファイルを読み込む（存在しない場合はNone）"""
+    try:
+        member = tar.getmember(name)
+    except KeyError:
+        return None
+    f = tar.extractfile(member)
+    return f.read() if f is not None else None
+
+
+def _split_member(name: str) -> tuple[str, Path]:
+    """
+    アーカイブ内のパスを先頭のディレクトリと残りのパスに分割
+
+    Raises:
+        CacheError: 絶対パス・親ディレクトリへの参照を含む場合
+    """
+    path = PurePosixPath(name)
+    if path.is_absolute() or ".." in path.parts:
+        raise CacheError(f"キャッシュバンドルに不正なパスが含まれています: {name}")
+    if len(path.parts) < 2:
+        return "", Path(name)
+    return path.parts[0], Path(*path.parts[1:])
+
+
+def _extract_to(tar: tarfile.TarFile, member: tarfile.TarInfo, dest: Path) -> None:
+    """アーカイブのファイルを一時ファイルに書き込んでからリネーム"""
+    f = tar.extractfile(member)
+    if f is None:
+        return
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest.with_name(dest.name + ".tmp")
+    with open(tmp_path, "wb") as out:
+        out.write(f.read())
+    os.replace(tmp_path, dest)
@@ -0,0 +1,175 @@
+"""
+リモートキャッシュの参照実装サーバー
+
+`remote_cache`モジュールのプロトコルを実装する小さなHTTPサーバーです（`docgen cache serve`）。
+値はnamespaceごとのディレクトリに、キーのSHA-256をファイル名として保存します
+（一時ファイルに書き込んでからリネームするため、書き込み中の値を読むことはありません）。
+キーは内容のハッシュのため、同じキーの値は常に同じであり、上書きは行いません。
+"""
+
+import base64
+import hashlib
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any
+
+from .logger import get_logger
+from .remote_cache import NAMESPACES, PROTOCOL_VERSION
+
+logger = get_logger("cache")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# 1回のリクエストの本文の上限（バイト）
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+
+class CacheServer:
+    """リモートキャッシュのサーバー"""
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        token: str | None = None,
+    ):
+        """
+        初期化
+
+        Args:
+            storage_dir: 値を保存するディレクトリ
+            host: 待ち受けるホスト
+            port: 待ち受けるポート（0の場合は空いているポート）
+            token: 認証トークン（指定した場合、`Authorization: Bearer`が一致しないリクエストを拒否）
+        """
+        self.storage_dir = storage_dir
+        self.token = token
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """サーバーのURL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """リクエストを処理（`shutdown`まで戻らない）"""
+        logger.info(f"リモートキャッシュのサーバーを起動しました: {self.url} ({self.storage_dir})")
+        self._httpd.serve_forever()
+
+    def start(self) -> None:
+        """バックグラウンドのスレッドでリクエストを処理"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """サーバーを停止"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_many(self, namespace: str, keys: list[str]) -> dict[str, bytes]:
+        """保存されている値を取得"""
+        found = {}
+        for key in keys:
+            try:
+                found[key] = self._path(namespace, key).read_bytes()
+            except FileNotFoundError:
+                continue
+        return found
+
+    def put_many(self, namespace: str, values: dict[str, bytes]) -> int:
+        """値を保存（既存のキーは上書きしない）し、保存した件数を返す"""
+        stored = 0
+        for key, value in values.items():
+            path = self._path(namespace, key)
+            if path.exists():
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(value)
+            os.replace(tmp_path, path)
+            stored += 1
+        return stored
+
+    def _path(self, namespace: str, key: str) -> Path:
+        """値のファイルのパス"""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.storage_dir / namespace / digest[:2] / digest
+
+
+def _make_handler(server: CacheServer) -> type[BaseHTTPRequestHandler]:
+    """サーバーのストレージを使用するリクエストハンドラーを作成"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if self.path != "/v1/health":
+                self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+                return
+            self._send(HTTPStatus.OK, {"status": "ok", "protocol": PROTOCOL_VERSION})
+
+        def do_POST(self) -> None:
+            parts = self.path.strip("/").split("/")
+            if len(parts) != 3 or parts[0] != "v1" or parts[1] not in NAMESPACES:
+                self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+                return
+            if server.token and self.headers.get("Authorization") != f"Bearer {server.token}":
+                self._send(HTTPStatus.UNAUTHORIZED, {"error": "unauthorized"})
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_REQUEST_BYTES:
+                # 本文を読まずに応答するため、接続を閉じる
+                self.close_connection = True
+                self._send(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "request too large"})
+                return
+            try:
+                payload = json.loads(self.rfile.read(length))
+                namespace, action = parts[1], parts[2]
+                if action == "get":
+                    values = server.get_many(namespace, [str(key) for key in payload["keys"]])
+                    body: dict[str, Any] = {
+                        "values": {
+                            key: base64.b64encode(value).decode("ascii")
+                            for key, value in values.items()
+                        }
+                    }
+                elif action == "put":
+                    stored = server.put_many(
+                        namespace,
+                        {
+                            str(key): base64.b64decode(value)
+                            for key, value in payload["values"].items()
+                        },
+                    )
+                    body = {"stored": stored}
+                else:
+                    self._send(HTTPStatus.NOT_FOUND, {"error": "not found"})
+                    return
+            except (KeyError, TypeError, AttributeError, ValueError) as e:
+                self._send(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+                return
+            self._send(HTTPStatus.OK, body)
+
+        def _send(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    return Handler
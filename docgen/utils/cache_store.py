@@ -0,0 +1,976 @@
+"""
+キャッシュストアモジュール
+
+`CacheManager`が使用するキャッシュの保存先（バックエンド）を提供します。
+
+キャッシュは2段階で構成されます。
+
+- パスエントリ: `パーサー種別:パス` → 内容のハッシュ、パーサーのバージョンと、検証に使用するstatの値
+  （`{"hash", "version", "mtime_ns", "size", "ino", "checked_ns", "cached_at"}`）
+- 解析結果: `パーサー種別@バージョン:拡張子:内容のハッシュ` → 解析結果（`api_records`の
+  レコード形式のbytes、またはJSONに変換できる値）、または解析に失敗した場合のエラー
+  （`{"error": メッセージ}`）
+
+解析結果には最終使用日時とサイズを記録し、`evict_results`で上限を超えた分を
+使用日時の古い順に削除します（LRU）。
+
+解析結果を内容のハッシュで保存するため、リネーム・コピー・ブランチの切り替えで
+パスが変わっても同じ内容のファイルは再解析せずにキャッシュを使用でき、
+vendoringされた同一ファイルは1つの解析結果を共有します。
+
+- `JsonCacheStore`: `parser_cache.json`にすべてのエントリを保存（起動時に全件読み込み、
+  変更は`parser_cache.journal`に追記し、ときどきスナップショットを書き直して圧縮する）
+- `SqliteCacheStore`: `parser_cache.db`（SQLite、WALモード）にエントリごとに保存
+  （キーごとに遅延読み込みし、更新はエントリ単位でupsertするため、大規模なキャッシュでも
+  起動と保存のコストがエントリ数に比例しない）
+"""
+
+import base64
+from collections.abc import Callable, Collection, Iterable
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from .exceptions import ErrorMessages
+from .logger import get_logger
+
+logger = get_logger("cache")
+
+JSON_CACHE_FILE = "parser_cache.json"
+SQLITE_CACHE_FILE = "parser_cache.db"
+
+# スキーマを変更した場合はインクリメントする（異なるバージョンのキャッシュは破棄して作り直す）
+_SCHEMA_VERSION = 5
+# パスエントリのフィールド（SQLiteのpathsテーブルの列順）
+_PATH_FIELDS = ("hash", "version", "mtime_ns", "size", "ino", "checked_ns", "cached_at")
+# 解析結果の最終使用日時を更新する間隔（秒）。取得のたびに書き込まないよう、
+# 前回の更新からこの時間が経過した場合のみ更新する
+_TOUCH_INTERVAL = 24 * 60 * 60
+# ジャーナルがこのサイズとスナップショットの半分の大きい方を超えたらスナップショットを書き直す
+_COMPACT_MIN_BYTES = 1024 * 1024
+# 他のプロセスが書き込み中の場合に待つ秒数
+_BUSY_TIMEOUT = 30.0
+
+
+def key_path(key: str) -> str:
+    """パスエントリのキー（`パーサー種別:パス`）からパスを取得"""
+    return key.partition(":")[2]
+
+
+def result_key(parser_type: str, rel_path: str, file_hash: str, parser_version: str = "") -> str:
+    """
+    解析結果のキーを生成
+
+    言語（`.js`と`.ts`など）は拡張子から判定されるため、内容のハッシュに加えて拡張子を含めます。
+    パーサーのバージョンを含めるため、抽出ロジックを変更した場合は以前の解析結果を使用しません。
+
+    Args:
+        parser_type: パーサーの種類
+        rel_path: ファイルのパス（拡張子の取得に使用）
+        file_hash: ファイルの内容のハッシュ
+        parser_version: パーサーの実装のバージョン（`BaseParser.PARSER_VERSION`）
+
+    Returns:
+        `パーサー種別@バージョン:拡張子:内容のハッシュ`形式のキー（バージョンが空の場合は
+        `パーサー種別:拡張子:内容のハッシュ`）
+    """
+    suffix = Path(rel_path).suffix.lower()
+    if parser_version:
+        parser_type = f"{parser_type}@{parser_version}"
+    return f"{parser_type}:{suffix}:{file_hash}"
+
+
+def is_error_result(result: Any) -> bool:
+    """解析に失敗したことを示す解析結果（`{"error": メッセージ}`）かどうか"""
+    return isinstance(result, dict) and "error" in result
+
+
+def is_outline_result(result: Any) -> bool:
+    """
+    解析が時間の上限を超えたため、アウトラインのみを保存した解析結果
+    （`{"slow": 解析時間（秒）, "apis": APIInfoの辞書のリスト}`）かどうか
+    """
+    return isinstance(result, dict) and "slow" in result
+
+
+def _encode_result(result: Any) -> str | bytes:
+    """解析結果を保存する形式に変換（bytesはそのまま、それ以外はJSON文字列）"""
+    if isinstance(result, bytes):
+        return result
+    return json.dumps(result, ensure_ascii=False)
+
+
+def _decode_result(encoded: str | bytes) -> Any:
+    """`_encode_result`で変換した解析結果を復元"""
+    if isinstance(encoded, bytes):
+        return encoded
+    return json.loads(encoded)
+
+
+def _encoded_size(encoded: str | bytes) -> int:
+    """保存する形式の解析結果のバイト数"""
+    return len(encoded) if isinstance(encoded, bytes) else len(encoded.encode("utf-8"))
+
+
+def _dump_record(record: dict[str, Any]) -> dict[str, Any]:
+    """解析結果のレコードをJSONに保存する形式に変換（bytesはbase64で`"records"`に保存）"""
+    if isinstance(record["result"], bytes):
+        return {
+            "records": base64.b64encode(record["result"]).decode("ascii"),
+            "size": record["size"],
+            "used_at": record["used_at"],
+        }
+    return record
+
+
+def _load_record(record: dict[str, Any]) -> dict[str, Any]:
+    """`_dump_record`で変換した解析結果のレコードを復元"""
+    if "records" in record:
+        return {
+            "result": base64.b64decode(record["records"]),
+            "size": record["size"],
+            "used_at": record["used_at"],
+        }
+    return record
+
+
+def _exceeds(count: int, total_bytes: int, max_entries: int, max_bytes: int) -> bool:
+    """解析結果の件数・合計サイズが上限（0の場合は無制限）を超えているかどうか"""
+    return bool(max_entries and count > max_entries) or bool(max_bytes and total_bytes > max_bytes)
+
+
+def _select_evictions(
+    rows: Iterable[tuple[str, int]], count: int, total_bytes: int, max_entries: int, max_bytes: int
+) -> list[str]:
+    """
+    上限を超えた解析結果から削除するキーを選択
+
+    Args:
+        rows: 最終使用日時の古い順の(キー, サイズ)
+        count: 解析結果の件数
+        total_bytes: 解析結果の合計サイズ
+        max_entries: 件数の上限（0の場合は無制限）
+        max_bytes: 合計サイズの上限（0の場合は無制限）
+
+    Returns:
+        削除するキーのリスト
+    """
+    evicted: list[str] = []
+    for key, size in rows:
+        if not _exceeds(count, total_bytes, max_entries, max_bytes):
+            break
+        evicted.append(key)
+        count -= 1
+        total_bytes -= size or 0
+    return evicted
+
+
+class JsonCacheStore:
+    """JSONファイルにすべてのエントリを保存するキャッシュストア
+
+    変更は`parser_cache.journal`にJSON Lines形式で追記し、保存のコストを変更された
+    エントリ数に比例させます。ジャーナルがスナップショット（`parser_cache.json`）に対して
+    大きくなった場合はスナップショットを書き直して（圧縮）ジャーナルを削除します。
+    スナップショットは一時ファイルに書き込んでからリネームするため、保存中にプロセスが
+    終了しても壊れません。ジャーナルはスナップショットの世代番号を持ち、異なる世代の
+    ジャーナル（圧縮の途中で終了した場合）は読み込みません。
+    """
+
+    def __init__(self, cache_file: Path):
+        """
+        初期化
+
+        Args:
+            cache_file: キャッシュファイル（スナップショット）のパス
+        """
+        self.path = cache_file
+        self.journal_path = cache_file.with_suffix(".journal")
+        self._paths: dict[str, dict[str, Any]] = {}
+        # 解析結果のキー → {"result": 解析結果, "size": バイト数, "used_at": 最終使用日時}
+        # （bytesの解析結果はファイルにはbase64で`"records"`として保存する）
+        self._results: dict[str, dict[str, Any]] = {}
+        # ジャーナルに追記していない変更
+        self._ops: list[dict[str, Any]] = []
+        # スナップショットを書き直す必要があるかどうか（形式の変更・クリア・壊れたジャーナル）
+        self._compact = False
+        self._generation = 0
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+        # 並列解析のスレッドからの更新と保存時の書き出しを排他する
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """スナップショットを読み込み、同じ世代のジャーナルの変更を適用する"""
+        if not self.path.exists():
+            # 新規作成時は最初の保存でスナップショットを作成する（ジャーナルは使用しない）
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                loaded_data = json.load(f)
+            self._snapshot_bytes = self.path.stat().st_size
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(ErrorMessages.CACHE_LOAD_FAILED.format(error=e))
+            self._compact = True
+            return
+        if not isinstance(loaded_data, dict):
+            logger.warning("キャッシュファイルの形式が不正です")
+            self._compact = True
+            return
+
+        if loaded_data.get("version") != _SCHEMA_VERSION:
+            # ハッシュの形式などが異なるため、以前の形式のキャッシュは使用しない
+            logger.info("キャッシュの形式が変わったため、キャッシュを作り直します")
+            self._compact = True
+            return
+        self._generation = loaded_data.get("generation", 0)
+        self._paths = loaded_data.get("paths", {})
+        for key, record in loaded_data.get("results", {}).items():
+            try:
+                self._results[key] = _load_record(record)
+            except (KeyError, TypeError, ValueError):
+                # 形式が不正な解析結果は読み込まず、次回の保存で取り除く
+                self._compact = True
+        self._replay_journal()
+        logger.debug(
+            f"キャッシュを読み込みました: {len(self._paths)} エントリ, "
+            f"解析結果 {len(self._results)} 件"
+        )
+
+    def _replay_journal(self) -> None:
+        """ジャーナルの変更を適用（世代が異なる・途中で切れている場合は次回の保存で書き直す）"""
+        if not self.journal_path.exists():
+            return
+        try:
+            with open(self.journal_path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            logger.warning(ErrorMessages.CACHE_LOAD_FAILED.format(error=e))
+            self._compact = True
+            return
+
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            header = {}
+        if header.get("version") != _SCHEMA_VERSION or header.get("generation") != self._generation:
+            # 圧縮の途中で終了した場合など、スナップショットに反映済みのジャーナル
+            self._compact = True
+            return
+
+        for line in lines[1:]:
+            try:
+                self._apply(json.loads(line))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                # 追記の途中で終了した行や形式が不正な変更は無視し、次回の保存で書き直す
+                logger.debug("キャッシュのジャーナルの壊れた変更を無視します")
+                self._compact = True
+        self._journal_bytes = sum(len(line) + 1 for line in lines)
+
+    def _apply(self, op: dict[str, Any]) -> None:
+        """ジャーナルの変更を1件適用"""
+        if "put" in op:
+            self._paths[op["put"]] = op["entry"]
+        elif "delete" in op:
+            self._paths.pop(op["delete"], None)
+        elif "result" in op:
+            self._results[op["result"]] = _load_record(op["record"])
+        elif "delete_result" in op:
+            self._results.pop(op["delete_result"], None)
+        elif "touch" in op:
+            record = self._results.get(op["touch"])
+            if record is not None:
+                record["used_at"] = op["used_at"]
+
+    def _put_path(self, key: str, entry: dict[str, Any]) -> None:
+        """パスエントリを追加・更新（ロックを取得して呼び出す）"""
+        self._paths[key] = entry
+        self._ops.append({"put": key, "entry": entry})
+
+    def _delete_paths(self, keys: list[str]) -> int:
+        """パスエントリを削除（ロックを取得して呼び出す）"""
+        for key in keys:
+            del self._paths[key]
+            self._ops.append({"delete": key})
+        return len(keys)
+
+    def _put_result(self, key: str, result: Any) -> None:
+        """解析結果を追加（ロックを取得して呼び出す）"""
+        if key in self._results:
+            return
+        record = {
+            "result": result,
+            "size": _encoded_size(_encode_result(result)),
+            "used_at": int(time.time()),
+        }
+        self._results[key] = record
+        self._ops.append({"result": key, "record": _dump_record(record)})
+
+    def _delete_results(self, keys: list[str]) -> int:
+        """解析結果を削除（ロックを取得して呼び出す）"""
+        for key in keys:
+            del self._results[key]
+            self._ops.append({"delete_result": key})
+        return len(keys)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """パスエントリを取得"""
+        return self._paths.get(key)
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """パスエントリを追加・更新"""
+        with self._lock:
+            self._put_path(key, entry)
+
+    def put_many(self, entries: dict[str, dict[str, Any]], results: dict[str, Any]) -> None:
+        """
+        解析結果とパスエントリをまとめて追加
+
+        Args:
+            entries: パスエントリ（キー → エントリ）
+            results: 解析結果（キー → 解析結果、既存の解析結果は上書きしない）
+        """
+        with self._lock:
+            for key, result in results.items():
+                self._put_result(key, result)
+            for key, entry in entries.items():
+                self._put_path(key, entry)
+
+    def delete(self, key: str) -> bool:
+        """パスエントリを削除（削除した場合はTrue）"""
+        with self._lock:
+            return self._delete_paths([key] if key in self._paths else []) > 0
+
+    def delete_path(self, path: str) -> int:
+        """指定パスのすべてのパーサー種別のパスエントリを削除（削除した件数を返す）"""
+        with self._lock:
+            return self._delete_paths([key for key in self._paths if key_path(key) == path])
+
+    def keys(self) -> list[str]:
+        """すべてのパスエントリのキーを取得"""
+        with self._lock:
+            return list(self._paths)
+
+    def items(self) -> list[tuple[str, dict[str, Any]]]:
+        """すべてのパスエントリを取得"""
+        with self._lock:
+            return list(self._paths.items())
+
+    def count(self) -> int:
+        """パスエントリ数を取得"""
+        return len(self._paths)
+
+    def delete_paths_except(self, live_paths: Collection[str]) -> int:
+        """指定したパス以外のパスエントリを削除（削除した件数を返す）"""
+        with self._lock:
+            return self._delete_paths(
+                [key for key in self._paths if key_path(key) not in live_paths]
+            )
+
+    def get_result(self, key: str) -> Any | None:
+        """解析結果を取得（存在しない場合はNone）"""
+        record = self._results.get(key)
+        if record is None:
+            return None
+        now = int(time.time())
+        if record["used_at"] < now - _TOUCH_INTERVAL:
+            with self._lock:
+                record["used_at"] = now
+                self._ops.append({"touch": key, "used_at": now})
+        return record["result"]
+
+    def put_result(self, key: str, result: Any) -> None:
+        """解析結果を追加（同じ内容の解析結果は同じため、既存の場合は何もしない）"""
+        with self._lock:
+            self._put_result(key, result)
+
+    def count_results(self) -> int:
+        """解析結果の件数を取得"""
+        return len(self._results)
+
+    def result_items(self) -> list[tuple[str, Any]]:
+        """すべての解析結果を取得"""
+        with self._lock:
+            return [(key, record["result"]) for key, record in self._results.items()]
+
+    def result_stats(self) -> dict[str, int]:
+        """解析結果の件数・合計サイズ・解析に失敗したファイルの件数を取得"""
+        with self._lock:
+            records = list(self._results.values())
+        return {
+            "results": len(records),
+            "result_bytes": sum(record["size"] for record in records),
+            "error_results": sum(1 for record in records if is_error_result(record["result"])),
+        }
+
+    def delete_results_except(self, referenced: Collection[str]) -> int:
+        """指定したキー以外の解析結果を削除（削除した件数を返す）"""
+        with self._lock:
+            return self._delete_results([key for key in self._results if key not in referenced])
+
+    def evict_results(self, max_entries: int = 0, max_bytes: int = 0) -> int:
+        """
+        上限を超えた解析結果を最終使用日時の古い順に削除
+
+        Args:
+            max_entries: 件数の上限（0の場合は無制限）
+            max_bytes: 合計サイズの上限（0の場合は無制限）
+
+        Returns:
+            削除した件数
+        """
+        with self._lock:
+            total_bytes = sum(record["size"] for record in self._results.values())
+            if not _exceeds(len(self._results), total_bytes, max_entries, max_bytes):
+                return 0
+            rows = sorted(self._results.items(), key=lambda item: item[1]["used_at"])
+            evicted = _select_evictions(
+                ((key, record["size"]) for key, record in rows),
+                len(self._results),
+                total_bytes,
+                max_entries,
+                max_bytes,
+            )
+            return self._delete_results(evicted)
+
+    def clear(self) -> None:
+        """すべてのエントリを削除"""
+        with self._lock:
+            self._paths.clear()
+            self._results.clear()
+            self._ops.clear()
+            self._compact = True
+
+    def flush(self) -> None:
+        """変更をジャーナルに追記（ジャーナルが大きくなった場合はスナップショットを書き直す）"""
+        with self._lock:
+            if self._compact or (self._ops and not self.path.exists()):
+                self._write_snapshot()
+                return
+            if not self._ops:
+                return
+            try:
+                self._append_journal(self._ops)
+            except OSError as e:
+                logger.warning(f"キャッシュファイルの保存に失敗しました: {e}")
+                return
+            self._ops = []
+            if self._journal_bytes > max(_COMPACT_MIN_BYTES, self._snapshot_bytes // 2):
+                self._write_snapshot()
+
+    def compact(self) -> None:
+        """スナップショットを書き直してジャーナルを削除"""
+        with self._lock:
+            self._write_snapshot()
+
+    def _append_journal(self, ops: list[dict[str, Any]]) -> None:
+        """変更をジャーナルに追記して同期（ロックを取得して呼び出す）"""
+        lines = [json.dumps(op, ensure_ascii=False, separators=(",", ":")) for op in ops]
+        if not self.journal_path.exists():
+            header = {"version": _SCHEMA_VERSION, "generation": self._generation}
+            lines.insert(0, json.dumps(header))
+            self._journal_bytes = 0
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        with open(self.journal_path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_bytes += len(data)
+        logger.debug(f"キャッシュの変更を保存しました: {len(ops)} 件")
+
+    def _write_snapshot(self) -> None:
+        """スナップショットを一時ファイルに書き込んでリネームし、ジャーナルを削除（ロックを取得して呼び出す）"""
+        data = {
+            "version": _SCHEMA_VERSION,
+            "generation": self._generation + 1,
+            "paths": self._paths,
+            "results": {key: _dump_record(record) for key, record in self._results.items()},
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"キャッシュファイルの保存に失敗しました: {e}")
+            return
+        # 新しい世代のスナップショットには以前のジャーナルの変更が含まれている
+        self._generation += 1
+        self._snapshot_bytes = self.path.stat().st_size
+        self._journal_bytes = 0
+        self._ops = []
+        self._compact = False
+        try:
+            self.journal_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"キャッシュのジャーナルを削除できませんでした: {e}")
+        logger.debug(f"キャッシュを保存しました: {len(self._paths)} エントリ")
+
+    def close(self) -> None:
+        """ストアを閉じる（JSONストアでは何もしない）"""
+
+
+class SqliteCacheStore:
+    """SQLite（WALモード）にエントリごとに保存するキャッシュストア
+
+    スレッドごとに接続を持つため、並列解析の各スレッドから同時に読み書きできます。
+    書き込みはコミット済みのため、`flush`を呼ぶ前にプロセスが終了しても
+    それまでの結果は失われません。WALモードのため、他のプロセス（watchと
+    pre-commit hookなど）が同じキャッシュを読んでいる間も書き込めます。
+    """
+
+    def __init__(self, db_file: Path, migrate_from: Path | None = None):
+        """
+        初期化
+
+        Args:
+            db_file: データベースファイルのパス
+            migrate_from: 移行元のJSONキャッシュファイル（データベースが新規作成され、
+                ファイルが存在する場合はエントリを取り込んで削除）
+
+        Raises:
+            sqlite3.Error: データベースを開けない場合
+        """
+        self.path = db_file
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        # 最終使用日時を更新する解析結果のキー（取得のたびに書き込まないよう`flush`でまとめて更新）
+        self._touched: set[str] = set()
+
+        is_new = not self.path.exists()
+        conn = self._conn()
+        # WALモードはデータベースファイルに記録されるため、一度設定すれば以降の接続にも適用される
+        conn.execute("PRAGMA journal_mode=WAL")
+        self._ensure_schema(conn)
+
+        if is_new and migrate_from is not None and migrate_from.exists():
+            self._migrate(migrate_from)
+
+    def _conn(self) -> sqlite3.Connection:
+        """現在のスレッドの接続を取得（初回は接続を作成）"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: 自動コミット（明示的なBEGINのみトランザクション）
+            conn = sqlite3.connect(
+                self.path, timeout=_BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            # WALモードではコミットごとのfsyncを省略しても破損しない（チェックポイント時のみ同期）
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection) -> None:
+        """テーブルを作成（スキーマのバージョンが異なる場合は作り直す）"""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _SCHEMA_VERSION):
+            logger.info("キャッシュの形式が変わったため、キャッシュを作り直します")
+            for table in ("entries", "paths", "results"):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS paths (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                hash TEXT,
+                version TEXT,
+                mtime_ns INTEGER,
+                size INTEGER,
+                ino INTEGER,
+                checked_ns INTEGER,
+                cached_at TEXT
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS paths_path ON paths (path)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                result BLOB,
+                size INTEGER,
+                used_at INTEGER
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS results_used_at ON results (used_at)")
+        if version != _SCHEMA_VERSION:
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @staticmethod
+    def _path_row(key: str, entry: dict[str, Any]) -> tuple[Any, ...]:
+        """パスエントリをテーブルの行に変換"""
+        return (key, key_path(key), *(entry.get(field) for field in _PATH_FIELDS))
+
+    def _migrate(self, json_file: Path) -> None:
+        """JSONキャッシュのエントリを1つのトランザクションで取り込み、JSONファイルを削除"""
+        source = JsonCacheStore(json_file)
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO paths VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._path_row(key, entry) for key, entry in source.items()),
+            )
+            used_at = int(time.time())
+            encoded_results = (
+                (key, _encode_result(result)) for key, result in source.result_items()
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (
+                    (key, encoded, _encoded_size(encoded), used_at)
+                    for key, encoded in encoded_results
+                ),
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        try:
+            json_file.unlink()
+            source.journal_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"移行済みのキャッシュファイルを削除できませんでした: {e}")
+        logger.info(f"キャッシュをSQLiteに移行しました: {source.count()} エントリ")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """パスエントリを取得"""
+        try:
+            row = (
+                self._conn()
+                .execute(f"SELECT {', '.join(_PATH_FIELDS)} FROM paths WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"キャッシュの読み込みに失敗しました: {e}")
+            return None
+        if row is None:
+            return None
+        return dict(zip(_PATH_FIELDS, row, strict=True))
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """パスエントリを追加・更新（upsert）"""
+        try:
+            self._conn().execute(
+                """
+                INSERT INTO paths VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    hash = excluded.hash,
+                    version = excluded.version,
+                    mtime_ns = excluded.mtime_ns,
+                    size = excluded.size,
+                    ino = excluded.ino,
+                    checked_ns = excluded.checked_ns,
+                    cached_at = excluded.cached_at
+                """,
+                self._path_row(key, entry),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"キャッシュの保存に失敗しました: {e}")
+
+    def put_many(self, entries: dict[str, dict[str, Any]], results: dict[str, Any]) -> None:
+        """
+        解析結果とパスエントリを1つのトランザクションでまとめて追加
+
+        Args:
+            entries: パスエントリ（キー → エントリ）
+            results: 解析結果（キー → 解析結果、既存の解析結果は上書きしない）
+        """
+        if not entries and not results:
+            return
+        now = int(time.time())
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?)",
+                (
+                    (key, encoded, _encoded_size(encoded), now)
+                    for key, encoded in (
+                        (key, _encode_result(result)) for key, result in results.items()
+                    )
+                ),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO paths VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._path_row(key, entry) for key, entry in entries.items()),
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"キャッシュの保存に失敗しました: {e}")
+
+    def delete(self, key: str) -> bool:
+        """パスエントリを削除（削除した場合はTrue）"""
+        try:
+            cursor = self._conn().execute("DELETE FROM paths WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"キャッシュの削除に失敗しました: {e}")
+            return False
+        return cursor.rowcount > 0
+
+    def delete_path(self, path: str) -> int:
+        """指定パスのすべてのパーサー種別のパスエントリを削除（削除した件数を返す）"""
+        try:
+            cursor = self._conn().execute("DELETE FROM paths WHERE path = ?", (path,))
+        except sqlite3.Error as e:
+            logger.warning(f"キャッシュの削除に失敗しました: {e}")
+            return 0
+        return cursor.rowcount
+
+    def keys(self) -> list[str]:
+        """すべてのパスエントリのキーを取得"""
+        return [row[0] for row in self._conn().execute("SELECT key FROM paths")]
+
+    def items(self) -> list[tuple[str, dict[str, Any]]]:
+        """すべてのパスエントリを取得"""
+        rows = self._conn().execute(f"SELECT key, {', '.join(_PATH_FIELDS)} FROM paths")
+        return [(row[0], dict(zip(_PATH_FIELDS, row[1:], strict=True))) for row in rows]
+
+    def count(self) -> int:
+        """パスエントリ数を取得"""
+        return self._conn().execute("SELECT COUNT(*) FROM paths").fetchone()[0]
+
+    def delete_paths_except(self, live_paths: Collection[str]) -> int:
+        """指定したパス以外のパスエントリを削除（削除した件数を返す）"""
+        conn = self._conn()
+        stale = [
+            (key,)
+            for key, path in conn.execute("SELECT key, path FROM paths")
+            if path not in live_paths
+        ]
+        self._delete_many(conn, "DELETE FROM paths WHERE key = ?", stale)
+        return len(stale)
+
+    def get_result(self, key: str) -> Any | None:
+        """解析結果を取得（存在しない場合はNone）"""
+        try:
+            row = (
+                self._conn()
+                .execute("SELECT result, used_at FROM results WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"キャッシュの読み込みに失敗しました: {e}")
+            return None
+        if row is None:
+            return None
+        if (row[1] or 0) < time.time() - _TOUCH_INTERVAL:
+            with self._lock:
+                self._touched.add(key)
+        return _decode_result(row[0])
+
+    def put_result(self, key: str, result: Any) -> None:
+        """解析結果を追加（同じ内容の解析結果は同じため、既存の場合は何もしない）"""
+        encoded = _encode_result(result)
+        try:
+            self._conn().execute(
+                "INSERT OR IGNORE INTO results VALUES (?, ?, ?, ?)",
+                (key, encoded, _encoded_size(encoded), int(time.time())),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"キャッシュの保存に失敗しました: {e}")
+
+    def count_results(self) -> int:
+        """解析結果の件数を取得"""
+        return self._conn().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def result_items(self) -> list[tuple[str, Any]]:
+        """すべての解析結果を取得"""
+        rows = self._conn().execute("SELECT key, result FROM results")
+        return [(key, _decode_result(result)) for key, result in rows]
+
+    def result_stats(self) -> dict[str, int]:
+        """解析結果の件数・合計サイズ・解析に失敗したファイルの件数を取得"""
+        # 解析結果はレコード形式のBLOBまたはJSONのリスト、解析に失敗したファイルは
+        # `{"error": ...}`のJSONとして保存している
+        count, total_bytes, errors = (
+            self._conn()
+            .execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(typeof(result) = 'text' AND substr(result, 1, 1) = '{'), 0) "
+                "FROM results"
+            )
+            .fetchone()
+        )
+        return {"results": count, "result_bytes": total_bytes, "error_results": errors}
+
+    def delete_results_except(self, referenced: Collection[str]) -> int:
+        """指定したキー以外の解析結果を削除（削除した件数を返す）"""
+        conn = self._conn()
+        stale = [
+            (row[0],) for row in conn.execute("SELECT key FROM results") if row[0] not in referenced
+        ]
+        self._delete_many(conn, "DELETE FROM results WHERE key = ?", stale)
+        return len(stale)
+
+    def evict_results(self, max_entries: int = 0, max_bytes: int = 0) -> int:
+        """
+        上限を超えた解析結果を最終使用日時の古い順に削除
+
+        Args:
+            max_entries: 件数の上限（0の場合は無制限）
+            max_bytes: 合計サイズの上限（0の場合は無制限）
+
+        Returns:
+            削除した件数
+        """
+        conn = self._conn()
+        count, total_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        if not _exceeds(count, total_bytes, max_entries, max_bytes):
+            return 0
+        cursor = conn.execute("SELECT key, size FROM results ORDER BY used_at")
+        evicted = _select_evictions(cursor, count, total_bytes, max_entries, max_bytes)
+        cursor.close()
+        self._delete_many(conn, "DELETE FROM results WHERE key = ?", [(key,) for key in evicted])
+        return len(evicted)
+
+    @staticmethod
+    def _delete_many(conn: sqlite3.Connection, sql: str, rows: list[tuple[str]]) -> None:
+        """複数の行を1つのトランザクションで削除"""
+        if not rows:
+            return
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(sql, rows)
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        """すべてのエントリを削除"""
+        conn = self._conn()
+        conn.execute("DELETE FROM paths")
+        conn.execute("DELETE FROM results")
+        with self._lock:
+            self._touched.clear()
+
+    def flush(self) -> None:
+        """使用した解析結果の最終使用日時を更新し、WALをデータベースファイルに反映
+        （その他の書き込みはエントリごとにコミット済み）"""
+        with self._lock:
+            touched, self._touched = self._touched, set()
+        conn = self._conn()
+        try:
+            if touched:
+                now = int(time.time())
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "UPDATE results SET used_at = ? WHERE key = ?", ((now, key) for key in touched)
+                )
+                conn.execute("COMMIT")
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"キャッシュの保存に失敗しました: {e}")
+
+    def close(self) -> None:
+        """すべてのスレッドの接続を閉じる"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+CacheStore = JsonCacheStore | SqliteCacheStore
+
+
+def dump_portable(store: CacheStore, export_result: Callable[[Any], Any | None]) -> dict[str, Any]:
+    """
+    パスに依存しない形式でキャッシュのエントリを出力（`cache export`で使用）
+
+    パスのエントリはプロジェクトルートからの相対パスのもののみ、内容のハッシュと
+    パーサーのバージョンのみを出力します（statの値は環境ごとに異なるため含めない。
+    取り込み先では初回に内容のハッシュで検証される）。
+
+    Args:
+        store: キャッシュストア
+        export_result: 解析結果をJSONに変換できる値に変換する関数（Noneの場合は出力しない）
+
+    Returns:
+        JSONに変換できる辞書（`load_portable`で取り込む）
+    """
+    paths = {
+        key: {"hash": entry["hash"], "version": entry.get("version") or ""}
+        for key, entry in store.items()
+        if entry.get("hash") and not os.path.isabs(key_path(key))
+    }
+    results = {}
+    for key, result in store.result_items():
+        value = export_result(result)
+        if value is not None:
+            results[key] = value
+    return {"version": _SCHEMA_VERSION, "paths": paths, "results": results}
+
+
+def load_portable(
+    store: CacheStore, data: dict[str, Any], import_result: Callable[[Any], Any | None]
+) -> dict[str, int]:
+    """
+    `dump_portable`で出力したエントリを取り込む
+
+    既存のパスのエントリ（statで検証できる）と解析結果は上書きしません。
+
+    Args:
+        store: キャッシュストア
+        data: `dump_portable`で出力した辞書
+        import_result: 値を検証して解析結果に変換する関数（Noneの場合は取り込まない）
+
+    Returns:
+        取り込んだ件数（`paths`: パスのエントリ、`results`: 解析結果（既存のものを含む））
+
+    Raises:
+        ValueError: キャッシュの形式が異なる場合
+    """
+    if data.get("version") != _SCHEMA_VERSION:
+        raise ValueError(
+            f"キャッシュの形式が異なります: {data.get('version')}（現在: {_SCHEMA_VERSION}）"
+        )
+    paths = {key: entry for key, entry in data.get("paths", {}).items() if store.get(key) is None}
+    results = {}
+    for key, value in data.get("results", {}).items():
+        result = import_result(value)
+        if result is not None:
+            results[key] = result
+    store.put_many(paths, results)
+    return {"paths": len(paths), "results": len(results)}
+
+
+def open_cache_store(cache_dir: Path, backend: str = "json") -> CacheStore:
+    """
+    キャッシュストアを開く
+
+    Args:
+        cache_dir: キャッシュディレクトリ
+        backend: "json" または "sqlite"（`cache.backend`）
+
+    Returns:
+        キャッシュストア（"sqlite"で既存のJSONキャッシュがある場合は移行する）
+
+    Raises:
+        ValueError: 不明なバックエンドが指定された場合
+        sqlite3.Error: SQLiteのデータベースを開けない場合
+    """
+    if backend == "sqlite":
+        return SqliteCacheStore(
+            cache_dir / SQLITE_CACHE_FILE, migrate_from=cache_dir / JSON_CACHE_FILE
+        )
+    if backend == "json":
+        return JsonCacheStore(cache_dir / JSON_CACHE_FILE)
+    raise ValueError(f"不明なキャッシュバックエンドです: {backend}（json, sqlite）")
@@ -0,0 +1,142 @@
+"""変更ファイル集合モジュール
+
+`--since <rev>`・`--staged`による差分実行で使用する変更ファイルの集合を
+`git diff`から取得し、変更内容から再生成が必要なドキュメントの種類を選択します。
+`watch`サブコマンドも同じ選択ロジックを使用します。
+"""
+
+from fnmatch import fnmatch
+from pathlib import Path
+import time
+from typing import NamedTuple
+
+from ..detectors.detector_patterns import DetectorPatterns
+from ..hooks.utils import GitCommandError, get_changed_file_statuses, get_untracked_files
+from .file_watcher import FileChange
+from .fs_walker import file_extension
+
+# ソースコードの変更で再生成するドキュメント
+_SOURCE_TARGETS = frozenset({"api", "rag"})
+# パッケージ定義ファイルの変更で再生成するドキュメント
+_MANIFEST_TARGETS = frozenset({"readme", "agents", "contributing"})
+
+
+class ChangeSetError(Exception):
+    """変更ファイルを取得できない場合の例外"""
+
+
+class ChangeSet(NamedTuple):
+    """差分実行の対象となる変更ファイル（プロジェクトルートからの`/`区切りの相対パス）"""
+
+    created: frozenset[str]
+    modified: frozenset[str]
+    deleted: frozenset[str]
+
+    @property
+    def existing(self) -> frozenset[str]:
+        """作成・変更されたファイル（再解析・再チャンク化の対象）"""
+        return self.created | self.modified
+
+    @property
+    def paths(self) -> frozenset[str]:
+        """すべての変更ファイル（削除を含む）"""
+        return self.created | self.modified | self.deleted
+
+    def is_empty(self) -> bool:
+        """変更がないかどうか"""
+        return not (self.created or self.modified or self.deleted)
+
+    def to_file_changes(self) -> list[FileChange]:
+        """`select_targets`に渡す変更のリストに変換"""
+        timestamp = time.monotonic()
+        return [
+            FileChange(path, kind, False, timestamp)
+            for kind, paths in (
+                ("created", self.created),
+                ("modified", self.modified),
+                ("deleted", self.deleted),
+            )
+            for path in sorted(paths)
+        ]
+
+
+def load_change_set(
+    project_root: Path, since: str | None = None, staged: bool = False
+) -> ChangeSet:
+    """
+    gitの差分から変更ファイルの集合を取得
+
+    - `staged`のみ: ステージされた変更（`git diff --cached`）
+    - `since`のみ: 指定リビジョンからワークツリーまでの変更と未追跡ファイル
+    - 両方: 指定リビジョンからステージされた状態までの変更
+
+    リネームは削除と作成として扱います。パスはプロジェクトルートからの相対パスで、
+    プロジェクトルート外の変更は含みません。
+
+    Args:
+        project_root: プロジェクトルートディレクトリ
+        since: 比較するリビジョン（例: "HEAD~1"、"origin/main"）
+        staged: ステージされた変更を対象にするかどうか
+
+    Returns:
+        変更ファイルの集合
+
+    Raises:
+        ChangeSetError: gitリポジトリでない、またはリビジョンが不正な場合
+    """
+    try:
+        statuses = get_changed_file_statuses(staged=staged, since=since, cwd=project_root)
+        # ワークツリーと比較する場合は未追跡ファイルも新規作成として扱う
+        untracked = get_untracked_files(project_root) if since and not staged else []
+    except GitCommandError as e:
+        raise ChangeSetError(str(e)) from e
+
+    created: set[str] = set(untracked)
+    modified: set[str] = set()
+    deleted: set[str] = set()
+    for status, path in statuses:
+        if status == "A":
+            created.add(path)
+        elif status == "D":
+            deleted.add(path)
+        else:
+            # M（変更）、T（種別変更）、U（未マージ）
+            modified.add(path)
+
+    return ChangeSet(frozenset(created), frozenset(modified), frozenset(deleted))
+
+
+def select_targets(changes: list[FileChange]) -> set[str] | None:
+    """
+    変更内容から再生成するドキュメントの種類を選択
+
+    - ファイル・ディレクトリの作成や削除: 言語検出や構造が変わるためすべて再生成
+    - ソースコードの変更: APIドキュメントとRAGインデックス
+    - パッケージ定義ファイル（pyproject.toml、package.jsonなど）の変更: README・AGENTS.md・CONTRIBUTING.md
+    - その他のファイルの変更: RAGインデックス（ドキュメントもチャンク化の対象になるため）
+
+    Args:
+        changes: まとめた変更のリスト
+
+    Returns:
+        ジェネレーターの種類のセット（Noneの場合はすべて）
+    """
+    source_extensions = {
+        ext.lower() for exts in DetectorPatterns.SOURCE_EXTENSIONS.values() for ext in exts
+    }
+    manifest_patterns = {
+        name for names in DetectorPatterns.PACKAGE_FILES.values() for name in names
+    }
+
+    targets: set[str] = set()
+    for change in changes:
+        if change.kind != "modified" or change.is_dir:
+            return None
+        name = change.rel_path.rpartition("/")[2]
+        if any(fnmatch(name, pattern) for pattern in manifest_patterns):
+            targets |= _MANIFEST_TARGETS
+        elif file_extension(name) in source_extensions:
+            targets |= _SOURCE_TARGETS
+        else:
+            targets.add("rag")
+    return targets
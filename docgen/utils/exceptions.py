@@ -97,6 +97,14 @@ class ParseError(DocGenError):
         )
 
 
+class ParseTimeoutError(ParseError):
+    """解析がファイルごとの時間の上限（`parse.file_timeout`）を超えたエラー"""
+
+    def __init__(self, message: str, timeout: float | None = None):
+        super().__init__(message)
+        self.timeout = timeout
+
+
 class CacheError(DocGenError):
     """キャッシュ関連のエラー"""
 
@@ -0,0 +1,333 @@
+"""ファイル分類モジュール
+
+走査済みファイルのサイズと種類（テキスト・バイナリ・minify済み）を判定します。
+サイズはファイルごとに一度だけstatし、種類は先頭の数KBのみを読み込んで判定します。
+結果はプロジェクトルートごとにメモ化され、パーサー・RAGチャンク化・キャッシュで共有されます。
+サイズ上限（`parse.max_file_bytes`・`rag.max_file_bytes`）を超えるファイルは
+本文を読み込む前にスキップ（または切り詰め）し、スキップしたファイルを記録します。
+解析が時間の上限（`parse.file_timeout`）を超えたファイルも記録し、実行の最後に報告します。
+"""
+
+from collections import Counter
+import os
+from pathlib import Path
+import threading
+from typing import NamedTuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# ファイルの種類
+TEXT = "text"
+BINARY = "binary"
+MINIFIED = "minified"
+# スキップの理由（種類に加えてサイズ超過）
+TOO_LARGE = "too_large"
+
+# 種類の判定に読み込む先頭のバイト数
+SNIFF_BYTES = 8192
+# この長さを超える行を含むファイルはminify済み（または生成されたデータ）とみなす
+_MINIFIED_LINE_LENGTH = 1000
+_MINIFIED_SUFFIXES = (".min.js", ".min.mjs", ".min.css")
+
+# サイズ上限のデフォルト値（`parse.max_file_bytes`・`rag.max_file_bytes`、0の場合は無制限）
+DEFAULT_MAX_FILE_BYTES = 1024 * 1024
+
+
+class SkippedFile(NamedTuple):
+    """サイズ・種類によりスキップしたファイル"""
+
+    rel_path: str
+    subsystem: str  # "parse" または "rag"
+    reason: str  # TOO_LARGE, BINARY, MINIFIED
+    size: int
+
+
+class SlowFile(NamedTuple):
+    """解析が時間の上限を超えたファイル"""
+
+    rel_path: str
+    parser_type: str
+    elapsed: float  # 解析時間（秒、キャッシュを再利用した場合は前回の解析時間）
+    outline: bool  # アウトラインのみを抽出したかどうか
+    cached: bool  # 前回のアウトラインをキャッシュから再利用したかどうか
+
+
+def sniff_kind(sample: bytes, name: str = "") -> str:
+    """
+    ファイル先頭のバイト列から種類を判定
+
+    Args:
+        sample: ファイル先頭のバイト列
+        name: ファイル名（`.min.js`などの拡張子の判定に使用）
+
+    Returns:
+        TEXT, BINARY, MINIFIED のいずれか
+    """
+    if b"\0" in sample:
+        return BINARY
+    try:
+        sample.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # 読み込み範囲の末尾でマルチバイト文字が切れた場合はテキストとして扱う
+        if e.start < len(sample) - 3:
+            return BINARY
+    if name.lower().endswith(_MINIFIED_SUFFIXES):
+        return MINIFIED
+    longest_line = max((len(line) for line in sample.split(b"\n")), default=0)
+    if longest_line > _MINIFIED_LINE_LENGTH:
+        return MINIFIED
+    return TEXT
+
+
+class FileClassifier:
+    """ファイルのサイズと種類をメモ化して判定するクラス
+
+    複数のスレッド（パーサーの並列解析など）から同時に呼び出せます。
+    """
+
+    def __init__(self, project_root: Path):
+        """
+        初期化
+
+        Args:
+            project_root: プロジェクトルートディレクトリ
+        """
+        self.project_root = Path(project_root)
+        self._sizes: dict[str, int | None] = {}
+        self._kinds: dict[str, str] = {}
+        self._skipped: dict[tuple[str, str], SkippedFile] = {}
+        self._slow: dict[tuple[str, str], SlowFile] = {}
+        self._lock = threading.Lock()
+
+    def size(self, rel_path: str) -> int | None:
+        """
+        ファイルサイズを取得（一度だけstatする）
+
+        Args:
+            rel_path: プロジェクトルートからの相対パス（`/`区切り）
+
+        Returns:
+            バイト数（statに失敗した場合はNone）
+        """
+        if rel_path in self._sizes:
+            return self._sizes[rel_path]
+        try:
+            size: int | None = os.stat(self.project_root / rel_path).st_size
+        except OSError:
+            size = None
+        self._sizes[rel_path] = size
+        return size
+
+    def kind(self, rel_path: str) -> str:
+        """
+        ファイルの種類を取得（先頭の`SNIFF_BYTES`バイトのみ読み込む）
+
+        Args:
+            rel_path: プロジェクトルートからの相対パス（`/`区切り）
+
+        Returns:
+            TEXT, BINARY, MINIFIED のいずれか（読み込めない場合はTEXTとして扱い、
+            本文の読み込み時のエラー処理に任せる）
+        """
+        kind = self._kinds.get(rel_path)
+        if kind is not None:
+            return kind
+        try:
+            with open(self.project_root / rel_path, "rb") as f:
+                sample = f.read(SNIFF_BYTES)
+            kind = sniff_kind(sample, rel_path.rpartition("/")[2])
+        except OSError:
+            kind = TEXT
+        self._kinds[rel_path] = kind
+        return kind
+
+    def check(
+        self,
+        rel_path: str,
+        subsystem: str,
+        max_bytes: int,
+        truncate: bool = False,
+        sniff: bool = True,
+    ) -> str | None:
+        """
+        ファイルを読み込む前にスキップすべきかどうかを判定
+
+        サイズ上限を超えるファイルは（`truncate`でない限り）本文も先頭も読み込まずにスキップし、
+        それ以外はバイナリ・minify済みのファイルをスキップします。スキップしたファイルは記録され、
+        `get_skipped`で取得できます。
+
+        Args:
+            rel_path: プロジェクトルートからの相対パス（`/`区切り）
+            subsystem: 判定を行うサブシステム名（"parse"、"rag"）
+            max_bytes: サイズ上限（0以下の場合は無制限）
+            truncate: サイズ上限を超えるファイルを切り詰めて読み込む場合はTrue
+            sniff: 先頭を読み込んで種類を判定するかどうか（Falseの場合はサイズのみ判定）
+
+        Returns:
+            スキップする理由（TOO_LARGE, BINARY, MINIFIED）、スキップしない場合はNone
+        """
+        size = self.size(rel_path)
+        if size is None:
+            return None
+        if 0 < max_bytes < size and not truncate:
+            reason = TOO_LARGE
+        elif not sniff:
+            return None
+        else:
+            kind = self.kind(rel_path)
+            if kind == TEXT:
+                return None
+            reason = kind
+
+        with self._lock:
+            self._skipped[(subsystem, rel_path)] = SkippedFile(rel_path, subsystem, reason, size)
+        logger.debug(f"[{subsystem}] {rel_path} をスキップしました（{reason}、{size} バイト）")
+        return reason
+
+    def get_skipped(self) -> list[SkippedFile]:
+        """
+        スキップしたファイルを取得
+
+        Returns:
+            SkippedFileのリスト（サブシステム・パス順）
+        """
+        with self._lock:
+            return sorted(self._skipped.values(), key=lambda s: (s.subsystem, s.rel_path))
+
+    def reset_skipped(self) -> None:
+        """スキップしたファイルの記録をクリア（実行ごとの集計用）"""
+        with self._lock:
+            self._skipped.clear()
+
+    def record_slow(
+        self,
+        rel_path: str,
+        parser_type: str,
+        elapsed: float,
+        outline: bool = False,
+        cached: bool = False,
+    ) -> None:
+        """
+        解析が時間の上限を超えたファイルを記録
+
+        Args:
+            rel_path: プロジェクトルートからの相対パス（`/`区切り）
+            parser_type: パーサーの種類
+            elapsed: 解析時間（秒）
+            outline: アウトラインのみを抽出したかどうか
+            cached: 前回のアウトラインをキャッシュから再利用したかどうか
+        """
+        with self._lock:
+            self._slow[(parser_type, rel_path)] = SlowFile(
+                rel_path, parser_type, elapsed, outline, cached
+            )
+
+    def get_slow(self) -> list[SlowFile]:
+        """
+        解析が時間の上限を超えたファイルを取得
+
+        Returns:
+            SlowFileのリスト（解析時間の長い順）
+        """
+        with self._lock:
+            return sorted(self._slow.values(), key=lambda s: (-s.elapsed, s.rel_path))
+
+    def reset_slow(self) -> None:
+        """解析が時間の上限を超えたファイルの記録をクリア（実行ごとの集計用）"""
+        with self._lock:
+            self._slow.clear()
+
+    def clear(self) -> None:
+        """メモ化した判定結果と記録をクリア（ファイルが変更された場合）"""
+        with self._lock:
+            self._sizes.clear()
+            self._kinds.clear()
+            self._skipped.clear()
+            self._slow.clear()
+
+
+def read_text_limited(file_path: Path, max_bytes: int) -> tuple[str, bool]:
+    """
+    サイズ上限までテキストファイルを読み込む
+
+    上限を超える場合は上限以内の最後の改行で切り詰めます（改行はUTF-8の
+    マルチバイト文字の途中に現れないため、文字の途中で切れることはありません）。
+
+    Args:
+        file_path: ファイルパス
+        max_bytes: サイズ上限（0以下の場合は無制限）
+
+    Returns:
+        (テキスト, 切り詰めたかどうか)
+
+    Raises:
+        OSError: ファイルを読み込めない場合
+        UnicodeDecodeError: UTF-8としてデコードできない場合
+    """
+    with open(file_path, "rb") as f:
+        data = f.read(max_bytes + 1) if max_bytes > 0 else f.read()
+    truncated = 0 < max_bytes < len(data)
+    if truncated:
+        data = data[: data.rfind(b"\n", 0, max_bytes) + 1]
+    return data.decode("utf-8"), truncated
+
+
+def summarize_skipped(skipped: list[SkippedFile], limit: int = 5) -> list[str]:
+    """
+    スキップしたファイルの概要を行のリストとして作成
+
+    Args:
+        skipped: スキップしたファイルのリスト
+        limit: サブシステムごとに表示するファイル数の上限
+
+    Returns:
+        ログ出力用の行のリスト（スキップしたファイルがない場合は空）
+    """
+    lines = []
+    by_subsystem: dict[str, list[SkippedFile]] = {}
+    for entry in skipped:
+        by_subsystem.setdefault(entry.subsystem, []).append(entry)
+
+    for subsystem, entries in by_subsystem.items():
+        reasons = Counter(entry.reason for entry in entries)
+        reason_label = ", ".join(f"{reason}: {count}" for reason, count in sorted(reasons.items()))
+        lines.append(
+            f"[{subsystem}] {len(entries)} 件のファイルをスキップしました（{reason_label}）"
+        )
+        largest = sorted(entries, key=lambda entry: entry.size, reverse=True)[:limit]
+        for entry in largest:
+            lines.append(f"  - {entry.rel_path} ({entry.reason}, {entry.size:,} bytes)")
+        if len(entries) > limit:
+            lines.append(f"  ... 他 {len(entries) - limit} 件")
+    return lines
+
+
+def summarize_slow(slow: list[SlowFile], limit: int = 5) -> list[str]:
+    """
+    解析が時間の上限を超えたファイル（slow files）の概要を行のリストとして作成
+
+    Args:
+        slow: 解析が時間の上限を超えたファイルのリスト（解析時間の長い順）
+        limit: 表示するファイル数の上限
+
+    Returns:
+        ログ出力用の行のリスト（該当するファイルがない場合は空）
+    """
+    if not slow:
+        return []
+    outlines = sum(1 for entry in slow if entry.outline)
+    cached = sum(1 for entry in slow if entry.cached)
+    lines = [
+        f"[parse] {len(slow)} 件のファイルの解析が時間の上限を超えました"
+        f"（アウトラインのみ: {outlines}、うち前回の記録を再利用: {cached}）"
+    ]
+    for entry in slow[:limit]:
+        labels = [entry.parser_type, f"{entry.elapsed:.1f}s"]
+        if entry.outline:
+            labels.append("cached outline" if entry.cached else "outline")
+        lines.append(f"  - {entry.rel_path} ({', '.join(labels)})")
+    if len(slow) > limit:
+        lines.append(f"  ... 他 {len(slow) - limit} 件")
+    return lines
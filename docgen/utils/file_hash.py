@@ -0,0 +1,84 @@
+"""
+ファイル内容のハッシュ計算モジュール
+
+パーサーキャッシュで使用する内容のハッシュを計算します。
+`cache.hash_algorithm`でアルゴリズムを選択でき、"auto"の場合は
+xxhash（インストールされている場合）、なければblake2bを使用します。
+ハッシュ値にはアルゴリズム名を前置するため、アルゴリズムを変更しても
+異なるアルゴリズムのハッシュが一致することはありません。
+"""
+
+from collections.abc import Callable
+import hashlib
+from pathlib import Path
+from typing import Any
+
+from .logger import get_logger
+
+logger = get_logger("cache")
+
+HASH_ALGORITHMS = ("auto", "xxhash", "blake2b", "sha256")
+
+# 一度に読み込むバイト数
+_READ_CHUNK = 1024 * 1024
+
+
+def _xxhash_factory() -> Callable[[], Any] | None:
+    """xxhashがインストールされていればXXH3（128ビット）のコンストラクタを返す"""
+    try:
+        import xxhash
+    except ImportError:
+        return None
+    return xxhash.xxh3_128
+
+
+_FACTORIES: dict[str, Callable[[], Any]] = {
+    "blake2b": lambda: hashlib.blake2b(digest_size=20),
+    "sha256": hashlib.sha256,
+}
+
+
+def resolve_hash_algorithm(name: str = "auto") -> str:
+    """
+    使用するハッシュアルゴリズムを決定
+
+    Args:
+        name: `cache.hash_algorithm`の値（"auto", "xxhash", "blake2b", "sha256"）
+
+    Returns:
+        実際に使用するアルゴリズム名（xxhashがインストールされていない場合はblake2b）
+    """
+    if name in ("auto", "xxhash"):
+        if _xxhash_factory() is not None:
+            return "xxhash"
+        if name == "xxhash":
+            logger.warning("xxhashがインストールされていないため、blake2bを使用します")
+        return "blake2b"
+    if name not in _FACTORIES:
+        logger.warning(f"不明なハッシュアルゴリズムです: {name}。blake2bを使用します")
+        return "blake2b"
+    return name
+
+
+def hash_file(file_path: Path, algorithm: str) -> str:
+    """
+    ファイル内容のハッシュを計算
+
+    Args:
+        file_path: ファイルパス
+        algorithm: `resolve_hash_algorithm`で決定したアルゴリズム名
+
+    Returns:
+        `アルゴリズム名:16進数`形式のハッシュ
+
+    Raises:
+        OSError: ファイルを読み込めない場合
+    """
+    factory = _xxhash_factory() if algorithm == "xxhash" else _FACTORIES[algorithm]
+    assert factory is not None
+    file_hash = factory()
+    with open(file_path, "rb") as f:
+        # 大きなファイルでも効率的に処理するため、チャンク単位で読み込む
+        while chunk := f.read(_READ_CHUNK):
+            file_hash.update(chunk)
+    return f"{algorithm}:{file_hash.hexdigest()}"
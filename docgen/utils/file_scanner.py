@@ -4,12 +4,17 @@
 複数のモジュールで同じプロジェクトルートを走査することを防ぎます。
 """
 
-import os
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
+from .file_classifier import FileClassifier
+from .fs_walker import file_extension, prefetch_listings, scandir_listing, walk_files
+from .git_index import GitIndexEntry, find_git_dir, load_tracked_files
 from .gitignore_parser import GitIgnoreMatcher
 from .logger import get_logger
+from .scan_snapshot import ScanSnapshot
 
 logger = get_logger(__name__)
 
@@ -23,6 +28,12 @@ class UnifiedFileScanner:
         exclude_dirs: set[str] | None = None,
         exclude_files: set[str] | None = None,
         gitignore_matcher: GitIgnoreMatcher | None = None,
+        snapshot: bool = False,
+        snapshot_path: Path | None = None,
+        fingerprint: str | None = None,
+        backend: str = "walk",
+        include_untracked: bool = True,
+        workers: int = 1,
     ):
         """
         初期化
@@ -32,15 +43,37 @@ class UnifiedFileScanner:
             exclude_dirs: 除外するディレクトリ名のセット
             exclude_files: 除外するファイル名のセット
             gitignore_matcher: .gitignoreマッチャー（Noneの場合は.gitignoreを読み込まない）
+            snapshot: 永続化スナップショットを使用するかどうか（`scan.snapshot`）
+            snapshot_path: スナップショットファイルのパス（Noneの場合は`docgen/.cache/`配下）
+            fingerprint: 走査設定のフィンガープリント（`compute_scan_fingerprint`の戻り値）
+            backend: ファイル列挙のバックエンド（`scan.backend`、"walk" または "git_index"）
+            include_untracked: git_index使用時に未追跡ファイルも含めるかどうか（`scan.untracked`）
+            workers: ディレクトリを並列に列挙するスレッド数（`scan.workers`、1の場合は逐次走査）
         """
         self.project_root = Path(project_root).resolve()
         self.exclude_dirs = exclude_dirs or set()
         self.exclude_files = exclude_files or set()
         self.gitignore_matcher = gitignore_matcher
+        self.snapshot = snapshot
+        self.fingerprint = fingerprint
+        self.backend = backend
+        self.include_untracked = include_untracked
+        self.workers = max(1, workers)
+        self._snapshot: ScanSnapshot | None = (
+            ScanSnapshot(self.project_root, snapshot_path) if snapshot else None
+        )
         self._scanned = False
         self._files_by_extension: dict[str, list[Path]] = {}
         self._all_files: list[Path] = []
         self._files_by_relative_path: dict[Path, Path] = {}  # 相対パス -> 絶対パス
+        self._pairs_by_extension: dict[str, list[tuple[Path, Path]]] = {}
+        # 相対パス -> (サブディレクトリ名のリスト, ファイル名のリスト)（除外済みのエントリのみ）
+        self._directories: dict[str, tuple[list[str], list[str]]] = {}
+        # git_indexバックエンドの追跡ファイル（相対パス -> エントリ）と、それらを含むディレクトリ
+        self._tracked_files: dict[str, GitIndexEntry] | None = None
+        self._tracked_dirs: set[str] = set()
+        # 走査したファイルのサイズ・種類（初回アクセス時に判定してメモ化）
+        self.classifier = FileClassifier(self.project_root)
 
     def scan_once(self) -> dict[str, Any]:
         """
@@ -51,113 +84,186 @@ class UnifiedFileScanner:
             - 'files_by_extension': 拡張子ごとのファイルリスト
             - 'all_files': すべてのファイルのリスト
             - 'files_by_relative_path': 相対パス -> 絶対パスのマッピング
+            - 'snapshot_stats': スナップショットのヒット/ミス数（スナップショットモード時のみ）
+            - 'backend': 実際に使用したバックエンド（"walk" または "git_index"）
         """
         if self._scanned:
-            return {
-                "files_by_extension": self._files_by_extension,
-                "all_files": self._all_files,
-                "files_by_relative_path": self._files_by_relative_path,
-            }
+            return self._build_result()
 
         logger.debug(f"Scanning project: {self.project_root}")
 
+        prune_dir = self._should_prune_dir
+        skip_file = self._should_skip_file
+        if self.backend == "git_index" and self._load_tracked_files():
+            prune_dir = self._should_prune_dir_indexed
+            skip_file = self._should_skip_file_indexed
+
+        # スナップショットモードではmtimeが変化したディレクトリのみ再列挙する
+        base_lister = scandir_listing
+        if self._snapshot is not None:
+            self._snapshot.reset_stats()
+            base_lister = self._snapshot.list_directory
+
+        files_by_extension = self._files_by_extension
+        pairs_by_extension = self._pairs_by_extension
+        all_files = self._all_files
+        files_by_relative_path = self._files_by_relative_path
+        directories = self._directories
+
+        def list_dir(dir_path: str, rel_dir: str) -> tuple[list[str], list[str]]:
+            # 訪問した（枝刈りされなかった）ディレクトリを親のエントリとして記録する
+            listing = base_lister(dir_path, rel_dir)
+            directories[rel_dir] = ([], [])
+            if rel_dir:
+                parent, _, name = rel_dir.rpartition("/")
+                directories[parent][0].append(name)
+            return listing
+
         try:
-            for root, dirs, files in os.walk(self.project_root, followlinks=False):
-                root_path = Path(root)
-
-                # 除外ディレクトリを早期にスキップ（dirsをin-placeで変更）
-                dirs_to_remove = []
-                for d in dirs:
-                    dir_path = root_path / d
-                    # 既存の除外チェック
-                    if d in self.exclude_dirs or d.startswith(".") or d.endswith(".egg-info"):
-                        dirs_to_remove.append(d)
-                        continue
-                    # .gitignoreチェック
-                    if self.gitignore_matcher and self.gitignore_matcher.should_exclude_dir(
-                        dir_path
-                    ):
-                        dirs_to_remove.append(d)
-                        continue
-
-                for d in dirs_to_remove:
-                    dirs.remove(d)
-
-                # パスベースの除外チェック
-                try:
-                    rel_path = root_path.relative_to(self.project_root)
-                    if any(excluded in rel_path.parts for excluded in self.exclude_dirs):
-                        dirs[:] = []  # このディレクトリ以下をスキップ
-                        continue
-                    if any(part.endswith(".egg-info") for part in rel_path.parts):
-                        dirs[:] = []  # egg-infoディレクトリ以下をスキップ
-                        continue
-                    # .gitignoreチェック（ディレクトリ全体）
-                    if self.gitignore_matcher and self.gitignore_matcher.should_exclude_dir(
-                        root_path
-                    ):
-                        dirs[:] = []  # このディレクトリ以下をスキップ
-                        continue
-                except ValueError:
-                    # プロジェクトルート外の場合はスキップ
-                    continue
-
-                # ファイルをチェック
-                for file_name in files:
-                    # 除外ファイル名のチェック
-                    if file_name in self.exclude_files:
-                        continue
-
-                    file_path = root_path / file_name
-
-                    try:
-                        # パスの正規化（シンボリックリンクを解決）
-                        file_path_resolved = file_path.resolve()
-
-                        # プロジェクトルート外へのアクセスを防止
-                        try:
-                            file_path_relative = file_path_resolved.relative_to(self.project_root)
-                        except ValueError:
-                            # プロジェクトルート外のファイルはスキップ
-                            continue
-
-                        # .gitignoreチェック
-                        if self.gitignore_matcher and self.gitignore_matcher.is_ignored(
-                            file_path_resolved
-                        ):
-                            continue
-
-                        # シンボリックリンクのチェック（オプション: シンボリックリンクをスキップする場合）
-                        if file_path.is_symlink():
-                            continue
-
-                        # 拡張子で分類
-                        ext = file_path.suffix.lower()
-                        if ext not in self._files_by_extension:
-                            self._files_by_extension[ext] = []
-                        self._files_by_extension[ext].append(file_path_resolved)
-                        self._all_files.append(file_path_resolved)
-                        self._files_by_relative_path[file_path_relative] = file_path_resolved
-
-                    except (OSError, PermissionError) as e:
-                        # ファイルアクセスエラー（権限エラーなど）は無視して続行
-                        logger.debug(f"{file_path} へのアクセスに失敗しました: {e}")
-                        continue
+            # 並列モードでは列挙だけを先行して行い、結果の組み立ては逐次走査と同じ順序で行う
+            if self.workers > 1:
+                base_lister = prefetch_listings(
+                    str(self.project_root), prune_dir, base_lister, self.workers
+                )
+
+            for walked in walk_files(
+                str(self.project_root),
+                prune_dir=prune_dir,
+                skip_file=skip_file,
+                list_dir=list_dir,
+            ):
+                # 拡張子で分類（パス文字列から直接取得してPath生成を最小限にする）
+                ext = file_extension(walked.name)
+                file_path = Path(walked.abs_path)
+                rel_path = Path(walked.rel_path)
+
+                if ext not in files_by_extension:
+                    files_by_extension[ext] = []
+                    pairs_by_extension[ext] = []
+                files_by_extension[ext].append(file_path)
+                pairs_by_extension[ext].append((file_path, rel_path))
+                all_files.append(file_path)
+                files_by_relative_path[rel_path] = file_path
+                directories[walked.rel_path[: -len(walked.name) - 1]][1].append(walked.name)
 
         except (OSError, PermissionError) as e:
             logger.warning(f"プロジェクトの走査中にエラーが発生しました: {e}")
 
         self._scanned = True
 
+        if self._snapshot is not None:
+            self._snapshot.save()
+            stats = self._snapshot.get_stats()
+            logger.debug(f"Snapshot: {stats['hits']} hits, {stats['misses']} misses")
+
         logger.debug(
             f"Scanned {len(self._all_files)} files, {len(self._files_by_extension)} extensions"
         )
 
-        return {
+        return self._build_result()
+
+    def _build_result(self) -> dict[str, Any]:
+        """走査結果の辞書を組み立てる"""
+        result: dict[str, Any] = {
             "files_by_extension": self._files_by_extension,
             "all_files": self._all_files,
             "files_by_relative_path": self._files_by_relative_path,
         }
+        if self._snapshot is not None:
+            result["snapshot_stats"] = self._snapshot.get_stats()
+        result["backend"] = "git_index" if self._tracked_files is not None else "walk"
+        return result
+
+    def _load_tracked_files(self) -> bool:
+        """
+        gitインデックスから追跡ファイルを読み込む
+
+        Returns:
+            読み込めた場合はTrue（gitリポジトリでない場合などはFalseで、通常の走査を行う）
+        """
+        tracked = load_tracked_files(self.project_root)
+        if tracked is None:
+            logger.debug("gitインデックスを読み込めないため、ディレクトリ走査を使用します")
+            self._tracked_files = None
+            self._tracked_dirs = set()
+            return False
+
+        tracked_dirs = {""}
+        for rel_path in tracked:
+            parent = rel_path.rpartition("/")[0]
+            while parent not in tracked_dirs:
+                tracked_dirs.add(parent)
+                parent = parent.rpartition("/")[0]
+
+        self._tracked_files = tracked
+        self._tracked_dirs = tracked_dirs
+        logger.debug(f"git index: {len(tracked)} tracked files in {len(tracked_dirs)} directories")
+        return True
+
+    def _is_excluded_dir_name(self, name: str) -> bool:
+        """ディレクトリ名が常に除外される名前かどうかを判定"""
+        return name in self.exclude_dirs or name.startswith(".") or name.endswith(".egg-info")
+
+    def _should_prune_dir(self, rel_path: str, name: str) -> bool:
+        """サブディレクトリを走査対象から外すかどうかを判定"""
+        if self._is_excluded_dir_name(name):
+            return True
+        if self.gitignore_matcher and self.gitignore_matcher.should_exclude_dir_relative(rel_path):
+            return True
+        return False
+
+    def _should_prune_dir_indexed(self, rel_path: str, name: str) -> bool:
+        """git_indexバックエンドでサブディレクトリを走査対象から外すかどうかを判定
+
+        追跡ファイルを含むディレクトリには.gitignoreを評価しない（gitと同様に追跡が優先される）。
+        """
+        if rel_path in self._tracked_dirs:
+            return self._is_excluded_dir_name(name)
+        if not self.include_untracked:
+            return True
+        return self._should_prune_dir(rel_path, name)
+
+    def _should_skip_file_indexed(self, rel_path: str, name: str) -> bool:
+        """git_indexバックエンドでファイルを結果から除外するかどうかを判定"""
+        if rel_path in self._tracked_files:
+            return name in self.exclude_files
+        if not self.include_untracked:
+            return True
+        return self._should_skip_file(rel_path, name)
+
+    def _should_skip_file(self, rel_path: str, name: str) -> bool:
+        """ファイルを結果から除外するかどうかを判定"""
+        if name in self.exclude_files:
+            return True
+        if self.gitignore_matcher and self.gitignore_matcher.is_ignored_relative(rel_path):
+            return True
+        return False
+
+    def is_excluded_dir(self, rel_path: str, name: str) -> bool:
+        """
+        ディレクトリが走査対象外かどうかを判定（走査時と同じ除外設定・.gitignoreを適用）
+
+        Args:
+            rel_path: プロジェクトルートからの相対パス（`/`区切り）
+            name: ディレクトリ名
+
+        Returns:
+            走査対象外の場合True
+        """
+        return self._should_prune_dir(rel_path, name)
+
+    def is_excluded_file(self, rel_path: str, name: str) -> bool:
+        """
+        ファイルが走査対象外かどうかを判定（走査時と同じ除外設定・.gitignoreを適用）
+
+        Args:
+            rel_path: プロジェクトルートからの相対パス（`/`区切り）
+            name: ファイル名
+
+        Returns:
+            走査対象外の場合True
+        """
+        return self._should_skip_file(rel_path, name)
 
     def get_files_by_extensions(self, extensions: set[str] | list[str]) -> list[tuple[Path, Path]]:
         """
@@ -178,13 +284,7 @@ class UnifiedFileScanner:
         result = []
 
         for ext in extensions_set:
-            if ext in self._files_by_extension:
-                for file_path in self._files_by_extension[ext]:
-                    try:
-                        rel_path = file_path.relative_to(self.project_root)
-                        result.append((file_path, rel_path))
-                    except ValueError:
-                        continue
+            result.extend(self._pairs_by_extension.get(ext, ()))
 
         return result
 
@@ -198,15 +298,57 @@ class UnifiedFileScanner:
         if not self._scanned:
             self.scan_once()
 
-        result = []
-        for file_path in self._all_files:
-            try:
-                rel_path = file_path.relative_to(self.project_root)
-                result.append((file_path, rel_path))
-            except ValueError:
-                continue
+        return [
+            (file_path, rel_path) for rel_path, file_path in self._files_by_relative_path.items()
+        ]
 
-        return result
+    def get_directory_listing(self, rel_dir: str) -> tuple[list[str], list[str]]:
+        """
+        走査済みディレクトリの直下のエントリを取得
+
+        Args:
+            rel_dir: プロジェクトルートからの相対パス（`/`区切り、ルートは空文字）
+
+        Returns:
+            (サブディレクトリ名のリスト, ファイル名のリスト)
+            除外されたエントリは含まれず、走査対象外のディレクトリは空リストを返します。
+        """
+        if not self._scanned:
+            self.scan_once()
+
+        listing = self._directories.get(rel_dir)
+        if listing is None:
+            return [], []
+        return list(listing[0]), list(listing[1])
+
+    def get_directories(self) -> list[str]:
+        """
+        走査したディレクトリの相対パスを取得
+
+        Returns:
+            相対パス（`/`区切り、ルートは空文字）のリスト（走査順）
+        """
+        if not self._scanned:
+            self.scan_once()
+
+        return list(self._directories)
+
+    def get_index_entry(self, rel_path: str) -> GitIndexEntry | None:
+        """
+        追跡ファイルのインデックスエントリ（キャッシュ済みのstat情報）を取得
+
+        Args:
+            rel_path: プロジェクトルートからの相対パス（`/`区切り）
+
+        Returns:
+            GitIndexEntry、git_indexバックエンドを使用していないか未追跡の場合はNone
+        """
+        if not self._scanned:
+            self.scan_once()
+
+        if self._tracked_files is None:
+            return None
+        return self._tracked_files.get(rel_path)
 
     def clear_cache(self):
         """キャッシュをクリア（再スキャンが必要な場合）"""
@@ -214,32 +356,127 @@ class UnifiedFileScanner:
         self._files_by_extension.clear()
         self._all_files.clear()
         self._files_by_relative_path.clear()
+        self._pairs_by_extension.clear()
+        self._directories.clear()
+        self._tracked_files = None
+        self._tracked_dirs = set()
+        self.classifier.clear()
+
 
+def compute_scan_fingerprint(
+    project_root: Path,
+    exclude_dirs: set[str],
+    exclude_files: set[str],
+    use_gitignore: bool,
+    snapshot: bool,
+    backend: str = "walk",
+    include_untracked: bool = True,
+) -> str:
+    """
+    走査設定のフィンガープリントを計算
 
-# グローバルスキャナーインスタンス（プロジェクトルートごと）
-_scanner_cache: dict[Path, UnifiedFileScanner] = {}
+    除外設定・.gitignoreと.git/info/excludeの状態（mtimeとサイズ）・スナップショット設定・
+    バックエンド設定（git_indexの場合は.git/indexの状態を含む）から安定したハッシュを求めます。
+    `ScanSession.fingerprint`として、走査結果を識別するために使用します。
 
+    Args:
+        project_root: 正規化済みのプロジェクトルートディレクトリ
+        exclude_dirs: 除外するディレクトリ名のセット（デフォルトを含む実効値）
+        exclude_files: 除外するファイル名のセット
+        use_gitignore: .gitignoreを適用するかどうか
+        snapshot: 永続化スナップショットを使用するかどうか
+        backend: ファイル列挙のバックエンド
+        include_untracked: git_index使用時に未追跡ファイルも含めるかどうか
 
-def get_unified_scanner(
+    Returns:
+        SHA-256の16進文字列
+    """
+    # ルートの.gitignoreと.git/info/excludeの状態（サブディレクトリの.gitignoreは走査時に読み込む）
+    gitignore_state = []
+    if use_gitignore:
+        for ignore_file in (
+            project_root / ".gitignore",
+            project_root / ".git" / "info" / "exclude",
+        ):
+            try:
+                stat = ignore_file.stat()
+                gitignore_state.append([stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                gitignore_state.append(None)
+
+    index_state = None
+    if backend == "git_index":
+        located = find_git_dir(project_root)
+        if located is not None:
+            try:
+                stat = (located[1] / "index").stat()
+                index_state = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                pass
+
+    payload = {
+        "project_root": str(project_root),
+        "exclude_dirs": sorted(exclude_dirs),
+        "exclude_files": sorted(exclude_files),
+        "use_gitignore": use_gitignore,
+        "gitignore": gitignore_state,
+        "snapshot": snapshot,
+        "backend": backend,
+        "untracked": include_untracked,
+        "index": index_state,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def create_unified_scanner(
     project_root: Path,
     exclude_dirs: set[str] | None = None,
     exclude_files: set[str] | None = None,
     use_gitignore: bool = True,
+    snapshot: bool = False,
+    backend: str = "walk",
+    include_untracked: bool = True,
+    workers: int = 1,
 ) -> UnifiedFileScanner:
     """
-    統一ファイルスキャナーのインスタンスを取得（シングルトン的な動作）
+    統一ファイルスキャナーを作成
+
+    走査結果はスキャナーが保持するため、1回の実行の間は`ScanSession`が同じスキャナーを
+    共有します（プロセス全体ではキャッシュしません）。
 
     Args:
         project_root: プロジェクトルートディレクトリ
         exclude_dirs: 除外するディレクトリ名のセット
         exclude_files: 除外するファイル名のセット
         use_gitignore: .gitignoreを適用するかどうか
+        snapshot: 永続化スナップショットを使用するかどうか
+        backend: ファイル列挙のバックエンド（"walk" または "git_index"）
+        include_untracked: git_index使用時に未追跡ファイルも含めるかどうか
+        workers: ディレクトリを並列に列挙するスレッド数（走査結果は変わらないため
+            フィンガープリントには含めない）
 
     Returns:
         UnifiedFileScannerインスタンス
     """
     project_root_resolved = Path(project_root).resolve()
 
+    from ..detectors.detector_patterns import DetectorPatterns
+
+    effective_exclude_dirs = set(DetectorPatterns.EXCLUDE_DIRS)
+    if exclude_dirs:
+        effective_exclude_dirs.update(exclude_dirs)
+    effective_exclude_files = set(exclude_files or ())
+
+    fingerprint = compute_scan_fingerprint(
+        project_root_resolved,
+        effective_exclude_dirs,
+        effective_exclude_files,
+        use_gitignore,
+        snapshot,
+        backend,
+        include_untracked,
+    )
+
     # .gitignoreマッチャーを作成
     gitignore_matcher = None
     if use_gitignore:
@@ -247,30 +484,14 @@ def get_unified_scanner(
 
         gitignore_matcher = load_gitignore_patterns(project_root_resolved)
 
-    # 既存のスキャナーがある場合は再利用
-    if project_root_resolved in _scanner_cache:
-        scanner = _scanner_cache[project_root_resolved]
-        # 除外設定が変更された場合は新しいスキャナーを作成
-        if (
-            scanner.exclude_dirs == (exclude_dirs or set())
-            and scanner.exclude_files == (exclude_files or set())
-            and scanner.gitignore_matcher == gitignore_matcher
-        ):
-            return scanner
-
-    # 新しいスキャナーを作成
-    from ..detectors.detector_patterns import DetectorPatterns
-
-    default_exclude_dirs = set(DetectorPatterns.EXCLUDE_DIRS)
-    if exclude_dirs:
-        default_exclude_dirs.update(exclude_dirs)
-
-    scanner = UnifiedFileScanner(
+    return UnifiedFileScanner(
         project_root=project_root_resolved,
-        exclude_dirs=default_exclude_dirs,
-        exclude_files=exclude_files or set(),
+        exclude_dirs=effective_exclude_dirs,
+        exclude_files=effective_exclude_files,
         gitignore_matcher=gitignore_matcher,
+        snapshot=snapshot,
+        fingerprint=fingerprint,
+        backend=backend,
+        include_untracked=include_untracked,
+        workers=workers,
     )
-    _scanner_cache[project_root_resolved] = scanner
-
-    return scanner
@@ -0,0 +1,425 @@
+"""ファイル監視モジュール
+
+`watch`サブコマンドで使用するプロジェクトツリーの変更監視を提供します。
+Linuxでは`inotify`（ctypes経由、追加の依存関係なし）を使用し、
+それ以外の環境や`inotify`を初期化できない場合はstatによるポーリングにフォールバックします。
+短時間に連続する変更は`collect_changes`でまとめて（デバウンスして）返します。
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from typing import NamedTuple
+
+from .fs_walker import PrunePredicate, scandir_listing, walk_files
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# inotifyのイベントマスク（<sys/inotify.h>）
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_IN_ISDIR = 0x40000000
+_IN_CLOEXEC = 0o2000000
+_IN_NONBLOCK = 0o4000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+)
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+# キューがあふれた場合の変更種別（全体を再生成する必要がある）
+OVERFLOW = "overflow"
+
+
+class FileChange(NamedTuple):
+    """検知したファイルの変更"""
+
+    rel_path: str  # プロジェクトルートからの`/`区切りの相対パス
+    kind: str  # "created" | "modified" | "deleted" | "overflow"
+    is_dir: bool
+    timestamp: float  # 検知時刻（`time.monotonic()`）
+
+
+class PollingWatcher:
+    """statのスナップショットを比較して変更を検知するウォッチャー"""
+
+    backend = "polling"
+
+    def __init__(
+        self,
+        root: str,
+        prune_dir: PrunePredicate | None = None,
+        skip_file: PrunePredicate | None = None,
+        interval: float = 1.0,
+    ):
+        """
+        初期化
+
+        Args:
+            root: 監視するルートディレクトリ（正規化済みの絶対パス）
+            prune_dir: 監視対象から外すディレクトリの判定関数（相対パス, 名前）
+            skip_file: 監視対象から外すファイルの判定関数（相対パス, 名前）
+            interval: ポーリング間隔（秒）
+        """
+        self.root = root
+        self.prune_dir = prune_dir
+        self.skip_file = skip_file
+        self.interval = interval
+        self._state = self._snapshot()
+        self._next_poll = time.monotonic() + interval
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        """相対パス -> (mtime_ns, サイズ) のスナップショットを作成"""
+        state = {}
+        for walked in walk_files(self.root, prune_dir=self.prune_dir, skip_file=self.skip_file):
+            try:
+                stat = os.stat(walked.abs_path)
+            except OSError:
+                continue
+            state[walked.rel_path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def poll(self, timeout: float) -> list[FileChange]:
+        """
+        変更を待って取得
+
+        Args:
+            timeout: 最大待ち時間（秒）
+
+        Returns:
+            検知した変更のリスト（タイムアウトした場合は空リスト）
+        """
+        wait = self._next_poll - time.monotonic()
+        if wait > timeout:
+            time.sleep(max(0.0, timeout))
+            return []
+        if wait > 0:
+            time.sleep(wait)
+        self._next_poll = time.monotonic() + self.interval
+
+        previous = self._state
+        current = self._snapshot()
+        self._state = current
+        now = time.monotonic()
+
+        changes = [
+            FileChange(rel, "modified" if rel in previous else "created", False, now)
+            for rel, state in current.items()
+            if previous.get(rel) != state
+        ]
+        changes.extend(
+            FileChange(rel, "deleted", False, now) for rel in previous if rel not in current
+        )
+        return changes
+
+    def close(self) -> None:
+        """監視を終了"""
+        self._state = {}
+
+
+class InotifyWatcher:
+    """Linuxのinotifyで変更を検知するウォッチャー
+
+    除外されないディレクトリごとにウォッチを登録し、新しく作成されたディレクトリにも
+    自動的にウォッチを追加します。
+    """
+
+    backend = "inotify"
+
+    def __init__(
+        self,
+        root: str,
+        prune_dir: PrunePredicate | None = None,
+        skip_file: PrunePredicate | None = None,
+    ):
+        """
+        初期化
+
+        Args:
+            root: 監視するルートディレクトリ（正規化済みの絶対パス）
+            prune_dir: 監視対象から外すディレクトリの判定関数（相対パス, 名前）
+            skip_file: 監視対象から外すファイルの判定関数（相対パス, 名前）
+
+        Raises:
+            OSError: inotifyを使用できない場合（非Linux環境、ウォッチ数の上限など）
+        """
+        self.root = root
+        self.prune_dir = prune_dir
+        self.skip_file = skip_file
+        self._libc = _load_libc()
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise _errno_error("inotify_init1")
+        self._watches: dict[int, str] = {}  # ウォッチ記述子 -> 相対パス
+        try:
+            self._add_tree("", [])
+        except OSError:
+            self.close()
+            raise
+
+    @staticmethod
+    def is_available() -> bool:
+        """inotifyを使用できる環境かどうか"""
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            _load_libc()
+        except OSError:
+            return False
+        return True
+
+    def _add_tree(self, rel_dir: str, found: list[FileChange]) -> None:
+        """ディレクトリ配下にウォッチを登録（登録前に存在したファイルをfoundに追加）"""
+        stack = [rel_dir]
+        now = time.monotonic()
+        while stack:
+            current = stack.pop()
+            abs_dir = os.path.join(self.root, current) if current else self.root
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(abs_dir), _WATCH_MASK)
+            if wd < 0:
+                error = _errno_error(f"inotify_add_watch({abs_dir})")
+                # 監視開始前に削除されたディレクトリは無視する
+                if error.errno == errno.ENOENT and current:
+                    continue
+                raise error
+            self._watches[wd] = current
+
+            try:
+                dirs, files = scandir_listing(abs_dir)
+            except OSError:
+                continue
+            prefix = f"{current}/" if current else ""
+            if rel_dir:
+                # 新しく作成されたディレクトリでは、ウォッチ登録前に作成されたファイルを報告する
+                for name in files:
+                    rel_path = prefix + name
+                    if self.skip_file is None or not self.skip_file(rel_path, name):
+                        found.append(FileChange(rel_path, "created", False, now))
+            for name in dirs:
+                rel_path = prefix + name
+                if self.prune_dir is None or not self.prune_dir(rel_path, name):
+                    stack.append(rel_path)
+
+    def poll(self, timeout: float) -> list[FileChange]:
+        """
+        変更を待って取得
+
+        Args:
+            timeout: 最大待ち時間（秒）
+
+        Returns:
+            検知した変更のリスト（タイムアウトした場合は空リスト）
+        """
+        readable, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if not readable:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        now = time.monotonic()
+        changes: list[FileChange] = []
+        pos = 0
+        header_size = _EVENT_HEADER.size
+        while pos + header_size <= len(data):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, pos)
+            pos += header_size
+            name = data[pos : pos + name_len].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            pos += name_len
+
+            if mask & _IN_Q_OVERFLOW:
+                changes.append(FileChange("", OVERFLOW, True, now))
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            parent = self._watches.get(wd)
+            if parent is None or not name:
+                continue
+
+            rel_path = f"{parent}/{name}" if parent else name
+            is_dir = bool(mask & _IN_ISDIR)
+            if is_dir:
+                if self.prune_dir is not None and self.prune_dir(rel_path, name):
+                    continue
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    changes.append(FileChange(rel_path, "created", True, now))
+                    try:
+                        self._add_tree(rel_path, changes)
+                    except OSError as e:
+                        logger.warning(f"ディレクトリの監視を開始できませんでした: {e}")
+                elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                    changes.append(FileChange(rel_path, "deleted", True, now))
+                continue
+
+            if self.skip_file is not None and self.skip_file(rel_path, name):
+                continue
+            if mask & (_IN_CREATE | _IN_MOVED_TO):
+                kind = "created"
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                kind = "deleted"
+            else:
+                kind = "modified"
+            changes.append(FileChange(rel_path, kind, False, now))
+        return changes
+
+    def close(self) -> None:
+        """監視を終了"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._watches.clear()
+
+
+FileWatcher = InotifyWatcher | PollingWatcher
+
+
+def _load_libc() -> ctypes.CDLL:
+    """inotify関数を持つlibcを読み込む"""
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError("inotify is not supported by libc")
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def _errno_error(operation: str) -> OSError:
+    """ctypes呼び出しのerrnoからOSErrorを作成"""
+    code = ctypes.get_errno()
+    return OSError(code, f"{operation}: {os.strerror(code)}")
+
+
+def create_watcher(
+    root: str,
+    prune_dir: PrunePredicate | None = None,
+    skip_file: PrunePredicate | None = None,
+    backend: str = "auto",
+    poll_interval: float = 1.0,
+) -> FileWatcher:
+    """
+    ファイルウォッチャーを作成
+
+    Args:
+        root: 監視するルートディレクトリ（正規化済みの絶対パス）
+        prune_dir: 監視対象から外すディレクトリの判定関数（相対パス, 名前）
+        skip_file: 監視対象から外すファイルの判定関数（相対パス, 名前）
+        backend: "auto"（inotifyを優先）, "inotify", "polling"
+        poll_interval: ポーリング間隔（秒）
+
+    Returns:
+        InotifyWatcherまたはPollingWatcher（inotifyを使用できない場合はポーリング）
+    """
+    if backend != "polling" and InotifyWatcher.is_available():
+        try:
+            return InotifyWatcher(root, prune_dir=prune_dir, skip_file=skip_file)
+        except OSError as e:
+            logger.warning(f"inotifyを使用できないため、ポーリングで監視します: {e}")
+    elif backend == "inotify":
+        logger.warning("この環境ではinotifyを使用できないため、ポーリングで監視します")
+    return PollingWatcher(root, prune_dir=prune_dir, skip_file=skip_file, interval=poll_interval)
+
+
+def merge_changes(changes: list[FileChange]) -> list[FileChange]:
+    """
+    同じパスへの連続した変更を最終状態にまとめる
+
+    作成後に削除されたパスは除外し、削除後に再作成されたパスは変更として扱います。
+    タイムスタンプは最初に検知した時刻を保持します。
+
+    Args:
+        changes: 検知順の変更のリスト
+
+    Returns:
+        パスごとにまとめた変更のリスト（最初に検知した順）
+    """
+    merged: dict[str, FileChange] = {}
+    first_kinds: dict[str, str] = {}
+    for change in changes:
+        previous = merged.get(change.rel_path)
+        if previous is None or change.kind == OVERFLOW:
+            merged[change.rel_path] = change
+            first_kinds.setdefault(change.rel_path, change.kind)
+            continue
+
+        kind = change.kind
+        if previous.kind == "created" and kind != "deleted":
+            kind = "created"
+        elif previous.kind == "deleted" and kind == "created":
+            kind = "modified"
+        merged[change.rel_path] = previous._replace(kind=kind, is_dir=change.is_dir)
+
+    # 作成してすぐ削除されたパス（エディタの一時ファイルなど）は変更なしとみなす
+    return [
+        change
+        for rel_path, change in merged.items()
+        if not (first_kinds[rel_path] == "created" and change.kind == "deleted")
+    ]
+
+
+def collect_changes(
+    watcher: FileWatcher,
+    debounce: float,
+    timeout: float | None = None,
+    max_wait: float = 10.0,
+) -> list[FileChange]:
+    """
+    変更を待ち、連続する変更が`debounce`秒途絶えるまでまとめて取得
+
+    Args:
+        watcher: ファイルウォッチャー
+        debounce: 変更が途絶えたとみなす時間（秒）
+        timeout: 最初の変更を待つ最大時間（秒、Noneの場合は無制限）
+        max_wait: 最初の変更から返すまでの最大時間（変更が続く場合でも返す）
+
+    Returns:
+        まとめた変更のリスト（タイムアウトした場合は空リスト）
+    """
+    changes: list[FileChange] = []
+    start = time.monotonic()
+    while not changes:
+        if timeout is not None:
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                return []
+            changes.extend(watcher.poll(min(remaining, 1.0)))
+        else:
+            changes.extend(watcher.poll(1.0))
+
+    deadline = time.monotonic() + max_wait
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        more = watcher.poll(min(debounce, remaining))
+        if not more:
+            break
+        changes.extend(more)
+
+    return merge_changes(changes)
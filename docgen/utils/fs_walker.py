@@ -0,0 +1,245 @@
+"""scandirベースのディレクトリ走査エンジン
+
+`os.scandir`の`DirEntry`が保持するd_typeを利用して、ファイルごとの
+`Path.resolve()`・`relative_to()`・`is_symlink()`呼び出しを省略します。
+相対パスは文字列の連結で組み立て、シンボリックリンクはd_typeで判定して辿りません。
+
+ネットワークファイルシステムなど列挙の待ち時間が大きい環境向けに、
+ディレクトリの列挙だけを複数スレッドで先行実行する`prefetch_listings`も提供します。
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterator
+import os
+import threading
+from typing import NamedTuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# (相対パス, エントリ名) -> 除外する場合True
+PrunePredicate = Callable[[str, str], bool]
+# (ディレクトリの絶対パス, 相対パス) -> (サブディレクトリ名のリスト, ファイル名のリスト)
+DirectoryLister = Callable[[str, str], tuple[list[str], list[str]]]
+
+
+class WalkedFile(NamedTuple):
+    """走査で見つかったファイル"""
+
+    abs_path: str
+    rel_path: str  # `/`区切りのプロジェクトルートからの相対パス
+    name: str
+
+
+def file_extension(name: str) -> str:
+    """
+    ファイル名から小文字の拡張子を取得（`Path.suffix.lower()`と同じ結果）
+
+    Args:
+        name: ファイル名
+
+    Returns:
+        拡張子（例: '.py'）、拡張子がない場合は空文字
+    """
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
+
+
+def scandir_listing(dir_path: str, rel_dir: str = "") -> tuple[list[str], list[str]]:
+    """
+    ディレクトリを列挙してサブディレクトリ名とファイル名に分類
+
+    `DirEntry.is_symlink()`と`DirEntry.is_dir()`はd_typeから判定されるため、
+    通常は追加のstat呼び出しが発生しません。シンボリックリンクは除外されます。
+
+    Args:
+        dir_path: ディレクトリの絶対パス
+        rel_dir: プロジェクトルートからの相対パス（`DirectoryLister`互換のため）
+
+    Returns:
+        (サブディレクトリ名のリスト, ファイル名のリスト)
+
+    Raises:
+        OSError: ディレクトリにアクセスできない場合
+    """
+    dirs: list[str] = []
+    files: list[str] = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            try:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.name)
+                else:
+                    files.append(entry.name)
+            except OSError:
+                continue
+    return dirs, files
+
+
+def walk_files(
+    root: str,
+    prune_dir: PrunePredicate | None = None,
+    skip_file: PrunePredicate | None = None,
+    list_dir: DirectoryLister | None = None,
+) -> Iterator[WalkedFile]:
+    """
+    ディレクトリツリーを深さ優先（`os.walk`と同じ順序）で走査してファイルを列挙
+
+    シンボリックリンク（ファイル・ディレクトリとも）は辿らず、結果にも含めません。
+    そのため`root`が正規化済みであれば、返される絶対パスも正規化済みです。
+
+    Args:
+        root: 走査するルートディレクトリ（正規化済みの絶対パス）
+        prune_dir: サブディレクトリを枝刈りするかを判定する関数（相対パス, 名前）
+        skip_file: ファイルを除外するかを判定する関数（相対パス, 名前）
+        list_dir: ディレクトリ列挙関数（Noneの場合は`scandir_listing`）
+
+    Yields:
+        WalkedFile
+    """
+    lister = list_dir or scandir_listing
+    stack: list[tuple[str, str]] = [(root, "")]
+    sep = os.sep
+
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            dirs, files = lister(dir_path, rel_dir)
+        except OSError as e:
+            logger.debug(f"{dir_path} の列挙に失敗しました: {e}")
+            continue
+
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        dir_prefix = dir_path if dir_path.endswith(sep) else dir_path + sep
+
+        for name in files:
+            rel_path = prefix + name
+            if skip_file is not None and skip_file(rel_path, name):
+                continue
+            yield WalkedFile(dir_prefix + name, rel_path, name)
+
+        # os.walkと同じ順序で訪問するため逆順に積む
+        for name in reversed(dirs):
+            rel_path = prefix + name
+            if prune_dir is not None and prune_dir(rel_path, name):
+                continue
+            stack.append((dir_prefix + name, rel_path))
+
+
+def prefetch_listings(
+    root: str,
+    prune_dir: PrunePredicate | None = None,
+    list_dir: DirectoryLister | None = None,
+    workers: int = 4,
+) -> DirectoryLister:
+    """
+    枝刈りされないすべてのディレクトリを複数スレッドで先行して列挙
+
+    各スレッドは自身の両端キューから後入れ先出しで取り出し、空になると他のスレッドの
+    キューの反対側から盗みます（ワークスティーリング）。列挙結果は相対パスをキーに保持し、
+    返される関数を`walk_files`の`list_dir`に渡すことで、逐次走査と同じ順序・同じ結果で
+    走査できます（ファイルの判定と結果の組み立ては呼び出し側のスレッドで行います）。
+
+    `prune_dir`と`list_dir`はワーカースレッドから並行して呼び出されます。
+
+    Args:
+        root: 走査するルートディレクトリ（正規化済みの絶対パス）
+        prune_dir: サブディレクトリを枝刈りするかを判定する関数（相対パス, 名前）
+        list_dir: ディレクトリ列挙関数（Noneの場合は`scandir_listing`）
+        workers: スレッド数
+
+    Returns:
+        先行列挙の結果を返すディレクトリ列挙関数
+        （列挙に失敗したディレクトリでは、そのときのOSErrorを送出します）
+    """
+    lister = list_dir or scandir_listing
+    workers = max(1, workers)
+    listings: dict[str, tuple[list[str], list[str]] | OSError] = {}
+    queues: list[deque[tuple[str, str]]] = [deque() for _ in range(workers)]
+    queues[0].append((root, ""))
+    cond = threading.Condition()
+    state = {"pending": 1, "error": None}
+    sep = os.sep
+
+    def take(index: int) -> tuple[str, str] | None:
+        try:
+            return queues[index].pop()
+        except IndexError:
+            pass
+        for offset in range(1, workers):
+            try:
+                return queues[(index + offset) % workers].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def run(index: int) -> None:
+        while True:
+            item = take(index)
+            if item is None:
+                with cond:
+                    # キューへの追加はcondの保持中に行うため、ここでの確認は取りこぼさない
+                    while state["pending"] and state["error"] is None and not any(queues):
+                        cond.wait()
+                    if not state["pending"] or state["error"] is not None:
+                        return
+                continue
+
+            dir_path, rel_dir = item
+            children: list[tuple[str, str]] = []
+            try:
+                try:
+                    dirs, files = lister(dir_path, rel_dir)
+                except OSError as e:
+                    listings[rel_dir] = e
+                else:
+                    listings[rel_dir] = (dirs, files)
+                    prefix = f"{rel_dir}/" if rel_dir else ""
+                    dir_prefix = dir_path if dir_path.endswith(sep) else dir_path + sep
+                    for name in dirs:
+                        rel_path = prefix + name
+                        if prune_dir is not None and prune_dir(rel_path, name):
+                            continue
+                        children.append((dir_prefix + name, rel_path))
+            except BaseException as e:
+                with cond:
+                    state["error"] = e
+                    cond.notify_all()
+                return
+
+            with cond:
+                queues[index].extend(children)
+                state["pending"] += len(children) - 1
+                if not state["pending"]:
+                    cond.notify_all()
+                elif children:
+                    cond.notify(len(children))
+
+    threads = [
+        threading.Thread(target=run, args=(i,), name=f"docgen-scan-{i}", daemon=True)
+        for i in range(1, workers)
+    ]
+    for thread in threads:
+        thread.start()
+    run(0)
+    for thread in threads:
+        thread.join()
+
+    if state["error"] is not None:
+        raise state["error"]
+
+    def prefetched(dir_path: str, rel_dir: str) -> tuple[list[str], list[str]]:
+        listing = listings.get(rel_dir)
+        if listing is None:
+            # 先行列挙の対象外（呼び出し側の枝刈り判定が異なる場合）は直接列挙する
+            return lister(dir_path, rel_dir)
+        if isinstance(listing, OSError):
+            raise listing
+        return listing
+
+    return prefetched
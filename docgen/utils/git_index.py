@@ -0,0 +1,244 @@
+"""Gitインデックス（`.git/index`）リーダー
+
+gitのサブプロセスを起動せずに`.git/index`を直接パースし、追跡ファイルのパスと
+インデックスに記録されたstat情報を取得します。バージョン2・3・4の形式に対応しています。
+"""
+
+from pathlib import Path
+import struct
+from typing import NamedTuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+_SIGNATURE = b"DIRC"
+_SUPPORTED_VERSIONS = (2, 3, 4)
+# ctime(s, ns), mtime(s, ns), dev, ino, mode, uid, gid, size
+_STAT_STRUCT = struct.Struct(">10I")
+
+_FLAG_EXTENDED = 0x4000
+_FLAG_STAGE_MASK = 0x3000
+_FLAG_NAME_MASK = 0x0FFF
+_EXT_FLAG_SKIP_WORKTREE = 0x4000
+_EXT_FLAG_INTENT_TO_ADD = 0x2000
+
+# 通常ファイル（シンボリックリンク 0o120000 とサブモジュール 0o160000 は除外）
+_MODE_TYPE_MASK = 0o170000
+_MODE_REGULAR = 0o100000
+
+
+class GitIndexEntry(NamedTuple):
+    """インデックスに記録された追跡ファイル"""
+
+    path: str  # ワークツリールートからの`/`区切りの相対パス
+    mtime_ns: int
+    ctime_ns: int
+    size: int
+    ino: int
+    mode: int
+    object_id: str  # 16進表記のblobハッシュ
+
+
+class GitIndexError(Exception):
+    """インデックスを読み込めない場合の例外"""
+
+
+def find_git_dir(start: Path) -> tuple[Path, Path] | None:
+    """
+    ディレクトリから上位に向かってgitリポジトリを探す
+
+    `.git`がファイル（ワークツリー・サブモジュール）の場合は`gitdir:`の参照先を使用します。
+
+    Args:
+        start: 探索を開始するディレクトリ
+
+    Returns:
+        (ワークツリーのルート, gitディレクトリ)、見つからない場合はNone
+    """
+    current = Path(start).resolve()
+    for directory in (current, *current.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return directory, dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:") :].strip())
+                if not git_dir.is_absolute():
+                    git_dir = (directory / git_dir).resolve()
+                return directory, git_dir
+            return None
+    return None
+
+
+def _hash_size(git_dir: Path) -> int:
+    """オブジェクトIDのバイト数（SHA-256リポジトリは32、それ以外は20）"""
+    # ワークツリーの場合、設定は共通ディレクトリにある
+    candidates = [git_dir / "config"]
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        try:
+            common = Path(commondir.read_text(encoding="utf-8").strip())
+            common_dir = common if common.is_absolute() else git_dir / common
+            candidates.append(common_dir / "config")
+        except OSError:
+            pass
+
+    for config_path in candidates:
+        try:
+            config = config_path.read_text(encoding="utf-8").lower()
+        except OSError:
+            continue
+        if "objectformat" in config and "sha256" in config:
+            return 32
+    return 20
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """インデックスv4のオフセット付き可変長整数を読み込む"""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def read_git_index(git_dir: Path) -> list[GitIndexEntry]:
+    """
+    `.git/index`を読み込んで追跡ファイルを取得
+
+    マージ中のエントリ（ステージ1〜3）・skip-worktree・intent-to-add・
+    シンボリックリンク・サブモジュールは除外します。
+
+    Args:
+        git_dir: gitディレクトリ
+
+    Returns:
+        GitIndexEntryのリスト（インデックスの順序 = パスのバイト順）
+
+    Raises:
+        GitIndexError: インデックスが存在しない・形式が不正・未対応のバージョンの場合
+    """
+    index_path = git_dir / "index"
+    try:
+        data = index_path.read_bytes()
+    except OSError as e:
+        raise GitIndexError(f"{index_path} を読み込めません: {e}") from e
+
+    if len(data) < 12 or data[:4] != _SIGNATURE:
+        raise GitIndexError(f"{index_path} はgitインデックスではありません")
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in _SUPPORTED_VERSIONS:
+        raise GitIndexError(f"未対応のインデックスバージョンです: {version}")
+
+    hash_size = _hash_size(git_dir)
+    entries: list[GitIndexEntry] = []
+    pos = 12
+    previous_path = b""
+    stat_size = _STAT_STRUCT.size
+
+    try:
+        for _ in range(count):
+            start = pos
+            (
+                ctime_s,
+                ctime_ns,
+                mtime_s,
+                mtime_ns,
+                _dev,
+                ino,
+                mode,
+                _uid,
+                _gid,
+                size,
+            ) = _STAT_STRUCT.unpack_from(data, pos)
+            pos += stat_size
+            object_id = data[pos : pos + hash_size].hex()
+            pos += hash_size
+            (flags,) = struct.unpack_from(">H", data, pos)
+            pos += 2
+
+            ext_flags = 0
+            if flags & _FLAG_EXTENDED:
+                (ext_flags,) = struct.unpack_from(">H", data, pos)
+                pos += 2
+
+            if version == 4:
+                strip, pos = _read_varint(data, pos)
+                end = data.index(b"\0", pos)
+                path = previous_path[: len(previous_path) - strip] + data[pos:end]
+                pos = end + 1
+            else:
+                name_len = flags & _FLAG_NAME_MASK
+                if name_len < _FLAG_NAME_MASK:
+                    end = pos + name_len
+                else:
+                    end = data.index(b"\0", pos)
+                path = data[pos:end]
+                # エントリはNULを含めて8バイト境界までパディングされる
+                pos = start + ((end - start + 8) & ~7)
+            previous_path = path
+
+            if flags & _FLAG_STAGE_MASK:
+                continue
+            if ext_flags & (_EXT_FLAG_SKIP_WORKTREE | _EXT_FLAG_INTENT_TO_ADD):
+                continue
+            if mode & _MODE_TYPE_MASK != _MODE_REGULAR:
+                continue
+
+            entries.append(
+                GitIndexEntry(
+                    path=path.decode("utf-8", "surrogateescape"),
+                    mtime_ns=mtime_s * 1_000_000_000 + mtime_ns,
+                    ctime_ns=ctime_s * 1_000_000_000 + ctime_ns,
+                    size=size,
+                    ino=ino,
+                    mode=mode,
+                    object_id=object_id,
+                )
+            )
+    except (struct.error, ValueError, IndexError) as e:
+        raise GitIndexError(f"{index_path} の形式が不正です: {e}") from e
+
+    return entries
+
+
+def load_tracked_files(project_root: Path) -> dict[str, GitIndexEntry] | None:
+    """
+    プロジェクト配下の追跡ファイルをインデックスから取得
+
+    プロジェクトルートがリポジトリのサブディレクトリの場合は、その配下のエントリのみを
+    プロジェクトルートからの相対パスで返します。
+
+    Args:
+        project_root: 正規化済みのプロジェクトルートディレクトリ
+
+    Returns:
+        プロジェクトルートからの相対パス -> GitIndexEntry の辞書、
+        gitリポジトリでない・インデックスを読み込めない場合はNone
+    """
+    located = find_git_dir(project_root)
+    if located is None:
+        return None
+    worktree_root, git_dir = located
+
+    try:
+        entries = read_git_index(git_dir)
+    except GitIndexError as e:
+        logger.debug(f"gitインデックスを使用できません: {e}")
+        return None
+
+    prefix = Path(project_root).resolve().relative_to(worktree_root).as_posix()
+    if prefix == ".":
+        return {entry.path: entry for entry in entries}
+
+    prefix += "/"
+    prefix_len = len(prefix)
+    return {entry.path[prefix_len:]: entry for entry in entries if entry.path.startswith(prefix)}
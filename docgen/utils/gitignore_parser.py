@@ -1,203 +1,378 @@
 """.gitignoreパーサーユーティリティ
 
 .gitignoreファイルを読み込んで、パターンマッチングを行うためのユーティリティ。
+
+パターンはファイルごとに`IgnoreRuleSet`へコンパイルされます。ワイルドカードを含まない
+ファイル名・拡張子（`*.log`など）・パスは辞書で引き、それ以外のパターンは1つの結合正規表現で
+事前判定してから個別に評価します。評価は後ろのパターンから行い、最初に一致したもの
+（= 最後に書かれたもの）を採用します。
+
+`GitIgnoreMatcher`は`.git/info/exclude`・ルートの`.gitignore`・サブディレクトリの`.gitignore`を
+ディレクトリごとのスタックとして保持し、ディレクトリ単位の判定結果をメモ化します。
+除外されたディレクトリの配下は走査されないため、大きな除外ツリーに入ることはありません。
 """
 
+from collections.abc import Iterable
 from pathlib import Path
 import re
+from typing import NamedTuple
 
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+GITIGNORE_FILE_NAME = ".gitignore"
+_GLOB_CHARS = frozenset("*?[\\")
 
-class GitIgnoreMatcher:
-    """`.gitignore`パターンを解析してマッチングを行うクラス"""
 
-    def __init__(self, project_root: Path, gitignore_path: Path | None = None):
+class IgnoreRule(NamedTuple):
+    """1行分の.gitignoreパターン"""
+
+    pattern: str  # 元のパターン（否定の`!`を除く）
+    negated: bool
+    dir_only: bool  # 末尾が`/`のパターン（ディレクトリにのみ一致）
+    anchored: bool  # `/`を含むパターン（.gitignoreのあるディレクトリからの相対パスに一致）
+    body: str  # 先頭・末尾の`/`を除いたパターン本体
+
+
+def parse_gitignore_line(line: str) -> IgnoreRule | None:
+    """
+    .gitignoreの行をパース
+
+    Args:
+        line: .gitignoreの行
+
+    Returns:
+        IgnoreRule、またはNone（空行・コメント・無効な行の場合）
+    """
+    line = line.rstrip("\r\n")
+    # 末尾の空白を削除（`\ `でエスケープされた空白は残す）
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+
+    if not line or line.startswith("#"):
+        return None
+
+    negated = False
+    if line.startswith("!"):
+        negated = True
+        line = line[1:]
+    elif line.startswith(("\\!", "\\#")):
+        line = line[1:]
+
+    pattern = line
+    dir_only = line.endswith("/")
+    if dir_only:
+        line = line.rstrip("/")
+    anchored = "/" in line
+    body = line.lstrip("/")
+    if not body:
+        return None
+
+    return IgnoreRule(pattern, negated, dir_only, anchored, body)
+
+
+def translate_glob(pattern: str) -> str:
+    """
+    .gitignoreのグロブパターンを正規表現に変換（アンカーなし）
+
+    Args:
+        pattern: 先頭・末尾の`/`を除いたパターン
+
+    Returns:
+        正規表現文字列
+    """
+    parts: list[str] = []
+    i = 0
+    n = len(pattern)
+
+    while i < n:
+        char = pattern[i]
+        if char == "*":
+            if i + 1 < n and pattern[i + 1] == "*":
+                at_start = i == 0 or pattern[i - 1] == "/"
+                if at_start and i + 2 < n and pattern[i + 2] == "/":
+                    # `**/`: 0個以上のディレクトリ
+                    parts.append("(?:.*/)?")
+                    i += 3
+                    continue
+                if at_start and i + 2 == n:
+                    # 末尾の`/**`: 配下のすべて
+                    parts.append(".*")
+                    i += 2
+                    continue
+                parts.append("[^/]*")
+                i += 2
+                continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                # 閉じ括弧がない場合は`[`をリテラルとして扱う
+                parts.append(re.escape(char))
+            else:
+                content = pattern[i + 1 : j]
+                negate = content[:1] in ("!", "^")
+                if negate:
+                    content = content[1:]
+                content = content.replace("\\", "\\\\").replace("[", "\\[")
+                parts.append(f"(?!/)[{'^' if negate else ''}{content}]")
+                i = j
+        elif char == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+
+    return "".join(parts)
+
+
+class IgnoreRuleSet:
+    """1つの除外ファイルのパターンをコンパイルしたもの
+
+    ワイルドカードを含まないパターンは辞書（ファイル名・拡張子・パス）で引き、
+    それ以外は結合正規表現で一致の可能性を判定してから個別の正規表現を評価します。
+    """
+
+    def __init__(self, base_dir: str, rules: Iterable[IgnoreRule], source: str = ""):
         """
         初期化
 
         Args:
-            project_root: プロジェクトルートディレクトリ
-            gitignore_path: .gitignoreファイルのパス（Noneの場合はproject_root/.gitignore）
+            base_dir: 除外ファイルがあるディレクトリのプロジェクトルートからの相対パス（ルートは空文字）
+            rules: パターンのリスト（ファイル内の順序）
+            source: 読み込み元（ログ用）
         """
-        self.project_root = Path(project_root).resolve()
-        self.gitignore_path = gitignore_path or (self.project_root / ".gitignore")
-        self.patterns: list[
-            tuple[bool, str, re.Pattern[str]]
-        ] = []  # (negated, pattern, compiled_regex)
-        self._load_patterns()
-
-    def _load_patterns(self) -> None:
-        """`.gitignore`ファイルからパターンを読み込む"""
-        if not self.gitignore_path.exists():
-            logger.debug(f".gitignore not found: {self.gitignore_path}")
-            return
+        self.base_dir = base_dir
+        self.source = source
+        self.rules: list[IgnoreRule] = []
 
-        try:
-            with open(self.gitignore_path, encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    pattern = self._parse_line(line)
-                    if pattern:
-                        negated, pattern_str = pattern
-                        compiled = self._compile_pattern(pattern_str)
-                        if compiled:
-                            self.patterns.append((negated, pattern_str, compiled))
-                            logger.debug(
-                                f"Loaded pattern (line {line_num}): {'!' if negated else ''}{pattern_str}"
-                            )
-        except (OSError, UnicodeDecodeError) as e:
-            logger.warning(f"Failed to read .gitignore: {e}")
+        self._names: dict[str, list[int]] = {}
+        self._suffixes: dict[str, list[tuple[str, int]]] = {}
+        self._paths: dict[str, list[int]] = {}
+        self._name_regexes: list[tuple[int, re.Pattern[str]]] = []
+        self._path_regexes: list[tuple[int, re.Pattern[str]]] = []
+
+        for rule in rules:
+            self._add(rule)
+
+        self._name_prefilter = self._combine(self._name_regexes)
+        self._path_prefilter = self._combine(self._path_regexes)
 
-    def _parse_line(self, line: str) -> tuple[bool, str] | None:
+    @classmethod
+    def from_file(cls, path: Path, base_dir: str = "") -> "IgnoreRuleSet | None":
         """
-        .gitignoreの行をパース
+        除外ファイルを読み込む
 
         Args:
-            line: .gitignoreの行
+            path: 除外ファイルのパス
+            base_dir: 除外ファイルがあるディレクトリの相対パス
 
         Returns:
-            (negated, pattern) のタプル、またはNone（無効な行の場合）
+            IgnoreRuleSet、またはNone（ファイルが存在しない・読み込めない・パターンがない場合）
         """
-        # コメントと空行をスキップ
-        line = line.strip()
-        if not line or line.startswith("#"):
+        try:
+            with open(path, encoding="utf-8") as f:
+                rules = [rule for rule in map(parse_gitignore_line, f) if rule is not None]
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to read {path}: {e}")
             return None
 
-        # 否定パターン（!で始まる）
-        negated = False
-        if line.startswith("!"):
-            negated = True
-            line = line[1:].strip()
-            if not line:
-                return None
+        if not rules:
+            return None
+        logger.debug(f"Loaded {len(rules)} ignore patterns from {path}")
+        return cls(base_dir, rules, source=str(path))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _add(self, rule: IgnoreRule) -> None:
+        index = len(self.rules)
+        self.rules.append(rule)
+        body = rule.body
+        has_glob = not _GLOB_CHARS.isdisjoint(body)
+
+        if rule.anchored:
+            if has_glob:
+                self._path_regexes.append((index, re.compile(translate_glob(body))))
+            else:
+                self._paths.setdefault(body, []).append(index)
+            return
+
+        if not has_glob:
+            self._names.setdefault(body, []).append(index)
+            return
 
-        # 末尾の空白を削除（.gitignoreの仕様）
-        line = line.rstrip()
+        # `*.log`のようなパターンは拡張子で引く
+        suffix = body[1:]
+        if body[0] == "*" and "." in suffix and _GLOB_CHARS.isdisjoint(suffix):
+            key = suffix[suffix.rfind(".") :]
+            self._suffixes.setdefault(key, []).append((suffix, index))
+            return
 
-        return (negated, line)
+        self._name_regexes.append((index, re.compile(translate_glob(body))))
 
-    def _compile_pattern(self, pattern: str) -> re.Pattern[str] | None:
+    @staticmethod
+    def _combine(regexes: list[tuple[int, re.Pattern[str]]]) -> re.Pattern[str] | None:
+        """個別の正規表現を1つの結合正規表現にまとめる（一致の有無の事前判定用）"""
+        if not regexes:
+            return None
+        return re.compile("|".join(f"(?:{regex.pattern})" for _index, regex in regexes))
+
+    def match(self, rel_path: str, name: str, is_dir: bool) -> bool | None:
         """
-        .gitignoreパターンを正規表現にコンパイル
+        パスに一致する最後のパターンを判定
 
         Args:
-            pattern: .gitignoreパターン
+            rel_path: プロジェクトルートからの相対パス（`/`区切り）
+            name: パスの最後の要素
+            is_dir: ディレクトリかどうか
 
         Returns:
-            コンパイルされた正規表現、またはNone
+            除外される場合True、否定パターンで再び含まれる場合False、一致しない場合None
         """
-        if not pattern:
-            return None
+        if self.base_dir:
+            sub_path = rel_path[len(self.base_dir) + 1 :]
+        else:
+            sub_path = rel_path
+
+        rules = self.rules
+        best = -1
+
+        for index in reversed(self._names.get(name, ())):
+            if is_dir or not rules[index].dir_only:
+                best = index
+                break
+
+        if self._paths:
+            for index in reversed(self._paths.get(sub_path, ())):
+                if index > best and (is_dir or not rules[index].dir_only):
+                    best = index
+                    break
+
+        if self._suffixes:
+            dot = name.rfind(".")
+            if dot >= 0:
+                for suffix, index in reversed(self._suffixes.get(name[dot:], ())):
+                    if index <= best:
+                        break
+                    if (is_dir or not rules[index].dir_only) and name.endswith(suffix):
+                        best = index
+                        break
 
-        original_pattern = pattern
+        if self._name_prefilter is not None and self._name_prefilter.fullmatch(name):
+            best = self._last_regex_match(self._name_regexes, name, is_dir, best)
 
-        # ディレクトリパターン（末尾が/）を検出
-        is_dir_pattern = pattern.endswith("/")
-        if is_dir_pattern:
-            pattern = pattern[:-1]
+        if self._path_prefilter is not None and self._path_prefilter.fullmatch(sub_path):
+            best = self._last_regex_match(self._path_regexes, sub_path, is_dir, best)
 
-        # ルートからの相対パス（先頭が/）を検出
-        is_anchor = pattern.startswith("/")
-        if is_anchor:
-            pattern = pattern[1:]
+        if best < 0:
+            return None
+        return not rules[best].negated
+
+    def _last_regex_match(
+        self,
+        regexes: list[tuple[int, re.Pattern[str]]],
+        target: str,
+        is_dir: bool,
+        best: int,
+    ) -> int:
+        """`best`より後ろで一致する最後のパターンのインデックスを返す"""
+        for index, regex in reversed(regexes):
+            if index <= best:
+                break
+            if (is_dir or not self.rules[index].dir_only) and regex.fullmatch(target):
+                return index
+        return best
 
-        # パターンを正規表現に変換
-        regex_parts = []
 
-        # 先頭のアンカー
-        if is_anchor:
-            regex_parts.append(r"^")
-        else:
-            # 任意の位置からマッチ（パスの任意の部分、ディレクトリ名、またはファイル名）
-            regex_parts.append(r"(^|/)")
-
-        # パターンを正規表現に変換
-        # 特殊文字をエスケープしてから、ワイルドカードを処理
-        escaped_pattern = ""
-        i = 0
-        pattern_len = len(pattern)
-
-        while i < pattern_len:
-            char = pattern[i]
-
-            if char == "*":
-                # ** の場合は任意のディレクトリ階層
-                if i + 1 < pattern_len and pattern[i + 1] == "*":
-                    # **/ または /** の処理
-                    if i + 2 < pattern_len and pattern[i + 2] == "/":
-                        escaped_pattern += r".*"
-                        i += 3
-                    elif i > 0 and pattern[i - 1] == "/":
-                        escaped_pattern += r".*"
-                        i += 2
-                    else:
-                        # ** は任意の文字列（/を含む）
-                        escaped_pattern += r".*"
-                        i += 2
-                else:
-                    # * は / 以外の任意の文字
-                    escaped_pattern += r"[^/]*"
-                    i += 1
-            elif char == "?":
-                # ? は / 以外の任意の1文字
-                escaped_pattern += r"[^/]"
-                i += 1
-            elif char == "[":
-                # 文字クラス [abc] または [a-z] を処理
-                j = i + 1
-                char_class = "["
-                if j < pattern_len and pattern[j] == "!":
-                    char_class += "!"
-                    j += 1
-                # 文字クラス内の文字を収集
-                while j < pattern_len:
-                    if pattern[j] == "]":
-                        char_class += "]"
-                        escaped_pattern += char_class
-                        i = j + 1
-                        break
-                    elif pattern[j] == "/":
-                        # / を除外（文字クラスから除外）
-                        j += 1
-                    else:
-                        char_class += pattern[j]
-                        j += 1
-                else:
-                    # 閉じ括弧が見つからない場合は [ をリテラルとして扱う
-                    escaped_pattern += re.escape("[")
-                    i += 1
-            elif char in r".^$+{}|()":
-                # 正規表現の特殊文字をエスケープ
-                escaped_pattern += re.escape(char)
-                i += 1
-            elif char == "/":
-                # パス区切り文字
-                escaped_pattern += "/"
-                i += 1
-            else:
-                # 通常の文字もエスケープ（安全のため）
-                escaped_pattern += re.escape(char)
-                i += 1
-
-        regex_parts.append(escaped_pattern)
+class GitIgnoreMatcher:
+    """`.gitignore`パターンを解析してマッチングを行うクラス
 
-        # パターンの終端
-        if is_dir_pattern:
-            # ディレクトリパターンの場合、/ で終わるか、パスの終端
-            regex_parts.append(r"(/|$)")
-        else:
-            # ファイルパターンの場合、パスの終端または / の前
-            regex_parts.append(r"(/|$)")
+    優先度の低い順に`.git/info/exclude`、ルートの`.gitignore`、
+    サブディレクトリの`.gitignore`（深いほど優先）をスタックとして評価します。
+    """
 
-        regex_str = "".join(regex_parts)
+    def __init__(
+        self,
+        project_root: Path,
+        gitignore_path: Path | None = None,
+        nested: bool = True,
+        use_info_exclude: bool = True,
+    ):
+        """
+        初期化
 
-        try:
-            return re.compile(regex_str)
-        except re.error as e:
-            logger.debug(f"Failed to compile pattern '{original_pattern}': {e}, regex: {regex_str}")
-            return None
+        Args:
+            project_root: プロジェクトルートディレクトリ
+            gitignore_path: .gitignoreファイルのパス（Noneの場合はproject_root/.gitignore）
+            nested: サブディレクトリの.gitignoreを読み込むかどうか
+            use_info_exclude: `.git/info/exclude`を読み込むかどうか
+        """
+        self.project_root = Path(project_root).resolve()
+        self.gitignore_path = gitignore_path or (self.project_root / GITIGNORE_FILE_NAME)
+        self.nested = nested
+
+        root_sets: list[IgnoreRuleSet] = []
+        if use_info_exclude:
+            info_exclude = IgnoreRuleSet.from_file(self.project_root / ".git" / "info" / "exclude")
+            if info_exclude is not None:
+                root_sets.append(info_exclude)
+        root_gitignore = IgnoreRuleSet.from_file(self.gitignore_path)
+        if root_gitignore is not None:
+            root_sets.append(root_gitignore)
+
+        # 相対パス -> 適用される除外ファイルのスタック（優先度の低い順）
+        self._stacks: dict[str, tuple[IgnoreRuleSet, ...]] = {"": tuple(root_sets)}
+        # 相対パス -> ディレクトリが（祖先を含めて）除外されるか
+        self._dir_decisions: dict[str, bool] = {"": False}
+
+    @property
+    def rule_sets(self) -> list[IgnoreRuleSet]:
+        """読み込み済みの除外ファイル（優先度の低い順）"""
+        seen: dict[int, IgnoreRuleSet] = {}
+        for stack in self._stacks.values():
+            for rule_set in stack:
+                seen.setdefault(id(rule_set), rule_set)
+        return list(seen.values())
+
+    def _stack_for(self, rel_dir: str) -> tuple[IgnoreRuleSet, ...]:
+        """ディレクトリ内のエントリに適用される除外ファイルのスタックを取得"""
+        stack = self._stacks.get(rel_dir)
+        if stack is not None:
+            return stack
+
+        parent = rel_dir.rpartition("/")[0]
+        stack = self._stack_for(parent)
+        if self.nested:
+            rule_set = IgnoreRuleSet.from_file(
+                self.project_root / rel_dir / GITIGNORE_FILE_NAME, base_dir=rel_dir
+            )
+            if rule_set is not None:
+                stack = stack + (rule_set,)
+        self._stacks[rel_dir] = stack
+        return stack
+
+    def _decide(self, rel_path: str, parent: str, name: str, is_dir: bool) -> bool:
+        """親ディレクトリのスタックを優先度の高い順に評価"""
+        for rule_set in reversed(self._stack_for(parent)):
+            result = rule_set.match(rel_path, name, is_dir)
+            if result is not None:
+                return result
+        return False
 
     def is_ignored(self, file_path: Path) -> bool:
         """
@@ -209,29 +384,29 @@ class GitIgnoreMatcher:
         Returns:
             無視される場合True
         """
-        # プロジェクトルートからの相対パスを取得
-        try:
-            if file_path.is_absolute():
-                rel_path = file_path.relative_to(self.project_root)
-            else:
-                rel_path = file_path
-        except ValueError:
+        rel_path = self._relative(file_path)
+        if rel_path is None:
             # プロジェクトルート外のパスは無視しない
             return False
+        return self.is_ignored_relative(rel_path)
+
+    def is_ignored_relative(self, path_str: str) -> bool:
+        """
+        `/`区切りの相対パス文字列が.gitignoreで無視されるかどうかを判定
 
-        # パスを文字列に変換（スラッシュ区切りに統一）
-        path_str = str(rel_path).replace("\\", "/")
+        走査エンジンからPathオブジェクトを生成せずに呼び出すためのメソッドです。
+        親ディレクトリが除外されている場合は常に無視されます。
 
-        # パターンを順にチェック（後のパターンが優先）
-        result = False
-        for negated, pattern_str, compiled_regex in self.patterns:
-            if compiled_regex.search(path_str):
-                result = not negated
-                logger.debug(
-                    f"Pattern matched: {'!' if negated else ''}{pattern_str} -> {path_str}"
-                )
+        Args:
+            path_str: プロジェクトルートからの相対パス（`/`区切り）
 
-        return result
+        Returns:
+            無視される場合True
+        """
+        parent, _, name = path_str.rpartition("/")
+        if parent and self.should_exclude_dir_relative(parent):
+            return True
+        return self._decide(path_str, parent, name, is_dir=False)
 
     def should_exclude_dir(self, dir_path: Path) -> bool:
         """
@@ -243,23 +418,42 @@ class GitIgnoreMatcher:
         Returns:
             除外すべき場合True
         """
-        # ディレクトリ名だけでチェック（パス全体もチェック）
-        try:
-            if dir_path.is_absolute():
-                rel_path = dir_path.relative_to(self.project_root)
-            else:
-                rel_path = dir_path
-        except ValueError:
+        rel_path = self._relative(dir_path)
+        if rel_path is None:
             return False
+        return self.should_exclude_dir_relative(rel_path)
+
+    def should_exclude_dir_relative(self, path_str: str) -> bool:
+        """
+        `/`区切りの相対パス文字列のディレクトリを除外すべきかどうかを判定
 
-        path_str = str(rel_path).replace("\\", "/")
+        判定結果はディレクトリごとにメモ化され、祖先が除外されている場合も除外されます。
 
-        # ディレクトリパターンまたはパス全体がマッチするかチェック
-        for negated, _pattern_str, compiled_regex in self.patterns:
-            if compiled_regex.search(path_str) or compiled_regex.search(path_str + "/"):
-                return not negated
+        Args:
+            path_str: プロジェクトルートからの相対パス（`/`区切り）
 
-        return False
+        Returns:
+            除外すべき場合True
+        """
+        decision = self._dir_decisions.get(path_str)
+        if decision is not None:
+            return decision
+
+        parent, _, name = path_str.rpartition("/")
+        decision = (bool(parent) and self.should_exclude_dir_relative(parent)) or self._decide(
+            path_str, parent, name, is_dir=True
+        )
+        self._dir_decisions[path_str] = decision
+        return decision
+
+    def _relative(self, path: Path) -> str | None:
+        """パスをプロジェクトルートからの`/`区切りの相対パスに変換"""
+        try:
+            rel_path = path.relative_to(self.project_root) if path.is_absolute() else path
+        except ValueError:
+            return None
+        rel_str = rel_path.as_posix()
+        return "" if rel_str == "." else rel_str
 
 
 def load_gitignore_patterns(project_root: Path) -> GitIgnoreMatcher | None:
@@ -270,10 +464,10 @@ def load_gitignore_patterns(project_root: Path) -> GitIgnoreMatcher | None:
         project_root: プロジェクトルートディレクトリ
 
     Returns:
-        GitIgnoreMatcherインスタンス、またはNone（.gitignoreが存在しない場合）
+        GitIgnoreMatcherインスタンス、またはNone（.gitignoreも.gitも存在しない場合）
     """
-    gitignore_path = project_root / ".gitignore"
-    if not gitignore_path.exists():
+    project_root = Path(project_root)
+    if not (project_root / GITIGNORE_FILE_NAME).exists() and not (project_root / ".git").exists():
         return None
 
-    return GitIgnoreMatcher(project_root, gitignore_path)
+    return GitIgnoreMatcher(project_root, project_root / GITIGNORE_FILE_NAME)
@@ -0,0 +1,81 @@
+"""
+リモートキャッシュを使用するLLMクライアント
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from ..logger import get_logger
+from ..remote_cache import RemoteCacheClient
+
+logger = get_logger("llm_clients")
+
+_REMOTE_NAMESPACE = "llm"
+
+
+class RemoteCachedLLMClient:
+    """
+    LLMの応答をリモートキャッシュで共有するクライアント
+
+    プロバイダー・モデル・生成パラメータ・プロンプトのハッシュをキーとして応答を共有します。
+    `generate`以外の属性（Outlinesのモデル作成に使用する属性など）は元のクライアントに委譲します。
+    """
+
+    def __init__(self, client: Any, remote: RemoteCacheClient):
+        """
+        初期化
+
+        Args:
+            client: LLMクライアント
+            remote: リモートキャッシュのクライアント
+        """
+        self._client = client
+        self._remote = remote
+
+    def generate(self, prompt: str, system_prompt: str | None = None, **kwargs) -> str | None:
+        """
+        テキストを生成（リモートキャッシュにある場合はキャッシュの応答を返す）
+
+        Args:
+            prompt: プロンプト
+            system_prompt: システムプロンプト（オプション）
+            **kwargs: その他のパラメータ
+
+        Returns:
+            生成されたテキスト（エラー時はNone）
+        """
+        key = self._cache_key(prompt, system_prompt, kwargs)
+        cached = self._remote.get(_REMOTE_NAMESPACE, key)
+        if cached is not None:
+            logger.debug("LLMの応答をリモートキャッシュから取得しました")
+            return cached.decode("utf-8")
+
+        response = self._client.generate(prompt, system_prompt=system_prompt, **kwargs)
+        if response:
+            # LLMの呼び出しは数が少なく時間がかかるため、まとめずにすぐ送信する
+            self._remote.put(_REMOTE_NAMESPACE, key, response.encode("utf-8"))
+            self._remote.flush(_REMOTE_NAMESPACE)
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def _cache_key(self, prompt: str, system_prompt: str | None, kwargs: dict[str, Any]) -> str:
+        """応答のキャッシュキー（応答に影響する設定とプロンプトのハッシュ）"""
+        config = getattr(self._client, "config", None)
+        payload = json.dumps(
+            [
+                getattr(config, "provider", None) or getattr(self._client, "provider", None),
+                getattr(self._client, "model", None) or getattr(config, "model", None),
+                getattr(config, "temperature", None),
+                getattr(config, "max_tokens", None),
+                system_prompt,
+                prompt,
+                kwargs,
+            ],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return "sha256:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
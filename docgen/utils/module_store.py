@@ -0,0 +1,181 @@
+"""解析済みモジュールのストア
+
+1回の実行（`ScanSession`）の間、Pythonファイルのソース・行オフセット・ASTを
+内容のハッシュをキーとして保持し、API解析（`PythonParser`）・実装検証・RAGチャンク化・
+構造分析で共有します。各ファイルは実行中に一度だけ読み込み・パースされます。
+"""
+
+import ast
+from dataclasses import dataclass, field
+import hashlib
+import os
+from pathlib import Path
+import threading
+
+from .source_index import LineIndex
+
+# シンボルとして扱う定義のノード
+_DEFINITION_TYPES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+Definition = ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef
+
+
+def _content_hash(source: str) -> str:
+    """ソースのハッシュ（内容が同じファイルは同じモジュールを共有する）"""
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=20).hexdigest()
+
+
+@dataclass(slots=True, eq=False)
+class ParsedModule:
+    """パース済みのPythonモジュール
+
+    AST・行・行オフセット・定義のリストは初回アクセス時に作成します。
+
+    Attributes:
+        content_hash: ソースのハッシュ
+        source: ソース（改行はLFに正規化済み）
+        filename: 最初にパースしたファイルのパス（SyntaxErrorのメッセージに使用）
+    """
+
+    content_hash: str
+    source: str
+    filename: str = "<unknown>"
+    _parsed: bool = field(default=False, init=False, repr=False)
+    _tree: ast.Module | None = field(default=None, init=False, repr=False)
+    _error: SyntaxError | None = field(default=None, init=False, repr=False)
+    _lines: list[str] | None = field(default=None, init=False, repr=False)
+    _line_index: LineIndex | None = field(default=None, init=False, repr=False)
+    _definitions: list[Definition] | None = field(default=None, init=False, repr=False)
+
+    def _parse(self) -> None:
+        """ASTにパース（構文エラーはerrorに保持する）"""
+        if self._parsed:
+            return
+        try:
+            self._tree = ast.parse(self.source, filename=self.filename)
+        except SyntaxError as e:
+            self._error = e
+        self._parsed = True
+
+    @property
+    def tree(self) -> ast.Module | None:
+        """AST（構文エラーの場合はNone）"""
+        self._parse()
+        return self._tree
+
+    @property
+    def error(self) -> SyntaxError | None:
+        """パース時の構文エラー（パースできた場合はNone）"""
+        self._parse()
+        return self._error
+
+    @property
+    def lines(self) -> list[str]:
+        """ソースの行のリスト（改行を含まない）"""
+        if self._lines is None:
+            self._lines = self.source.splitlines()
+        return self._lines
+
+    @property
+    def line_index(self) -> LineIndex:
+        """文字位置と行番号の対応"""
+        if self._line_index is None:
+            self._line_index = LineIndex(self.source)
+        return self._line_index
+
+    @property
+    def line_offsets(self) -> list[int]:
+        """各行の先頭の文字オフセット（`line_offsets[lineno - 1]`が`lineno`行目の先頭）"""
+        return self.line_index.offsets
+
+    @property
+    def definitions(self) -> list[Definition]:
+        """クラス・関数・非同期関数の定義ノード（`ast.walk`の順、構文エラーの場合は空）"""
+        if self._definitions is None:
+            tree = self.tree
+            self._definitions = (
+                [node for node in ast.walk(tree) if isinstance(node, _DEFINITION_TYPES)]
+                if tree is not None
+                else []
+            )
+        return self._definitions
+
+
+class ModuleStore:
+    """実行中に共有する解析済みモジュールのストア
+
+    モジュールは内容のハッシュをキーとして保持し、ファイルパスからはstat（更新時刻・サイズ）が
+    変わっていない限り読み込み済みのモジュールを返します。スレッドセーフです。
+    プロセスプールのワーカーに転送した場合は空のストアになります（ワーカーでは共有しない）。
+    """
+
+    def __init__(self):
+        """初期化"""
+        self._lock = threading.Lock()
+        # 内容のハッシュ -> モジュール
+        self._modules: dict[str, ParsedModule] = {}
+        # ファイルパス -> ((更新時刻, サイズ), モジュール)
+        self._paths: dict[str, tuple[tuple[int, int], ParsedModule]] = {}
+
+    def __reduce__(self):
+        return (type(self), ())
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def get(self, file_path: Path, max_bytes: int = 0) -> ParsedModule | None:
+        """
+        ファイルのモジュールを取得（読み込んでいない場合は読み込む）
+
+        Args:
+            file_path: ファイルパス
+            max_bytes: サイズ上限（超える場合は読み込まずにNoneを返す、0以下の場合は無制限）
+
+        Returns:
+            ParsedModule（サイズ上限を超える場合はNone）
+
+        Raises:
+            OSError: ファイルを読み込めない場合
+            UnicodeDecodeError: UTF-8としてデコードできない場合
+        """
+        path = os.fspath(file_path)
+        stat = os.stat(path)
+        if 0 < max_bytes < stat.st_size:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._paths.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        module = self.from_source(source, path)
+        with self._lock:
+            self._paths[path] = (key, module)
+        return module
+
+    def from_source(self, source: str, filename: str = "<unknown>") -> ParsedModule:
+        """
+        ソースのモジュールを取得（同じ内容のモジュールがある場合はそれを返す）
+
+        Args:
+            source: ソース
+            filename: ファイルパス（構文エラーのメッセージに使用）
+
+        Returns:
+            ParsedModule
+        """
+        content_hash = _content_hash(source)
+        with self._lock:
+            module = self._modules.get(content_hash)
+            if module is None:
+                module = ParsedModule(content_hash, source, filename)
+                self._modules[content_hash] = module
+        return module
+
+    def clear(self) -> None:
+        """保持しているモジュールを破棄"""
+        with self._lock:
+            self._modules.clear()
+            self._paths.clear()
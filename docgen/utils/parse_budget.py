@@ -0,0 +1,48 @@
+"""
+解析の時間の上限モジュール
+
+ファイルごとの解析の時間の上限（`parse.file_timeout`）を現在のスレッドに設定し、
+正規表現・字句解析ベースのパーサーがループの途中で超過を確認できるようにします。
+Pythonのスレッドは外部から停止できないため、上限はパーサーが`check_deadline`を
+呼び出す位置で適用されます。プロセスプールで解析する場合は、確認位置で止まらない解析も
+親プロセスがワーカーを停止して打ち切ります（`BaseParser._parse_in_processes`）。
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import threading
+import time
+
+from .exceptions import ParseTimeoutError
+
+_local = threading.local()
+
+
+@contextmanager
+def parse_deadline(timeout: float) -> Iterator[None]:
+    """
+    現在のスレッドに解析の時間の上限を設定
+
+    Args:
+        timeout: 上限（秒、0以下の場合は無制限）
+    """
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = (time.monotonic() + timeout, timeout) if timeout > 0 else None
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def check_deadline() -> None:
+    """
+    時間の上限を超えていないか確認
+
+    Raises:
+        ParseTimeoutError: 現在のスレッドの時間の上限を超えた場合
+    """
+    deadline = getattr(_local, "deadline", None)
+    if deadline is not None and time.monotonic() > deadline[0]:
+        raise ParseTimeoutError(
+            f"解析が時間の上限（{deadline[1]:g}秒）を超えました", timeout=deadline[1]
+        )
@@ -0,0 +1,247 @@
+"""
+リモートキャッシュモジュール
+
+解析結果・埋め込み・LLMの応答を、内容のハッシュをキーとして複数の開発者のhookやCIで
+共有するためのクライアントです。ローカルのキャッシュにない値をリモートから読み込み
+（read-through）、新しく計算した値はまとめて書き込みます（write-back）。
+
+最初のリクエストの前に`/v1/health`でサーバーのプロトコルのバージョンを1度だけ確認します。
+バージョンが異なる・サーバーに接続できない・タイムアウトした場合は警告を1度だけ出力し、
+以降はプロセスの終了までリモートを使用せずローカルのキャッシュのみで動作します。
+
+プロトコル（JSON over HTTP、値はbase64でエンコードしたバイト列）:
+
+- `GET /v1/health` → `{"status": "ok", "protocol": 1}`
+- `POST /v1/<namespace>/get` `{"keys": [...]}` → `{"values": {key: value}}`（ないキーは含めない）
+- `POST /v1/<namespace>/put` `{"values": {key: value}}` → `{"stored": 件数}`
+
+namespaceは`NAMESPACES`のいずれか。参照実装のサーバーは`cache_server`モジュールにあります。
+"""
+
+import atexit
+import base64
+import os
+import threading
+from typing import Any
+
+import httpx
+
+from .logger import get_logger
+
+logger = get_logger("cache")
+
+PROTOCOL_VERSION = 1
+# キャッシュの種類: 解析結果, 埋め込み, LLMの応答
+NAMESPACES = ("parse", "embeddings", "llm")
+
+DEFAULT_TIMEOUT = 2.0
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_TOKEN_ENV = "DOCGEN_CACHE_TOKEN"
+
+
+class RemoteCacheClient:
+    """リモートキャッシュのクライアント（スレッドセーフ）"""
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        token: str | None = None,
+        read_only: bool = False,
+    ):
+        """
+        初期化
+
+        Args:
+            url: サーバーのURL（例: `http://cache.example.com:8765`）
+            timeout: 1回のリクエストのタイムアウト（秒）
+            batch_size: 1回のリクエストで送受信するキーの最大数
+            token: 認証トークン（`Authorization: Bearer`で送信）
+            read_only: 読み込みのみ行い、書き込まないかどうか
+        """
+        self.url = url.rstrip("/")
+        self.batch_size = max(1, batch_size)
+        self.read_only = read_only
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._client = httpx.Client(base_url=self.url, timeout=timeout, headers=headers)
+        self._available = True
+        # サーバーのプロトコルのバージョンを確認したかどうか
+        self._checked = False
+        # 書き込み待ちの値（namespace → キー → 値）
+        self._pending: dict[str, dict[str, bytes]] = {namespace: {} for namespace in NAMESPACES}
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """サーバーを使用できるかどうか（接続に失敗した後はFalse）"""
+        return self._available
+
+    def get_many(self, namespace: str, keys: list[str]) -> dict[str, bytes]:
+        """
+        複数のキーの値をまとめて取得
+
+        Args:
+            namespace: キャッシュの種類
+            keys: キーのリスト
+
+        Returns:
+            キー → 値（サーバーにない・接続できない場合は含めない）
+        """
+        found: dict[str, bytes] = {}
+        self._check_server()
+        for start in range(0, len(keys), self.batch_size):
+            if not self._available:
+                break
+            response = self._post(
+                f"/v1/{namespace}/get", {"keys": keys[start : start + self.batch_size]}
+            )
+            if response is None:
+                break
+            try:
+                for key, value in response.get("values", {}).items():
+                    found[key] = base64.b64decode(value)
+            except (AttributeError, TypeError, ValueError) as e:
+                self._disable(f"不正な応答です: {e}")
+                break
+        return found
+
+    def get(self, namespace: str, key: str) -> bytes | None:
+        """キーの値を取得（ない場合はNone）"""
+        return self.get_many(namespace, [key]).get(key)
+
+    def put(self, namespace: str, key: str, value: bytes) -> None:
+        """
+        値を書き込み待ちに追加（`batch_size`件たまるか`flush`を呼ぶとまとめて送信）
+
+        Args:
+            namespace: キャッシュの種類
+            key: キー
+            value: 値
+        """
+        if self.read_only or not self._available:
+            return
+        with self._lock:
+            pending = self._pending[namespace]
+            pending[key] = value
+            full = len(pending) >= self.batch_size
+        if full:
+            self.flush(namespace)
+
+    def flush(self, namespace: str | None = None) -> None:
+        """
+        書き込み待ちの値を送信
+
+        Args:
+            namespace: 送信するキャッシュの種類（Noneの場合はすべて）
+        """
+        for name in (namespace,) if namespace else NAMESPACES:
+            with self._lock:
+                pending, self._pending[name] = self._pending[name], {}
+            if not pending:
+                continue
+            self._check_server()
+            if not self._available:
+                continue
+            items = list(pending.items())
+            for start in range(0, len(items), self.batch_size):
+                values = {
+                    key: base64.b64encode(value).decode("ascii")
+                    for key, value in items[start : start + self.batch_size]
+                }
+                if self._post(f"/v1/{name}/put", {"values": values}) is None:
+                    break
+
+    def close(self) -> None:
+        """書き込み待ちの値を送信して接続を閉じる"""
+        self.flush()
+        self._client.close()
+
+    def _check_server(self) -> None:
+        """サーバーのプロトコルのバージョンを確認（初回のみ、異なる場合はリモートを無効にする）"""
+        with self._lock:
+            if self._checked:
+                return
+            self._checked = True
+            try:
+                response = self._client.get("/v1/health")
+                response.raise_for_status()
+                health = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                self._disable(str(e) or type(e).__name__)
+                return
+            if not isinstance(health, dict) or health.get("status") != "ok":
+                self._disable(f"不正な応答です: {health!r}")
+            elif health.get("protocol") != PROTOCOL_VERSION:
+                self._disable(
+                    f"プロトコルのバージョンが異なります: "
+                    f"{health.get('protocol')!r}（クライアント: {PROTOCOL_VERSION}）"
+                )
+
+    def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any] | None:
+        """リクエストを送信（失敗した場合はリモートを無効にしてNone）"""
+        try:
+            response = self._client.post(path, json=payload)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            self._disable(str(e) or type(e).__name__)
+            return None
+
+    def _disable(self, reason: str) -> None:
+        """以降のリクエストを行わない（警告は1度のみ）"""
+        if self._available:
+            self._available = False
+            logger.warning(
+                f"リモートキャッシュを使用できないため、ローカルのキャッシュのみを使用します: "
+                f"{self.url} ({reason})"
+            )
+
+
+# URLごとに共有するクライアント（接続に失敗した状態もプロセス内で共有する）
+_clients: dict[str, RemoteCacheClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_remote_cache(config: dict[str, Any]) -> RemoteCacheClient | None:
+    """
+    設定からリモートキャッシュのクライアントを取得（`cache.remote`）
+
+    同じURLのクライアントはプロセス内で共有し、終了時に書き込み待ちの値を送信します。
+
+    Args:
+        config: 設定辞書（`cache`セクションを使用）
+
+    Returns:
+        クライアント（`cache.remote.url`が設定されていない・キャッシュが無効な場合はNone）
+    """
+    cache_config = config.get("cache", {})
+    remote_config = cache_config.get("remote", {})
+    url = remote_config.get("url", "")
+    if not url or not cache_config.get("enabled", True):
+        return None
+
+    with _clients_lock:
+        client = _clients.get(url)
+        if client is None:
+            token_env = remote_config.get("token_env", DEFAULT_TOKEN_ENV)
+            client = RemoteCacheClient(
+                url,
+                timeout=remote_config.get("timeout", DEFAULT_TIMEOUT),
+                batch_size=remote_config.get("batch_size", DEFAULT_BATCH_SIZE),
+                token=os.environ.get(token_env) if token_env else None,
+                read_only=remote_config.get("read_only", False),
+            )
+            if not _clients:
+                atexit.register(_close_clients)
+            _clients[url] = client
+    return client
+
+
+def _close_clients() -> None:
+    """すべてのクライアントの書き込み待ちの値を送信して閉じる（プロセスの終了時）"""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
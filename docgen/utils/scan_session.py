@@ -0,0 +1,217 @@
+"""走査セッションモジュール
+
+1回の実行（`DocGen.generate_documents`）の間、プロジェクトツリーの走査結果を
+言語検出・API生成・構造分析・実装検証・RAGチャンク化・アーキテクチャ検出で共有します。
+各サブシステムは独自に`os.walk`する代わりに、拡張子・深さ・プレフィックスで
+絞り込んだビュー（`ScanView`）を使用します。
+Pythonファイルのソース・ASTは`ScanSession.modules`（`ModuleStore`）で共有し、
+各ファイルを一度だけ読み込み・パースします。
+"""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from .file_classifier import FileClassifier
+from .file_scanner import UnifiedFileScanner, create_unified_scanner
+from .logger import get_logger
+from .module_store import ModuleStore
+
+logger = get_logger(__name__)
+
+
+class ScanView:
+    """走査結果を絞り込んだビュー
+
+    走査結果そのものは`ScanSession`が保持し、ビューは条件に一致するファイルを
+    初回アクセス時に抽出してキャッシュします。
+    """
+
+    def __init__(
+        self,
+        scanner: UnifiedFileScanner,
+        extensions: Iterable[str] | None = None,
+        exclude_dirs: Iterable[str] | None = None,
+        prefix: str = "",
+        max_depth: int | None = None,
+    ):
+        """
+        初期化
+
+        Args:
+            scanner: 走査結果を保持するスキャナー
+            extensions: 対象とする拡張子（Noneの場合はすべて）
+            exclude_dirs: 追加で除外するディレクトリ名（パスのいずれかの階層に一致した場合に除外）
+            prefix: 対象とするディレクトリの相対パス（`/`区切り、空文字の場合はルート全体）
+            max_depth: prefixからの最大深度（0はprefix直下のファイルのみ、Noneの場合は無制限）
+        """
+        self._scanner = scanner
+        self.extensions = set(extensions) if extensions is not None else None
+        self.exclude_dirs = set(exclude_dirs or ())
+        self.prefix = prefix.strip("/")
+        self.max_depth = max_depth
+        self._files: list[tuple[Path, Path]] | None = None
+
+    def files(self) -> list[tuple[Path, Path]]:
+        """
+        条件に一致するファイルを取得
+
+        Returns:
+            (絶対パス, 相対パス) のタプルのリスト（走査順）
+        """
+        if self._files is None:
+            self._files = self._filter()
+        return self._files
+
+    def __iter__(self) -> Iterator[tuple[Path, Path]]:
+        return iter(self.files())
+
+    def __len__(self) -> int:
+        return len(self.files())
+
+    def _filter(self) -> list[tuple[Path, Path]]:
+        """走査結果から条件に一致するファイルを抽出"""
+        if self.extensions is None:
+            candidates = self._scanner.get_all_files()
+        else:
+            candidates = self._scanner.get_files_by_extensions(self.extensions)
+
+        prefix_parts = tuple(self.prefix.split("/")) if self.prefix else ()
+        prefix_len = len(prefix_parts)
+        exclude_dirs = self.exclude_dirs
+        max_depth = self.max_depth
+
+        if not prefix_parts and not exclude_dirs and max_depth is None:
+            return list(candidates)
+
+        result = []
+        for file_path, rel_path in candidates:
+            dir_parts = rel_path.parts[:-1]
+            if prefix_parts and dir_parts[:prefix_len] != prefix_parts:
+                continue
+            if max_depth is not None and len(dir_parts) - prefix_len > max_depth:
+                continue
+            if exclude_dirs and not exclude_dirs.isdisjoint(dir_parts):
+                continue
+            result.append((file_path, rel_path))
+        return result
+
+
+class ScanSession:
+    """1回の実行で共有するプロジェクト走査セッション
+
+    除外設定（`exclude.directories`・`exclude.use_gitignore`）と走査設定
+    （`scan.snapshot`・`scan.backend`・`scan.untracked`・`scan.workers`）から
+    `create_unified_scanner`でセッション専用のスキャナーを作成し、
+    プロジェクトツリーを一度だけ走査します。走査結果はセッションの間のみ保持し、
+    次の実行では新しいセッションで.gitignoreなどを読み込み直します。
+    """
+
+    def __init__(self, project_root: Path, config: dict[str, Any] | None = None):
+        """
+        初期化
+
+        Args:
+            project_root: プロジェクトルートディレクトリ
+            config: 設定辞書
+        """
+        config = config or {}
+        exclude_config = config.get("exclude", {})
+        scan_config = config.get("scan", {})
+
+        self.project_root = Path(project_root).resolve()
+        self.exclude_directories: list[str] = list(exclude_config.get("directories", []))
+        self.scanner = create_unified_scanner(
+            self.project_root,
+            exclude_dirs=set(self.exclude_directories),
+            use_gitignore=exclude_config.get("use_gitignore", True),
+            snapshot=scan_config.get("snapshot", False),
+            backend=scan_config.get("backend", "walk"),
+            include_untracked=scan_config.get("untracked", True),
+            workers=scan_config.get("workers", 1),
+        )
+        # 解析済みモジュール（API解析・実装検証・RAGチャンク化・構造分析で共有）
+        self.modules = ModuleStore()
+
+    @property
+    def fingerprint(self) -> str | None:
+        """走査設定のフィンガープリント"""
+        return self.scanner.fingerprint
+
+    @property
+    def classifier(self) -> FileClassifier:
+        """走査したファイルのサイズ・種類の判定（サブシステム間で共有）"""
+        return self.scanner.classifier
+
+    def scan(self) -> dict[str, Any]:
+        """
+        プロジェクトを走査（走査済みの場合はキャッシュを返す）
+
+        Returns:
+            `UnifiedFileScanner.scan_once`の結果
+        """
+        return self.scanner.scan_once()
+
+    def view(
+        self,
+        extensions: Iterable[str] | None = None,
+        exclude_dirs: Iterable[str] | None = None,
+        prefix: str = "",
+        max_depth: int | None = None,
+    ) -> ScanView:
+        """
+        絞り込んだビューを作成
+
+        Args:
+            extensions: 対象とする拡張子（Noneの場合はすべて）
+            exclude_dirs: 追加で除外するディレクトリ名
+            prefix: 対象とするディレクトリの相対パス（`/`区切り）
+            max_depth: prefixからの最大深度
+
+        Returns:
+            ScanViewインスタンス
+        """
+        return ScanView(
+            self.scanner,
+            extensions=extensions,
+            exclude_dirs=exclude_dirs,
+            prefix=prefix,
+            max_depth=max_depth,
+        )
+
+    def list_dir(self, rel_dir: str = "") -> tuple[list[str], list[str]]:
+        """
+        走査済みディレクトリの直下のエントリを取得
+
+        Args:
+            rel_dir: プロジェクトルートからの相対パス（`/`区切り、ルートは空文字）
+
+        Returns:
+            (サブディレクトリ名のリスト, ファイル名のリスト)
+        """
+        return self.scanner.get_directory_listing(rel_dir.strip("/"))
+
+    def relative_dir(self, directory: Path) -> str | None:
+        """
+        ディレクトリのパスをセッションの相対パスに変換
+
+        Args:
+            directory: ディレクトリのパス（絶対パスまたはカレントディレクトリからの相対パス）
+
+        Returns:
+            `/`区切りの相対パス（ルートは空文字）、プロジェクト外の場合はNone
+        """
+        try:
+            rel = Path(directory).resolve().relative_to(self.project_root)
+        except (OSError, ValueError):
+            return None
+        return "" if rel == Path(".") else rel.as_posix()
+
+    def directories(self) -> list[str]:
+        """
+        走査したディレクトリの相対パスを取得
+
+        Returns:
+            相対パスのリスト（走査順）
+        """
+        return self.scanner.get_directories()
@@ -0,0 +1,145 @@
+"""ファイルシステムスナップショットモジュール
+
+ディレクトリごとのmtimeとエントリ一覧を`docgen/.cache/`に永続化し、
+次回の走査ではmtimeが変化したディレクトリだけを再列挙します。
+"""
+
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from .fs_walker import scandir_listing
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# mtimeの粒度による取りこぼしを防ぐための猶予（ナノ秒）
+# 記録直前に変更されたディレクトリは、同じmtimeのまま再変更される可能性がある
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class ScanSnapshot:
+    """ディレクトリ単位の列挙結果を永続化するスナップショット
+
+    各ディレクトリについて、mtime（ナノ秒）・サブディレクトリ名・ファイル名を保持します。
+    ディレクトリのmtimeはエントリの追加・削除・リネーム時にのみ更新されるため、
+    mtimeが一致する場合は前回の列挙結果をそのまま再利用できます。
+    """
+
+    VERSION = 1
+    DEFAULT_FILE_NAME = "scan_snapshot.json"
+
+    def __init__(self, project_root: Path, snapshot_path: Path | None = None):
+        """
+        初期化
+
+        Args:
+            project_root: プロジェクトルートディレクトリ
+            snapshot_path: スナップショットファイルのパス（Noneの場合は`docgen/.cache/scan_snapshot.json`）
+        """
+        self.project_root = Path(project_root).resolve()
+        self.snapshot_path = snapshot_path or (
+            self.project_root / "docgen" / ".cache" / self.DEFAULT_FILE_NAME
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._visited: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        # 並列走査（`scan.workers`）ではlist_directoryが複数スレッドから呼び出される
+        self._stats_lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """スナップショットファイルを読み込む"""
+        if not self.snapshot_path.exists():
+            return
+
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.debug(f"スナップショットの読み込みに失敗しました: {e}")
+            return
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self.VERSION
+            or data.get("project_root") != str(self.project_root)
+        ):
+            logger.debug("スナップショットの形式が異なるため破棄します")
+            return
+
+        directories = data.get("directories")
+        if isinstance(directories, dict):
+            self._entries = directories
+
+    def list_directory(self, dir_path: str, rel_dir: str) -> tuple[list[str], list[str]]:
+        """
+        ディレクトリのエントリを取得（mtimeが一致すればスナップショットから再利用）
+
+        Args:
+            dir_path: ディレクトリの絶対パス
+            rel_dir: プロジェクトルートからの相対パス（ルートは空文字）
+
+        Returns:
+            (サブディレクトリ名のリスト, ファイル名のリスト)
+            シンボリックリンクはどちらにも含まれません。
+
+        Raises:
+            OSError: ディレクトリにアクセスできない場合
+        """
+        mtime_ns = os.stat(dir_path).st_mtime_ns
+        cached = self._entries.get(rel_dir)
+        if cached is not None and cached.get("mtime_ns") == mtime_ns:
+            with self._stats_lock:
+                self.hits += 1
+            self._visited[rel_dir] = cached
+            return list(cached["dirs"]), list(cached["files"])
+
+        with self._stats_lock:
+            self.misses += 1
+        dirs, files = scandir_listing(dir_path)
+
+        # 記録直前に変更されたディレクトリは次回必ず再列挙する
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            recorded_mtime: int | None = None
+        else:
+            recorded_mtime = mtime_ns
+        self._visited[rel_dir] = {"mtime_ns": recorded_mtime, "dirs": dirs, "files": files}
+        return list(dirs), list(files)
+
+    def reset_stats(self) -> None:
+        """ヒット/ミス数をリセット（走査開始時に呼び出す）"""
+        self.hits = 0
+        self.misses = 0
+
+    def save(self) -> None:
+        """今回の走査で訪問したディレクトリのみを保存（存在しないディレクトリは破棄）"""
+        data = {
+            "version": self.VERSION,
+            "project_root": str(self.project_root),
+            "directories": self._visited,
+        }
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.snapshot_path)
+            logger.debug(f"スナップショットを保存しました: {len(self._visited)} ディレクトリ")
+        except OSError as e:
+            logger.warning(f"スナップショットの保存に失敗しました: {e}")
+        self._entries = self._visited
+        self._visited = {}
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        ヒット/ミス数を取得
+
+        Returns:
+            {'hits': 再利用したディレクトリ数, 'misses': 再列挙したディレクトリ数}
+        """
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,96 @@
+"""ソースの位置のインデックス
+
+正規表現ベースのパーサー・チャンク化で、ソース中の文字位置から行番号を、開き括弧から
+対応する閉じ括弧を二分探索で求めます。マッチごとに先頭からの改行を数えたり
+（`content[:pos].count("\\n")`）、1文字ずつ括弧を数えたりすると、シンボルの多い
+大きなファイルでは二乗の時間がかかるため、ファイルごとに一度だけインデックスを作成して
+使い回します。
+"""
+
+from bisect import bisect_left, bisect_right
+import re
+
+_BRACE_PATTERN = re.compile(r"[{}]")
+
+
+class LineIndex:
+    """文字位置と行番号の対応
+
+    Attributes:
+        offsets: 各行の先頭の文字位置（`offsets[lineno - 1]`が`lineno`行目の先頭）
+    """
+
+    __slots__ = ("offsets",)
+
+    def __init__(self, text: str):
+        """
+        初期化
+
+        Args:
+            text: ソース（改行はLF）
+        """
+        offsets = [0]
+        find = text.find
+        pos = find("\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = find("\n", pos + 1)
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def line_of(self, pos: int) -> int:
+        """
+        文字位置の行番号を取得
+
+        Args:
+            pos: 文字位置（0始まり）
+
+        Returns:
+            行番号（1始まり、`text[:pos].count("\\n") + 1`と同じ）
+        """
+        return bisect_right(self.offsets, pos)
+
+
+class BraceIndex:
+    """波括弧の位置
+
+    Attributes:
+        positions: ソース中の`{`・`}`の位置（昇順）
+    """
+
+    __slots__ = ("_text", "positions")
+
+    def __init__(self, text: str):
+        """
+        初期化
+
+        Args:
+            text: ソース
+        """
+        self._text = text
+        self.positions = [match.start() for match in _BRACE_PATTERN.finditer(text)]
+
+    def find_block_end(self, start: int) -> int:
+        """
+        開始位置以降の最初の`{`に対応する`}`を見つける
+
+        Args:
+            start: 開始位置
+
+        Returns:
+            対応する`}`の位置（見つからない場合は-1）
+        """
+        text = self._text
+        positions = self.positions
+        depth = 0
+        for i in range(bisect_left(positions, start), len(positions)):
+            pos = positions[i]
+            if text[pos] == "{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos
+        return -1
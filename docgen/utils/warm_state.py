@@ -0,0 +1,96 @@
+"""実行間で共有する状態モジュール
+
+`watch`サブコマンドのように同じプロセスでドキュメント生成を繰り返す場合に、
+走査結果（ディレクトリスナップショット）・パーサーキャッシュ・埋め込みモデル・
+ベクトルインデックスを実行間で保持し、毎回のコールドスタートを避けます。
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .cache import CacheManager
+from .logger import get_logger
+from .scan_session import ScanSession
+
+if TYPE_CHECKING:
+    from ..rag.embedder import Embedder
+    from ..rag.indexer import VectorIndexer
+
+logger = get_logger(__name__)
+
+
+class WarmState:
+    """実行間で保持するウォームな状態
+
+    埋め込みモデルとベクトルインデックスは初回アクセス時に作成します（RAGの依存関係が
+    インストールされていない環境でも、RAGを使用しなければインポートされません）。
+    """
+
+    def __init__(self, project_root: Path, config: dict[str, Any]):
+        """
+        初期化
+
+        Args:
+            project_root: プロジェクトルートディレクトリ
+            config: 設定辞書
+        """
+        self.project_root = Path(project_root).resolve()
+        self.config = config
+        self.scan_session = ScanSession(self.project_root, config)
+        self._cache_manager: CacheManager | None = None
+        self._embedder: Embedder | None = None
+        self._indexer: VectorIndexer | None = None
+
+    def refresh(self) -> None:
+        """
+        ファイルの変更後、次の実行で再走査するように走査結果を破棄
+
+        走査セッションを作り直すため、サブディレクトリの.gitignoreの変更も反映されます。
+        スナップショットモードでは、変更のないディレクトリの再列挙をスナップショットファイルで
+        省略できます。
+        """
+        from ..detectors.detector_patterns import DetectorPatterns
+
+        self.scan_session = ScanSession(self.project_root, self.config)
+        DetectorPatterns.clear_cache(self.project_root)
+
+    @property
+    def cache_manager(self) -> CacheManager | None:
+        """パーサーキャッシュ（`cache.enabled`が無効の場合はNone）"""
+        if not self.config.get("cache", {}).get("enabled", True):
+            return None
+        if self._cache_manager is None:
+            self._cache_manager = CacheManager.from_config(self.project_root, self.config)
+        return self._cache_manager
+
+    @property
+    def embedder(self) -> "Embedder":
+        """埋め込み生成器（モデルは一度だけ読み込まれる）"""
+        if self._embedder is None:
+            from ..rag.embedder import Embedder
+            from .remote_cache import get_remote_cache
+
+            self._embedder = Embedder(
+                self.config.get("rag", {}), remote_cache=get_remote_cache(self.config)
+            )
+        return self._embedder
+
+    def get_indexer(self, embedding_dim: int) -> "VectorIndexer":
+        """
+        ベクトルインデックスを取得
+
+        Args:
+            embedding_dim: 埋め込みベクトルの次元数
+
+        Returns:
+            VectorIndexerインスタンス（次元数が変わった場合は作り直す）
+        """
+        if self._indexer is None or self._indexer.embedding_dim != embedding_dim:
+            from ..rag.indexer import VectorIndexer
+
+            self._indexer = VectorIndexer(
+                index_dir=self.project_root / "docgen" / "index",
+                embedding_dim=embedding_dim,
+                config=self.config.get("rag", {}),
+            )
+        return self._indexer
@@ -16,6 +16,7 @@ from ..utils.logger import get_logger
 
 if TYPE_CHECKING:
     from ..models import APIInfo
+    from ..utils.scan_session import ScanSession
 
 logger = get_logger("implementation_validator")
 
@@ -87,6 +88,7 @@ class ImplementationValidator:
         languages: list[str] | None = None,
         parsers: list[BaseParser] | None = None,
         config: dict[str, Any] | None = None,
+        scan_session: "ScanSession | None" = None,
     ):
         """
         初期化
@@ -96,17 +98,23 @@ class ImplementationValidator:
             languages: 検出された言語のリスト（Noneの場合は自動検出）
             parsers: パーサーのリスト（Noneの場合は自動生成）
             config: 設定辞書
+            scan_session: 走査セッション（指定された場合は走査結果を再利用）
         """
         self.project_root = project_root
         self.config = config or {}
+        self.scan_session = scan_session
         self.implemented_apis: dict[str, dict[str, Any]] = {}
         self._api_index: dict[str, set[str]] = {}  # {entity_type: {name1, name2, ...}}
 
-        # パーサーの初期化
+        # パーサーの初期化（走査セッションがある場合はPythonのソース・ASTを他の処理と共有する）
+        module_store = scan_session.modules if scan_session is not None else None
+        backend = self.config.get("parse", {}).get("backend", "regex")
         if parsers is not None:
             self.parsers = parsers
         elif languages is not None:
-            self.parsers = ParserFactory.create_parsers(project_root, languages)
+            self.parsers = ParserFactory.create_parsers(
+                project_root, languages, module_store=module_store, backend=backend
+            )
         else:
             # 言語を自動検出
             from ..language_detector import LanguageDetector
@@ -114,7 +122,9 @@ class ImplementationValidator:
             detector = LanguageDetector(project_root)
             detected_languages = detector.detect_languages()
             languages = [lang.name for lang in detected_languages]
-            self.parsers = ParserFactory.create_parsers(project_root, languages)
+            self.parsers = ParserFactory.create_parsers(
+                project_root, languages, module_store=module_store, backend=backend
+            )
 
         # 検証設定
         validation_config = self.config.get("validation", {})
@@ -146,26 +156,32 @@ class ImplementationValidator:
 
             exclude_dirs = list(DetectorPatterns.EXCLUDE_DIRS) + ["venv"]
 
-        # .gitignoreマッチャー
+        # .gitignoreマッチャー（走査セッションは.gitignore適用済みのため不要）
         gitignore_matcher = None
         use_gitignore = self.config.get("exclude", {}).get("use_gitignore", True)
-        if use_gitignore:
+        if use_gitignore and self.scan_session is None:
             from ..utils.gitignore_parser import load_gitignore_patterns
 
             gitignore_matcher = load_gitignore_patterns(self.project_root)
 
+        # ファイルスキャンは全パーサーの拡張子に対して一度だけ行い、各パーサーで共有する
+        # （各パーサーは対応する拡張子のファイルのみを抽出する）
+        extensions = {
+            ext.lower() for parser in self.parsers for ext in parser.get_supported_extensions()
+        }
+        if self.scan_session is not None:
+            files_to_parse = self.scan_session.view(
+                extensions=extensions, exclude_dirs=exclude_dirs
+            ).files()
+        else:
+            files_to_parse = self._scan_project_files(
+                exclude_dirs, list(extensions), gitignore_matcher
+            )
+
         # 各パーサーでAPI情報を収集
         all_apis = []
         for parser in self.parsers:
             try:
-                # ファイルスキャンは一度だけ行う（最初のパーサーで）
-                files_to_parse = None
-                if parser == self.parsers[0]:
-                    # 最初のパーサーでファイルスキャン
-                    files_to_parse = self._scan_project_files(
-                        exclude_dirs, parser.get_supported_extensions(), gitignore_matcher
-                    )
-
                 apis = parser.parse_project(
                     exclude_dirs=exclude_dirs,
                     use_cache=True,
@@ -178,7 +194,10 @@ class ImplementationValidator:
             except (AttributeError, TypeError) as e:
                 logger.debug(f"パーサー {parser.get_parser_type()} のAPI抽出でエラー: {e}")
             except Exception as e:
-                logger.warning(f"パーサー {parser.get_parser_type()} で予期しないエラーが発生しました: {e}", exc_info=True)
+                logger.warning(
+                    f"パーサー {parser.get_parser_type()} で予期しないエラーが発生しました: {e}",
+                    exc_info=True,
+                )
 
         # インデックスを構築
         self._api_index = {"function": set(), "method": set(), "class": set()}
@@ -327,7 +346,11 @@ class ImplementationValidator:
                     if is_in_code_block(line_start_pos + match.start()):
                         continue
 
-                    name = match.group(1) if match.lastindex is not None and match.lastindex >= 1 else match.group(2)
+                    name = (
+                        match.group(1)
+                        if match.lastindex is not None and match.lastindex >= 1
+                        else match.group(2)
+                    )
                     if name:
                         # 一般的な単語を除外
                         if name.lower() in ["def", "async", "function", "const", "let", "var"]:
@@ -348,7 +371,11 @@ class ImplementationValidator:
                     if is_in_code_block(line_start_pos + match.start()):
                         continue
 
-                    name = match.group(1) if match.lastindex is not None and match.lastindex >= 1 else match.group(2)
+                    name = (
+                        match.group(1)
+                        if match.lastindex is not None and match.lastindex >= 1
+                        else match.group(2)
+                    )
                     if name:
                         # 一般的な単語を除外
                         if name.lower() in ["class", "struct", "type", "impl"]:
@@ -523,4 +550,3 @@ class ImplementationValidator:
                 print(f"  - {entity.entity_type}: {entity.name} (行 {entity.line_number})")
 
         print("=" * 60 + "\n")
-
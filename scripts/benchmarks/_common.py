@@ -0,0 +1,93 @@
+"""
+ベンチマークスクリプト共通ユーティリティ
+
+合成プロジェクトツリーの生成と計測ヘルパーを提供します。
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# `python scripts/benchmarks/bench_*.py` で実行した場合でもdocgenをインポートできるようにする
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def make_synthetic_tree(
+    root: Path,
+    file_count: int = 100_000,
+    files_per_dir: int = 50,
+    dirs_per_level: int = 10,
+    extensions: tuple[str, ...] = (".py", ".js", ".ts", ".go", ".md", ".txt"),
+    content: Callable[[int, str], str] | None = None,
+) -> Path:
+    """
+    合成プロジェクトツリーを作成
+
+    Args:
+        root: 作成先のディレクトリ
+        file_count: 作成するファイル数
+        files_per_dir: 1ディレクトリあたりのファイル数
+        dirs_per_level: 1階層あたりのサブディレクトリ数
+        extensions: 順番に割り当てる拡張子
+        content: (通し番号, 拡張子) からファイル内容を返す関数（Noneの場合は空ファイル）
+
+    Returns:
+        作成したルートディレクトリ
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    dir_count = max(1, (file_count + files_per_dir - 1) // files_per_dir)
+
+    created = 0
+    for d in range(dir_count):
+        # 通し番号をdirs_per_level進数で分解して階層を作る
+        parts = []
+        n = d
+        while True:
+            parts.append(f"d{n % dirs_per_level}")
+            n //= dirs_per_level
+            if n == 0:
+                break
+        directory = root.joinpath("src", *reversed(parts))
+        directory.mkdir(parents=True, exist_ok=True)
+        for i in range(files_per_dir):
+            if created >= file_count:
+                break
+            ext = extensions[created % len(extensions)]
+            body = content(created, ext) if content else ""
+            (directory / f"f{i}{ext}").write_text(body, encoding="utf-8")
+            created += 1
+
+    return root
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> tuple[float, Any]:
+    """
+    関数を繰り返し実行して最小実行時間を計測
+
+    Args:
+        func: 計測する関数
+        repeat: 繰り返し回数
+
+    Returns:
+        (最小実行時間（秒）, 最後の戻り値)
+    """
+    best = float("inf")
+    result: Any = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_table(headers: list[str], rows: list[list[Any]]) -> None:
+    """Markdown形式の表を標準出力に表示"""
+    print("| " + " | ".join(headers) + " |")
+    print("|" + "|".join("---" for _ in headers) + "|")
+    for row in rows:
+        print("| " + " | ".join(str(cell) for cell in row) + " |")
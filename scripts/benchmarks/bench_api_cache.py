@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+キャッシュからのAPIドキュメント生成（ウォームラン）のベンチマーク
+
+変更のない状態での`APIGenerator._generate_markdown`（キャッシュの読み込み・解析結果の
+復元・Markdownの生成）にかかる時間を、`cache.backend`ごとに計測します。
+初回実行（cold）ですべてのファイルを解析してキャッシュを作成した後、新しいAPIGeneratorで
+繰り返し生成します（CLIを毎回起動する場合と同様に、キャッシュは毎回開き直す）。
+
+変更前後の比較は、同じスクリプトを変更前のツリーでも実行して行います。
+
+使い方:
+    python scripts/benchmarks/bench_api_cache.py --apis 50000
+    python scripts/benchmarks/bench_api_cache.py --backends sqlite --repeat 5
+"""
+
+import argparse
+import gc
+from pathlib import Path
+import re
+import tempfile
+import time
+
+from _common import make_synthetic_tree, print_table
+
+from docgen.generators.api_generator import APIGenerator
+from docgen.models.project import ProjectInfo
+
+# 1ファイルあたりの関数の数
+FUNCTIONS_PER_FILE = 5
+
+
+def python_source(i: int, ext: str) -> str:
+    """引数・docstring・デコレータを持つ関数を含むPythonソースを生成"""
+    functions = "\n\n".join(
+        f"@functools.lru_cache\n"
+        f"def func_{i}_{j}(path: str, count: int = {j}, *, verbose: bool = False) -> list[str]:\n"
+        f'    """\n    関数{j}の説明\n\n    Args:\n        path: パス\n        count: 回数\n    """\n'
+        f"    return [path] * count\n"
+        for j in range(FUNCTIONS_PER_FILE)
+    )
+    return f'"""モジュール{i}"""\n\nimport functools\n\n\n{functions}'
+
+
+def generate(root: Path, backend: str) -> str:
+    """新しいAPIGeneratorでAPIドキュメントを生成（生成日時の行を除いて返す）"""
+    config = {
+        "cache": {"enabled": True, "backend": backend},
+        "exclude": {"use_gitignore": False},
+    }
+    generator = APIGenerator(root, ["python"], config)
+    try:
+        markdown = generator._generate_markdown(ProjectInfo())
+    finally:
+        if generator.cache_manager is not None:
+            generator.cache_manager.close()
+    return re.sub(r"^.*\d{4}-\d{2}-\d{2}.*$", "", markdown, flags=re.MULTILINE)
+
+
+def timed(root: Path, backend: str) -> tuple[float, str]:
+    """GCを回収してから1回分の生成時間を計測"""
+    gc.collect()
+    start = time.perf_counter()
+    markdown = generate(root, backend)
+    return time.perf_counter() - start, markdown
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--apis", type=int, default=50_000, help="API要素の数")
+    parser.add_argument(
+        "--backends", nargs="+", default=["json", "sqlite"], help="比較するキャッシュバックエンド"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="ウォームランの繰り返し回数")
+    args = parser.parse_args()
+
+    file_count = max(1, args.apis // FUNCTIONS_PER_FILE)
+    rows = []
+    markdowns = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in args.backends:
+            root = make_synthetic_tree(
+                Path(tmp) / backend,
+                file_count=file_count,
+                extensions=(".py",),
+                content=python_source,
+            )
+            # 作成直後のファイルはstatのみでは検証できないため、時間を置く
+            time.sleep(1.1)
+
+            cold, expected = timed(root, backend)
+            warm = float("inf")
+            for _ in range(args.repeat):
+                elapsed, markdown = timed(root, backend)
+                warm = min(warm, elapsed)
+                # キャッシュから生成した結果は初回の解析結果と一致する
+                assert markdown == expected, f"{backend}: キャッシュからの生成結果が一致しません"
+            markdowns[backend] = expected
+            api_count = expected.count("\n### ")
+            rows.append(
+                [
+                    backend,
+                    f"{api_count:,}",
+                    f"{cold:.2f}",
+                    f"{warm:.2f}",
+                    f"{api_count / warm:,.0f}",
+                ]
+            )
+
+    # バックエンドによらず同じドキュメントが生成される
+    assert len(set(markdowns.values())) == 1
+
+    print(f"\nファイル数: {file_count:,}\n")
+    print_table(["backend", "apis", "cold (s)", "warm (s)", "warm apis/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
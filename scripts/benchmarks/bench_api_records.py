@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+解析結果のレコード（API情報）の時間・メモリのベンチマーク
+
+大規模なプロジェクト（Python・JavaScriptのファイル）について、次を計測します。
+
+- parse: キャッシュなしで全ファイルを解析する時間と、解析結果のリストが保持するメモリ
+- cold / warm: APIドキュメントの生成（キャッシュの作成・キャッシュからの生成）の時間と
+  ピークメモリ
+
+メモリはtracemallocで計測します（時間への影響を避けるため、時間とは別の実行で計測する）。
+
+変更前後の比較は、同じスクリプトを変更前のツリーでも実行して行います。
+
+使い方:
+    python scripts/benchmarks/bench_api_records.py --files 5000
+"""
+
+import argparse
+from collections.abc import Callable
+import gc
+import inspect
+from pathlib import Path
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from _common import make_synthetic_tree, print_table
+
+from docgen.generators.api_generator import APIGenerator
+from docgen.generators.parsers.js_parser import JSParser
+from docgen.generators.parsers.python_parser import PythonParser
+from docgen.models.project import ProjectInfo
+
+# 1ファイルあたりの関数の数
+FUNCTIONS_PER_FILE = 10
+
+
+def source(i: int, ext: str) -> str:
+    """関数・メソッド・docstringを含むPython・JavaScriptのソースを生成"""
+    if ext == ".js":
+        functions = "\n\n".join(
+            f"/**\n * 関数{j}の説明\n * @param {{string}} path パス\n * @param {{number}} count 回数\n */\n"
+            f"export function func_{i}_{j}(path, count) {{\n  return path.repeat(count);\n}}"
+            for j in range(FUNCTIONS_PER_FILE)
+        )
+        return f"{functions}\n"
+    functions = "\n\n".join(
+        f"def func_{i}_{j}(path: str, count: int = {j}) -> list[str]:\n"
+        f'    """\n    関数{j}の説明\n\n    Args:\n        path: パス\n    """\n'
+        f"    return [path] * count\n"
+        for j in range(FUNCTIONS_PER_FILE)
+    )
+    return f'"""モジュール{i}"""\n\n{functions}\n'
+
+
+def parse_all(root: Path, files: list[tuple[Path, Path]]) -> list:
+    """キャッシュなしで全ファイルを解析"""
+    results = []
+    for parser in (PythonParser(root), JSParser(root)):
+        kwargs = {"use_parallel": False}
+        # 内部のレコードを返す経路がある場合はそれを使用する
+        if "as_records" in inspect.signature(parser.parse_project).parameters:
+            kwargs["as_records"] = True
+        results.extend(parser.parse_project(files_to_parse=files, **kwargs))
+    return results
+
+
+def generate(root: Path) -> None:
+    """キャッシュを使用してAPIドキュメントを生成"""
+    config = {"cache": {"enabled": True}, "exclude": {"use_gitignore": False}}
+    generator = APIGenerator(root, ["python", "javascript"], config)
+    try:
+        generator._generate_markdown(ProjectInfo())
+    finally:
+        if generator.cache_manager is not None:
+            generator.cache_manager.close()
+
+
+def timed(func: Callable[[], Any]) -> tuple[float, Any]:
+    """GCを回収してから実行時間を計測"""
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def traced(func: Callable[[], Any]) -> tuple[int, int]:
+    """実行中のピークメモリと、戻り値が保持するメモリ（バイト）を計測"""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=5_000, help="ファイル数")
+    parser.add_argument("--repeat", type=int, default=3, help="warmの繰り返し回数")
+    args = parser.parse_args()
+
+    mb = 1024 * 1024
+    with tempfile.TemporaryDirectory() as tmp:
+        root = make_synthetic_tree(
+            Path(tmp), file_count=args.files, extensions=(".py", ".js"), content=source
+        )
+        files = sorted((path, path.relative_to(root)) for path in root.rglob("*") if path.is_file())
+        # 作成直後のファイルはstatのみでは検証できないため、時間を置く
+        time.sleep(1.1)
+
+        parse_time, apis = timed(lambda: parse_all(root, files))
+        api_count = len(apis)
+        del apis
+        _, retained = traced(lambda: parse_all(root, files))
+
+        # cold: キャッシュを作成（以降のwarmはキャッシュから生成）
+        cold_time, _ = timed(lambda: generate(root))
+        warm_time = min(timed(lambda: generate(root))[0] for _ in range(args.repeat))
+        warm_peak, _ = traced(lambda: generate(root))
+        (root / "docgen" / ".cache").rename(root / "docgen" / ".cache-warm")
+        cold_peak, _ = traced(lambda: generate(root))
+
+    print(f"\nファイル数: {args.files:,}, API数: {api_count:,}\n")
+    print_table(
+        ["phase", "time (s)", "memory (MB)"],
+        [
+            ["parse (retained)", f"{parse_time:.2f}", f"{retained / mb:.1f}"],
+            ["generate cold (peak)", f"{cold_time:.2f}", f"{cold_peak / mb:.1f}"],
+            ["generate warm (peak)", f"{warm_time:.2f}", f"{warm_peak / mb:.1f}"],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
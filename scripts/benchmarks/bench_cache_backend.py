@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+パーサーキャッシュのバックエンド比較ベンチマーク
+
+`cache.backend` = "json" / "sqlite" で、キャッシュの読み込み・保存にかかる時間を比較します。
+
+- populate: 全エントリを書き込んで保存（初回実行）
+- open + lookup: キャッシュを開いて一部のエントリを取得（差分実行・pre-commit hook）
+- update + save: 一部のエントリを更新して保存（差分実行・pre-commit hook）
+- open + read all: キャッシュを開いてすべてのエントリを取得（変更のない全体実行）
+
+使い方:
+    python scripts/benchmarks/bench_cache_backend.py
+    python scripts/benchmarks/bench_cache_backend.py --entries 10000 100000 --touched 100
+"""
+
+import argparse
+from collections.abc import Callable
+import gc
+from pathlib import Path
+import random
+import shutil
+import tempfile
+from typing import Any
+
+from _common import measure, print_table
+
+from docgen.utils.cache_store import CacheStore, open_cache_store, result_key
+
+
+def make_entry(i: int, apis_per_file: int = 5) -> dict[str, Any]:
+    """解析結果に近い大きさのキャッシュエントリを作成"""
+    return {
+        "hash": f"{i:064x}",
+        "mtime": 1_700_000_000.0 + i,
+        "result": [
+            {
+                "name": f"func_{i}_{j}",
+                "type": "function",
+                "file_path": f"src/d{i % 100}/f{i}.py",
+                "line_number": j * 10 + 1,
+                "signature": f"def func_{i}_{j}(arg1: int, arg2: str = 'x') -> list[str]",
+                "docstring": "関数の説明。" * 10,
+                "parameters": [{"name": "arg1", "type": "int"}, {"name": "arg2", "type": "str"}],
+                "return_type": "list[str]",
+            }
+            for j in range(apis_per_file)
+        ],
+        "cached_at": "2026-01-01T00:00:00",
+    }
+
+
+def put_entry(store: CacheStore, key: str, entry: dict[str, Any]) -> None:
+    """`CacheManager.set_cached_result`と同様にパスエントリと解析結果を書き込む"""
+    parser_type, _, rel_path = key.partition(":")
+    store.put_result(result_key(parser_type, rel_path, entry["hash"]), entry["result"])
+    store.put(key, {k: entry[k] for k in ("hash", "mtime", "cached_at")})
+
+
+def get_entry(store: CacheStore, key: str) -> dict[str, Any] | None:
+    """`CacheManager.get_cached_result`と同様にパスエントリから解析結果を取得"""
+    entry = store.get(key)
+    if entry is None:
+        return None
+    parser_type, _, rel_path = key.partition(":")
+    return {**entry, "result": store.get_result(result_key(parser_type, rel_path, entry["hash"]))}
+
+
+def populate(cache_dir: Path, backend: str, entries: dict[str, dict[str, Any]]) -> None:
+    """すべてのエントリを書き込んで保存"""
+    store = open_cache_store(cache_dir, backend)
+    for key, entry in entries.items():
+        put_entry(store, key, entry)
+    store.flush()
+    store.close()
+
+
+def open_and_lookup(cache_dir: Path, backend: str, keys: list[str]) -> list[Any]:
+    """キャッシュを開いて指定したキーのエントリを取得"""
+    store = open_cache_store(cache_dir, backend)
+    found = [get_entry(store, key) for key in keys]
+    store.close()
+    return found
+
+
+def update_and_save(
+    cache_dir: Path, backend: str, keys: list[str], entries: dict[str, dict[str, Any]]
+) -> None:
+    """キャッシュを開いて指定したキーのエントリを更新して保存"""
+    store = open_cache_store(cache_dir, backend)
+    for key in keys:
+        put_entry(store, key, entries[key])
+    store.flush()
+    store.close()
+
+
+def timed(func: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """前のバックエンドで作成したオブジェクトのGCを計測に含めないよう、回収してから計測"""
+    gc.collect()
+    return measure(func, repeat)
+
+
+def fresh_dir(base: Path, name: str) -> Path:
+    """空のキャッシュディレクトリを作成"""
+    path = base / name
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir(parents=True)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--entries", type=int, nargs="+", default=[10_000, 100_000], help="キャッシュのエントリ数"
+    )
+    parser.add_argument("--touched", type=int, default=100, help="取得・更新するエントリ数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        for count in args.entries:
+            entries = {f"python:src/d{i % 100}/f{i}.py": make_entry(i) for i in range(count)}
+            keys = list(entries)
+            touched = random.Random(0).sample(keys, min(args.touched, count))
+
+            results: dict[str, dict[str, float]] = {}
+            lookups: dict[str, list[Any]] = {}
+            for backend in ("json", "sqlite"):
+                timings = results.setdefault(backend, {})
+                timings["populate"], _ = timed(
+                    lambda b=backend, e=entries: populate(fresh_dir(base, b), b, e), args.repeat
+                )
+                cache_dir = base / backend
+                timings["open + lookup"], lookups[backend] = timed(
+                    lambda b=backend, d=cache_dir, t=touched: open_and_lookup(d, b, t), args.repeat
+                )
+                timings["update + save"], _ = timed(
+                    lambda b=backend, d=cache_dir, t=touched, e=entries: update_and_save(
+                        d, b, t, e
+                    ),
+                    args.repeat,
+                )
+                timings["open + read all"], _ = timed(
+                    lambda b=backend, d=cache_dir, k=keys: open_and_lookup(d, b, k), 1
+                )
+                timings["size (MB)"] = sum(f.stat().st_size for f in cache_dir.iterdir()) / (
+                    1024 * 1024
+                )
+
+            # 両方のバックエンドで同じエントリを取得できる
+            assert lookups["json"] == lookups["sqlite"] == [entries[k] for k in touched]
+
+            for metric in results["json"]:
+                json_value = results["json"][metric]
+                sqlite_value = results["sqlite"][metric]
+                rows.append(
+                    [
+                        f"{count:,}",
+                        metric,
+                        f"{json_value:.3f}",
+                        f"{sqlite_value:.3f}",
+                        f"{json_value / sqlite_value:.2f}x" if sqlite_value else "-",
+                    ]
+                )
+
+    print(f"\n取得・更新するエントリ数: {args.touched}\n")
+    print_table(["entries", "operation", "json (s)", "sqlite (s)", "json / sqlite"], rows)
+
+
+if __name__ == "__main__":
+    main()
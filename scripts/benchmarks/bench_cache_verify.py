@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+パーサーキャッシュの検証方法ベンチマーク
+
+変更のない状態での再実行（ウォームラン）にかかる時間を、`cache.verify` = "stat" / "hash" と
+`cache.hash_algorithm`の組み合わせで比較します。"stat"ではmtime・サイズ・inodeが一致する
+ファイルの内容を読まないため、ソースコードの総量に比例するコストがなくなります。
+ファイルがページキャッシュに載っている場合は読み込みのコストが小さいため、内容を読んだ
+ファイル数（hashed）も表示します。
+
+使い方:
+    python scripts/benchmarks/bench_cache_verify.py --files 20000
+    python scripts/benchmarks/bench_cache_verify.py --root /path/to/repo
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+from unittest.mock import patch
+
+from _common import make_synthetic_tree, measure, print_table
+
+from docgen.generators.parsers.python_parser import PythonParser
+from docgen.utils.cache import CacheManager
+from docgen.utils.file_hash import resolve_hash_algorithm
+from docgen.utils.file_scanner import UnifiedFileScanner
+
+
+def python_source(i: int, ext: str) -> str:
+    """数KBのPythonソースを生成"""
+    body = "".join(f"    value = value * {k} + arg  # 計算{k}\n" for k in range(30))
+    functions = "\n\n".join(
+        f'def func_{i}_{j}(arg: int) -> int:\n    """関数{j}の説明"""\n    value = 0\n{body}    return value\n'
+        for j in range(3)
+    )
+    return f'"""モジュール{i}"""\n\n{functions}'
+
+
+def warm_run(
+    root: Path, files: list[tuple[Path, Path]], cache_manager: CacheManager
+) -> tuple[list, int]:
+    """キャッシュを使用して解析し、(結果, 内容を読んだファイル数)を返す"""
+    with patch.object(
+        cache_manager, "get_file_hash", wraps=cache_manager.get_file_hash
+    ) as get_file_hash:
+        apis = PythonParser(root).parse_project(cache_manager=cache_manager, files_to_parse=files)
+    return sorted((api.file_path, api.name) for api in apis), get_file_hash.call_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=20_000, help="合成ツリーのファイル数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数")
+    parser.add_argument("--root", type=Path, help="既存のツリーを使用する場合のパス")
+    args = parser.parse_args()
+
+    algorithms = ["sha256", "blake2b"]
+    if resolve_hash_algorithm("auto") == "xxhash":
+        algorithms.append("xxhash")
+    configs = [("hash", algorithm) for algorithm in algorithms] + [("stat", algorithms[-1])]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.root or make_synthetic_tree(
+            Path(tmp) / "tree", file_count=args.files, extensions=(".py",), content=python_source
+        )
+        scanner = UnifiedFileScanner(root, exclude_dirs={".git", "docgen"})
+        scanner.scan_once()
+        files = [(path, rel) for path, rel in scanner.get_all_files() if path.suffix == ".py"]
+        total_bytes = sum(path.stat().st_size for path, _ in files)
+
+        # 作成直後のファイルは同じ秒のうちの書き換えを区別できず内容で検証されるため、時間を置く
+        time.sleep(1.1)
+
+        rows = []
+        baseline = None
+        for verify, algorithm in configs:
+            cache_manager = CacheManager(
+                root,
+                cache_dir=Path(tmp) / f"cache-{verify}-{algorithm}",
+                verify=verify,
+                hash_algorithm=algorithm,
+            )
+            cold, (expected, _) = measure(lambda c=cache_manager: warm_run(root, files, c), 1)
+            warm, (result, hashed) = measure(
+                lambda c=cache_manager: warm_run(root, files, c), args.repeat
+            )
+            # キャッシュから取得した結果は解析結果と一致する
+            assert result == expected, f"{verify}/{algorithm} の結果が一致しません"
+            if baseline is None:
+                baseline = warm
+            rows.append(
+                [
+                    verify,
+                    algorithm,
+                    f"{cold:.3f}",
+                    f"{warm:.3f}",
+                    f"{hashed:,}",
+                    f"{len(files) / warm:,.0f}",
+                    f"{baseline / warm:.2f}x",
+                ]
+            )
+
+    print(f"\nファイル数: {len(files)}, 総サイズ: {total_bytes / (1024 * 1024):.1f} MB\n")
+    print_table(
+        ["verify", "hash", "cold (s)", "warm (s)", "hashed", "warm files/s", "warm speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
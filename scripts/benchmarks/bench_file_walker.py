@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+ファイル走査ベンチマーク
+
+従来の`os.walk` + `Path.resolve()`/`relative_to()`/`is_symlink()`による走査と、
+scandirベースの走査エンジン（`docgen.utils.fs_walker`）を合成ツリーで比較します。
+
+使い方:
+    python scripts/benchmarks/bench_file_walker.py --files 100000
+"""
+
+import argparse
+import os
+from pathlib import Path
+import tempfile
+
+from _common import make_synthetic_tree, measure, print_table
+
+from docgen.detectors.detector_patterns import DetectorPatterns
+from docgen.utils.file_scanner import UnifiedFileScanner
+
+
+def legacy_walk(project_root: Path, exclude_dirs: set[str]) -> list[tuple[Path, Path]]:
+    """変更前の`UnifiedFileScanner.scan_once`と同等の走査"""
+    project_root = project_root.resolve()
+    result = []
+    for root, dirs, files in os.walk(project_root, followlinks=False):
+        root_path = Path(root)
+        dirs[:] = [
+            d
+            for d in dirs
+            if not (d in exclude_dirs or d.startswith(".") or d.endswith(".egg-info"))
+        ]
+        rel_root = root_path.relative_to(project_root)
+        if any(part in exclude_dirs for part in rel_root.parts):
+            dirs[:] = []
+            continue
+        for file_name in files:
+            file_path = root_path / file_name
+            try:
+                resolved = file_path.resolve()
+                relative = resolved.relative_to(project_root)
+            except (OSError, ValueError):
+                continue
+            if file_path.is_symlink():
+                continue
+            _ = file_path.suffix.lower()
+            result.append((resolved, relative))
+    return result
+
+
+def scandir_walk(project_root: Path, exclude_dirs: set[str]) -> list[tuple[Path, Path]]:
+    """scandirベースの走査エンジンによる走査"""
+    scanner = UnifiedFileScanner(project_root, exclude_dirs=exclude_dirs)
+    scanner.scan_once()
+    return scanner.get_all_files()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=100_000, help="合成ツリーのファイル数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数")
+    parser.add_argument("--root", type=Path, help="既存のツリーを使用する場合のパス")
+    args = parser.parse_args()
+
+    exclude_dirs = set(DetectorPatterns.EXCLUDE_DIRS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.root or make_synthetic_tree(Path(tmp) / "tree", file_count=args.files)
+
+        legacy_time, legacy_files = measure(lambda: legacy_walk(root, exclude_dirs), args.repeat)
+        new_time, new_files = measure(lambda: scandir_walk(root, exclude_dirs), args.repeat)
+
+        assert sorted(legacy_files) == sorted(new_files), "走査結果が一致しません"
+
+        print(f"\nファイル数: {len(new_files)}\n")
+        print_table(
+            ["walker", "time (s)", "files/s"],
+            [
+                [
+                    "os.walk + resolve",
+                    f"{legacy_time:.3f}",
+                    f"{len(legacy_files) / legacy_time:,.0f}",
+                ],
+                ["scandir engine", f"{new_time:.3f}", f"{len(new_files) / new_time:,.0f}"],
+            ],
+        )
+        print(f"\nspeedup: {legacy_time / new_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+多言語リポジトリでの汎用パーサー（GenericParser）のベンチマーク
+
+Go・Rust・Javaのファイルを同じ数だけ並べた合成ツリー（デフォルト: 3,000ファイル）を
+言語ごとの`GenericParser`で解析し、言語別の時間と抽出したシンボル数を計測します。
+
+変更前後の比較は、同じスクリプトを変更前のツリーでも実行して行います。
+
+使い方:
+    python scripts/benchmarks/bench_generic_parser.py --files 3000
+"""
+
+import argparse
+import gc
+from pathlib import Path
+import tempfile
+import time
+
+from _common import make_synthetic_tree, print_table
+
+from docgen.generators.parsers.generic_parser import GenericParser
+
+# 拡張子と言語の対応
+LANGUAGES = {".go": "go", ".rs": "rust", ".java": "java"}
+
+# 1ファイルあたりの定義の数
+DEFINITIONS_PER_FILE = 20
+
+
+def source(i: int, ext: str) -> str:
+    """ドキュメントコメント付きの関数と構造体（クラス）を並べたソースを生成"""
+    blocks = []
+    for j in range(DEFINITIONS_PER_FILE):
+        if ext == ".go":
+            blocks.append(
+                f"// Func{j} は関数{j}です\n// path を返します\n"
+                f"func Func{j}(path string) string {{\n\treturn path\n}}\n\n"
+                f"type Model{j} struct {{\n\tName string\n}}\n"
+            )
+        elif ext == ".rs":
+            blocks.append(
+                f"/// Func{j} は関数{j}です\npub fn func_{j}(path: &str) -> &str {{\n    path\n}}\n\n"
+                f"struct Model{j} {{\n    name: String,\n}}\n"
+            )
+        else:
+            blocks.append(
+                f"/**\n * 関数{j}\n */\npublic static String func{j}(String path) {{\n"
+                f"    return path;\n}}\n\npublic class Model{j} {{\n}}\n"
+            )
+    return "package main;\n\n" + "\n".join(blocks) if ext == ".java" else "\n".join(blocks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=3_000, help="ファイル数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = make_synthetic_tree(
+            Path(tmp), file_count=args.files, extensions=tuple(LANGUAGES), content=source
+        )
+        files = sorted(root.rglob("*.*"))
+
+        rows = []
+        total_time = 0.0
+        total_symbols = 0
+        for ext, language in LANGUAGES.items():
+            parser_ = GenericParser(root, language)
+            targets = [path for path in files if path.suffix == ext]
+            gc.collect()
+            start = time.perf_counter()
+            symbols = sum(len(parser_.parse_file(path)) for path in targets)
+            elapsed = time.perf_counter() - start
+            total_time += elapsed
+            total_symbols += symbols
+            rows.append([language, f"{len(targets):,}", f"{symbols:,}", f"{elapsed:.2f}"])
+        rows.append(["total", f"{len(files):,}", f"{total_symbols:,}", f"{total_time:.2f}"])
+
+    print(f"\nファイル数: {args.files:,}\n")
+    print_table(["language", "files", "symbols", "time (s)"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+.gitignore判定ベンチマーク
+
+変更前の「全パターンの正規表現を順に評価する」判定と、
+コンパイル済みの判定エンジン（`docgen.utils.gitignore_parser`）を合成パスで比較します。
+
+使い方:
+    python scripts/benchmarks/bench_gitignore.py --paths 200000 --patterns 200
+"""
+
+import argparse
+from pathlib import Path
+import re
+import tempfile
+
+from _common import measure, print_table
+
+from docgen.utils.gitignore_parser import GitIgnoreMatcher, parse_gitignore_line, translate_glob
+
+
+def make_patterns(count: int) -> list[str]:
+    """一般的な.gitignoreに近いパターンを生成"""
+    base = ["*.log", "*.tmp", "*.pyc", "build/", "dist/", "/coverage", "docs/_build/", "**/.cache"]
+    patterns = list(base)
+    i = 0
+    while len(patterns) < count:
+        patterns.append(f"*.ext{i}" if i % 3 else f"generated_{i}/")
+        if i % 5 == 0:
+            patterns.append(f"!keep_{i}.log")
+        if i % 7 == 0:
+            patterns.append(f"src/module_{i}/*.py")
+        i += 1
+    return patterns[:count]
+
+
+def make_paths(count: int) -> list[str]:
+    """判定対象の相対パスを生成"""
+    exts = [".py", ".js", ".log", ".md", ".tmp", ".ts"]
+    return [f"src/d{i % 97}/sub{i % 13}/file{i}{exts[i % len(exts)]}" for i in range(count)]
+
+
+class LegacyMatcher:
+    """変更前の判定（全パターンの正規表現を順に評価し、一致のたびにログ出力）"""
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = []
+        for line in patterns:
+            rule = parse_gitignore_line(line)
+            if rule is not None:
+                regex = re.compile(r"(^|/)" + translate_glob(rule.body) + r"(/|$)")
+                self.patterns.append((rule.negated, rule.pattern, regex))
+
+    def is_ignored_relative(self, path_str: str) -> bool:
+        result = False
+        for negated, _pattern, regex in self.patterns:
+            if regex.search(path_str):
+                result = not negated
+        return result
+
+    def should_exclude_dir_relative(self, path_str: str) -> bool:
+        for negated, _pattern, regex in self.patterns:
+            if regex.search(path_str) or regex.search(path_str + "/"):
+                return not negated
+        return False
+
+
+def run(matcher, paths: list[str]) -> int:
+    """ディレクトリ判定 + ファイル判定を走査と同じ順序で行う"""
+    ignored = 0
+    for path in paths:
+        parent = path.rpartition("/")[0]
+        if matcher.should_exclude_dir_relative(parent) or matcher.is_ignored_relative(path):
+            ignored += 1
+    return ignored
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--paths", type=int, default=200_000, help="判定するパス数")
+    parser.add_argument("--patterns", type=int, default=200, help=".gitignoreのパターン数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    patterns = make_patterns(args.patterns)
+    paths = make_paths(args.paths)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / ".gitignore").write_text("\n".join(patterns) + "\n", encoding="utf-8")
+
+        legacy = LegacyMatcher(patterns)
+        legacy_time, legacy_ignored = measure(lambda: run(legacy, paths), args.repeat)
+        # 判定のメモ化を含めて計測するため、毎回新しいマッチャーを作成する
+        new_time, new_ignored = measure(
+            lambda: run(GitIgnoreMatcher(root, nested=False), paths), args.repeat
+        )
+
+    print(f"\nパス数: {len(paths)}, パターン数: {len(patterns)}")
+    print(f"除外: legacy={legacy_ignored}, compiled={new_ignored}\n")
+    print_table(
+        ["matcher", "time (s)", "paths/s"],
+        [
+            ["regex loop", f"{legacy_time:.3f}", f"{len(paths) / legacy_time:,.0f}"],
+            ["compiled", f"{new_time:.3f}", f"{len(paths) / new_time:,.0f}"],
+        ],
+    )
+    print(f"\nspeedup: {legacy_time / new_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
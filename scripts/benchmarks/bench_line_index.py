@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+大きなファイルの正規表現ベースの解析のベンチマーク
+
+生成した大きなJavaScriptファイル（デフォルト: 20,000行）とGoファイルについて、
+`JSParser`・`GenericParser`の解析とRAGのJavaScriptのチャンク化の時間を計測します。
+マッチごとに行番号・対応する括弧を求める処理が、ファイルの大きさに対して
+線形に近いかどうかを確認できます（`--lines`で行数を変えて比較する）。
+
+変更前後の比較は、同じスクリプトを変更前のツリーでも実行して行います。
+
+使い方:
+    python scripts/benchmarks/bench_line_index.py --lines 20000
+"""
+
+import argparse
+from collections.abc import Callable
+import gc
+from pathlib import Path
+import tempfile
+import time
+
+from _common import print_table
+
+from docgen.generators.parsers.generic_parser import GenericParser
+from docgen.generators.parsers.js_parser import JSParser
+from docgen.rag.strategies.code_strategy import CodeChunkStrategy
+
+
+def js_source(lines: int) -> str:
+    """JSDoc付きの関数とメソッドを持つクラスを交互に並べたJavaScriptを生成（約lines行）"""
+    blocks = []
+    count = 0
+    i = 0
+    while count < lines:
+        if i % 2:
+            block = (
+                f"/**\n * 関数{i}\n * @param {{string}} path - パス\n */\n"
+                f"export function func{i}(path) {{\n  return path;\n}}\n"
+            )
+        else:
+            block = (
+                f"class Model{i} {{\n"
+                f"  load{i}(path) {{\n    return path;\n  }}\n"
+                f"  save{i}(path) {{\n    return path;\n  }}\n"
+                f"}}\n"
+            )
+        blocks.append(block)
+        count += block.count("\n")
+        i += 1
+    return "\n".join(blocks)
+
+
+def go_source(lines: int) -> str:
+    """コメント付きの関数と構造体を交互に並べたGoを生成（約lines行）"""
+    blocks = ["package main\n"]
+    count = 1
+    i = 0
+    while count < lines:
+        block = (
+            f"// Func{i} は関数{i}です\nfunc Func{i}(path string) string {{\n\treturn path\n}}\n"
+            f"type Model{i} struct {{\n\tName string\n}}\n"
+        )
+        blocks.append(block)
+        count += block.count("\n")
+        i += 1
+    return "\n".join(blocks)
+
+
+def best_of(repeat: int, func: Callable[[], int]) -> tuple[float, int]:
+    """repeat回実行した最小の時間と結果の件数"""
+    times = []
+    count = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        count = func()
+        times.append(time.perf_counter() - start)
+    return min(times), count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lines", type=int, default=20_000, help="生成するファイルの行数")
+    parser.add_argument("--repeat", type=int, default=3, help="繰り返し回数（最小値を使用）")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        js_file = root / "big.js"
+        js_file.write_text(js_source(args.lines))
+        go_file = root / "big.go"
+        go_file.write_text(go_source(args.lines))
+        js_content = js_file.read_text()
+
+        cases = [
+            ("JSParser", lambda: len(JSParser(root).parse_file(js_file))),
+            ("GenericParser (go)", lambda: len(GenericParser(root, "go").parse_file(go_file))),
+            (
+                "chunk (javascript)",
+                lambda: len(CodeChunkStrategy(root).chunk(js_content, js_file)),
+            ),
+        ]
+        rows = []
+        for name, func in cases:
+            elapsed, count = best_of(args.repeat, func)
+            rows.append([name, f"{count:,}", f"{elapsed * 1000:.0f}"])
+
+    print(f"\n行数: {args.lines:,}\n")
+    print_table(["case", "symbols", "time (ms)"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Pythonファイルのパース結果の共有（ModuleStore）のベンチマーク
+
+1回の実行（`ScanSession`）で、Pythonファイルを解析する次の処理を順に実行し、
+それぞれの時間と`ast.parse`の呼び出し回数を計測します。
+
+- api: API解析（`APIGenerator`、パーサーキャッシュなし）
+- validate: 実装検証のAPIインデックスの構築
+- chunk: RAGのチャンク化
+- structure: 構造分析のシンボル数のカウント
+
+変更前後の比較は、同じスクリプトを変更前のツリーでも実行して行います。
+
+使い方:
+    python scripts/benchmarks/bench_module_store.py --files 2000
+"""
+
+import argparse
+import ast
+import gc
+from pathlib import Path
+import tempfile
+import time
+
+from _common import make_synthetic_tree, print_table
+
+from docgen.collectors.structure_analyzer import StructureAnalyzer
+from docgen.generators.api_generator import APIGenerator
+from docgen.models.project import ProjectInfo
+from docgen.rag.chunker import CodeChunker
+from docgen.utils.scan_session import ScanSession
+from docgen.validators.implementation_validator import ImplementationValidator
+
+# 1ファイルあたりのクラスの数
+CLASSES_PER_FILE = 10
+
+_parse_calls = 0
+_ast_parse = ast.parse
+
+
+def _counting_parse(*args, **kwargs):
+    global _parse_calls
+    _parse_calls += 1
+    return _ast_parse(*args, **kwargs)
+
+
+def python_source(i: int, ext: str) -> str:
+    """クラス・メソッド・docstringを含むPythonソースを生成"""
+    classes = "\n\n".join(
+        f"class Model{i}_{j}:\n"
+        f'    """モデル{j}"""\n\n'
+        f"    def method(self, path: str, count: int = {j}) -> list[str]:\n"
+        f'        """メソッド{j}"""\n'
+        f"        return [path] * count\n"
+        for j in range(CLASSES_PER_FILE)
+    )
+    return f'"""モジュール{i}"""\n\n{classes}\n'
+
+
+def run(root: Path, config: dict) -> list[list[str]]:
+    """1回の実行で各処理を順に実行し、時間と`ast.parse`の呼び出し回数を返す"""
+    global _parse_calls
+    session = ScanSession(root, config)
+    session.scan()
+    files = [path for path, _rel in session.view(extensions={".py"})]
+
+    def api() -> None:
+        generator = APIGenerator(root, ["python"], config, scan_session=session)
+        generator._generate_markdown(ProjectInfo())
+
+    def validate() -> None:
+        ImplementationValidator(
+            root, languages=["python"], config=config, scan_session=session
+        ).build_api_index()
+
+    def chunk() -> None:
+        CodeChunker().chunk_codebase(root, scan_session=session)
+
+    def structure() -> None:
+        analyzer = StructureAnalyzer(root, scan_session=session)
+        for path in files:
+            analyzer.count_symbols_in_file(path)
+
+    rows = []
+    for name, func in (
+        ("api", api),
+        ("validate", validate),
+        ("chunk", chunk),
+        ("structure", structure),
+    ):
+        gc.collect()
+        _parse_calls = 0
+        start = time.perf_counter()
+        func()
+        rows.append([name, f"{time.perf_counter() - start:.2f}", f"{_parse_calls:,}"])
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=2_000, help="ファイル数")
+    args = parser.parse_args()
+
+    config = {"cache": {"enabled": False}, "exclude": {"use_gitignore": False}}
+    ast.parse = _counting_parse
+    with tempfile.TemporaryDirectory() as tmp:
+        root = make_synthetic_tree(
+            Path(tmp), file_count=args.files, extensions=(".py",), content=python_source
+        )
+        rows = run(root, config)
+
+    total = sum(float(row[1]) for row in rows)
+    calls = sum(int(row[2].replace(",", "")) for row in rows)
+    rows.append(["total", f"{total:.2f}", f"{calls:,}"])
+    print(f"\nファイル数: {args.files:,}\n")
+    print_table(["phase", "time (s)", "ast.parse"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+解析の並列処理の方式（parse.executor）のベンチマーク
+
+キャッシュを使用せずに（すべてのファイルを解析する場合）、`PythonParser.parse_project`の
+スループットを`executor`（thread / process）とワーカー数ごとに計測します。
+`--sizes`を指定すると、ファイル数ごとにthreadとprocessを比較し、プロセスの起動に
+見合うファイル数（`parse.process_min_files`）の目安を確認できます。
+
+使い方:
+    python scripts/benchmarks/bench_parse_executor.py --files 5000
+    python scripts/benchmarks/bench_parse_executor.py --sizes 50 100 200 400 800
+"""
+
+import argparse
+import gc
+import os
+from pathlib import Path
+import tempfile
+import time
+
+from _common import make_synthetic_tree, print_table
+
+from docgen.generators.parsers.python_parser import PythonParser
+
+# 1ファイルあたりのクラス・関数の数
+DEFINITIONS_PER_FILE = 10
+
+
+def python_source(i: int, ext: str) -> str:
+    """クラス・メソッド・型注釈・docstringを含むPythonソースを生成"""
+    definitions = "\n\n".join(
+        f"class Model{i}_{j}:\n"
+        f'    """モデル{j}"""\n\n'
+        f"    def method(self, path: str, count: int = {j}, *args, **kwargs) -> list[str]:\n"
+        f'        """\n        メソッド{j}\n\n        Args:\n            path: パス\n        """\n'
+        f"        return [path] * count\n\n\n"
+        f"def func_{i}_{j}(value: dict[str, int] | None = None) -> int:\n"
+        f'    """関数{j}"""\n'
+        f"    return len(value or {{}})\n"
+        for j in range(DEFINITIONS_PER_FILE)
+    )
+    return f'"""モジュール{i}"""\n\n{definitions}\n'
+
+
+def timed(root: Path, files: list[tuple[Path, Path]], executor: str, workers: int) -> float:
+    """キャッシュなしで1回分の解析時間を計測"""
+    parser = PythonParser(root)
+    gc.collect()
+    start = time.perf_counter()
+    apis = parser.parse_project(
+        files_to_parse=files, max_workers=workers, executor=executor, process_min_files=1
+    )
+    elapsed = time.perf_counter() - start
+    assert len(apis) == len(files) * DEFINITIONS_PER_FILE * 3
+    return elapsed
+
+
+def best_of(repeat: int, *args) -> float:
+    return min(timed(*args) for _ in range(repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=2_000, help="解析するファイル数")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        help="計測するワーカー数（デフォルト: 1からCPU数まで2倍ずつ）",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="threadとprocessを比較するファイル数のリスト"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="繰り返し回数（最小値を使用）")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    workers_list = args.workers or sorted(
+        {min(2**n, cpu_count) for n in range(cpu_count.bit_length() + 1)}
+    )
+    max_files = max([args.files, *(args.sizes or [])])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = make_synthetic_tree(
+            Path(tmp), file_count=max_files, extensions=(".py",), content=python_source
+        )
+        all_files = sorted(
+            (path, path.relative_to(root)) for path in root.rglob("*.py") if path.is_file()
+        )
+
+        if args.sizes:
+            rows = []
+            for size in args.sizes:
+                files = all_files[:size]
+                thread = best_of(args.repeat, root, files, "thread", cpu_count)
+                process = best_of(args.repeat, root, files, "process", cpu_count)
+                rows.append(
+                    [
+                        f"{size:,}",
+                        f"{thread * 1000:.0f}",
+                        f"{process * 1000:.0f}",
+                        f"{thread / process:.2f}x",
+                    ]
+                )
+            print(f"\nCPU数: {cpu_count}\n")
+            print_table(["files", "thread (ms)", "process (ms)", "speedup"], rows)
+            return
+
+        files = all_files[: args.files]
+        rows = []
+        baseline = None
+        for executor in ("thread", "process"):
+            for workers in workers_list:
+                elapsed = best_of(args.repeat, root, files, executor, workers)
+                baseline = baseline or elapsed
+                rows.append(
+                    [
+                        executor,
+                        str(workers),
+                        f"{elapsed:.2f}",
+                        f"{len(files) / elapsed:,.0f}",
+                        f"{baseline / elapsed:.2f}x",
+                    ]
+                )
+
+    print(f"\nファイル数: {len(files):,}, CPU数: {cpu_count}\n")
+    print_table(["executor", "workers", "time (s)", "files/s", "vs thread x1"], rows)
+
+
+if __name__ == "__main__":
+    main()
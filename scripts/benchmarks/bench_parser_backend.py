@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+解析のバックエンド（regex・tree_sitter）のA/Bベンチマーク
+
+TypeScript・Go・Rust・Javaのファイルを同じ数だけ並べた合成ツリー（デフォルト: 2,000ファイル）を、
+言語ごとに正規表現ベースのパーサー（`JSParser`・`GenericParser`）と`TreeSitterParser`で解析し、
+時間・抽出したシンボル数・抽出結果の一致率（regexの(名前, 種類, 行番号)のうちtree_sitterでも
+抽出されたものの割合）を計測します。
+
+tree-sitterの文法がインストールされていない言語はregexのみ計測します
+（`pip install "agents-docs-sync[tree-sitter]"`）。
+
+使い方:
+    python scripts/benchmarks/bench_parser_backend.py --files 2000
+"""
+
+import argparse
+import gc
+from pathlib import Path
+import tempfile
+import time
+
+from _common import make_synthetic_tree, print_table
+
+from docgen.generators.parsers.parser_factory import ParserFactory
+from docgen.generators.parsers.tree_sitter_parser import TreeSitterParser
+
+# 拡張子と言語の対応
+LANGUAGES = {".ts": "typescript", ".go": "go", ".rs": "rust", ".java": "java"}
+
+# 1ファイルあたりの定義の数
+DEFINITIONS_PER_FILE = 20
+
+
+def source(i: int, ext: str) -> str:
+    """ドキュメントコメント付きの関数とクラス（構造体）を並べたソースを生成"""
+    blocks = []
+    for j in range(DEFINITIONS_PER_FILE):
+        if ext == ".ts":
+            blocks.append(
+                f"/**\n * 関数{j}\n * @param {{string}} path - パス\n */\n"
+                f"export function func{j}(path: string): string {{\n"
+                f'  const text = `${{path}} {{`;\n  return text + "}}";\n}}\n\n'
+                f"export class Model{j}<T> {{\n  /** 読み込む */\n"
+                f"  load(path: string): T[] {{\n    return [];\n  }}\n}}\n"
+            )
+        elif ext == ".go":
+            blocks.append(
+                f"// Func{j} は関数{j}です\nfunc Func{j}(path string) string {{\n\treturn path\n}}\n\n"
+                f"type Model{j} struct {{\n\tName string\n}}\n"
+            )
+        elif ext == ".rs":
+            blocks.append(
+                f"/// Func{j} は関数{j}です\npub fn func_{j}(path: &str) -> &str {{\n    path\n}}\n\n"
+                f"struct Model{j} {{\n    name: String,\n}}\n"
+            )
+        else:
+            blocks.append(
+                f"/**\n * 関数{j}\n */\npublic static String func{j}(String path) {{\n"
+                f"    return path;\n}}\n\npublic class Model{j} {{\n}}\n"
+            )
+    return "\n".join(blocks)
+
+
+def run(parser, files: list[Path]) -> tuple[float, set[tuple[str, str, str, int | None]]]:
+    """ファイルを順に解析し、時間と(ファイル, 名前, 種類, 行番号)の集合を返す"""
+    gc.collect()
+    start = time.perf_counter()
+    apis = [api for path in files for api in parser.parse_file(path)]
+    elapsed = time.perf_counter() - start
+    return elapsed, {(api.file_path, api.name, api.type, api.line_number) for api in apis}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--files", type=int, default=2_000, help="ファイル数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = make_synthetic_tree(
+            Path(tmp), file_count=args.files, extensions=tuple(LANGUAGES), content=source
+        )
+        files = sorted(root.rglob("*.*"))
+
+        rows = []
+        for ext, language in LANGUAGES.items():
+            targets = [path for path in files if path.suffix == ext]
+            regex_time, regex_apis = run(ParserFactory.create_parser(root, language), targets)
+            row = [language, f"{len(targets):,}", f"{regex_time:.2f}", f"{len(regex_apis):,}"]
+            if TreeSitterParser.is_available(language):
+                ts_time, ts_apis = run(TreeSitterParser(root, language), targets)
+                agreement = len(regex_apis & ts_apis) / len(regex_apis) if regex_apis else 1.0
+                row += [f"{ts_time:.2f}", f"{len(ts_apis):,}", f"{agreement:.1%}"]
+            else:
+                row += ["-", "-", "-"]
+            rows.append(row)
+
+    print(f"\nファイル数: {args.files:,}\n")
+    print_table(
+        [
+            "language",
+            "files",
+            "regex (s)",
+            "regex symbols",
+            "tree_sitter (s)",
+            "tree_sitter symbols",
+            "agreement",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -150,3 +150,37 @@ class TestVectorIndexer:
         assert meta["chunk_count"] == len(sample_metadata)
         assert meta["embedding_dim"] == 384
         assert meta["index_type"] == "hnswlib"
+
+    def test_update_files(self, indexer, sample_embeddings, sample_metadata, tmp_path):
+        """指定ファイルのチャンクを置き換え、保存・読み込み後も削除済みが維持されることを確認"""
+        indexer.build(sample_embeddings[:5], sample_metadata[:5])
+
+        # test0.pyを更新（test5.pyの内容で置き換え）、test1.pyを削除
+        new_metadata = [dict(sample_metadata[5], file="test0.py")]
+        indexer.update_files({"test0.py", "test1.py"}, sample_embeddings[5:6], new_metadata)
+        indexer.save()
+
+        config = {"index": {"type": "hnswlib"}}
+        indexer2 = VectorIndexer(index_dir=tmp_path / "index", embedding_dim=384, config=config)
+        indexer2.load()
+
+        results = indexer2.search(sample_embeddings[1], k=10)
+        assert len(results) == 4
+        assert "func1" not in {metadata["name"] for metadata, _ in results}
+        metadata, score = indexer2.search(sample_embeddings[5], k=1)[0]
+        assert metadata["file"] == "test0.py"
+        assert score > 0.99
+
+    def test_update_files_compacts_deleted_chunks(
+        self, indexer, sample_embeddings, sample_metadata
+    ):
+        """削除済みのチャンクが半数を超えた場合にインデックスを詰め直すことを確認"""
+        indexer.build(sample_embeddings[:5], sample_metadata[:5])
+
+        indexer.update_files({f"test{i}.py" for i in range(3)}, sample_embeddings[:0], [])
+
+        assert [m["name"] for m in indexer._metadata] == ["func3", "func4"]
+        assert not indexer._deleted
+        metadata, score = indexer.search(sample_embeddings[4], k=1)[0]
+        assert metadata["name"] == "func4"
+        assert score > 0.99
@@ -0,0 +1,85 @@
+"""
+キャッシュ用のAPI情報のレコード形式のテスト
+"""
+
+import marshal
+
+import pytest
+
+from docgen.models.api import APIInfo, APIParameter, APIRecord
+from docgen.utils.api_records import RECORD_FORMAT, decode_apis, encode_apis
+
+
+def _apis() -> list[APIInfo]:
+    return [
+        APIInfo(
+            name="load",
+            type="function",
+            file_path="pkg/a.py",
+            line_number=3,
+            signature="def load(path: str, retries: int = 3) -> bytes",
+            docstring="読み込む",
+            parameters=[
+                APIParameter(name="path", type="str"),
+                APIParameter(name="retries", type="int", default=3, required=False),
+            ],
+            return_type="bytes",
+            decorators=["cache"],
+            visibility="public",
+            language="python",
+        ),
+        APIInfo(name="Loader", type="class", file_path="pkg/a.py", language="python"),
+    ]
+
+
+class TestApiRecords:
+    """レコード形式の変換のテスト"""
+
+    def test_round_trip(self):
+        """復元したAPI情報は元のAPI情報と一致し、ファイルパスは指定したパスになる"""
+        records = decode_apis(encode_apis(_apis()), "lib/a.py")
+        assert all(isinstance(record, APIRecord) for record in records)
+
+        apis = [record.to_model() for record in records]
+        expected = [api.model_copy(update={"file_path": "lib/a.py"}) for api in _apis()]
+        assert apis == expected
+        assert [api.model_dump() for api in apis] == [api.model_dump() for api in expected]
+        assert repr(apis[0]) == repr(expected[0])
+
+    def test_record_model_conversion(self):
+        """レコードとAPIInfoは相互に変換でき、レコードからもレコード形式に変換できる"""
+        records = [APIRecord.from_model(api) for api in _apis()]
+        assert [record.to_model() for record in records] == _apis()
+        assert encode_apis(records) == encode_apis(_apis())
+        assert not hasattr(records[0], "__dict__")
+
+    def test_decoded_objects_are_independent(self):
+        """復元のたびに新しいオブジェクトを作成する"""
+        data = encode_apis(_apis())
+        first = decode_apis(data, "a.py")
+        first[0].file_path = "changed.py"
+        first[0].parameters[0].name = "changed"
+
+        second = decode_apis(data, "a.py")
+        assert second[0].file_path == "a.py"
+        assert second[0].parameters[0].name == "path"
+
+    def test_rejects_other_formats(self):
+        """形式の異なるレコードや壊れたデータはNoneを返す"""
+        assert decode_apis(marshal.dumps((RECORD_FORMAT + 1, ())), "a.py") is None
+        assert decode_apis(b"broken", "a.py") is None
+        # 形式の番号が同じでも、レコードのフィールドの数が異なる場合は復元しない
+        assert decode_apis(marshal.dumps((RECORD_FORMAT, (("f", "function"),))), "a.py") is None
+        assert decode_apis(marshal.dumps((RECORD_FORMAT, 1)), "a.py") is None
+
+    def test_unmarshalable_value_raises(self):
+        """marshalできない値はValueErrorになる"""
+        api = APIInfo(
+            name="f",
+            type="function",
+            file_path="a.py",
+            parameters=[APIParameter(name="x", type="object", default=object())],
+            language="python",
+        )
+        with pytest.raises(ValueError):
+            encode_apis([api])
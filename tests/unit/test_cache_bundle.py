@@ -0,0 +1,169 @@
+"""
+キャッシュバンドル（cache export / import）のテスト
+"""
+
+import io
+import json
+import shutil
+import tarfile
+from unittest.mock import patch
+
+import pytest
+
+from docgen.generators.parsers.python_parser import PythonParser
+from docgen.utils.cache import CacheManager
+from docgen.utils.cache_bundle import BUNDLE_FORMAT, export_bundle, import_bundle
+from docgen.utils.exceptions import CacheError
+
+
+def _parse(root, cache_manager):
+    """a.pyを解析し、実際に解析したファイルの相対パスを返す"""
+    parser = PythonParser(root)
+    files = [(root / "a.py", (root / "a.py").relative_to(root))]
+    with patch.object(
+        parser, "_parse_file_records", wraps=parser._parse_file_records
+    ) as parse_file:
+        apis = parser.parse_project(
+            cache_manager=cache_manager, files_to_parse=files, use_parallel=False
+        )
+    return apis, [call.args[0].name for call in parse_file.call_args_list]
+
+
+def _write_bundle(path, members):
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+@pytest.fixture
+def source(tmp_path):
+    """解析済みのプロジェクト・埋め込みのキャッシュ・RAGインデックス"""
+    root = tmp_path / "src"
+    root.mkdir()
+    (root / "a.py").write_text("def a():\n    pass\n")
+    cache_manager = CacheManager(root)
+    _parse(root, cache_manager)
+    cache_manager.close()
+
+    embeddings = tmp_path / "embeddings"
+    (embeddings / "sentence-transformers").mkdir(parents=True)
+    (embeddings / "emb_model_0123.npy").write_bytes(b"npy-1")
+    (embeddings / "sentence-transformers" / "emb_model_4567.npy").write_bytes(b"npy-2")
+
+    index = root / "docgen" / "index"
+    index.mkdir(parents=True)
+    (index / "meta.json").write_text('{"chunks": []}')
+    (index / "hnswlib.idx").write_bytes(b"index")
+    return root, embeddings, index
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_bundle_restores_caches_at_another_path(tmp_path, source, backend):
+    """別のパスにチェックアウトしたプロジェクトでもバンドルのキャッシュを使用できる"""
+    root, embeddings, index = source
+    bundle = tmp_path / "bundle.tar.gz"
+    cache_manager = CacheManager(root)
+    counts = export_bundle(bundle, cache_manager, embeddings_dir=embeddings, index_dir=index)
+    cache_manager.close()
+    assert counts == {"paths": 1, "results": 1, "embeddings": 2, "index_files": 2}
+
+    target = tmp_path / "ci" / "checkout"
+    target.mkdir(parents=True)
+    shutil.copy(root / "a.py", target / "a.py")
+    target_embeddings = tmp_path / "ci-embeddings"
+    target_index = target / "docgen" / "index"
+    cache_manager = CacheManager(target, backend=backend)
+    counts = import_bundle(
+        bundle, cache_manager, embeddings_dir=target_embeddings, index_dir=target_index
+    )
+    assert counts == {"paths": 1, "results": 1, "embeddings": 2, "index_files": 2}
+    cache_manager.close()
+
+    cache_manager = CacheManager(target, backend=backend)
+    try:
+        apis, parsed = _parse(target, cache_manager)
+    finally:
+        cache_manager.close()
+    assert parsed == []
+    assert [api.name for api in apis] == ["a"]
+    assert apis[0].file_path == "a.py"
+    assert (target_embeddings / "sentence-transformers" / "emb_model_4567.npy").read_bytes() == (
+        b"npy-2"
+    )
+    assert (target_index / "hnswlib.idx").read_bytes() == b"index"
+
+
+def test_bundle_stores_results_as_validated_json(tmp_path, source):
+    """解析結果はJSONで出力し、取り込み時に検証して不正な値は取り込まない"""
+    root, _embeddings, _index = source
+    bundle = tmp_path / "bundle.tar.gz"
+    cache_manager = CacheManager(root)
+    export_bundle(bundle, cache_manager)
+    cache_manager.close()
+
+    with tarfile.open(bundle) as tar:
+        manifest = tar.extractfile("manifest.json").read()
+        parser_cache = json.loads(tar.extractfile("parser_cache.json").read())
+    [apis] = parser_cache["results"].values()
+    assert [api["name"] for api in apis] == ["a"]
+
+    parser_cache["results"]["python:.py:broken"] = [{**apis[0], "line_number": "x"}]
+    _write_bundle(
+        bundle,
+        {"manifest.json": manifest, "parser_cache.json": json.dumps(parser_cache).encode()},
+    )
+    target = tmp_path / "target"
+    target.mkdir()
+    shutil.copy(root / "a.py", target / "a.py")
+    cache_manager = CacheManager(target)
+    try:
+        assert import_bundle(bundle, cache_manager)["results"] == 1
+        apis, parsed = _parse(target, cache_manager)
+    finally:
+        cache_manager.close()
+    assert parsed == []
+    assert [api.name for api in apis] == ["a"]
+
+
+def test_import_keeps_existing_index(tmp_path, source):
+    """既存のRAGインデックスは指定した場合のみ置き換える"""
+    root, embeddings, index = source
+    bundle = tmp_path / "bundle.tar.gz"
+    export_bundle(bundle, None, embeddings_dir=embeddings, index_dir=index)
+
+    target_index = tmp_path / "target" / "index"
+    target_index.mkdir(parents=True)
+    (target_index / "meta.json").write_text("local")
+
+    import_bundle(bundle, None, index_dir=target_index)
+    assert (target_index / "meta.json").read_text() == "local"
+
+    import_bundle(bundle, None, index_dir=target_index, overwrite_index=True)
+    assert (target_index / "meta.json").read_text() == '{"chunks": []}'
+
+
+def test_rejects_other_bundle_format(tmp_path):
+    """形式の異なるバンドルは取り込まない"""
+    bundle = tmp_path / "bundle.tar.gz"
+    _write_bundle(bundle, {"manifest.json": json.dumps({"format": BUNDLE_FORMAT + 1}).encode()})
+
+    with pytest.raises(CacheError):
+        import_bundle(bundle, None)
+
+
+def test_rejects_paths_outside_cache_dirs(tmp_path):
+    """親ディレクトリへのパスを含むバンドルは取り込まない"""
+    bundle = tmp_path / "bundle.tar.gz"
+    _write_bundle(
+        bundle,
+        {
+            "manifest.json": json.dumps({"format": BUNDLE_FORMAT}).encode(),
+            "embeddings/../../escape.npy": b"x",
+        },
+    )
+
+    with pytest.raises(CacheError):
+        import_bundle(bundle, None, embeddings_dir=tmp_path / "embeddings")
+    assert not (tmp_path / "escape.npy").exists()
@@ -0,0 +1,579 @@
+"""
+キャッシュストア（JSON・SQLiteバックエンド）のテスト
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from docgen.generators.parsers.python_parser import PythonParser
+from docgen.utils.cache import CacheManager
+from docgen.utils.cache_store import (
+    JSON_CACHE_FILE,
+    SQLITE_CACHE_FILE,
+    JsonCacheStore,
+    SqliteCacheStore,
+    open_cache_store,
+)
+from docgen.utils.file_hash import hash_file, resolve_hash_algorithm
+
+
+def _entry(name: str) -> dict:
+    return {
+        "hash": f"hash-{name}",
+        "version": "1",
+        "mtime_ns": 1_500_000_000,
+        "size": 10,
+        "ino": 1,
+        "checked_ns": 3_000_000_000,
+        "cached_at": "2026-01-01T00:00:00",
+    }
+
+
+def _result(name: str) -> list[dict]:
+    return [{"name": name, "type": "function", "file_path": f"{name}.py"}]
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    store = open_cache_store(tmp_path, request.param)
+    yield store
+    store.close()
+
+
+class TestCacheStore:
+    """両バックエンド共通の動作のテスト"""
+
+    def test_put_get_delete(self, store):
+        """エントリの追加・取得・削除"""
+        store.put("python:a.py", _entry("a"))
+        store.put("javascript:a.py", _entry("a"))
+        store.put("python:b.py", _entry("b"))
+        store.put("python:b.py", _entry("b2"))
+
+        assert store.get("python:b.py") == _entry("b2")
+        assert store.get("python:missing.py") is None
+        assert store.count() == 3
+
+        assert store.delete("python:b.py") is True
+        assert store.delete("python:b.py") is False
+        assert store.delete_path("a.py") == 2
+        assert store.keys() == []
+
+    def test_results(self, store):
+        """解析結果の追加・取得（既存の解析結果は上書きしない）"""
+        store.put_result("python:.py:hash-a", _result("a"))
+        store.put_result("python:.py:hash-a", _result("other"))
+        store.put_result("python:.py:hash-empty", [])
+
+        assert store.get_result("python:.py:hash-a") == _result("a")
+        assert store.get_result("python:.py:hash-empty") == []
+        assert store.get_result("python:.py:missing") is None
+        assert store.count_results() == 2
+
+        store.clear()
+        assert store.count_results() == 0
+
+    def test_persists_after_flush(self, store, tmp_path):
+        """保存したエントリは開き直しても取得できる"""
+        store.put("python:a.py", _entry("a"))
+        store.put_result("python:.py:hash-a", _result("a"))
+        store.put_result("python:.py:hash-b", b"\x00records")
+        store.flush()
+        store.close()
+
+        reopened = open_cache_store(
+            tmp_path, "sqlite" if isinstance(store, SqliteCacheStore) else "json"
+        )
+        try:
+            assert reopened.get("python:a.py") == _entry("a")
+            assert reopened.get_result("python:.py:hash-a") == _result("a")
+            assert reopened.get_result("python:.py:hash-b") == b"\x00records"
+        finally:
+            reopened.close()
+
+    def test_concurrent_writers(self, store):
+        """複数のスレッドから同時に書き込める"""
+
+        def write(i: int) -> None:
+            store.put(f"python:f{i}.py", _entry(f"f{i}"))
+            store.put_result(f"python:.py:hash-f{i}", _result(f"f{i}"))
+            assert store.get(f"python:f{i}.py") == _entry(f"f{i}")
+            assert store.get_result(f"python:.py:hash-f{i}") == _result(f"f{i}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(write, range(200)))
+
+        assert store.count() == 200
+
+
+class TestSqliteCacheStore:
+    """SQLiteバックエンドのテスト"""
+
+    def test_migrates_json_cache(self, tmp_path):
+        """既存のJSONキャッシュを取り込み、JSONファイルを削除する"""
+        json_file = tmp_path / JSON_CACHE_FILE
+        json_store = JsonCacheStore(json_file)
+        for name in ("a", "b"):
+            json_store.put(f"python:{name}.py", _entry(name))
+            json_store.put_result(f"python:.py:hash-{name}", _result(name))
+        json_store.flush()
+
+        store = open_cache_store(tmp_path, "sqlite")
+        try:
+            assert store.count() == 2
+            assert store.get("python:b.py") == _entry("b")
+            assert store.get_result("python:.py:hash-b") == _result("b")
+        finally:
+            store.close()
+        assert not json_file.exists()
+        assert (tmp_path / SQLITE_CACHE_FILE).exists()
+
+    def test_uses_wal_mode(self, tmp_path):
+        """WALモードで開く"""
+        store = SqliteCacheStore(tmp_path / SQLITE_CACHE_FILE)
+        try:
+            assert store._conn().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            store.close()
+
+    def test_writes_are_visible_to_other_connections_before_flush(self, tmp_path):
+        """エントリごとにコミットされ、保存前でも他のプロセス（接続）から読める"""
+        writer = SqliteCacheStore(tmp_path / SQLITE_CACHE_FILE)
+        reader = SqliteCacheStore(tmp_path / SQLITE_CACHE_FILE)
+        try:
+            writer.put("python:a.py", _entry("a"))
+            assert reader.get("python:a.py") == _entry("a")
+        finally:
+            writer.close()
+            reader.close()
+
+
+def test_json_store_discards_old_format(tmp_path):
+    """形式の異なるJSONキャッシュは使用しない"""
+    (tmp_path / JSON_CACHE_FILE).write_text(
+        json.dumps({"python:a.py": {"hash": "0" * 64, "mtime": 1.5, "result": _result("a")}})
+    )
+
+    store = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+
+    assert store.count() == 0
+    assert store.get("python:a.py") is None
+
+
+def test_json_store_skips_write_without_changes(tmp_path):
+    """変更がなければJSONファイルを書き直さない"""
+    store = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+    store.flush()
+    assert not (tmp_path / JSON_CACHE_FILE).exists()
+
+
+class TestJsonJournal:
+    """JSONバックエンドのジャーナルとスナップショットのテスト"""
+
+    def _journal(self, tmp_path):
+        return (tmp_path / JSON_CACHE_FILE).with_suffix(".journal")
+
+    def test_appends_changes_to_journal(self, tmp_path):
+        """2回目以降の保存は変更のみをジャーナルに追記し、開き直すと反映される"""
+        store = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        store.put("python:a.py", _entry("a"))
+        store.flush()
+        snapshot = (tmp_path / JSON_CACHE_FILE).read_bytes()
+
+        store.put("python:b.py", _entry("b"))
+        store.put_result("python:.py:hash-b", b"\x00records")
+        store.delete("python:a.py")
+        store.flush()
+
+        assert (tmp_path / JSON_CACHE_FILE).read_bytes() == snapshot
+        assert len(self._journal(tmp_path).read_text().splitlines()) == 4
+        reopened = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        assert reopened.keys() == ["python:b.py"]
+        assert reopened.get_result("python:.py:hash-b") == b"\x00records"
+
+    def test_ignores_truncated_journal_line(self, tmp_path):
+        """追記の途中で終了したジャーナルは、壊れた行より前の変更のみを使用する"""
+        store = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        store.put("python:a.py", _entry("a"))
+        store.flush()
+        store.put("python:b.py", _entry("b"))
+        store.flush()
+        with open(self._journal(tmp_path), "a") as f:
+            f.write('{"put": "python:c.py", "ent')
+
+        reopened = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        assert sorted(reopened.keys()) == ["python:a.py", "python:b.py"]
+
+        # 次の保存でスナップショットを書き直し、壊れたジャーナルを削除する
+        reopened.flush()
+        assert not self._journal(tmp_path).exists()
+        assert sorted(JsonCacheStore(tmp_path / JSON_CACHE_FILE).keys()) == [
+            "python:a.py",
+            "python:b.py",
+        ]
+
+    def test_skips_malformed_journal_records(self, tmp_path):
+        """形式が不正な変更（キーの欠落・型の誤り）は無視し、以降の変更は適用する"""
+        store = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        store.put("python:a.py", _entry("a"))
+        store.flush()
+        store.put("python:b.py", _entry("b"))
+        store.flush()
+        with open(self._journal(tmp_path), "a") as f:
+            f.write('{"result": "python:.py:hash-x", "record": {"records": "AA=="}}\n')
+            f.write('["put", "python:d.py"]\n')
+            f.write(json.dumps({"put": "python:c.py", "entry": _entry("c")}) + "\n")
+
+        reopened = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        assert sorted(reopened.keys()) == ["python:a.py", "python:b.py", "python:c.py"]
+        assert reopened.count_results() == 0
+
+    def test_compacts_large_journal(self, tmp_path):
+        """ジャーナルが大きくなるとスナップショットを書き直してジャーナルを削除する"""
+        store = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        store.put("python:a.py", _entry("a"))
+        store.flush()
+        for i in range(5):
+            store.put(f"python:f{i}.py", _entry(f"f{i}"))
+        with patch("docgen.utils.cache_store._COMPACT_MIN_BYTES", 0):
+            store.flush()
+
+        assert not self._journal(tmp_path).exists()
+        data = json.loads((tmp_path / JSON_CACHE_FILE).read_text())
+        assert len(data["paths"]) == 6
+        assert JsonCacheStore(tmp_path / JSON_CACHE_FILE).count() == 6
+
+    def test_ignores_journal_of_older_generation(self, tmp_path):
+        """スナップショットに反映済みのジャーナル（圧縮の途中で終了した場合）は適用しない"""
+        store = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        store.put("python:a.py", _entry("a"))
+        store.flush()
+        store.delete("python:a.py")
+        store.flush()
+        stale_journal = self._journal(tmp_path).read_bytes()
+        store.put("python:a.py", _entry("a2"))
+        store.compact()
+        self._journal(tmp_path).write_bytes(stale_journal)
+
+        assert JsonCacheStore(tmp_path / JSON_CACHE_FILE).get("python:a.py") == _entry("a2")
+
+    def test_failed_snapshot_write_keeps_previous_cache(self, tmp_path):
+        """スナップショットの書き込みに失敗しても以前のキャッシュは壊れない"""
+        store = JsonCacheStore(tmp_path / JSON_CACHE_FILE)
+        store.put("python:a.py", _entry("a"))
+        store.flush()
+        store.put("python:b.py", _entry("b"))
+
+        with patch("docgen.utils.cache_store.json.dump", side_effect=OSError("disk full")):
+            store.compact()
+
+        assert JsonCacheStore(tmp_path / JSON_CACHE_FILE).keys() == ["python:a.py"]
+
+
+def test_cache_manager_buffers_worker_writes(tmp_path):
+    """並列解析の書き込みはスレッドごとに保持し、解析の終了時にまとめて反映する"""
+    for i in range(20):
+        (tmp_path / f"m{i}.py").write_text(f"def f{i}():\n    pass\n")
+    files = [(path, path.relative_to(tmp_path)) for path in sorted(tmp_path.glob("*.py"))]
+    cache_manager = CacheManager(tmp_path)
+    store = cache_manager._store
+    with (
+        patch.object(store, "put", wraps=store.put) as put,
+        patch.object(store, "put_result", wraps=store.put_result) as put_result,
+        patch.object(store, "put_many", wraps=store.put_many) as put_many,
+    ):
+        PythonParser(tmp_path).parse_project(
+            cache_manager=cache_manager,
+            files_to_parse=files,
+            use_parallel=True,
+            max_workers=4,
+            skip_cache_save=True,
+        )
+
+    put.assert_not_called()
+    put_result.assert_not_called()
+    put_many.assert_called_once()
+    assert store.count() == 20
+    assert store.count_results() == 20
+    cache_manager.close()
+
+
+def test_unknown_backend(tmp_path):
+    """不明なバックエンドはエラーになる"""
+    with pytest.raises(ValueError):
+        open_cache_store(tmp_path, "redis")
+
+
+def test_cache_manager_with_sqlite_backend(tmp_path):
+    """SQLiteバックエンドでも解析結果をキャッシュから取得できる"""
+    (tmp_path / "a.py").write_text("def a():\n    pass\n")
+    files = [(tmp_path / "a.py", tmp_path.joinpath("a.py").relative_to(tmp_path))]
+    cache_manager = CacheManager(tmp_path, backend="sqlite")
+    PythonParser(tmp_path).parse_project(
+        cache_manager=cache_manager, files_to_parse=files, use_parallel=False
+    )
+    cache_manager.close()
+
+    cache_manager = CacheManager(tmp_path, backend="sqlite")
+    try:
+        [api] = cache_manager.get_cached_result(
+            tmp_path / "a.py", "python", parser_version=PythonParser.PARSER_VERSION
+        )
+        assert api.name == "a"
+        assert cache_manager.get_cache_stats()["total_entries"] == 1
+        assert cache_manager.cache_file.name == SQLITE_CACHE_FILE
+    finally:
+        cache_manager.close()
+
+
+class TestContentAddressedCache:
+    """内容のハッシュによる解析結果の共有のテスト"""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "a.py").write_text("def a():\n    pass\n")
+        return tmp_path
+
+    def _parse(self, root, cache_manager, *names):
+        parser = PythonParser(root)
+        files = [(root / name, root.joinpath(name).relative_to(root)) for name in names]
+        with patch.object(
+            parser, "_parse_file_records", wraps=parser._parse_file_records
+        ) as parse_file:
+            apis = parser.parse_project(
+                cache_manager=cache_manager, files_to_parse=files, use_parallel=False
+            )
+        return apis, [
+            call.args[0].relative_to(root).as_posix() for call in parse_file.call_args_list
+        ]
+
+    @pytest.mark.parametrize("backend", ["json", "sqlite"])
+    def test_renamed_file_is_not_reparsed(self, project, backend):
+        """リネームしたファイルは再解析せず、パスを付け替えて返す"""
+        cache_manager = CacheManager(project, backend=backend)
+        self._parse(project, cache_manager, "pkg/a.py")
+        (project / "pkg").rename(project / "lib")
+
+        apis, parsed = self._parse(project, cache_manager, "lib/a.py")
+
+        assert parsed == []
+        assert [(api.name, api.file_path) for api in apis] == [("a", "lib/a.py")]
+        cache_manager.close()
+
+    def test_copies_share_one_result(self, project):
+        """同じ内容のファイルは1つの解析結果を共有する"""
+        (project / "vendor").mkdir()
+        (project / "vendor" / "a.py").write_text((project / "pkg" / "a.py").read_text())
+        cache_manager = CacheManager(project)
+
+        apis, parsed = self._parse(project, cache_manager, "pkg/a.py", "vendor/a.py")
+
+        assert parsed == ["pkg/a.py"]
+        assert sorted(api.file_path for api in apis) == ["pkg/a.py", "vendor/a.py"]
+        stats = cache_manager.get_cache_stats()
+        assert (stats["total_entries"], stats["total_results"]) == (2, 1)
+
+    def test_reverted_file_hits_cache(self, project):
+        """変更を取り消したファイルは以前の解析結果を使用する"""
+        original = (project / "pkg" / "a.py").read_text()
+        cache_manager = CacheManager(project)
+        self._parse(project, cache_manager, "pkg/a.py")
+        (project / "pkg" / "a.py").write_text("def b():\n    pass\n")
+        self._parse(project, cache_manager, "pkg/a.py")
+        (project / "pkg" / "a.py").write_text(original)
+
+        apis, parsed = self._parse(project, cache_manager, "pkg/a.py")
+
+        assert parsed == []
+        assert [api.name for api in apis] == ["a"]
+
+    def test_miss_hashes_file_once(self, project):
+        """キャッシュにない場合、取得時に計算したハッシュを保存時に再利用する"""
+        cache_manager = CacheManager(project)
+        with patch.object(
+            cache_manager, "get_file_hash", wraps=cache_manager.get_file_hash
+        ) as get_hash:
+            self._parse(project, cache_manager, "pkg/a.py")
+        assert get_hash.call_count == 1
+
+
+class TestCacheVerification:
+    """statによるキャッシュの検証のテスト"""
+
+    @pytest.fixture
+    def aged_file(self, tmp_path):
+        """キャッシュ保存時刻より十分前に更新されたファイル"""
+        path = tmp_path / "a.py"
+        path.write_text("def a():\n    pass\n")
+        mtime = time.time() - 10
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def _cache(self, root, path, **kwargs):
+        cache_manager = CacheManager(root, **kwargs)
+        assert cache_manager.get_cached_result(path, "python") is None
+        cache_manager.set_cached_result(path, "python", PythonParser(root).parse_file(path))
+        return cache_manager
+
+    def test_stat_match_skips_hashing(self, tmp_path, aged_file):
+        """mtime・サイズ・inodeが一致すれば内容を読まない"""
+        cache_manager = self._cache(tmp_path, aged_file)
+
+        with patch.object(cache_manager, "get_file_hash") as get_hash:
+            [api] = cache_manager.get_cached_result(aged_file, "python")
+
+        assert api.name == "a"
+        get_hash.assert_not_called()
+
+    def test_hash_mode_always_hashes(self, tmp_path, aged_file):
+        """verify="hash"では常に内容のハッシュで検証する"""
+        cache_manager = self._cache(tmp_path, aged_file, verify="hash")
+
+        with patch.object(
+            cache_manager, "get_file_hash", wraps=cache_manager.get_file_hash
+        ) as get_hash:
+            assert cache_manager.get_cached_result(aged_file, "python") is not None
+
+        assert get_hash.call_count == 1
+
+    def test_recently_modified_file_is_hashed(self, tmp_path):
+        """保存直後に更新されたファイルはstatが一致しても内容で検証する"""
+        path = tmp_path / "a.py"
+        path.write_text("def a():\n    pass\n")
+        cache_manager = self._cache(tmp_path, path)
+        stat = path.stat()
+        # 同じ時刻・同じサイズで書き換えられた場合
+        path.write_text("def b():\n    pass\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert cache_manager.get_cached_result(path, "python") is None
+
+    def test_modified_file_misses(self, tmp_path, aged_file):
+        """内容が変わったファイルはキャッシュを使用しない"""
+        cache_manager = self._cache(tmp_path, aged_file)
+        aged_file.write_text("def b():\n    pass\n")
+
+        assert cache_manager.get_cached_result(aged_file, "python") is None
+
+
+class TestHashAlgorithm:
+    """内容のハッシュのアルゴリズムのテスト"""
+
+    def test_hash_is_prefixed_with_algorithm(self, tmp_path):
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"content")
+
+        assert hash_file(path, "sha256") == "sha256:" + hashlib.sha256(b"content").hexdigest()
+        assert hash_file(path, "blake2b").startswith("blake2b:")
+        assert hash_file(path, "blake2b") != hash_file(path, "sha256")
+
+    def test_falls_back_to_blake2b_without_xxhash(self):
+        with patch("docgen.utils.file_hash._xxhash_factory", return_value=None):
+            assert resolve_hash_algorithm("auto") == "blake2b"
+            assert resolve_hash_algorithm("xxhash") == "blake2b"
+        assert resolve_hash_algorithm("sha256") == "sha256"
+        assert resolve_hash_algorithm("md5") == "blake2b"
+
+
+class TestCacheMaintenance:
+    """バージョン・上限・GC・解析失敗の記録のテスト"""
+
+    def _parse(self, root, cache_manager, *names, parser=None):
+        parser = parser or PythonParser(root)
+        files = [(root / name, root.joinpath(name).relative_to(root)) for name in names]
+        with patch.object(
+            parser, "_parse_file_records", wraps=parser._parse_file_records
+        ) as parse_file:
+            apis = parser.parse_project(
+                cache_manager=cache_manager, files_to_parse=files, use_parallel=False
+            )
+        return apis, parse_file.call_count
+
+    def test_evicts_least_recently_used(self, store):
+        """上限を超えた解析結果は最終使用日時の古い順に削除する"""
+        for i, key in enumerate(["python:.py:old", "python:.py:used", "python:.py:new"]):
+            with patch("docgen.utils.cache_store.time.time", return_value=1_000_000 + i):
+                store.put_result(key, _result(key))
+        # 古い解析結果を使用すると最終使用日時が更新される
+        with patch("docgen.utils.cache_store.time.time", return_value=2_000_000):
+            assert store.get_result("python:.py:used") is not None
+            store.flush()
+
+        assert store.evict_results(max_entries=2) == 1
+        assert store.get_result("python:.py:old") is None
+        assert store.get_result("python:.py:used") is not None
+        assert store.evict_results(max_entries=0, max_bytes=1) == 2
+        assert store.count_results() == 0
+
+    def test_result_stats_counts_errors(self, store):
+        store.put_result("python:.py:a", _result("a"))
+        store.put_result("python:.py:b", {"error": "SyntaxError: invalid syntax"})
+
+        stats = store.result_stats()
+
+        assert (stats["results"], stats["error_results"]) == (2, 1)
+        assert stats["result_bytes"] > 0
+
+    def test_parser_version_change_reparses(self, tmp_path):
+        """パーサーのバージョンが変わると以前の解析結果を使用しない"""
+        (tmp_path / "a.py").write_text("def a():\n    pass\n")
+        cache_manager = CacheManager(tmp_path)
+        self._parse(tmp_path, cache_manager, "a.py")
+        assert self._parse(tmp_path, cache_manager, "a.py")[1] == 0
+
+        parser = PythonParser(tmp_path)
+        with patch.object(PythonParser, "PARSER_VERSION", "2"):
+            apis, parsed = self._parse(tmp_path, cache_manager, "a.py", parser=parser)
+
+        assert parsed == 1
+        assert [api.name for api in apis] == ["a"]
+
+    @pytest.mark.parametrize("backend", ["json", "sqlite"])
+    def test_failed_parse_is_cached(self, tmp_path, backend):
+        """解析に失敗したファイルは内容が変わるまで再解析しない"""
+        path = tmp_path / "broken.py"
+        path.write_text("def broken():\n    pass\n")
+        cache_manager = CacheManager(tmp_path, backend=backend)
+
+        # 深いネストでの再帰エラーなど、内容に対して決まる失敗
+        with patch.object(
+            PythonParser, "_extract_elements", side_effect=RecursionError("too deep")
+        ):
+            assert self._parse(tmp_path, cache_manager, "broken.py") == ([], 1)
+            assert self._parse(tmp_path, cache_manager, "broken.py") == ([], 0)
+        assert cache_manager.get_cache_stats()["error_results"] == 1
+
+        path.write_text("def fixed():\n    pass\n")
+        apis, parsed = self._parse(tmp_path, cache_manager, "broken.py")
+        assert parsed == 1
+        assert [api.name for api in apis] == ["fixed"]
+        cache_manager.close()
+
+    @pytest.mark.parametrize("backend", ["json", "sqlite"])
+    def test_gc_removes_missing_paths(self, tmp_path, backend):
+        """走査で見つからないパスのエントリと、参照されていない解析結果を削除する"""
+        (tmp_path / "a.py").write_text("def a():\n    pass\n")
+        (tmp_path / "b.py").write_text("def b():\n    pass\n")
+        cache_manager = CacheManager(tmp_path, backend=backend)
+        self._parse(tmp_path, cache_manager, "a.py", "b.py")
+        (tmp_path / "b.py").unlink()
+
+        # 解析結果はブランチの切り替えなどで再利用できるよう残す
+        assert cache_manager.gc(live_paths={"a.py"}, prune_results=False) == {
+            "paths": 1,
+            "results": 0,
+            "evicted": 0,
+        }
+        assert cache_manager.gc(live_paths={"a.py"})["results"] == 1
+
+        stats = cache_manager.get_cache_stats()
+        assert (stats["total_entries"], stats["total_results"]) == (1, 1)
+        assert self._parse(tmp_path, cache_manager, "a.py")[1] == 0
+        cache_manager.close()
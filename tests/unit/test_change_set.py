@@ -0,0 +1,129 @@
+"""
+差分実行（`--since`・`--staged`）のテスト
+"""
+
+import shutil
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from docgen.generators.parsers.python_parser import PythonParser
+from docgen.hooks.utils import get_changed_files
+from docgen.utils.cache import CacheManager
+from docgen.utils.change_set import ChangeSet, ChangeSetError, load_change_set
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """コミット済みのファイルを含むリポジトリを作成"""
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "main.py").write_text("def main():\n    pass\n")
+    (root / "src" / "old.py").write_text("x = 1\n")
+    (root / "README.md").write_text("# repo\n")
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "initial")
+    return root
+
+
+@requires_git
+class TestLoadChangeSet:
+    """gitの差分から変更ファイルを取得するテスト"""
+
+    def test_staged(self, git_repo):
+        """ステージされた変更のみを取得する"""
+        (git_repo / "src" / "main.py").write_text("def main():\n    return 1\n")
+        (git_repo / "src" / "new.py").write_text("")
+        _git(git_repo, "add", "src/main.py", "src/new.py")
+        _git(git_repo, "rm", "-q", "src/old.py")
+        (git_repo / "README.md").write_text("# unstaged\n")
+
+        change_set = load_change_set(git_repo, staged=True)
+        assert change_set == ChangeSet(
+            frozenset({"src/new.py"}), frozenset({"src/main.py"}), frozenset({"src/old.py"})
+        )
+
+    def test_since_includes_worktree_and_untracked(self, git_repo):
+        """リビジョンからワークツリーまでの変更と未追跡ファイルを取得する"""
+        (git_repo / "README.md").write_text("# changed\n")
+        (git_repo / "scratch.py").write_text("")
+
+        change_set = load_change_set(git_repo, since="HEAD")
+        assert change_set.modified == {"README.md"}
+        assert change_set.created == {"scratch.py"}
+        assert change_set.to_file_changes()[0].kind == "created"
+
+    def test_paths_relative_to_project_root(self, git_repo):
+        """サブディレクトリをプロジェクトルートとした場合は相対パスで、配下の変更のみ返す"""
+        (git_repo / "src" / "main.py").write_text("y = 2\n")
+        (git_repo / "README.md").write_text("# changed\n")
+
+        change_set = load_change_set(git_repo / "src", since="HEAD")
+        assert change_set.paths == {"main.py"}
+
+    def test_no_changes(self, git_repo):
+        """変更がない場合は空の集合を返す"""
+        assert load_change_set(git_repo, staged=True).is_empty()
+
+    def test_invalid_revision(self, git_repo):
+        """不正なリビジョンはエラーになる"""
+        with pytest.raises(ChangeSetError):
+            load_change_set(git_repo, since="no-such-rev")
+
+    def test_get_changed_files_since(self, git_repo, tmp_path):
+        """フックのget_changed_filesも同じ差分を返し、gitリポジトリ外では空のリストを返す"""
+        (git_repo / "README.md").write_text("# changed\n")
+        _git(git_repo, "rm", "-q", "src/old.py")
+
+        assert sorted(get_changed_files(since="HEAD", cwd=git_repo)) == ["README.md", "src/old.py"]
+        assert get_changed_files(staged=True, cwd=git_repo) == ["src/old.py"]
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        assert get_changed_files(since="HEAD", cwd=outside) == []
+
+
+class TestIncrementalParse:
+    """変更ファイルのみ再解析するテスト"""
+
+    def test_unchanged_files_use_cache_without_verification(self, tmp_path):
+        """変更されていないファイルはキャッシュを検証せずに使用し、変更ファイルのみ解析する"""
+        (tmp_path / "a.py").write_text("def a():\n    pass\n")
+        (tmp_path / "b.py").write_text("def b():\n    pass\n")
+        cache_manager = CacheManager(tmp_path)
+        parser = PythonParser(tmp_path)
+        files = [
+            (tmp_path / name, tmp_path.joinpath(name).relative_to(tmp_path))
+            for name in ("a.py", "b.py")
+        ]
+        parser.parse_project(cache_manager=cache_manager, files_to_parse=files, use_parallel=False)
+
+        with (
+            patch.object(cache_manager, "get_file_hash", MagicMock(return_value="")) as get_hash,
+            patch.object(
+                parser, "_parse_file_records", wraps=parser._parse_file_records
+            ) as parse_file,
+        ):
+            apis = parser.parse_project(
+                cache_manager=cache_manager,
+                files_to_parse=files,
+                use_parallel=False,
+                changed_paths={"b.py"},
+            )
+
+        assert sorted(api.name for api in apis) == ["a", "b"]
+        # a.pyはキャッシュから、b.pyはハッシュ不一致として再解析される
+        assert [call.args[0].name for call in parse_file.call_args_list] == ["b.py"]
+        assert get_hash.call_count == 2  # b.pyの検証とキャッシュ保存のみ
@@ -0,0 +1,137 @@
+"""
+ファイル分類（サイズ・バイナリ・minify判定）のテスト
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from docgen.generators.parsers.python_parser import PythonParser
+from docgen.rag.chunker import CodeChunker
+from docgen.utils.file_classifier import (
+    BINARY,
+    MINIFIED,
+    TEXT,
+    TOO_LARGE,
+    FileClassifier,
+    read_text_limited,
+    sniff_kind,
+    summarize_skipped,
+)
+
+
+@pytest.mark.parametrize(
+    "sample, name, expected",
+    [
+        (b"def main():\n    pass\n", "main.py", TEXT),
+        ("# 日本語のコメント\n".encode() * 10, "main.py", TEXT),
+        # 読み込み範囲の末尾で切れたマルチバイト文字
+        ("あ".encode()[:2], "notes.md", TEXT),
+        (b"\x89PNG\r\n\x1a\n\0\0\0\rIHDR", "logo.png", BINARY),
+        (b"\xff\xfe\xfa\xfb" + b"x" * 100, "data.bin", BINARY),
+        (b"function a(){return 1}", "bundle.min.js", MINIFIED),
+        (b"var a=1;" * 200, "bundle.js", MINIFIED),
+    ],
+)
+def test_sniff_kind(sample, name, expected):
+    """先頭のバイト列から種類を判定する"""
+    assert sniff_kind(sample, name) == expected
+
+
+class TestFileClassifier:
+    """FileClassifierのテスト"""
+
+    def test_too_large_is_skipped_without_reading(self, tmp_path):
+        """サイズ上限を超えるファイルは読み込まずにスキップする"""
+        (tmp_path / "big.py").write_text("x = 1\n" * 100)
+        classifier = FileClassifier(tmp_path)
+
+        with patch("builtins.open", side_effect=AssertionError("must not read")):
+            assert classifier.check("big.py", "parse", max_bytes=100) == TOO_LARGE
+
+        [skipped] = classifier.get_skipped()
+        assert (skipped.rel_path, skipped.subsystem, skipped.size) == ("big.py", "parse", 600)
+
+    def test_truncate_allows_large_text(self, tmp_path):
+        """切り詰める場合は大きいテキストファイルもスキップしない"""
+        (tmp_path / "big.md").write_text("line\n" * 100)
+        (tmp_path / "app.min.js").write_text("var a=1;\n" * 100)
+        classifier = FileClassifier(tmp_path)
+
+        assert classifier.check("big.md", "rag", max_bytes=100, truncate=True) is None
+        assert classifier.check("app.min.js", "rag", max_bytes=100, truncate=True) == MINIFIED
+        assert [s.rel_path for s in classifier.get_skipped()] == ["app.min.js"]
+
+    def test_results_are_memoized(self, tmp_path):
+        """サイズと種類は一度だけ判定する"""
+        (tmp_path / "a.py").write_text("x = 1\n")
+        classifier = FileClassifier(tmp_path)
+        classifier.check("a.py", "parse", max_bytes=0)
+
+        with patch("os.stat") as stat, patch("builtins.open") as open_:
+            assert classifier.check("a.py", "rag", max_bytes=0) is None
+        stat.assert_not_called()
+        open_.assert_not_called()
+
+
+def test_read_text_limited_truncates_at_newline(tmp_path):
+    """上限以内の最後の改行で切り詰める"""
+    path = tmp_path / "doc.md"
+    path.write_text("あいう\n" * 10)  # 1行10バイト
+
+    assert read_text_limited(path, 0) == ("あいう\n" * 10, False)
+    assert read_text_limited(path, 25) == ("あいう\n" * 2, True)
+
+
+def test_summarize_skipped(tmp_path):
+    """スキップしたファイルをサブシステムごとにサイズの大きい順で報告する"""
+    for name, size in (("a.bin", 10), ("b.bin", 30), ("c.bin", 20)):
+        (tmp_path / name).write_bytes(b"\0" * size)
+    classifier = FileClassifier(tmp_path)
+    for name in ("a.bin", "b.bin", "c.bin"):
+        classifier.check(name, "parse", max_bytes=0)
+
+    lines = summarize_skipped(classifier.get_skipped(), limit=2)
+    assert lines[0] == "[parse] 3 件のファイルをスキップしました（binary: 3）"
+    assert [line.split()[1] for line in lines[1:3]] == ["b.bin", "c.bin"]
+    assert lines[3] == "  ... 他 1 件"
+
+
+class TestSubsystemLimits:
+    """パーサー・チャンク化でのサイズ・種類の判定のテスト"""
+
+    def test_parser_skips_large_and_generated_files(self, tmp_path):
+        """サイズ上限を超えるファイルと生成されたファイルは解析しない"""
+        (tmp_path / "small.py").write_text("def small():\n    pass\n")
+        (tmp_path / "large.py").write_text("def large():\n    pass\n" + "# pad\n" * 500)
+        (tmp_path / "generated.py").write_text("DATA = [" + "1," * 600 + "]\n")
+        files = [
+            (tmp_path / name, tmp_path.joinpath(name).relative_to(tmp_path))
+            for name in ("small.py", "large.py", "generated.py")
+        ]
+        classifier = FileClassifier(tmp_path)
+
+        apis = PythonParser(tmp_path).parse_project(
+            use_cache=False,
+            files_to_parse=files,
+            use_parallel=False,
+            classifier=classifier,
+            max_file_bytes=2000,
+        )
+
+        assert [api.name for api in apis] == ["small"]
+        assert {(s.rel_path, s.reason) for s in classifier.get_skipped()} == {
+            ("large.py", TOO_LARGE),
+            ("generated.py", MINIFIED),
+        }
+
+    def test_chunker_truncates_large_files(self, tmp_path):
+        """チャンク化ではサイズ上限を超えるファイルの先頭のみ読み込む"""
+        (tmp_path / "guide.txt").write_text("first line\n" + "x" * 50 + "\n" + "tail\n" * 100)
+        chunker = CodeChunker({"max_file_bytes": 65})
+
+        chunks = chunker.chunk_codebase(tmp_path)
+
+        text = "".join(chunk["text"] for chunk in chunks)
+        assert "first line" in text
+        assert "tail" not in text
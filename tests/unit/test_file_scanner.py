@@ -0,0 +1,161 @@
+"""
+UnifiedFileScannerのテスト
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from docgen.utils.file_scanner import UnifiedFileScanner
+from docgen.utils.fs_walker import file_extension, prefetch_listings, walk_files
+
+
+@pytest.fixture
+def project_tree(tmp_path):
+    """走査対象のプロジェクトを作成"""
+    root = tmp_path / "project"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / "main.py").write_text("def main(): pass\n")
+    (root / "src" / "pkg" / "util.py").write_text("def util(): pass\n")
+    (root / "web").mkdir()
+    (root / "web" / "app.js").write_text("function app() {}\n")
+    (root / "node_modules" / "lib").mkdir(parents=True)
+    (root / "node_modules" / "lib" / "index.js").write_text("module.exports = {}\n")
+    (root / "README.md").write_text("# project\n")
+    return root
+
+
+def _age_tree(root, seconds=10):
+    """レースウィンドウを避けるため、全ディレクトリのmtimeを過去に設定"""
+    past = os.stat(root).st_mtime - seconds
+    for dirpath, _dirs, _files in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def _relative_files(scanner):
+    return sorted(str(rel) for _abs, rel in scanner.get_all_files())
+
+
+class TestUnifiedFileScannerSnapshot:
+    """スナップショットモードのテスト"""
+
+    def test_snapshot_matches_walk(self, project_tree, tmp_path):
+        """スナップショットモードでも通常走査と同じ結果になる"""
+        exclude = {"node_modules"}
+        walk_scanner = UnifiedFileScanner(project_tree, exclude_dirs=exclude)
+        snap_scanner = UnifiedFileScanner(
+            project_tree,
+            exclude_dirs=exclude,
+            snapshot=True,
+            snapshot_path=tmp_path / "snapshot.json",
+        )
+
+        assert _relative_files(snap_scanner) == _relative_files(walk_scanner)
+        result = snap_scanner.scan_once()
+        assert set(result["files_by_extension"]) == {".py", ".js", ".md"}
+        assert result["snapshot_stats"]["hits"] == 0
+        assert result["snapshot_stats"]["misses"] > 0
+
+    def test_unchanged_directories_are_reused(self, project_tree, tmp_path):
+        """mtimeが変わらないディレクトリはスナップショットから再利用される"""
+        _age_tree(project_tree)
+        snapshot_path = tmp_path / "snapshot.json"
+
+        first = UnifiedFileScanner(project_tree, snapshot=True, snapshot_path=snapshot_path)
+        first.scan_once()
+        assert snapshot_path.exists()
+
+        second = UnifiedFileScanner(project_tree, snapshot=True, snapshot_path=snapshot_path)
+        stats = second.scan_once()["snapshot_stats"]
+        assert stats["misses"] == 0
+        assert stats["hits"] == first.scan_once()["snapshot_stats"]["misses"]
+        assert _relative_files(second) == _relative_files(first)
+
+    def test_changed_directory_is_relisted(self, project_tree, tmp_path):
+        """エントリが追加されたディレクトリのみ再列挙される"""
+        _age_tree(project_tree)
+        snapshot_path = tmp_path / "snapshot.json"
+        UnifiedFileScanner(project_tree, snapshot=True, snapshot_path=snapshot_path).scan_once()
+
+        (project_tree / "src" / "pkg" / "new_module.py").write_text("x = 1\n")
+
+        scanner = UnifiedFileScanner(project_tree, snapshot=True, snapshot_path=snapshot_path)
+        stats = scanner.scan_once()["snapshot_stats"]
+        assert stats["misses"] == 1
+        assert "src/pkg/new_module.py" in _relative_files(scanner)
+
+    def test_walk_mode_has_no_snapshot_stats(self, project_tree):
+        """通常モードでは結果にスナップショット統計が含まれない"""
+        result = UnifiedFileScanner(project_tree).scan_once()
+        assert "snapshot_stats" not in result
+
+
+class TestWalkFiles:
+    """scandirベースの走査エンジンのテスト"""
+
+    def test_matches_os_walk_order(self, project_tree):
+        """os.walkと同じ順序・相対パスで列挙される"""
+        expected = []
+        for dirpath, dirs, files in os.walk(project_tree):
+            dirs[:] = [d for d in dirs if d != "node_modules"]
+            for name in files:
+                expected.append(os.path.relpath(os.path.join(dirpath, name), project_tree))
+
+        walked = walk_files(str(project_tree), prune_dir=lambda _rel, name: name == "node_modules")
+        assert [w.rel_path for w in walked] == [p.replace(os.sep, "/") for p in expected]
+
+    def test_symlinks_are_not_followed(self, project_tree):
+        """シンボリックリンクはファイル・ディレクトリとも列挙されない"""
+        (project_tree / "link.py").symlink_to(project_tree / "src" / "main.py")
+        (project_tree / "linked_dir").symlink_to(project_tree / "src", target_is_directory=True)
+
+        rel_paths = {w.rel_path for w in walk_files(str(project_tree))}
+        assert "src/main.py" in rel_paths
+        assert "link.py" not in rel_paths
+        assert not any(p.startswith("linked_dir/") for p in rel_paths)
+
+    def test_file_extension_matches_path_suffix(self):
+        """拡張子の判定がPath.suffixと一致する"""
+        for name in ["a.py", "A.PY", ".bashrc", "archive.tar.gz", "noext", "trailing."]:
+            assert file_extension(name) == Path(name).suffix.lower()
+
+
+class TestParallelScan:
+    """並列走査のテスト"""
+
+    def test_prefetch_preserves_walk_order(self, tmp_path):
+        """先行列挙した結果での走査が逐次走査と同じ順序になる"""
+        root = tmp_path / "wide"
+        for i in range(12):
+            for j in range(4):
+                (root / f"d{i}" / f"s{j}").mkdir(parents=True)
+                (root / f"d{i}" / f"s{j}" / "f.py").write_text("")
+            (root / f"d{i}" / "skip").mkdir()
+            (root / f"d{i}" / "skip" / "x.py").write_text("")
+
+        def prune(_rel, name):
+            return name == "skip"
+
+        expected = [w.rel_path for w in walk_files(str(root), prune_dir=prune)]
+        for workers in (1, 2, 8):
+            lister = prefetch_listings(str(root), prune_dir=prune, workers=workers)
+            walked = walk_files(str(root), prune_dir=prune, list_dir=lister)
+            assert [w.rel_path for w in walked] == expected
+
+    def test_prefetch_propagates_predicate_errors(self, project_tree):
+        """判定関数の例外は呼び出し側に送出される"""
+
+        def prune(_rel, _name):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            prefetch_listings(str(project_tree), prune_dir=prune, workers=4)
+
+    def test_scanner_results_match_serial(self, project_tree):
+        """並列走査の結果とディレクトリ一覧が逐次走査と一致する"""
+        serial = UnifiedFileScanner(project_tree, exclude_dirs={"node_modules"})
+        parallel = UnifiedFileScanner(project_tree, exclude_dirs={"node_modules"}, workers=4)
+        assert parallel.get_all_files() == serial.get_all_files()
+        assert parallel.get_directories() == serial.get_directories()
+        assert parallel.get_directory_listing("src") == serial.get_directory_listing("src")
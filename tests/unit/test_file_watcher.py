@@ -0,0 +1,127 @@
+"""
+ファイル監視とwatchコマンドのテスト
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from docgen.document_generator import DocumentGenerator
+from docgen.models import DetectedLanguage
+from docgen.utils.change_set import select_targets
+from docgen.utils.file_watcher import (
+    FileChange,
+    InotifyWatcher,
+    PollingWatcher,
+    collect_changes,
+    merge_changes,
+)
+
+
+def _prune(_rel, name):
+    return name.startswith(".") or name == "node_modules"
+
+
+def _kinds(changes):
+    return sorted((c.rel_path, c.kind) for c in changes)
+
+
+@pytest.fixture
+def watched_tree(tmp_path):
+    """監視対象のプロジェクトを作成"""
+    root = tmp_path / "project"
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "main.py").write_text("x = 1\n")
+    (root / "README.md").write_text("# project\n")
+    (root / "node_modules").mkdir()
+    return root
+
+
+class TestWatchers:
+    """ウォッチャーのテスト"""
+
+    def test_polling_detects_changes(self, watched_tree):
+        """ポーリングで作成・変更・削除を検知する"""
+        watcher = PollingWatcher(str(watched_tree), prune_dir=_prune, interval=0.01)
+        (watched_tree / "src" / "main.py").write_text("x = 2  # changed size\n")
+        (watched_tree / "src" / "new.py").write_text("")
+        (watched_tree / "README.md").unlink()
+        (watched_tree / "node_modules" / "dep.js").write_text("")
+
+        changes = collect_changes(watcher, debounce=0.05, timeout=2.0)
+        assert _kinds(changes) == [
+            ("README.md", "deleted"),
+            ("src/main.py", "modified"),
+            ("src/new.py", "created"),
+        ]
+
+    @pytest.mark.skipif(not InotifyWatcher.is_available(), reason="inotify is not available")
+    def test_inotify_follows_new_directories(self, watched_tree):
+        """inotifyで新しいディレクトリ配下の変更も検知し、除外ディレクトリは無視する"""
+        watcher = InotifyWatcher(str(watched_tree), prune_dir=_prune)
+        try:
+            (watched_tree / "pkg").mkdir()
+            (watched_tree / "pkg" / "mod.py").write_text("")
+            (watched_tree / "node_modules" / "dep.js").write_text("")
+            changes = collect_changes(watcher, debounce=0.1, timeout=2.0)
+            assert ("pkg/mod.py", "created") in _kinds(changes)
+            assert not any(c.rel_path.startswith("node_modules") for c in changes)
+
+            (watched_tree / "pkg" / "mod.py").write_text("y = 1\n")
+            changes = collect_changes(watcher, debounce=0.1, timeout=2.0)
+            assert _kinds(changes) == [("pkg/mod.py", "modified")]
+        finally:
+            watcher.close()
+
+    def test_merge_changes(self):
+        """同じパスへの連続した変更は最終状態にまとめられる"""
+        changes = [
+            FileChange("a.py", "created", False, 1.0),
+            FileChange("a.py", "modified", False, 2.0),
+            FileChange("tmp.swp", "created", False, 1.5),
+            FileChange("tmp.swp", "deleted", False, 1.6),
+            FileChange("b.py", "deleted", False, 3.0),
+            FileChange("b.py", "created", False, 3.1),
+        ]
+        merged = merge_changes(changes)
+        assert _kinds(merged) == [("a.py", "created"), ("b.py", "modified")]
+        assert next(c for c in merged if c.rel_path == "a.py").timestamp == 1.0
+
+
+class TestWatchTargets:
+    """再生成対象の選択のテスト"""
+
+    @pytest.mark.parametrize(
+        "paths, expected",
+        [
+            (["src/main.py"], {"api", "rag"}),
+            (["pyproject.toml"], {"readme", "agents", "contributing"}),
+            (["docs/guide.md"], {"rag"}),
+            (["src/main.py", "package.json"], {"api", "rag", "readme", "agents", "contributing"}),
+        ],
+    )
+    def test_modified_files(self, paths, expected):
+        """変更されたファイルの種類に応じて対象を選ぶ"""
+        changes = [FileChange(path, "modified", False, 0.0) for path in paths]
+        assert select_targets(changes) == expected
+
+    def test_structure_changes_regenerate_all(self):
+        """ファイルの追加・削除ではすべて再生成する"""
+        assert select_targets([FileChange("src/new.py", "created", False, 0.0)]) is None
+        assert select_targets([FileChange("src/old.py", "deleted", False, 0.0)]) is None
+
+    @patch("docgen.document_generator.GeneratorFactory")
+    def test_document_generator_runs_only_targets(self, mock_factory, tmp_path):
+        """指定した種類のジェネレーターのみ実行し、共有キャッシュをAPI生成に渡す"""
+        mock_factory.create_generator.return_value.generate.return_value = True
+        warm_state = MagicMock()
+        generator = DocumentGenerator(
+            tmp_path, [DetectedLanguage(name="python")], {}, warm_state=warm_state
+        )
+
+        assert generator.generate_documents(targets={"api"})
+        mock_factory.create_generator.assert_called_once()
+        assert mock_factory.create_generator.call_args.args[0] == "api"
+        assert mock_factory.create_generator.call_args.kwargs["cache_manager"] is (
+            warm_state.cache_manager
+        )
@@ -0,0 +1,64 @@
+"""
+汎用パーサー（GenericParser）のテスト
+"""
+
+from pathlib import Path
+
+from docgen.generators.parsers.generic_parser import GenericParser
+
+_GO = """package main
+
+// Load はファイルを読み込みます
+// 複数行のコメント
+func Load(path string) string {
+	return path // http://example.com
+}
+
+func helper() {}
+
+type Model struct {
+	Name string
+}
+"""
+
+_JAVA = """/**
+ * Greeter class
+ */
+public class Greeter {
+    /**
+     * Say hi
+     */
+    public String greet(String name) { return name; }
+}
+"""
+
+
+def _parse(tmp_path: Path, language: str, name: str, content: str) -> list[tuple]:
+    file_path = tmp_path / name
+    file_path.write_text(content, encoding="utf-8")
+    apis = GenericParser(tmp_path, language).parse_file(file_path)
+    return [(api.type, api.name, api.docstring, api.line_number) for api in apis]
+
+
+def test_go_line_comments_attach_to_following_function(tmp_path):
+    """連続する行コメントは1つのドキュメントとして直後の関数に付き、行末のコメントは無視する"""
+    assert _parse(tmp_path, "go", "main.go", _GO) == [
+        ("function", "Load", "Load はファイルを読み込みます\n複数行のコメント", 5),
+        ("class", "Model", "", 11),
+    ]
+
+
+def test_java_block_comments(tmp_path):
+    """ブロックコメントは次のドキュメントコメントまでの関数に付く"""
+    assert _parse(tmp_path, "java", "Greeter.java", _JAVA) == [
+        ("class", "Greeter", "", 4),
+        ("function", "greet", "Say hi", 8),
+    ]
+
+
+def test_pattern_compiled_once_per_language():
+    """言語ごとの選択パターンはクラスで共有される"""
+    pattern = GenericParser.get_pattern("rust")
+    assert GenericParser.get_pattern("rust") is pattern
+    assert GenericParser.get_pattern("unknown") is not pattern
+    assert set(pattern.groupindex) >= {"_doc", "_class", "_function", "doc", "function"}
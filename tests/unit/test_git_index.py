@@ -0,0 +1,137 @@
+"""
+gitインデックスバックエンドのテスト
+"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from docgen.utils.file_scanner import UnifiedFileScanner, create_unified_scanner
+from docgen.utils.git_index import (
+    GitIndexError,
+    find_git_dir,
+    load_tracked_files,
+    read_git_index,
+)
+from docgen.utils.gitignore_parser import load_gitignore_patterns
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """追跡・未追跡・無視ファイルを含むリポジトリを作成"""
+    root = tmp_path / "repo"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / "main.py").write_text("print('main')\n")
+    (root / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+    (root / "build").mkdir()
+    (root / "build" / "keep.py").write_text("")
+    (root / "README.md").write_text("# repo\n")
+    (root / ".gitignore").write_text("build/\n*.log\n")
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "add", "-f", "build/keep.py")
+
+    (root / "src" / "new.py").write_text("")
+    (root / "src" / "debug.log").write_text("")
+    (root / "build" / "out.py").write_text("")
+    (root / "scratch").mkdir()
+    (root / "scratch" / "note.py").write_text("")
+    return root
+
+
+def _scan(root, **kwargs):
+    scanner = UnifiedFileScanner(
+        root, gitignore_matcher=load_gitignore_patterns(root), backend="git_index", **kwargs
+    )
+    return scanner, sorted(rel.as_posix() for _abs, rel in scanner.get_all_files())
+
+
+class TestReadGitIndex:
+    """インデックスのパースのテスト"""
+
+    @pytest.mark.parametrize("version", ["2", "3", "4"])
+    def test_versions(self, git_repo, version):
+        """v2・v3・v4（プレフィックス圧縮）のインデックスを読み込める"""
+        _git(git_repo, "update-index", "--index-version", version)
+        paths = [entry.path for entry in read_git_index(git_repo / ".git")]
+        assert paths == [
+            ".gitignore",
+            "README.md",
+            "build/keep.py",
+            "src/main.py",
+            "src/pkg/mod.py",
+        ]
+
+    def test_entries_carry_stat_data(self, git_repo):
+        """エントリにワークツリーのstat情報が記録されている"""
+        entries = {entry.path: entry for entry in read_git_index(git_repo / ".git")}
+        stat = (git_repo / "src" / "main.py").stat()
+        entry = entries["src/main.py"]
+        assert entry.size == stat.st_size
+        assert entry.mtime_ns // 1_000_000_000 == stat.st_mtime_ns // 1_000_000_000
+        assert len(entry.object_id) == 40
+
+    def test_invalid_index(self, tmp_path):
+        """インデックスでないファイルは例外になる"""
+        (tmp_path / "index").write_bytes(b"not an index")
+        with pytest.raises(GitIndexError):
+            read_git_index(tmp_path)
+
+    def test_subdirectory_project_root(self, git_repo):
+        """プロジェクトルートがサブディレクトリの場合は相対パスに変換される"""
+        assert find_git_dir(git_repo / "src")[0] == git_repo
+        assert sorted(load_tracked_files(git_repo / "src")) == ["main.py", "pkg/mod.py"]
+
+
+class TestGitIndexBackend:
+    """スキャナーのgit_indexバックエンドのテスト"""
+
+    def test_tracked_files_bypass_gitignore(self, git_repo):
+        """追跡ファイルは.gitignoreに一致しても含まれ、未追跡ファイルには.gitignoreが適用される"""
+        scanner, files = _scan(git_repo)
+        assert files == [
+            ".gitignore",
+            "README.md",
+            "build/keep.py",
+            "scratch/note.py",
+            "src/main.py",
+            "src/new.py",
+            "src/pkg/mod.py",
+        ]
+        assert scanner.scan_once()["backend"] == "git_index"
+        assert scanner.get_index_entry("src/main.py").size == len("print('main')\n")
+        assert scanner.get_index_entry("src/new.py") is None
+
+    def test_untracked_disabled(self, git_repo):
+        """untracked=Falseでは追跡ファイルのみ、削除済みのファイルは含まれない"""
+        (git_repo / "src" / "pkg" / "mod.py").unlink()
+        _scanner, files = _scan(git_repo, include_untracked=False)
+        assert files == [".gitignore", "README.md", "build/keep.py", "src/main.py"]
+
+    def test_fallback_without_repository(self, tmp_path):
+        """gitリポジトリでない場合は通常の走査にフォールバックする"""
+        (tmp_path / "a.py").write_text("")
+        scanner, files = _scan(tmp_path)
+        assert files == ["a.py"]
+        assert scanner.scan_once()["backend"] == "walk"
+
+    def test_fingerprint_tracks_index(self, git_repo):
+        """インデックスが更新されるとフィンガープリントが変わる"""
+        first = create_unified_scanner(git_repo, backend="git_index").fingerprint
+        assert create_unified_scanner(git_repo, backend="git_index").fingerprint == first
+        assert create_unified_scanner(git_repo).fingerprint != first
+
+        _git(git_repo, "add", "src/new.py")
+        assert create_unified_scanner(git_repo, backend="git_index").fingerprint != first
@@ -0,0 +1,128 @@
+"""
+GitIgnoreMatcherのテスト
+"""
+
+import pytest
+
+from docgen.utils.file_scanner import UnifiedFileScanner
+from docgen.utils.gitignore_parser import (
+    GitIgnoreMatcher,
+    IgnoreRuleSet,
+    load_gitignore_patterns,
+    parse_gitignore_line,
+)
+
+
+def _rule_set(*lines, base_dir=""):
+    return IgnoreRuleSet(base_dir, [r for r in map(parse_gitignore_line, lines) if r])
+
+
+def _matcher(root, gitignore):
+    root.mkdir(parents=True, exist_ok=True)
+    (root / ".gitignore").write_text(gitignore)
+    return GitIgnoreMatcher(root)
+
+
+class TestIgnoreRuleSet:
+    """パターンのコンパイルと評価のテスト"""
+
+    @pytest.mark.parametrize(
+        "pattern, path, is_dir, expected",
+        [
+            ("*.log", "a/b/debug.log", False, True),
+            ("*.log", "a/b/debug.txt", False, None),
+            ("*.tar.gz", "dist.tar.gz", False, True),
+            ("*.tar.gz", "dist.gz", False, None),
+            ("build/", "src/build", True, True),
+            ("build/", "src/build", False, None),
+            ("/build", "build", True, True),
+            ("/build", "src/build", True, None),
+            ("doc/*.txt", "doc/notes.txt", False, True),
+            ("doc/*.txt", "doc/sub/notes.txt", False, None),
+            ("**/logs", "a/b/logs", True, True),
+            ("logs/**", "logs/a/b.txt", False, True),
+            ("a/**/b", "a/x/y/b", False, True),
+            ("a/**/b", "a/b", False, True),
+            ("file[0-9].py", "file3.py", False, True),
+            ("file[!0-9].py", "file3.py", False, None),
+            ("te?t.py", "test.py", False, True),
+        ],
+    )
+    def test_pattern_semantics(self, pattern, path, is_dir, expected):
+        """gitのパターン仕様どおりに一致する"""
+        name = path.rpartition("/")[2]
+        assert _rule_set(pattern).match(path, name, is_dir) is expected
+
+    def test_last_match_wins_across_buckets(self):
+        """辞書引きと正規表現の混在でも最後に書かれたパターンが優先される"""
+        rules = _rule_set("*.py", "!keep.py", "k*p.py")
+        assert rules.match("keep.py", "keep.py", False) is True
+        rules = _rule_set("k*p.py", "*.py", "!keep.py")
+        assert rules.match("keep.py", "keep.py", False) is False
+
+    def test_comments_escapes_and_blank_lines(self):
+        """コメント・空行は無視され、エスケープは文字として扱われる"""
+        assert parse_gitignore_line("# comment") is None
+        assert parse_gitignore_line("   \n") is None
+        rules = _rule_set("\\#hash", "\\!bang")
+        assert rules.match("#hash", "#hash", False) is True
+        assert rules.match("!bang", "!bang", False) is True
+
+
+class TestGitIgnoreMatcher:
+    """除外ファイルのスタックとディレクトリ単位の判定のテスト"""
+
+    def test_excluded_dir_excludes_descendants(self, tmp_path):
+        """除外されたディレクトリ配下は否定パターンがあっても除外される"""
+        matcher = _matcher(tmp_path / "p", "cache/\n!cache/keep.txt\n")
+        assert matcher.should_exclude_dir_relative("cache")
+        assert matcher.should_exclude_dir_relative("cache/deep")
+        assert matcher.is_ignored_relative("cache/keep.txt")
+
+    def test_nested_gitignore_overrides_parent(self, tmp_path):
+        """サブディレクトリの.gitignoreはそのディレクトリ配下にのみ適用され、親より優先される"""
+        root = tmp_path / "p"
+        (root / "pkg").mkdir(parents=True)
+        (root / "pkg" / ".gitignore").write_text("!important.log\n/generated\n")
+        matcher = _matcher(root, "*.log\n")
+
+        assert matcher.is_ignored_relative("other.log")
+        assert matcher.is_ignored_relative("pkg/debug.log")
+        assert not matcher.is_ignored_relative("pkg/important.log")
+        assert matcher.is_ignored_relative("important.log")
+        assert matcher.should_exclude_dir_relative("pkg/generated")
+        assert not matcher.should_exclude_dir_relative("generated")
+
+    def test_info_exclude_has_lower_priority(self, tmp_path):
+        """.git/info/excludeも読み込まれ、.gitignoreより優先度が低い"""
+        root = tmp_path / "p"
+        (root / ".git" / "info").mkdir(parents=True)
+        (root / ".git" / "info" / "exclude").write_text("local/\n*.tmp\n")
+        matcher = _matcher(root, "!keep.tmp\n")
+
+        assert matcher.should_exclude_dir_relative("local")
+        assert matcher.is_ignored_relative("x.tmp")
+        assert not matcher.is_ignored_relative("keep.tmp")
+
+    def test_load_without_gitignore(self, tmp_path):
+        """.gitignoreも.gitもない場合はNone"""
+        assert load_gitignore_patterns(tmp_path) is None
+        (tmp_path / ".git").mkdir()
+        assert load_gitignore_patterns(tmp_path) is not None
+
+    def test_scanner_prunes_ignored_trees(self, tmp_path):
+        """走査時に除外ディレクトリへは入らず、配下の.gitignoreも読み込まない"""
+        root = tmp_path / "p"
+        (root / "vendor" / "lib").mkdir(parents=True)
+        (root / "vendor" / ".gitignore").write_text("!*\n")
+        (root / "vendor" / "lib" / "x.py").write_text("")
+        (root / "src").mkdir()
+        (root / "src" / ".gitignore").write_text("*.gen.py\n")
+        (root / "src" / "a.py").write_text("")
+        (root / "src" / "a.gen.py").write_text("")
+        matcher = _matcher(root, "vendor/\n")
+
+        scanner = UnifiedFileScanner(root, gitignore_matcher=matcher)
+        files = sorted(rel.as_posix() for _abs, rel in scanner.get_all_files())
+        assert files == [".gitignore", "src/.gitignore", "src/a.py"]
+        assert all(rule_set.base_dir != "vendor" for rule_set in matcher.rule_sets)
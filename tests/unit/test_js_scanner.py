@@ -0,0 +1,141 @@
+"""
+JavaScript/TypeScriptの宣言スキャナー（js_scanner）のテスト
+"""
+
+import pytest
+
+from docgen.generators.parsers.js_parser import JSParser
+from docgen.generators.parsers.js_scanner import scan_declarations
+from docgen.models import APIInfo
+
+_SOURCE = """\
+/**
+ * 挨拶する
+ * @param {string} name - 名前
+ */
+export async function hello(name: string): Promise<string> {
+  const text = `{ ${name.replace(/}/g, "{")} ${`${ {a: 1}.a }`}`;
+  function inner() {}
+  return '}' + text;
+}
+
+// function commented() {}
+const pattern = /class NotAClass {/g;
+export const add = (a: number, b: number): number => a + b
+let double = async x => x * 2
+
+/** 計算機 */
+export default class Calculator extends Base<number> {
+  static count = 0
+  #secret() {}
+  /** 加算 */
+  @log()
+  add(a: number, b: number): number {
+    return a + b;
+  }
+  get total(): number { return 1 }
+  handle = (e: Event) => { console.log("}") }
+  abstract run(): void;
+}
+
+module.exports = {
+  foo(a) { return a; },
+  bar: (b) => b,
+  baz: 1,
+};
+"""
+
+
+def _summary(declarations):
+    return [(d.name, d.kind, d.line, d.signature) for d in declarations]
+
+
+def test_scan_declarations():
+    """文字列・テンプレート・コメント・正規表現中の括弧に影響されずに宣言を抽出する"""
+    declarations = scan_declarations(_SOURCE)
+
+    assert _summary(declarations) == [
+        ("hello", "function", 5, "function hello(name: string)"),
+        ("add", "function", 13, "function add(a: number, b: number)"),
+        ("double", "function", 14, "function double(x)"),
+        ("Calculator", "class", 17, "class Calculator"),
+        ("add", "method", 21, "add(a: number, b: number)"),
+        ("total", "method", 25, "get total()"),
+        ("handle", "method", 26, "handle(e: Event)"),
+        ("run", "method", 27, "run()"),
+        ("foo", "function", 31, "foo(a)"),
+        ("bar", "function", 32, "bar(b)"),
+    ]
+    docs = {d.name: (d.jsdoc or "").strip() for d in declarations if d.kind != "method"}
+    assert docs["hello"].startswith("* 挨拶する")
+    assert docs["Calculator"] == "計算機"
+    assert declarations[4].jsdoc.strip() == "加算"
+
+
+def test_unbalanced_brace_in_string_does_not_swallow_rest(tmp_path):
+    """文字列中の閉じていない括弧があっても後続のクラスのメソッドを判定する"""
+    source = 'const open = "{";\nclass A {\n  m() {}\n}\nfunction after() {}\n'
+    assert _summary(scan_declarations(source)) == [
+        ("A", "class", 2, "class A"),
+        ("m", "method", 3, "m()"),
+        ("after", "function", 5, "function after()"),
+    ]
+
+
+def test_braces_in_class_type_arguments():
+    """型パラメータ・継承元の型引数中の{}をクラス本体と誤認しない"""
+    source = (
+        "class Greeter<T extends { id: string }> {\n  greet(t: T) {}\n}\n"
+        "class A extends Base<{ a: number }> implements I<{ b: 1 }> {\n  run() {}\n}\n"
+    )
+    assert _summary(scan_declarations(source)) == [
+        ("Greeter", "class", 1, "class Greeter"),
+        ("greet", "method", 2, "greet(t: T)"),
+        ("A", "class", 4, "class A"),
+        ("run", "method", 5, "run()"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("name", "props"),
+    [("list.jsx", "{ items }"), ("list.tsx", "{ items }: { items: string[] }")],
+)
+def test_jsx_closing_tags_are_not_regex(tmp_path, name, props):
+    """JSXの式の中の閉じタグ（</tag>)}）を正規表現リテラルと誤認しない"""
+    (tmp_path / name).write_text(
+        f"export function List({props}) {{\n"
+        "  return <ul>{items.map(i => <li key={i}>{i}</li>)}</ul>;\n"
+        "}\n"
+        "function helper(a) { return a / 2; }\n"
+        "class Widget extends React.Component {\n"
+        "  render() { return <div>{this.props.x && <span>{'x'}</span>}</div>; }\n"
+        "}\n"
+    )
+    apis = JSParser(tmp_path).parse_file(tmp_path / name)
+
+    assert [(api.name, api.type, api.line_number) for api in apis] == [
+        ("List", "function", 1),
+        ("helper", "function", 4),
+        ("Widget", "class", 5),
+        ("render", "method", 6),
+    ]
+
+
+def test_js_parser_records(tmp_path):
+    """JSParserはJSDocの説明とパラメータを含むAPI情報を返す"""
+    (tmp_path / "a.js").write_text(
+        "/**\n * 関数\n * @param {string} a - 値\n */\nfunction top(a) {\n  return a;\n}\n\n"
+        "class Model {\n  load(path) {\n    return path;\n  }\n}\n"
+    )
+    apis = JSParser(tmp_path).parse_file(tmp_path / "a.js")
+
+    assert all(isinstance(api, APIInfo) for api in apis)
+
+    assert [(api.name, api.type, api.line_number) for api in apis] == [
+        ("top", "function", 5),
+        ("Model", "class", 9),
+        ("load", "method", 10),
+    ]
+    assert apis[0].docstring == "関数\n@param {string} a - 値"
+    assert [(p.name, p.type, p.description) for p in apis[0].parameters] == [("a", "string", "値")]
+    assert apis[1].parameters is None
@@ -0,0 +1,74 @@
+"""
+解析済みモジュールのストア（ModuleStore）のテスト
+"""
+
+import ast
+import os
+import pickle
+from unittest.mock import patch
+
+from docgen.collectors.structure_analyzer import StructureAnalyzer
+from docgen.rag.chunker import CodeChunker
+from docgen.utils.module_store import ModuleStore
+from docgen.utils.scan_session import ScanSession
+from docgen.validators.implementation_validator import ImplementationValidator
+
+
+def _write(path, text):
+    path.write_text(text)
+    # 更新時刻で変更を検出できるように時刻をずらす
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_modules_are_shared_by_content(tmp_path):
+    """同じ内容のファイルは同じモジュールを共有し、変更されたファイルは読み込み直す"""
+    (tmp_path / "a.py").write_text("def a():\n    pass\n")
+    (tmp_path / "b.py").write_text("def a():\n    pass\n")
+    store = ModuleStore()
+
+    first = store.get(tmp_path / "a.py")
+    assert store.get(tmp_path / "b.py") is first
+    assert store.from_source("def a():\n    pass\n") is first
+    assert [node.name for node in first.definitions] == ["a"]
+    assert first.line_offsets == [0, 9, 18]
+
+    _write(tmp_path / "a.py", "class A:\n    pass\n")
+    changed = store.get(tmp_path / "a.py")
+    assert changed is not first
+    assert [node.name for node in changed.definitions] == ["A"]
+    assert len(store) == 2
+
+
+def test_syntax_error_and_size_limit(tmp_path):
+    """構文エラーはerrorに保持し、サイズ上限を超えるファイルは読み込まない"""
+    (tmp_path / "broken.py").write_text("def broken(:\n")
+    store = ModuleStore()
+
+    module = store.get(tmp_path / "broken.py")
+    assert module.tree is None
+    assert isinstance(module.error, SyntaxError)
+    assert module.definitions == []
+    assert store.get(tmp_path / "broken.py", max_bytes=4) is None
+    # ワーカープロセスには空のストアとして転送する
+    assert len(pickle.loads(pickle.dumps(store))) == 0
+
+
+def test_each_file_is_parsed_once_per_session(tmp_path):
+    """API解析・実装検証・RAGチャンク化・構造分析で各ファイルを一度だけパースする"""
+    for i in range(3):
+        (tmp_path / f"m{i}.py").write_text(f'def func_{i}():\n    """関数{i}"""\n')
+    session = ScanSession(tmp_path, {"exclude": {"use_gitignore": False}})
+    session.scan()
+
+    with patch("docgen.utils.module_store.ast.parse", wraps=ast.parse) as parse:
+        validator = ImplementationValidator(tmp_path, languages=["python"], scan_session=session)
+        index = validator.build_api_index()
+        chunks = CodeChunker().chunk_codebase(tmp_path, scan_session=session)
+        analyzer = StructureAnalyzer(tmp_path, scan_session=session)
+        counts = [analyzer.count_symbols_in_file(tmp_path / f"m{i}.py") for i in range(3)]
+
+    assert parse.call_count == 3
+    assert index["function"] == {"func_0", "func_1", "func_2"}
+    assert sorted(chunk["name"] for chunk in chunks) == ["func_0", "func_1", "func_2"]
+    assert counts == [1, 1, 1]
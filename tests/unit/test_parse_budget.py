@@ -0,0 +1,155 @@
+"""
+ファイルごとの解析の時間の上限（parse.file_timeout）のテスト
+"""
+
+import re
+import time
+from unittest.mock import patch
+
+from docgen.generators.parsers.generic_parser import GenericParser
+from docgen.generators.parsers.js_parser import JSParser
+from docgen.utils.cache import CacheManager
+from docgen.utils.file_classifier import FileClassifier, SlowFile, summarize_slow
+
+# 字句解析が時間の上限を確認するのに十分なトークン数を含むJavaScript
+_SLOW_JS = "export class Store {}\n" + "".join(
+    f"/** 関数{i} */\nexport function handler{i}(a, b) {{ return a + b; }}\n" for i in range(500)
+)
+
+# ネストした量指定子: "("のない長い単語列では、1回の照合の中で破滅的なバックトラックを起こす
+_NESTED_QUANTIFIER = re.compile(r"(?:\w+\s?)+\(")
+
+
+class _BacktrackingParser(GenericParser):
+    """slow.goの抽出で、確認位置のない1回の正規表現の照合が終わらないパーサー"""
+
+    def _extract_elements(self, content, file_path):
+        if file_path.name == "slow.go":
+            _NESTED_QUANTIFIER.search(content)
+        return super()._extract_elements(content, file_path)
+
+
+def _project(tmp_path):
+    (tmp_path / "slow.js").write_text(_SLOW_JS, encoding="utf-8")
+    (tmp_path / "fast.js").write_text("function ok(a) { return a; }\n", encoding="utf-8")
+    return [(path, path.relative_to(tmp_path)) for path in sorted(tmp_path.glob("*.js"))]
+
+
+def test_timeout_falls_back_to_outline_and_is_cached(tmp_path):
+    """上限を超えたファイルはアウトラインのみを抽出し、変更されるまでキャッシュのアウトラインを使用する"""
+    files = _project(tmp_path)
+    classifier = FileClassifier(tmp_path)
+    cache_manager = CacheManager(tmp_path)
+    try:
+        apis = JSParser(tmp_path).parse_project(
+            cache_manager=cache_manager,
+            files_to_parse=files,
+            classifier=classifier,
+            file_timeout=1e-9,
+            use_parallel=False,
+            as_records=True,
+        )
+        slow = [api for api in apis if api.file_path == "slow.js"]
+        assert len(slow) == 501
+        assert (slow[0].name, slow[0].type, slow[0].line_number) == ("Store", "class", 1)
+        assert (slow[1].name, slow[1].signature, slow[1].docstring) == (
+            "handler0",
+            "handler0(...)",
+            "",
+        )
+        # 上限内に確認位置のないファイルは解析を終えたうえで記録する
+        assert sorted((s.rel_path, s.outline, s.cached) for s in classifier.get_slow()) == [
+            ("fast.js", False, False),
+            ("slow.js", True, False),
+        ]
+
+        classifier.reset_slow()
+        parser = JSParser(tmp_path)
+        with patch.object(
+            parser, "_parse_file_records", wraps=parser._parse_file_records
+        ) as parse_file:
+            cached = parser.parse_project(
+                cache_manager=cache_manager,
+                files_to_parse=files,
+                classifier=classifier,
+                file_timeout=1e-9,
+                use_parallel=False,
+                as_records=True,
+            )
+        assert parse_file.call_count == 0
+        assert sorted((api.file_path, api.name) for api in cached) == sorted(
+            (api.file_path, api.name) for api in apis
+        )
+        assert [(s.rel_path, s.outline, s.cached) for s in classifier.get_slow()] == [
+            ("slow.js", True, True)
+        ]
+    finally:
+        cache_manager.close()
+
+
+def test_process_executor_stops_unresponsive_worker(tmp_path):
+    """プロセスプールでは、上限を超えても応答しないワーカーを停止してアウトラインを使用する"""
+    (tmp_path / "slow.go").write_text(
+        "package main\n\ntype Slow struct {\n\t" + "a" * 40 + "\n}\n", encoding="utf-8"
+    )
+    for i in range(3):
+        (tmp_path / f"f{i}.go").write_text(
+            f"package main\n\n// F{i} は関数です\nfunc F{i}() {{}}\n", encoding="utf-8"
+        )
+    files = [(path, path.relative_to(tmp_path)) for path in sorted(tmp_path.glob("*.go"))]
+    classifier = FileClassifier(tmp_path)
+
+    start = time.monotonic()
+    with (
+        patch("docgen.generators.parsers.base_parser.should_use_processes", return_value=True),
+        patch("docgen.generators.parsers.base_parser._WORKER_GRACE", 0.2),
+    ):
+        apis = _BacktrackingParser(tmp_path, "go").parse_project(
+            files_to_parse=files,
+            classifier=classifier,
+            executor="process",
+            max_workers=2,
+            file_timeout=0.5,
+            as_records=True,
+        )
+
+    assert time.monotonic() - start < 10
+    assert sorted((api.file_path, api.name, api.signature) for api in apis) == [
+        ("f0.go", "F0", "F0(...)"),
+        ("f1.go", "F1", "F1(...)"),
+        ("f2.go", "F2", "F2(...)"),
+        ("slow.go", "Slow", "type Slow"),
+    ]
+    assert [(s.rel_path, s.outline) for s in classifier.get_slow()] == [("slow.go", True)]
+
+
+def test_generic_parser_matches_across_large_offsets(tmp_path):
+    """ファイル全体を1回で照合し、16KBを超える位置をまたぐ定義も抽出する"""
+    padding = ("// " + "-" * 77 + "\n") * 202
+    file_path = tmp_path / "main.c"
+    file_path.write_text(
+        padding + "/**\n * 計算します\n */\nint foo(\n" + "    int a,\n" * 20 + "    int b)\n{}\n",
+        encoding="utf-8",
+    )
+    assert len(padding) < 16384 < file_path.read_text().index("int b)")
+
+    apis = GenericParser(tmp_path, "c").parse_file(file_path)
+    assert [(api.name, api.line_number, api.docstring) for api in apis] == [
+        ("foo", 206, "計算します")
+    ]
+
+
+def test_summarize_slow():
+    """解析時間の長い順に上限の件数まで表示する"""
+    slow = [
+        SlowFile("a.js", "javascript", 12.5, True, False),
+        SlowFile("b.go", "go", 11.0, True, True),
+        SlowFile("c.py", "python", 10.2, False, False),
+    ]
+    assert summarize_slow(slow, limit=2) == [
+        "[parse] 3 件のファイルの解析が時間の上限を超えました（アウトラインのみ: 2、うち前回の記録を再利用: 1）",
+        "  - a.js (javascript, 12.5s, outline)",
+        "  - b.go (go, 11.0s, cached outline)",
+        "  ... 他 1 件",
+    ]
+    assert summarize_slow([]) == []
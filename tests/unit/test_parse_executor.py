@@ -0,0 +1,117 @@
+"""
+プロセスプールでの解析（parse.executor = "process"）のテスト
+"""
+
+import multiprocessing
+import os
+from unittest.mock import patch
+
+import pytest
+
+from docgen.generators.parsers.base_parser import should_use_processes
+from docgen.generators.parsers.python_parser import PythonParser
+from docgen.utils.cache import CacheManager
+
+
+class _FailingParser(PythonParser):
+    """broken.pyの抽出で失敗するパーサー（ワーカープロセスでも同じように失敗する）"""
+
+    def _extract_elements(self, tree, file_path):
+        if file_path.name == "broken.py":
+            raise RecursionError("too deep")
+        return super()._extract_elements(tree, file_path)
+
+
+class _CrashingParser(PythonParser):
+    """ワーカープロセスでbroken.pyを解析すると異常終了するパーサー（親プロセスでは解析できる）"""
+
+    def _extract_elements(self, tree, file_path):
+        if file_path.name == "broken.py" and multiprocessing.parent_process() is not None:
+            os._exit(1)
+        return super()._extract_elements(tree, file_path)
+
+
+@pytest.fixture
+def project(tmp_path):
+    for i in range(6):
+        (tmp_path / f"m{i}.py").write_text(
+            f'def func_{i}(x: int = {i}) -> int:\n    """関数{i}"""\n    return x\n'
+        )
+    (tmp_path / "broken.py").write_text("def broken():\n    pass\n")
+    files = [(path, path.relative_to(tmp_path)) for path in sorted(tmp_path.glob("*.py"))]
+    return tmp_path, files
+
+
+def _summary(apis):
+    return sorted(
+        (api.file_path, api.name, api.signature, api.docstring, api.language) for api in apis
+    )
+
+
+def test_process_executor_matches_thread_executor(project):
+    """プロセスプールでもスレッドと同じ解析結果を返す"""
+    root, files = project
+    with (
+        patch("docgen.generators.parsers.base_parser.should_use_processes", return_value=True),
+        patch.object(
+            PythonParser,
+            "_parse_in_processes",
+            autospec=True,
+            side_effect=PythonParser._parse_in_processes,
+        ) as pool,
+    ):
+        process_apis = PythonParser(root).parse_project(files_to_parse=files, executor="process")
+    thread_apis = PythonParser(root).parse_project(files_to_parse=files, executor="thread")
+
+    assert pool.call_count == 1
+    assert _summary(process_apis) == _summary(thread_apis)
+    assert len(process_apis) == 7
+
+
+def test_process_executor_fills_cache(project):
+    """ワーカーの解析結果・失敗は親プロセスでキャッシュに保存する"""
+    root, files = project
+    cache_manager = CacheManager(root)
+    try:
+        with patch("docgen.generators.parsers.base_parser.should_use_processes", return_value=True):
+            _FailingParser(root).parse_project(
+                cache_manager=cache_manager, files_to_parse=files, executor="process"
+            )
+        assert cache_manager.get_cache_stats()["error_results"] == 1
+
+        parser = _FailingParser(root)
+        with (
+            patch.object(
+                parser, "_parse_file_records", wraps=parser._parse_file_records
+            ) as parse_file,
+            patch.object(parser, "_parse_in_processes") as pool,
+        ):
+            apis = parser.parse_project(
+                cache_manager=cache_manager, files_to_parse=files, executor="process"
+            )
+    finally:
+        cache_manager.close()
+
+    assert parse_file.call_count == 0
+    assert pool.call_count == 0
+    assert sorted(api.file_path for api in apis) == [f"m{i}.py" for i in range(6)]
+
+
+def test_crashed_worker_falls_back_to_threads(project):
+    """ワーカーが異常終了した場合は、結果を返していないファイルを親プロセスで解析する"""
+    root, files = project
+    with patch("docgen.generators.parsers.base_parser.should_use_processes", return_value=True):
+        apis = _CrashingParser(root).parse_project(
+            files_to_parse=files, executor="process", max_workers=2
+        )
+
+    assert sorted(api.file_path for api in apis) == ["broken.py"] + [f"m{i}.py" for i in range(6)]
+
+
+def test_should_use_processes_threshold():
+    """解析が必要なファイルが少ない場合はプロセスを起動しない"""
+    with patch("docgen.generators.parsers.base_parser.os.cpu_count", return_value=8):
+        assert not should_use_processes(10, min_files=200)
+        assert should_use_processes(200, min_files=200)
+    with patch("docgen.generators.parsers.base_parser.os.cpu_count", return_value=1):
+        assert not should_use_processes(10_000, min_files=200)
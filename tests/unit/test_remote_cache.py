@@ -0,0 +1,195 @@
+"""
+リモートキャッシュ（cache.remote）のテスト
+"""
+
+import marshal
+import socket
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from docgen.generators.parsers.python_parser import PythonParser
+from docgen.rag.embedder import Embedder
+from docgen.utils.cache import CacheManager
+from docgen.utils.cache_server import CacheServer
+from docgen.utils.cache_store import result_key
+from docgen.utils.llm.remote_cached_client import RemoteCachedLLMClient
+from docgen.utils.remote_cache import RemoteCacheClient
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = CacheServer(tmp_path / "remote", port=0, token="secret")
+    server.start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def client(server):
+    client = RemoteCacheClient(server.url, batch_size=2, token="secret")
+    yield client
+    client.close()
+
+
+def _unused_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def _parse(root, cache_manager):
+    """a.pyを解析し、実際に解析したファイル名を返す"""
+    parser = PythonParser(root)
+    files = [(root / "a.py", (root / "a.py").relative_to(root))]
+    with patch.object(
+        parser, "_parse_file_records", wraps=parser._parse_file_records
+    ) as parse_file:
+        apis = parser.parse_project(
+            cache_manager=cache_manager, files_to_parse=files, use_parallel=False
+        )
+    return apis, [call.args[0].name for call in parse_file.call_args_list]
+
+
+def test_client_roundtrip_in_batches(server, client):
+    """書き込んだ値をbatch_sizeずつ送受信できる"""
+    values = {f"key-{i}": bytes([i]) * 10 for i in range(5)}
+    for key, value in values.items():
+        client.put("parse", key, value)
+    client.flush()
+
+    assert client.get_many("parse", [*values, "missing"]) == values
+    assert client.get("embeddings", "key-0") is None
+    assert client.available
+
+
+def test_server_rejects_wrong_token(server):
+    """トークンが一致しないクライアントはリモートを使用しない"""
+    client = RemoteCacheClient(server.url, token="wrong")
+    try:
+        assert client.get("parse", "key") is None
+        assert not client.available
+    finally:
+        client.close()
+
+
+def test_cache_manager_shares_results_across_checkouts(tmp_path, client):
+    """別のパスにチェックアウトしたプロジェクトでもリモートの解析結果を使用する"""
+    first = tmp_path / "alice"
+    second = tmp_path / "bob"
+    for root in (first, second):
+        root.mkdir()
+        (root / "a.py").write_text("def a():\n    pass\n")
+
+    cache_manager = CacheManager(first, remote=client)
+    try:
+        _, parsed = _parse(first, cache_manager)
+    finally:
+        cache_manager.close()
+    assert parsed == ["a.py"]
+
+    cache_manager = CacheManager(second, remote=client)
+    try:
+        apis, parsed = _parse(second, cache_manager)
+    finally:
+        cache_manager.close()
+    assert parsed == []
+    assert [api.name for api in apis] == ["a"]
+    assert apis[0].file_path == "a.py"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"R" + marshal.dumps((1, (("evil", "function", 1, "", "", None, None, None, "", ""),))),
+        b'J[{"name": 1, "type": "function"}]',
+        b'J{"slow": "x", "apis": []}',
+        b"J{not json",
+    ],
+)
+def test_invalid_remote_result_is_a_miss(tmp_path, client, payload):
+    """リモートの値がJSONのAPI情報として検証できない場合は使用せずに解析する"""
+    (tmp_path / "a.py").write_text("def a():\n    pass\n")
+    cache_manager = CacheManager(tmp_path, remote=client)
+    file_hash = cache_manager.get_file_hash(tmp_path / "a.py")
+    client.put(
+        "parse", result_key("python", "a.py", file_hash, PythonParser.PARSER_VERSION), payload
+    )
+    client.flush()
+    try:
+        apis, parsed = _parse(tmp_path, cache_manager)
+    finally:
+        cache_manager.close()
+
+    assert parsed == ["a.py"]
+    assert [api.name for api in apis] == ["a"]
+    assert client.available
+
+
+def test_protocol_mismatch_disables_remote(server):
+    """サーバーのプロトコルのバージョンが異なる場合はリモートを使用しない"""
+    with patch("docgen.utils.remote_cache.PROTOCOL_VERSION", 2):
+        client = RemoteCacheClient(server.url, token="secret")
+        try:
+            client.put("parse", "key", b"value")
+            client.flush()
+            assert client.get("parse", "key") is None
+            assert not client.available
+        finally:
+            client.close()
+
+
+def test_unreachable_server_falls_back_to_local(tmp_path):
+    """サーバーに接続できない場合はローカルのキャッシュのみで解析する"""
+    (tmp_path / "a.py").write_text("def a():\n    pass\n")
+    client = RemoteCacheClient(_unused_url(), timeout=0.5)
+    cache_manager = CacheManager(tmp_path, remote=client)
+    try:
+        apis, parsed = _parse(tmp_path, cache_manager)
+    finally:
+        cache_manager.close()
+        client.close()
+
+    assert parsed == ["a.py"]
+    assert [api.name for api in apis] == ["a"]
+    assert not client.available
+
+
+def test_embedder_uses_remote_embeddings(tmp_path, client):
+    """ローカルにない埋め込みはリモートから取得し、モデルで計算しない"""
+    first = Embedder(remote_cache=client)
+    first.cache_dir = tmp_path / "alice"
+    first._model = MagicMock()
+    first._model.encode.return_value = np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+    first.embed_batch(["foo", "bar"])
+
+    second = Embedder(remote_cache=client)
+    second.cache_dir = tmp_path / "bob"
+    second._model = MagicMock()
+    second._model.encode.return_value = np.array([[5.0, 6.0]], dtype=np.float32)
+    embeddings = second.embed_batch(["bar", "baz"])
+
+    assert second._model.encode.call_args.args[0] == ["baz"]
+    np.testing.assert_array_equal(embeddings, [[3.0, 4.0], [5.0, 6.0]])
+    # リモートから取得した埋め込みはローカルにも保存する
+    assert second._get_from_cache(second._get_cache_key("bar")) is not None
+
+
+def test_llm_client_reuses_remote_response(client):
+    """同じモデル・プロンプトの応答はリモートから取得する"""
+    llm = MagicMock()
+    llm.config.provider = "openai"
+    llm.config.temperature = 0.2
+    llm.config.max_tokens = 1000
+    llm.model = "gpt-4o"
+    llm.generate.return_value = "response"
+
+    assert RemoteCachedLLMClient(llm, client).generate("prompt") == "response"
+    assert RemoteCachedLLMClient(llm, client).generate("prompt") == "response"
+    assert llm.generate.call_count == 1
+
+    llm.model = "gpt-4o-mini"
+    RemoteCachedLLMClient(llm, client).generate("prompt")
+    assert llm.generate.call_count == 2
@@ -0,0 +1,151 @@
+"""
+ScanSessionのテスト
+"""
+
+import os
+
+import pytest
+
+from docgen.archgen.detectors.python_detector import PythonDetector
+from docgen.collectors.structure_analyzer import StructureAnalyzer
+from docgen.detectors.detector_patterns import DetectorPatterns
+from docgen.rag.chunker import CodeChunker
+from docgen.utils.file_scanner import create_unified_scanner
+from docgen.utils.scan_session import ScanSession
+
+_BIG_MODULE = "\n".join(f"def f{i}():\n    pass\n" for i in range(6))
+
+
+@pytest.fixture
+def project_tree(tmp_path):
+    """走査対象のプロジェクトを作成"""
+    root = tmp_path / "project"
+    (root / "pkg" / "sub" / "deep").mkdir(parents=True)
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "core.py").write_text(_BIG_MODULE)
+    (root / "pkg" / "sub" / "__init__.py").write_text("from pkg import core\n")
+    (root / "pkg" / "sub" / "deep" / "leaf.py").write_text("x = 1\n")
+    (root / "web").mkdir()
+    (root / "web" / "app.js").write_text("function app() {}\n")
+    (root / "node_modules" / "lib").mkdir(parents=True)
+    (root / "node_modules" / "lib" / "index.js").write_text("module.exports = {}\n")
+    (root / "ignored").mkdir()
+    (root / "ignored" / "skip.py").write_text("y = 2\n")
+    (root / ".gitignore").write_text("ignored/\n")
+    (root / "README.md").write_text("# project\n")
+    return root
+
+
+def _rel(view):
+    return sorted(rel.as_posix() for _abs, rel in view)
+
+
+class TestScanSessionFingerprint:
+    """フィンガープリントとセッションごとのスキャナーのテスト"""
+
+    def test_sessions_do_not_share_scanner(self, project_tree):
+        """スキャナーはセッションごとに作成され、同じ設定ではフィンガープリントが一致する"""
+        first = ScanSession(project_tree, {"exclude": {"directories": ["web"]}})
+        second = ScanSession(project_tree, {"exclude": {"directories": ["web"]}})
+        assert first.scanner is not second.scanner
+        assert first.fingerprint == second.fingerprint
+
+    def test_new_session_reads_nested_gitignore(self, project_tree):
+        """サブディレクトリの.gitignoreの変更は次のセッションで反映される"""
+        first = ScanSession(project_tree)
+        first.scan()
+        assert "pkg/sub/deep/leaf.py" in _rel(first.view())
+
+        (project_tree / "pkg" / "sub" / ".gitignore").write_text("deep/\n")
+        second = ScanSession(project_tree)
+        second.scan()
+        assert second.fingerprint == first.fingerprint
+        assert "pkg/sub/deep/leaf.py" not in _rel(second.view())
+
+    def test_fingerprint_changes_with_settings(self, project_tree):
+        """除外設定や.gitignoreが変わるとフィンガープリントが変わる"""
+        base = create_unified_scanner(project_tree).fingerprint
+        assert create_unified_scanner(project_tree, exclude_dirs={"web"}).fingerprint != base
+        assert create_unified_scanner(project_tree, use_gitignore=False).fingerprint != base
+
+        gitignore = project_tree / ".gitignore"
+        gitignore.write_text("ignored/\n*.md\n")
+        stat = gitignore.stat()
+        os.utime(gitignore, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert create_unified_scanner(project_tree).fingerprint != base
+
+
+class TestScanView:
+    """絞り込みビューのテスト"""
+
+    def test_session_applies_universal_excludes(self, project_tree):
+        """除外ディレクトリと.gitignoreは走査時に適用される"""
+        session = ScanSession(project_tree, {})
+        paths = _rel(session.view())
+        assert "node_modules/lib/index.js" not in paths
+        assert "ignored/skip.py" not in paths
+        assert "pkg/sub/deep/leaf.py" in paths
+
+    def test_filter_by_extension_prefix_and_depth(self, project_tree):
+        """拡張子・プレフィックス・深さで絞り込める"""
+        session = ScanSession(project_tree, {})
+        assert _rel(session.view(extensions={".js"})) == ["web/app.js"]
+        assert _rel(session.view(extensions={".py"}, prefix="pkg", max_depth=0)) == [
+            "pkg/__init__.py",
+            "pkg/core.py",
+        ]
+        assert _rel(session.view(extensions={".py"}, exclude_dirs={"deep"})) == [
+            "pkg/__init__.py",
+            "pkg/core.py",
+            "pkg/sub/__init__.py",
+        ]
+
+    def test_list_dir_matches_scan(self, project_tree):
+        """走査したディレクトリの直下のエントリを取得できる"""
+        session = ScanSession(project_tree, {"exclude": {"directories": ["web"]}})
+        dirs, files = session.list_dir("")
+        assert sorted(dirs) == ["pkg"]
+        assert sorted(files) == [".gitignore", "README.md"]
+        assert session.list_dir("node_modules") == ([], [])
+        assert "pkg/sub/deep" in session.directories()
+
+
+class TestScanSessionConsumers:
+    """走査セッションを利用する各サブシステムのテスト"""
+
+    def test_structure_analyzer_matches_direct_walk(self, project_tree):
+        """構造分析の結果が独自走査と一致する"""
+        session = ScanSession(project_tree, {})
+        direct = StructureAnalyzer(project_tree, exclude_directories=["ignored"]).analyze()
+        shared = StructureAnalyzer(project_tree, scan_session=session).analyze()
+        assert shared == direct
+        assert shared["pkg/"]["core.py"] == "file"
+
+    def test_language_detection_primed_from_session(self, project_tree):
+        """言語検出のキャッシュが走査結果から作成される"""
+        session = ScanSession(project_tree, {})
+        detected = DetectorPatterns.prime_from_scan_session(project_tree, session)
+        try:
+            assert detected["python"] is True
+            assert detected["javascript"] is True
+            assert detected["go"] is False
+            assert DetectorPatterns.detect_by_extensions_with_exclusions(project_tree, [".py"])
+        finally:
+            DetectorPatterns.clear_cache(project_tree)
+
+    def test_python_detector_uses_session(self, project_tree):
+        """archgenのパッケージ走査が独自走査と一致する"""
+        session = ScanSession(project_tree, {})
+        direct = PythonDetector(exclude_directories=["ignored"])._scan_modules(project_tree)
+        shared = PythonDetector(scan_session=session)._scan_modules(project_tree)
+        assert [m.model_dump() for m in shared] == [m.model_dump() for m in direct]
+        assert [m.name for m in shared[0].submodules] == ["sub"]
+
+    def test_chunker_uses_session(self, project_tree):
+        """チャンク化対象のファイルが走査結果から選ばれる"""
+        session = ScanSession(project_tree, {})
+        chunker = CodeChunker({"exclude_files": []})
+        chunks = chunker.chunk_codebase(project_tree, scan_session=session)
+        sources = {chunk["file"] for chunk in chunks}
+        assert "README.md" in sources
+        assert not any(source.startswith(("ignored", "node_modules")) for source in sources)
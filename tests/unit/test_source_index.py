@@ -0,0 +1,24 @@
+"""
+ソースの位置のインデックス（LineIndex・BraceIndex）のテスト
+"""
+
+from docgen.utils.source_index import BraceIndex, LineIndex
+
+_TEXT = "class A {\n  f() {\n    return {};\n  }\n}\n\n} stray {\n"
+
+
+def test_line_of_matches_newline_count():
+    """すべての位置で先頭からの改行の数と同じ行番号を返す"""
+    index = LineIndex(_TEXT)
+    assert [index.line_of(pos) for pos in range(len(_TEXT) + 1)] == [
+        _TEXT[:pos].count("\n") + 1 for pos in range(len(_TEXT) + 1)
+    ]
+    assert len(index) == _TEXT.count("\n") + 1
+
+
+def test_find_block_end():
+    """開始位置以降の最初の{に対応する}を返し、閉じていない場合は-1を返す"""
+    index = BraceIndex(_TEXT)
+    assert index.find_block_end(0) == _TEXT.index("\n}") + 1
+    assert index.find_block_end(_TEXT.index("f()")) == _TEXT.index("  }") + 2
+    assert index.find_block_end(_TEXT.index("stray")) == -1
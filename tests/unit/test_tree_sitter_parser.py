@@ -0,0 +1,107 @@
+"""
+tree-sitterによる解析のバックエンド（TreeSitterParser）のテスト
+"""
+
+import pickle
+
+import pytest
+
+from docgen.generators.parsers.generic_parser import GenericParser
+from docgen.generators.parsers.js_parser import JSParser
+from docgen.generators.parsers.parser_factory import ParserFactory
+from docgen.generators.parsers.tree_sitter_parser import TreeSitterParser
+
+_JS = """\
+/**
+ * 挨拶する
+ * @param {string} name - 名前
+ */
+export function hello(name) {
+  function inner() {}
+  return name;
+}
+
+const add = (a, b) => a + b;
+
+/** 計算機 */
+class Calculator {
+  /** 加算 */
+  add(a, b) {
+    return a + b;
+  }
+  get total() { return 1 }
+  #secret() {}
+}
+"""
+
+_GO = """package main
+
+// Load はファイルを読み込みます
+// 複数行のコメント
+func Load(path string) string {
+	return path
+}
+
+func helper() {}
+
+type Model struct {
+	Name string
+}
+"""
+
+
+def _summary(apis):
+    return [(api.name, api.type, api.line_number, api.docstring, api.language) for api in apis]
+
+
+def test_factory_selects_backend(tmp_path, monkeypatch):
+    """tree_sitterは文法を読み込める言語のみ使用し、それ以外は正規表現ベースのパーサーを使用する"""
+    monkeypatch.setattr(TreeSitterParser, "is_available", staticmethod(lambda language: True))
+    parser = ParserFactory.create_parser(tmp_path, "go", backend="tree_sitter")
+    assert isinstance(parser, TreeSitterParser)
+    assert parser.get_parser_type() == "tree_sitter_go"
+    assert isinstance(ParserFactory.create_parser(tmp_path, "go"), GenericParser)
+
+    monkeypatch.setattr(TreeSitterParser, "is_available", staticmethod(lambda language: False))
+    assert isinstance(
+        ParserFactory.create_parser(tmp_path, "go", backend="tree_sitter"), GenericParser
+    )
+    parsers = ParserFactory.create_parsers(
+        tmp_path, ["javascript", "typescript", "go", "rust"], backend="tree_sitter"
+    )
+    assert [parser.get_parser_type() for parser in parsers] == ["javascript", "go", "rust"]
+
+
+def test_pickle_without_thread_local_parsers(tmp_path):
+    """プロセスプールに渡せるよう、スレッドごとのParserを除いてpickleできる"""
+    parser = pickle.loads(pickle.dumps(TreeSitterParser(tmp_path, "go")))
+    assert parser.language == "go"
+    assert parser.get_parser_type() == "tree_sitter_go"
+
+
+@pytest.mark.skipif(
+    not TreeSitterParser.is_available("javascript"),
+    reason="tree-sitter-javascript is not installed",
+)
+def test_javascript_matches_regex_parser(tmp_path):
+    """JSParserと同じAPI情報を抽出する"""
+    file_path = tmp_path / "app.js"
+    file_path.write_text(_JS, encoding="utf-8")
+    expected = JSParser(tmp_path).parse_file(file_path)
+    actual = TreeSitterParser(tmp_path, "javascript").parse_file(file_path)
+    assert _summary(actual) == _summary(expected)
+    assert [api.signature for api in actual] == [api.signature for api in expected]
+    assert actual[0].parameters == expected[0].parameters
+
+
+@pytest.mark.skipif(
+    not TreeSitterParser.is_available("go"), reason="tree-sitter-go is not installed"
+)
+def test_go_matches_generic_parser(tmp_path):
+    """GenericParserと同じくドキュメントコメント付きの関数と構造体を抽出する"""
+    file_path = tmp_path / "main.go"
+    file_path.write_text(_GO, encoding="utf-8")
+    expected = GenericParser(tmp_path, "go").parse_file(file_path)
+    actual = TreeSitterParser(tmp_path, "go").parse_file(file_path)
+    assert _summary(actual) == _summary(expected)
+    assert actual[0].signature == "Load(path string)"